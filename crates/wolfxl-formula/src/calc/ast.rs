@@ -0,0 +1,472 @@
+//! Formula → expression tree, built from the [`crate::tokenizer`] stream.
+//!
+//! References are resolved while parsing: sheet prefixes become sheet
+//! indices, defined names are expanded to what they refer to, and ranges
+//! are normalized so `first <= last` on both axes. Anything the evaluator
+//! cannot run (array constants, structured or external references,
+//! unknown functions) is reported as a parse error so callers can route
+//! the formula elsewhere.
+
+use std::collections::HashMap;
+
+use crate::reference::{parse_ref, SheetPrefix};
+use crate::tokenizer::{tokenize, Token, TokenKind, TokenSubKind};
+use crate::{RefKind, MAX_COL, MAX_ROW};
+
+use super::functions::Function;
+use super::value::ErrorKind;
+
+/// How deeply defined names may refer to other defined names.
+const MAX_NAME_DEPTH: usize = 8;
+
+/// Binding power of prefix `-` / `+`: tighter than `^`, so `-2^2` is 4
+/// as in Excel.
+const PREFIX_BP: u8 = 11;
+/// Binding power of postfix `%`.
+const POSTFIX_BP: u8 = 12;
+
+/// One cell: sheet index plus 1-based row and column.
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash, PartialOrd, Ord)]
+pub struct CellAddr {
+    /// Index of the sheet in load order.
+    pub sheet: u32,
+    /// 1-based row.
+    pub row: u32,
+    /// 1-based column.
+    pub col: u32,
+}
+
+/// A rectangular block of cells on one sheet, corners inclusive.
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
+pub(crate) struct RangeRef {
+    pub sheet: u32,
+    pub first_row: u32,
+    pub first_col: u32,
+    pub last_row: u32,
+    pub last_col: u32,
+}
+
+impl RangeRef {
+    pub fn contains(&self, addr: &CellAddr) -> bool {
+        addr.sheet == self.sheet
+            && (self.first_row..=self.last_row).contains(&addr.row)
+            && (self.first_col..=self.last_col).contains(&addr.col)
+    }
+
+    pub fn rows(&self) -> usize {
+        (self.last_row - self.first_row + 1) as usize
+    }
+
+    pub fn cols(&self) -> usize {
+        (self.last_col - self.first_col + 1) as usize
+    }
+
+    /// The single cell of a 1x1 range.
+    pub fn single(&self) -> Option<CellAddr> {
+        (self.first_row == self.last_row && self.first_col == self.last_col).then_some(CellAddr {
+            sheet: self.sheet,
+            row: self.first_row,
+            col: self.first_col,
+        })
+    }
+}
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub(crate) enum UnaryOp {
+    Neg,
+    Percent,
+}
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub(crate) enum BinaryOp {
+    Add,
+    Sub,
+    Mul,
+    Div,
+    Pow,
+    Concat,
+    Eq,
+    Ne,
+    Lt,
+    Le,
+    Gt,
+    Ge,
+}
+
+impl BinaryOp {
+    /// `(operator, left binding power, right binding power)`; every
+    /// operator is left-associative, `^` included, as in Excel.
+    fn from_token(value: &str) -> Option<(Self, u8, u8)> {
+        Some(match value {
+            "=" => (BinaryOp::Eq, 1, 2),
+            "<>" => (BinaryOp::Ne, 1, 2),
+            "<" => (BinaryOp::Lt, 1, 2),
+            "<=" => (BinaryOp::Le, 1, 2),
+            ">" => (BinaryOp::Gt, 1, 2),
+            ">=" => (BinaryOp::Ge, 1, 2),
+            "&" => (BinaryOp::Concat, 3, 4),
+            "+" => (BinaryOp::Add, 5, 6),
+            "-" => (BinaryOp::Sub, 5, 6),
+            "*" => (BinaryOp::Mul, 7, 8),
+            "/" => (BinaryOp::Div, 7, 8),
+            "^" => (BinaryOp::Pow, 9, 10),
+            _ => return None,
+        })
+    }
+}
+
+/// A parsed formula.
+#[derive(Debug, Clone, PartialEq)]
+pub(crate) enum Expr {
+    Number(f64),
+    Text(String),
+    Bool(bool),
+    Error(ErrorKind),
+    /// An omitted function argument, as in `IF(A1,,2)`.
+    Missing,
+    Cell(CellAddr),
+    Range(RangeRef),
+    Unary(UnaryOp, Box<Expr>),
+    Binary(BinaryOp, Box<Expr>, Box<Expr>),
+    Call(Function, Vec<Expr>),
+}
+
+impl Expr {
+    /// Every cell and range the expression reads, in source order.
+    pub fn visit_refs(&self, cells: &mut Vec<CellAddr>, ranges: &mut Vec<RangeRef>) {
+        match self {
+            Expr::Cell(addr) => cells.push(*addr),
+            Expr::Range(range) => match range.single() {
+                Some(addr) => cells.push(addr),
+                None => ranges.push(*range),
+            },
+            Expr::Unary(_, operand) => operand.visit_refs(cells, ranges),
+            Expr::Binary(_, left, right) => {
+                left.visit_refs(cells, ranges);
+                right.visit_refs(cells, ranges);
+            }
+            Expr::Call(_, args) => {
+                for arg in args {
+                    arg.visit_refs(cells, ranges);
+                }
+            }
+            _ => {}
+        }
+    }
+}
+
+/// What a formula is parsed against.
+pub(crate) struct Scope<'a> {
+    /// Sheet the formula lives on; unqualified references point here.
+    pub sheet: u32,
+    /// Lower-cased sheet name → sheet index.
+    pub sheets: &'a HashMap<String, u32>,
+    /// Upper-cased defined name → the text it refers to.
+    pub names: &'a HashMap<String, String>,
+}
+
+/// Parse `formula` (with its leading `=`) into an expression tree.
+pub(crate) fn parse_formula(formula: &str, scope: &Scope<'_>) -> Result<Expr, String> {
+    parse_at_depth(formula, scope, 0)
+}
+
+fn parse_at_depth(formula: &str, scope: &Scope<'_>, depth: usize) -> Result<Expr, String> {
+    let tokens: Vec<Token> = tokenize(formula)
+        .map_err(|e| e.to_string())?
+        .into_iter()
+        .filter(|t| t.kind != TokenKind::Wspace)
+        .collect();
+    if tokens.first().is_some_and(|t| t.kind == TokenKind::Literal) {
+        return Err("not a formula".to_string());
+    }
+    let mut parser = Parser {
+        tokens,
+        pos: 0,
+        scope,
+        depth,
+    };
+    let expr = parser.expr(0)?;
+    match parser.tokens.get(parser.pos) {
+        None => Ok(expr),
+        Some(t) => Err(format!("unexpected {:?}", t.value)),
+    }
+}
+
+struct Parser<'s, 'a> {
+    tokens: Vec<Token>,
+    pos: usize,
+    scope: &'s Scope<'a>,
+    depth: usize,
+}
+
+impl Parser<'_, '_> {
+    fn peek(&self) -> Option<&Token> {
+        self.tokens.get(self.pos)
+    }
+
+    fn next(&mut self) -> Result<Token, String> {
+        let token = self
+            .tokens
+            .get(self.pos)
+            .cloned()
+            .ok_or_else(|| "unexpected end of formula".to_string())?;
+        self.pos += 1;
+        Ok(token)
+    }
+
+    fn is_close(token: Option<&Token>, kind: TokenKind) -> bool {
+        token.is_some_and(|t| t.kind == kind && t.subkind == TokenSubKind::Close)
+    }
+
+    fn is_arg_sep(token: Option<&Token>) -> bool {
+        token.is_some_and(|t| t.kind == TokenKind::Sep && t.subkind == TokenSubKind::Arg)
+    }
+
+    fn expr(&mut self, min_bp: u8) -> Result<Expr, String> {
+        let mut lhs = self.prefix()?;
+        while let Some(token) = self.peek() {
+            match token.kind {
+                TokenKind::OpPost => {
+                    if POSTFIX_BP < min_bp {
+                        break;
+                    }
+                    self.pos += 1;
+                    lhs = Expr::Unary(UnaryOp::Percent, Box::new(lhs));
+                }
+                TokenKind::OpIn => {
+                    let (op, left_bp, right_bp) = BinaryOp::from_token(&token.value)
+                        .ok_or_else(|| format!("unsupported operator {:?}", token.value))?;
+                    if left_bp < min_bp {
+                        break;
+                    }
+                    self.pos += 1;
+                    let rhs = self.expr(right_bp)?;
+                    lhs = Expr::Binary(op, Box::new(lhs), Box::new(rhs));
+                }
+                _ => break,
+            }
+        }
+        Ok(lhs)
+    }
+
+    fn prefix(&mut self) -> Result<Expr, String> {
+        let token = self.next()?;
+        match (token.kind, token.subkind) {
+            (TokenKind::OpPre, _) => {
+                let operand = self.expr(PREFIX_BP)?;
+                Ok(match token.value.as_str() {
+                    "-" => Expr::Unary(UnaryOp::Neg, Box::new(operand)),
+                    _ => operand,
+                })
+            }
+            (TokenKind::Operand, TokenSubKind::Number) => token
+                .value
+                .parse::<f64>()
+                .map(Expr::Number)
+                .map_err(|_| format!("bad number {:?}", token.value)),
+            (TokenKind::Operand, TokenSubKind::Text) => {
+                let inner = &token.value[1..token.value.len() - 1];
+                Ok(Expr::Text(inner.replace("\"\"", "\"")))
+            }
+            (TokenKind::Operand, TokenSubKind::Logical) => Ok(Expr::Bool(token.value == "TRUE")),
+            (TokenKind::Operand, TokenSubKind::Error) => ErrorKind::from_code(&token.value)
+                .map(Expr::Error)
+                .ok_or_else(|| format!("unsupported error literal {}", token.value)),
+            (TokenKind::Operand, _) => self.reference(&token.value),
+            (TokenKind::Paren, TokenSubKind::Open) => {
+                let inner = self.expr(0)?;
+                if !Self::is_close(self.peek(), TokenKind::Paren) {
+                    return Err("expected `)`".to_string());
+                }
+                self.pos += 1;
+                Ok(inner)
+            }
+            (TokenKind::Func, TokenSubKind::Open) => self.call(&token.value),
+            (TokenKind::Array, _) => Err("array constants are not supported".to_string()),
+            _ => Err(format!("unexpected {:?}", token.value)),
+        }
+    }
+
+    fn call(&mut self, open: &str) -> Result<Expr, String> {
+        let name = open.trim_end_matches('(').to_ascii_uppercase();
+        let name = name
+            .strip_prefix("_XLFN.")
+            .or_else(|| name.strip_prefix("_XLWS."))
+            .unwrap_or(&name);
+        let func =
+            Function::from_name(name).ok_or_else(|| format!("unsupported function {name}"))?;
+
+        let mut args = Vec::new();
+        if Self::is_close(self.peek(), TokenKind::Func) {
+            self.pos += 1;
+            return Ok(Expr::Call(func, args));
+        }
+        loop {
+            let next = self.peek();
+            if Self::is_arg_sep(next) || Self::is_close(next, TokenKind::Func) {
+                args.push(Expr::Missing);
+            } else {
+                args.push(self.expr(0)?);
+            }
+            let token = self.next()?;
+            if Self::is_arg_sep(Some(&token)) {
+                continue;
+            }
+            if Self::is_close(Some(&token), TokenKind::Func) {
+                return Ok(Expr::Call(func, args));
+            }
+            return Err(format!("unexpected {:?} in {name} arguments", token.value));
+        }
+    }
+
+    fn reference(&mut self, value: &str) -> Result<Expr, String> {
+        let range = |sheet: u32, first_row: u32, first_col: u32, last_row: u32, last_col: u32| {
+            Expr::Range(RangeRef {
+                sheet,
+                first_row: first_row.min(last_row),
+                first_col: first_col.min(last_col),
+                last_row: first_row.max(last_row),
+                last_col: first_col.max(last_col),
+            })
+        };
+        Ok(match parse_ref(value) {
+            RefKind::Cell { sheet, cell } => match self.sheet(sheet) {
+                Some(sheet) => Expr::Cell(CellAddr {
+                    sheet,
+                    row: cell.row,
+                    col: cell.col,
+                }),
+                None => Expr::Error(ErrorKind::Ref),
+            },
+            RefKind::Range { sheet, lhs, rhs } => match self.sheet(sheet) {
+                Some(sheet) => range(sheet, lhs.row, lhs.col, rhs.row, rhs.col),
+                None => Expr::Error(ErrorKind::Ref),
+            },
+            RefKind::RowRange { sheet, lhs, rhs } => match self.sheet(sheet) {
+                Some(sheet) => range(sheet, lhs.row, 1, rhs.row, MAX_COL),
+                None => Expr::Error(ErrorKind::Ref),
+            },
+            RefKind::ColRange { sheet, lhs, rhs } => match self.sheet(sheet) {
+                Some(sheet) => range(sheet, 1, lhs.col, MAX_ROW, rhs.col),
+                None => Expr::Error(ErrorKind::Ref),
+            },
+            RefKind::Name(name) => return self.name(&name),
+            RefKind::Error(code) => ErrorKind::from_code(&code)
+                .map(Expr::Error)
+                .ok_or_else(|| format!("unsupported error literal {code}"))?,
+            RefKind::Table(_) => return Err("structured references are not supported".into()),
+            RefKind::ExternalBook { .. } => {
+                return Err("external workbook references are not supported".into())
+            }
+        })
+    }
+
+    fn sheet(&self, prefix: Option<SheetPrefix>) -> Option<u32> {
+        match prefix {
+            None => Some(self.scope.sheet),
+            Some(prefix) => self.scope.sheets.get(&prefix.name.to_lowercase()).copied(),
+        }
+    }
+
+    fn name(&mut self, name: &str) -> Result<Expr, String> {
+        let upper = name.to_ascii_uppercase();
+        if upper == "TRUE" || upper == "FALSE" {
+            return Ok(Expr::Bool(upper == "TRUE"));
+        }
+        let refers_to = self
+            .scope
+            .names
+            .get(&upper)
+            .ok_or_else(|| format!("unknown name {name}"))?;
+        if self.depth >= MAX_NAME_DEPTH {
+            return Err(format!("defined name {name} nests too deeply"));
+        }
+        let body = refers_to.trim();
+        let body = body.strip_prefix('=').unwrap_or(body);
+        parse_at_depth(&format!("={body}"), self.scope, self.depth + 1)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn parse(formula: &str) -> Result<Expr, String> {
+        let sheets = HashMap::from([("sheet1".to_string(), 0), ("data".to_string(), 1)]);
+        let names = HashMap::from([
+            ("RATE".to_string(), "Data!$B$1".to_string()),
+            ("ITEMS".to_string(), "=Data!$A$1:$A$3".to_string()),
+        ]);
+        parse_formula(
+            formula,
+            &Scope {
+                sheet: 0,
+                sheets: &sheets,
+                names: &names,
+            },
+        )
+    }
+
+    fn cell(sheet: u32, row: u32, col: u32) -> Expr {
+        Expr::Cell(CellAddr { sheet, row, col })
+    }
+
+    #[test]
+    fn precedence_and_associativity() {
+        let expr = parse("=1+2*A1-3").unwrap();
+        let product = Expr::Binary(
+            BinaryOp::Mul,
+            Box::new(Expr::Number(2.0)),
+            Box::new(cell(0, 1, 1)),
+        );
+        let sum = Expr::Binary(
+            BinaryOp::Add,
+            Box::new(Expr::Number(1.0)),
+            Box::new(product),
+        );
+        assert_eq!(
+            expr,
+            Expr::Binary(BinaryOp::Sub, Box::new(sum), Box::new(Expr::Number(3.0)))
+        );
+    }
+
+    #[test]
+    fn unary_minus_binds_tighter_than_power() {
+        let expr = parse("=-2^2").unwrap();
+        let neg = Expr::Unary(UnaryOp::Neg, Box::new(Expr::Number(2.0)));
+        assert_eq!(
+            expr,
+            Expr::Binary(BinaryOp::Pow, Box::new(neg), Box::new(Expr::Number(2.0)))
+        );
+    }
+
+    #[test]
+    fn names_and_sheets_resolve() {
+        assert_eq!(parse("=rate").unwrap(), cell(1, 1, 2));
+        assert_eq!(
+            parse("=SUM(Items, )").unwrap(),
+            Expr::Call(
+                Function::Sum,
+                vec![
+                    Expr::Range(RangeRef {
+                        sheet: 1,
+                        first_row: 1,
+                        first_col: 1,
+                        last_row: 3,
+                        last_col: 1,
+                    }),
+                    Expr::Missing,
+                ]
+            )
+        );
+        assert_eq!(parse("=Nope!A1").unwrap(), Expr::Error(ErrorKind::Ref));
+    }
+
+    #[test]
+    fn unsupported_constructs_are_errors() {
+        assert!(parse("=OFFSET(A1,1,1)").is_err());
+        assert!(parse("=SUM({1,2})").is_err());
+        assert!(parse("=Table1[Col]").is_err());
+        assert!(parse("=UnknownName").is_err());
+    }
+}
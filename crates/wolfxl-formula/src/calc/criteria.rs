@@ -0,0 +1,348 @@
+//! Criteria functions: SUMIF(S), COUNTIF(S), AVERAGEIF(S), MINIFS, MAXIFS.
+//!
+//! Criteria are parsed the way the Python evaluator's `_parse_criteria`
+//! does: a number or `">=10"`-style operator with a numeric operand
+//! compares numbers only, anything else compares case-insensitive text,
+//! and `*` / `?` turn the criterion into a wildcard pattern.
+
+use super::ast::{Expr, RangeRef};
+use super::eval::Ctx;
+use super::functions::{arity, Arg, FnResult};
+use super::lookup::wildcard_match;
+use super::store::Grid;
+use super::value::{format_number, ErrorKind, Value};
+use crate::{MAX_COL, MAX_ROW};
+
+#[derive(Debug, Clone, Copy, PartialEq)]
+enum Op {
+    Eq,
+    Ne,
+    Lt,
+    Le,
+    Gt,
+    Ge,
+}
+
+impl Op {
+    fn holds(self, ordering: std::cmp::Ordering) -> bool {
+        match self {
+            Op::Eq => ordering.is_eq(),
+            Op::Ne => ordering.is_ne(),
+            Op::Lt => ordering.is_lt(),
+            Op::Le => ordering.is_le(),
+            Op::Gt => ordering.is_gt(),
+            Op::Ge => ordering.is_ge(),
+        }
+    }
+}
+
+#[derive(Debug, Clone, PartialEq)]
+enum Criterion {
+    /// Compares numbers; `<>` also accepts every non-number.
+    Number(Op, f64),
+    /// Compares lower-cased text; blanks read as `""` for `=` / `<>`.
+    Text(Op, String),
+    /// Lower-cased wildcard pattern; never matches a blank.
+    Wildcard(String),
+}
+
+impl Criterion {
+    fn parse(value: &Value) -> Result<Self, ErrorKind> {
+        let s = match value {
+            Value::Number(n) => return Ok(Criterion::Number(Op::Eq, *n)),
+            Value::Error(e) => return Err(*e),
+            other => other.to_text()?,
+        };
+        let (op, rest) = [
+            (">=", Op::Ge),
+            ("<=", Op::Le),
+            ("<>", Op::Ne),
+            (">", Op::Gt),
+            ("<", Op::Lt),
+            ("=", Op::Eq),
+        ]
+        .iter()
+        .find_map(|(prefix, op)| s.strip_prefix(prefix).map(|rest| (Some(*op), rest.trim())))
+        .unwrap_or((None, s.as_str()));
+        if let Some(op) = op {
+            return Ok(match rest.parse::<f64>() {
+                Ok(n) => Criterion::Number(op, n),
+                Err(_) => Criterion::Text(op, rest.to_lowercase()),
+            });
+        }
+        if rest.contains(['*', '?']) {
+            return Ok(Criterion::Wildcard(rest.to_string()));
+        }
+        Ok(Criterion::Text(Op::Eq, rest.to_lowercase()))
+    }
+
+    fn matches(&self, value: &Value) -> bool {
+        match self {
+            Criterion::Number(op, target) => match value {
+                Value::Number(n) => {
+                    op.holds(n.partial_cmp(target).unwrap_or(std::cmp::Ordering::Less))
+                }
+                _ => *op == Op::Ne,
+            },
+            Criterion::Text(op, target) => {
+                if value.is_empty() && !matches!(op, Op::Eq | Op::Ne) {
+                    return false;
+                }
+                op.holds(criterion_text(value).cmp(target))
+            }
+            Criterion::Wildcard(pattern) => {
+                !value.is_empty() && wildcard_match(pattern, &criterion_text(value))
+            }
+        }
+    }
+}
+
+/// Lower-cased text of `value` as criteria compare it.
+fn criterion_text(value: &Value) -> String {
+    match value {
+        Value::Empty => String::new(),
+        Value::Number(n) => format_number(*n),
+        Value::Text(s) => s.to_lowercase(),
+        Value::Bool(b) => if *b { "true" } else { "false" }.to_string(),
+        Value::Error(e) => e.code().to_lowercase(),
+    }
+}
+
+/// A criteria range and its parsed criterion.
+struct Condition<'a> {
+    grid: Grid<'a>,
+    criterion: Criterion,
+}
+
+fn condition<'a>(
+    ctx: &'a Ctx<'_>,
+    range: &'a Arg,
+    criterion: &Expr,
+) -> Result<Condition<'a>, ErrorKind> {
+    Ok(Condition {
+        grid: ctx.grid(range),
+        criterion: Criterion::parse(&ctx.eval(criterion))?,
+    })
+}
+
+/// `arg` resized to `rows` x `cols` from its top-left cell, the way
+/// `SUMIF` reads a sum range whose shape differs from the criteria range.
+fn resized(arg: Arg, rows: usize, cols: usize) -> Arg {
+    match arg {
+        Arg::Range(range) => Arg::Range(RangeRef {
+            last_row: (range.first_row as usize + rows - 1).min(MAX_ROW as usize) as u32,
+            last_col: (range.first_col as usize + cols - 1).min(MAX_COL as usize) as u32,
+            ..range
+        }),
+        value => value,
+    }
+}
+
+/// What the `*IFS` family folds the matching numbers into.
+#[derive(Debug, Clone, Copy)]
+pub(crate) enum Aggregate {
+    Sum,
+    Average,
+    Min,
+    Max,
+}
+
+#[derive(Default)]
+struct Fold {
+    total: f64,
+    count: usize,
+    min: Option<f64>,
+    max: Option<f64>,
+}
+
+impl Fold {
+    fn add(&mut self, value: &Value) {
+        if let Value::Number(n) = value {
+            self.total += n;
+            self.count += 1;
+            self.min = Some(self.min.map_or(*n, |m| m.min(*n)));
+            self.max = Some(self.max.map_or(*n, |m| m.max(*n)));
+        }
+    }
+
+    fn finish(self, aggregate: Aggregate) -> FnResult {
+        match aggregate {
+            Aggregate::Sum => Ok(Value::number(self.total)),
+            Aggregate::Average if self.count == 0 => Err(ErrorKind::Div0),
+            Aggregate::Average => Ok(Value::number(self.total / self.count as f64)),
+            Aggregate::Min => Ok(Value::Number(self.min.unwrap_or(0.0))),
+            Aggregate::Max => Ok(Value::Number(self.max.unwrap_or(0.0))),
+        }
+    }
+}
+
+/// Fold the target values at every position where all `conditions` hold.
+/// Positions past every stored area are blank on all sides and contribute
+/// nothing, so only the stored part is visited.
+fn fold_matches(target: &Grid<'_>, conditions: &[Condition<'_>], fold: &mut Fold) {
+    for (r, c, value) in target.cells() {
+        if conditions
+            .iter()
+            .all(|cond| cond.criterion.matches(cond.grid.get(r, c)))
+        {
+            fold.add(value);
+        }
+    }
+}
+
+/// `SUMIF` / `AVERAGEIF`: criteria range, criterion, optional value range.
+fn single(ctx: &Ctx<'_>, args: &[Expr], aggregate: Aggregate) -> FnResult {
+    arity(args, 2, 3)?;
+    let range = ctx.arg(&args[0]);
+    let cond = condition(ctx, &range, &args[1])?;
+    let values = match args.get(2) {
+        Some(expr) => resized(ctx.arg(expr), cond.grid.rows, cond.grid.cols),
+        None => range.clone(),
+    };
+    let target = ctx.grid(&values);
+    let mut fold = Fold::default();
+    fold_matches(&target, std::slice::from_ref(&cond), &mut fold);
+    fold.finish(aggregate)
+}
+
+pub(crate) fn sum_if(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    single(ctx, args, Aggregate::Sum)
+}
+
+pub(crate) fn average_if(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    single(ctx, args, Aggregate::Average)
+}
+
+/// `SUMIFS`, `AVERAGEIFS`, `MINIFS`, `MAXIFS`: value range first, then
+/// `(criteria_range, criterion)` pairs, all of one shape.
+pub(crate) fn ifs(ctx: &Ctx<'_>, args: &[Expr], aggregate: Aggregate) -> FnResult {
+    if args.len() < 3 || args.len() % 2 == 0 {
+        return Err(ErrorKind::Value);
+    }
+    let values = ctx.arg(&args[0]);
+    let ranges: Vec<Arg> = args[1..].iter().step_by(2).map(|e| ctx.arg(e)).collect();
+    let mut conditions = Vec::with_capacity(ranges.len());
+    for (range, criterion) in ranges.iter().zip(args[2..].iter().step_by(2)) {
+        conditions.push(condition(ctx, range, criterion)?);
+    }
+    let target = ctx.grid(&values);
+    if conditions
+        .iter()
+        .any(|cond| (cond.grid.rows, cond.grid.cols) != (target.rows, target.cols))
+    {
+        return Err(ErrorKind::Value);
+    }
+    let mut fold = Fold::default();
+    fold_matches(&target, &conditions, &mut fold);
+    fold.finish(aggregate)
+}
+
+/// Count the positions where every condition holds, including the blank
+/// tail past all stored areas when blanks satisfy every criterion.
+fn count_matches(conditions: &[Condition<'_>]) -> usize {
+    let (rows, cols) = (conditions[0].grid.rows, conditions[0].grid.cols);
+    let stored_rows = conditions
+        .iter()
+        .map(|c| c.grid.stored_rows())
+        .max()
+        .unwrap_or(0)
+        .min(rows);
+    let stored_cols = conditions
+        .iter()
+        .map(|c| c.grid.stored_cols())
+        .max()
+        .unwrap_or(0)
+        .min(cols);
+    let mut n = 0;
+    for r in 0..stored_rows {
+        for c in 0..stored_cols {
+            if conditions
+                .iter()
+                .all(|cond| cond.criterion.matches(cond.grid.get(r, c)))
+            {
+                n += 1;
+            }
+        }
+    }
+    if conditions
+        .iter()
+        .all(|cond| cond.criterion.matches(&Value::Empty))
+    {
+        n += rows * cols - stored_rows * stored_cols;
+    }
+    n
+}
+
+pub(crate) fn count_if(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    arity(args, 2, 2)?;
+    let range = ctx.arg(&args[0]);
+    let cond = condition(ctx, &range, &args[1])?;
+    Ok(Value::Number(
+        count_matches(std::slice::from_ref(&cond)) as f64
+    ))
+}
+
+pub(crate) fn count_ifs(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    if args.is_empty() || args.len() % 2 != 0 {
+        return Err(ErrorKind::Value);
+    }
+    let ranges: Vec<Arg> = args.iter().step_by(2).map(|e| ctx.arg(e)).collect();
+    let mut conditions = Vec::with_capacity(ranges.len());
+    for (range, criterion) in ranges.iter().zip(args[1..].iter().step_by(2)) {
+        conditions.push(condition(ctx, range, criterion)?);
+    }
+    let shape = (conditions[0].grid.rows, conditions[0].grid.cols);
+    if conditions
+        .iter()
+        .any(|cond| (cond.grid.rows, cond.grid.cols) != shape)
+    {
+        return Err(ErrorKind::Value);
+    }
+    Ok(Value::Number(count_matches(&conditions) as f64))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::{Criterion, Op};
+    use crate::calc::value::Value;
+
+    fn matches(criterion: Value, value: Value) -> bool {
+        Criterion::parse(&criterion).unwrap().matches(&value)
+    }
+
+    #[test]
+    fn parses_operators() {
+        assert_eq!(
+            Criterion::parse(&Value::Text(">=10".into())).unwrap(),
+            Criterion::Number(Op::Ge, 10.0)
+        );
+        assert_eq!(
+            Criterion::parse(&Value::Text("<>East".into())).unwrap(),
+            Criterion::Text(Op::Ne, "east".into())
+        );
+        assert_eq!(
+            Criterion::parse(&Value::Text("ap*".into())).unwrap(),
+            Criterion::Wildcard("ap*".into())
+        );
+    }
+
+    #[test]
+    fn numeric_criteria_skip_text() {
+        assert!(matches(Value::Text(">5".into()), Value::Number(6.0)));
+        assert!(!matches(Value::Text(">5".into()), Value::Text("6".into())));
+        assert!(matches(Value::Text("<>5".into()), Value::Text("x".into())));
+        assert!(matches(Value::Number(3.0), Value::Number(3.0)));
+    }
+
+    #[test]
+    fn text_criteria_are_case_insensitive() {
+        assert!(matches(
+            Value::Text("east".into()),
+            Value::Text("EAST".into())
+        ));
+        assert!(matches(Value::Text("100".into()), Value::Number(100.0)));
+        assert!(!matches(Value::Text("east".into()), Value::Empty));
+        assert!(matches(Value::Text("<>east".into()), Value::Empty));
+        assert!(!matches(Value::Text("*".into()), Value::Empty));
+    }
+}
@@ -0,0 +1,730 @@
+//! The workbook-level engine: cell storage, the formula dependency graph,
+//! and full / incremental / multi-scenario evaluation.
+
+use std::collections::{BTreeMap, HashMap, HashSet, VecDeque};
+use std::fmt;
+
+use crate::reference::col_letter;
+
+use super::ast::{parse_formula, CellAddr, Expr, RangeRef, Scope};
+use super::eval::Ctx;
+use super::store::Store;
+use super::value::Value;
+
+/// Why the engine cannot evaluate a workbook.
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub enum EngineError {
+    /// A formula uses something the engine does not implement.
+    Unsupported {
+        /// `Sheet!A1` of the formula cell.
+        cell: String,
+        /// What the parser rejected.
+        reason: String,
+    },
+    /// The formulas form a cycle.
+    Circular(String),
+}
+
+impl fmt::Display for EngineError {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        match self {
+            EngineError::Unsupported { cell, reason } => {
+                write!(f, "unsupported formula in {cell}: {reason}")
+            }
+            EngineError::Circular(message) => f.write_str(message),
+        }
+    }
+}
+
+impl std::error::Error for EngineError {}
+
+/// Outcome of [`Engine::recalculate`].
+#[derive(Debug, Clone, PartialEq)]
+pub struct Recalc {
+    /// Every recomputed formula cell with its old and new value, in
+    /// evaluation order.
+    pub affected: Vec<(CellAddr, Value, Value)>,
+    /// Longest dependency chain from the perturbed cells.
+    pub max_depth: usize,
+}
+
+#[derive(Debug)]
+struct Formula {
+    addr: CellAddr,
+    text: String,
+}
+
+/// Compiled formulas plus the edges between them. Dropped whenever the
+/// workbook's formulas or names change and rebuilt on next use.
+#[derive(Debug)]
+struct Graph {
+    exprs: Vec<Expr>,
+    /// Single-cell reference → formulas reading it.
+    cell_readers: HashMap<CellAddr, Vec<usize>>,
+    /// Per sheet: every range some formula reads, with that formula.
+    range_readers: Vec<Vec<(RangeRef, usize)>>,
+    /// Formula → formulas reading it, directly or through a range.
+    readers: Vec<Vec<usize>>,
+    /// Topological level of each formula.
+    levels: Vec<usize>,
+    /// Formulas by `(level, "Sheet!A1")`.
+    order: Vec<usize>,
+    /// Position of each formula in `order`.
+    rank: Vec<usize>,
+}
+
+/// Narrowest level [`Engine::run`] splits across threads; below this the
+/// thread start-up costs more than the evaluation it saves.
+const PARALLEL_MIN_LEVEL: usize = 512;
+
+/// Evaluate `batch` (formulas of one level) on up to `threads` scoped
+/// threads, returning the values in `batch` order.
+fn evaluate_parallel(store: &Store, exprs: &[Expr], batch: &[usize], threads: usize) -> Vec<Value> {
+    let chunk = batch.len().div_ceil(threads);
+    std::thread::scope(|scope| {
+        let handles: Vec<_> = batch
+            .chunks(chunk)
+            .map(|part| {
+                scope.spawn(move || {
+                    part.iter()
+                        .map(|&idx| Ctx { store }.eval(&exprs[idx]))
+                        .collect::<Vec<_>>()
+                })
+            })
+            .collect();
+        handles
+            .into_iter()
+            .flat_map(|handle| {
+                handle
+                    .join()
+                    .unwrap_or_else(|panic| std::panic::resume_unwind(panic))
+            })
+            .collect()
+    })
+}
+
+/// A workbook loaded for evaluation.
+///
+/// Sheets are added in workbook order and addressed by index; values and
+/// formulas are then set cell by cell. Formulas are compiled and the
+/// dependency graph built on the first evaluation.
+#[derive(Debug, Default)]
+pub struct Engine {
+    sheets: Vec<String>,
+    /// Lower-cased sheet name → index.
+    sheet_index: HashMap<String, u32>,
+    /// Upper-cased defined name → what it refers to.
+    names: HashMap<String, String>,
+    store: Store,
+    formulas: Vec<Formula>,
+    formula_at: HashMap<CellAddr, usize>,
+    graph: Option<Graph>,
+    /// Worker threads per wide level; 0 and 1 both evaluate serially.
+    threads: usize,
+}
+
+impl Engine {
+    pub fn new() -> Self {
+        Self::default()
+    }
+
+    /// Add a sheet, returning its index.
+    pub fn add_sheet(&mut self, name: &str) -> u32 {
+        let idx = self.sheets.len() as u32;
+        self.sheets.push(name.to_string());
+        self.sheet_index.insert(name.to_lowercase(), idx);
+        self.store.add_sheet();
+        self.graph = None;
+        idx
+    }
+
+    /// Register a workbook-level defined name.
+    pub fn define_name(&mut self, name: &str, refers_to: &str) {
+        self.names
+            .insert(name.to_uppercase(), refers_to.to_string());
+        self.graph = None;
+    }
+
+    /// Evaluate each dependency level wide enough to be worth it on up to
+    /// `threads` threads. Results are identical for every thread count.
+    pub fn set_threads(&mut self, threads: usize) {
+        self.threads = threads;
+    }
+
+    /// Set an input value.
+    pub fn set_value(&mut self, addr: CellAddr, value: Value) {
+        self.store.set(addr, value);
+    }
+
+    /// Set a formula (with its leading `=`).
+    pub fn set_formula(&mut self, addr: CellAddr, text: &str) {
+        let formula = Formula {
+            addr,
+            text: text.to_string(),
+        };
+        match self.formula_at.get(&addr) {
+            Some(&idx) => self.formulas[idx] = formula,
+            None => {
+                self.formula_at.insert(addr, self.formulas.len());
+                self.formulas.push(formula);
+            }
+        }
+        self.graph = None;
+    }
+
+    pub fn sheet_name(&self, sheet: u32) -> Option<&str> {
+        self.sheets.get(sheet as usize).map(String::as_str)
+    }
+
+    /// Index of a sheet by (case-insensitive) name.
+    pub fn sheet_index(&self, name: &str) -> Option<u32> {
+        self.sheet_index.get(&name.to_lowercase()).copied()
+    }
+
+    /// Canonical `Sheet!A1` for `addr`.
+    pub fn ref_string(&self, addr: &CellAddr) -> String {
+        format!(
+            "{}!{}{}",
+            self.sheet_name(addr.sheet).unwrap_or_default(),
+            col_letter(addr.col),
+            addr.row
+        )
+    }
+
+    pub fn formula_count(&self) -> usize {
+        self.formulas.len()
+    }
+
+    pub fn formula_text(&self, addr: &CellAddr) -> Option<&str> {
+        self.formula_at
+            .get(addr)
+            .map(|&idx| self.formulas[idx].text.as_str())
+    }
+
+    /// Current value of a cell.
+    pub fn value(&self, addr: &CellAddr) -> &Value {
+        self.store.get(addr)
+    }
+
+    /// Every formula the engine cannot evaluate, with the reason.
+    pub fn unsupported(&self) -> Vec<(CellAddr, String)> {
+        let names = &self.names;
+        self.formulas
+            .iter()
+            .filter_map(|formula| {
+                let scope = Scope {
+                    sheet: formula.addr.sheet,
+                    sheets: &self.sheet_index,
+                    names,
+                };
+                parse_formula(&formula.text, &scope)
+                    .err()
+                    .map(|reason| (formula.addr, reason))
+            })
+            .collect()
+    }
+
+    /// Evaluate every formula in dependency order, returning each formula
+    /// cell's value in that order.
+    pub fn calculate(&mut self) -> Result<Vec<(CellAddr, Value)>, EngineError> {
+        self.ensure_graph()?;
+        let order = self
+            .graph
+            .as_ref()
+            .expect("graph built above")
+            .order
+            .clone();
+        Ok(self
+            .run(&order)
+            .into_iter()
+            .map(|(addr, _, value)| (addr, value))
+            .collect())
+    }
+
+    /// Apply `changes` and recompute only the formulas reachable from them.
+    pub fn recalculate(&mut self, changes: &[(CellAddr, Value)]) -> Result<Recalc, EngineError> {
+        self.ensure_graph()?;
+        let roots: Vec<CellAddr> = changes.iter().map(|(addr, _)| *addr).collect();
+        let (order, max_depth) = self.dirty(&roots);
+        for (addr, value) in changes {
+            self.store.set(*addr, value.clone());
+        }
+        Ok(Recalc {
+            affected: self.run(&order),
+            max_depth,
+        })
+    }
+
+    /// Evaluate one scenario per row of `scenarios` (values for `inputs`,
+    /// column by column) and read `outputs` after each. `outputs` defaults
+    /// to the affected formula cells in evaluation order. Cell values are
+    /// restored afterwards.
+    pub fn evaluate_scenarios(
+        &mut self,
+        inputs: &[CellAddr],
+        scenarios: &[Vec<Value>],
+        outputs: Option<&[CellAddr]>,
+    ) -> Result<(Vec<CellAddr>, Vec<Vec<Value>>), EngineError> {
+        self.ensure_graph()?;
+        let (order, _) = self.dirty(inputs);
+        let graph = self.graph.as_ref().expect("graph built above");
+        let outputs: Vec<CellAddr> = match outputs {
+            Some(outputs) => outputs.to_vec(),
+            None => order.iter().map(|&idx| self.formulas[idx].addr).collect(),
+        };
+        let touched: Vec<CellAddr> = inputs
+            .iter()
+            .copied()
+            .chain(order.iter().map(|&idx| self.formulas[idx].addr))
+            .collect();
+        let saved: Vec<Value> = touched
+            .iter()
+            .map(|addr| self.store.get(addr).clone())
+            .collect();
+
+        let mut rows = Vec::with_capacity(scenarios.len());
+        for scenario in scenarios {
+            for (addr, value) in inputs.iter().zip(scenario) {
+                self.store.set(*addr, value.clone());
+            }
+            for &idx in &order {
+                let value = Ctx { store: &self.store }.eval(&graph.exprs[idx]);
+                self.store.set(self.formulas[idx].addr, value);
+            }
+            rows.push(
+                outputs
+                    .iter()
+                    .map(|addr| self.store.get(addr).clone())
+                    .collect(),
+            );
+        }
+        for (addr, value) in touched.into_iter().zip(saved) {
+            self.store.set(addr, value);
+        }
+        Ok((outputs, rows))
+    }
+
+    /// Evaluate the formulas in `order` (ascending by level) into the
+    /// store, returning each address with its previous and new value.
+    ///
+    /// Formulas on one level never read each other, so a level of at
+    /// least [`PARALLEL_MIN_LEVEL`] formulas is split across scoped
+    /// threads evaluating against the same read-only store. Values are
+    /// written back in `order` once the level is done.
+    fn run(&mut self, order: &[usize]) -> Vec<(CellAddr, Value, Value)> {
+        let graph = self.graph.as_ref().expect("graph built before use");
+        let mut out = Vec::with_capacity(order.len());
+        let mut start = 0;
+        while start < order.len() {
+            let level = graph.levels[order[start]];
+            let width = order[start..]
+                .iter()
+                .take_while(|&&idx| graph.levels[idx] == level)
+                .count();
+            let batch = &order[start..start + width];
+            if self.threads > 1 && batch.len() >= PARALLEL_MIN_LEVEL {
+                let values = evaluate_parallel(&self.store, &graph.exprs, batch, self.threads);
+                for (&idx, value) in batch.iter().zip(values) {
+                    let addr = self.formulas[idx].addr;
+                    let old = self.store.set(addr, value.clone());
+                    out.push((addr, old, value));
+                }
+            } else {
+                for &idx in batch {
+                    let value = Ctx { store: &self.store }.eval(&graph.exprs[idx]);
+                    let addr = self.formulas[idx].addr;
+                    let old = self.store.set(addr, value.clone());
+                    out.push((addr, old, value));
+                }
+            }
+            start += width;
+        }
+        out
+    }
+
+    // ------------------------------------------------------------------
+    // Graph
+    // ------------------------------------------------------------------
+
+    fn ensure_graph(&mut self) -> Result<(), EngineError> {
+        if self.graph.is_none() {
+            self.graph = Some(self.build_graph()?);
+        }
+        Ok(())
+    }
+
+    fn build_graph(&self) -> Result<Graph, EngineError> {
+        let n = self.formulas.len();
+        let mut exprs = Vec::with_capacity(n);
+        let mut cell_readers: HashMap<CellAddr, Vec<usize>> = HashMap::new();
+        let mut range_readers: Vec<Vec<(RangeRef, usize)>> = vec![Vec::new(); self.sheets.len()];
+        let mut ranges_of: Vec<Vec<RangeRef>> = Vec::with_capacity(n);
+        for (idx, formula) in self.formulas.iter().enumerate() {
+            let scope = Scope {
+                sheet: formula.addr.sheet,
+                sheets: &self.sheet_index,
+                names: &self.names,
+            };
+            let expr = parse_formula(&formula.text, &scope).map_err(|reason| {
+                EngineError::Unsupported {
+                    cell: self.ref_string(&formula.addr),
+                    reason,
+                }
+            })?;
+            let (mut cells, mut ranges) = (Vec::new(), Vec::new());
+            expr.visit_refs(&mut cells, &mut ranges);
+            cells.sort_unstable();
+            cells.dedup();
+            for cell in cells {
+                cell_readers.entry(cell).or_default().push(idx);
+            }
+            for range in &ranges {
+                if let Some(list) = range_readers.get_mut(range.sheet as usize) {
+                    list.push((*range, idx));
+                }
+            }
+            ranges_of.push(ranges);
+            exprs.push(expr);
+        }
+
+        // Formula → formula edges. Ranges are matched against the formula
+        // cells they cover, never expanded cell by cell.
+        let mut by_column: Vec<BTreeMap<(u32, u32), usize>> =
+            vec![BTreeMap::new(); self.sheets.len()];
+        for (idx, formula) in self.formulas.iter().enumerate() {
+            if let Some(grid) = by_column.get_mut(formula.addr.sheet as usize) {
+                grid.insert((formula.addr.col, formula.addr.row), idx);
+            }
+        }
+        let mut readers: Vec<Vec<usize>> = vec![Vec::new(); n];
+        for (idx, formula) in self.formulas.iter().enumerate() {
+            if let Some(list) = cell_readers.get(&formula.addr) {
+                readers[idx].extend(list);
+            }
+        }
+        for (reader, ranges) in ranges_of.iter().enumerate() {
+            for range in ranges {
+                let Some(grid) = by_column.get(range.sheet as usize) else {
+                    continue;
+                };
+                let span = grid
+                    .range((range.first_col, range.first_row)..=(range.last_col, range.last_row));
+                for (&(_, row), &idx) in span {
+                    if (range.first_row..=range.last_row).contains(&row) {
+                        readers[idx].push(reader);
+                    }
+                }
+            }
+        }
+        for list in &mut readers {
+            list.sort_unstable();
+            list.dedup();
+        }
+
+        let levels = self.levels(&readers)?;
+        let keys: Vec<String> = self
+            .formulas
+            .iter()
+            .map(|formula| self.ref_string(&formula.addr))
+            .collect();
+        let mut order: Vec<usize> = (0..n).collect();
+        order.sort_by(|&a, &b| {
+            levels[a]
+                .cmp(&levels[b])
+                .then_with(|| keys[a].cmp(&keys[b]))
+        });
+        let mut rank = vec![0; n];
+        for (pos, &idx) in order.iter().enumerate() {
+            rank[idx] = pos;
+        }
+
+        Ok(Graph {
+            exprs,
+            cell_readers,
+            range_readers,
+            readers,
+            levels,
+            order,
+            rank,
+        })
+    }
+
+    /// Kahn's algorithm: level 0 formulas read no formula cells, every
+    /// other formula sits one above its highest formula precedent.
+    fn levels(&self, readers: &[Vec<usize>]) -> Result<Vec<usize>, EngineError> {
+        let n = readers.len();
+        let mut in_degree = vec![0usize; n];
+        for list in readers {
+            for &dep in list {
+                in_degree[dep] += 1;
+            }
+        }
+        let mut levels = vec![0usize; n];
+        let mut queue: VecDeque<usize> = (0..n).filter(|&i| in_degree[i] == 0).collect();
+        let mut done = 0;
+        while let Some(idx) = queue.pop_front() {
+            done += 1;
+            for &dep in &readers[idx] {
+                levels[dep] = levels[dep].max(levels[idx] + 1);
+                in_degree[dep] -= 1;
+                if in_degree[dep] == 0 {
+                    queue.push_back(dep);
+                }
+            }
+        }
+        if done != n {
+            let mut missing: Vec<String> = (0..n)
+                .filter(|&i| in_degree[i] > 0)
+                .map(|i| self.ref_string(&self.formulas[i].addr))
+                .collect();
+            missing.sort();
+            return Err(EngineError::Circular(format!(
+                "Circular reference detected involving: {{{}}}",
+                missing.join(", ")
+            )));
+        }
+        Ok(levels)
+    }
+
+    /// Formulas reading `addr`, directly or through a range.
+    fn readers_of(&self, graph: &Graph, addr: &CellAddr) -> Vec<usize> {
+        if let Some(&idx) = self.formula_at.get(addr) {
+            return graph.readers[idx].clone();
+        }
+        let mut found: Vec<usize> = graph.cell_readers.get(addr).cloned().unwrap_or_default();
+        if let Some(ranges) = graph.range_readers.get(addr.sheet as usize) {
+            found.extend(
+                ranges
+                    .iter()
+                    .filter(|(range, _)| range.contains(addr))
+                    .map(|(_, idx)| *idx),
+            );
+        }
+        found
+    }
+
+    /// Formulas reachable from `roots` in evaluation order, excluding the
+    /// roots themselves, plus the longest chain from any root.
+    fn dirty(&self, roots: &[CellAddr]) -> (Vec<usize>, usize) {
+        let graph = self.graph.as_ref().expect("graph built before use");
+        let root_formulas: HashSet<usize> = roots
+            .iter()
+            .filter_map(|addr| self.formula_at.get(addr).copied())
+            .collect();
+        let mut visited: HashSet<usize> = root_formulas.clone();
+        let mut affected: HashSet<usize> = HashSet::new();
+        let mut queue: VecDeque<usize> = VecDeque::new();
+        // Perturbed cells sit at depth 0; readers of plain inputs at 1.
+        let mut depth: HashMap<usize, usize> = root_formulas.iter().map(|&idx| (idx, 0)).collect();
+        let mut max_depth = 0;
+        for addr in roots {
+            let is_input = !self.formula_at.contains_key(addr);
+            for idx in self.readers_of(graph, addr) {
+                affected.insert(idx);
+                if is_input {
+                    let d = depth.entry(idx).or_insert(0);
+                    *d = (*d).max(1);
+                    max_depth = 1;
+                }
+                if visited.insert(idx) {
+                    queue.push_back(idx);
+                }
+            }
+        }
+        while let Some(idx) = queue.pop_front() {
+            for &dep in &graph.readers[idx] {
+                affected.insert(dep);
+                if visited.insert(dep) {
+                    queue.push_back(dep);
+                }
+            }
+        }
+
+        let mut walk: Vec<usize> = visited.into_iter().collect();
+        walk.sort_by_key(|&idx| graph.rank[idx]);
+        for &idx in &walk {
+            let next = depth.get(&idx).copied().unwrap_or(0) + 1;
+            for &dep in &graph.readers[idx] {
+                let d = depth.entry(dep).or_insert(0);
+                if next > *d {
+                    *d = next;
+                    max_depth = max_depth.max(next);
+                }
+            }
+        }
+        walk.retain(|idx| affected.contains(idx) && !root_formulas.contains(idx));
+        (walk, max_depth)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::{Engine, EngineError};
+    use crate::calc::ast::CellAddr;
+    use crate::calc::value::{ErrorKind, Value};
+
+    fn at(row: u32, col: u32) -> CellAddr {
+        CellAddr { sheet: 0, row, col }
+    }
+
+    fn engine(cells: &[(u32, u32, &str)]) -> Engine {
+        let mut engine = Engine::new();
+        engine.add_sheet("Sheet1");
+        for &(row, col, text) in cells {
+            if text.starts_with('=') {
+                engine.set_formula(at(row, col), text);
+            } else if let Ok(n) = text.parse() {
+                engine.set_value(at(row, col), Value::Number(n));
+            } else {
+                engine.set_value(at(row, col), Value::Text(text.to_string()));
+            }
+        }
+        engine
+    }
+
+    fn num(n: f64) -> Value {
+        Value::Number(n)
+    }
+
+    #[test]
+    fn calculates_in_dependency_order() {
+        let mut e = engine(&[
+            (1, 1, "10"),
+            (2, 1, "20"),
+            (3, 1, "=SUM(A1:A2)"),
+            (4, 1, "=A3*2"),
+            (1, 2, "=A4+A3"),
+        ]);
+        let results = e.calculate().unwrap();
+        let refs: Vec<String> = results.iter().map(|(a, _)| e.ref_string(a)).collect();
+        assert_eq!(refs, ["Sheet1!A3", "Sheet1!A4", "Sheet1!B1"]);
+        assert_eq!(e.value(&at(1, 2)), &num(90.0));
+    }
+
+    #[test]
+    fn recalculates_only_reachable_formulas() {
+        let mut e = engine(&[
+            (1, 1, "1"),
+            (2, 1, "2"),
+            (1, 2, "=A1*10"),
+            (2, 2, "=A2*10"),
+            (3, 2, "=B1+1"),
+        ]);
+        e.calculate().unwrap();
+        let recalc = e.recalculate(&[(at(1, 1), num(5.0))]).unwrap();
+        let changed: Vec<(String, Value)> = recalc
+            .affected
+            .iter()
+            .map(|(a, _, new)| (e.ref_string(a), new.clone()))
+            .collect();
+        assert_eq!(
+            changed,
+            [
+                ("Sheet1!B1".to_string(), num(50.0)),
+                ("Sheet1!B3".to_string(), num(51.0))
+            ]
+        );
+        assert_eq!(recalc.max_depth, 2);
+        assert_eq!(recalc.affected[0].1, num(10.0));
+    }
+
+    #[test]
+    fn range_readers_see_changes() {
+        let mut e = engine(&[(1, 1, "1"), (5, 1, "2"), (1, 2, "=SUM(A:A)")]);
+        e.calculate().unwrap();
+        let recalc = e.recalculate(&[(at(100, 1), num(7.0))]).unwrap();
+        assert_eq!(recalc.affected[0].2, num(10.0));
+    }
+
+    #[test]
+    fn scenarios_leave_values_untouched() {
+        let mut e = engine(&[(1, 1, "1"), (1, 2, "=A1*2"), (1, 3, "=B1+1")]);
+        e.calculate().unwrap();
+        let (outputs, rows) = e
+            .evaluate_scenarios(&[at(1, 1)], &[vec![num(2.0)], vec![num(3.0)]], None)
+            .unwrap();
+        assert_eq!(outputs, [at(1, 2), at(1, 3)]);
+        assert_eq!(rows, [vec![num(4.0), num(5.0)], vec![num(6.0), num(7.0)]]);
+        assert_eq!(e.value(&at(1, 3)), &num(3.0));
+    }
+
+    #[test]
+    fn cycles_are_reported() {
+        let mut e = engine(&[(1, 1, "=B1"), (1, 2, "=A1")]);
+        match e.calculate() {
+            Err(EngineError::Circular(message)) => {
+                assert!(message.starts_with("Circular reference detected"))
+            }
+            other => panic!("expected a cycle, got {other:?}"),
+        }
+    }
+
+    #[test]
+    fn unsupported_formulas_are_listed() {
+        let e = engine(&[(1, 1, "=TODAY()"), (1, 2, "=1+1")]);
+        let unsupported = e.unsupported();
+        assert_eq!(unsupported.len(), 1);
+        assert_eq!(unsupported[0].0, at(1, 1));
+    }
+
+    #[test]
+    fn functions_end_to_end() {
+        let mut e = engine(&[
+            (1, 1, "East"),
+            (2, 1, "West"),
+            (3, 1, "East"),
+            (1, 2, "10"),
+            (2, 2, "20"),
+            (3, 2, "30"),
+            (1, 3, "=SUMIF(A1:A3,\"east\",B1:B3)"),
+            (2, 3, "=COUNTIFS(A1:A3,\"East\",B1:B3,\">15\")"),
+            (3, 3, "=VLOOKUP(\"West\",A1:B3,2,FALSE)"),
+            (4, 3, "=INDEX(B1:B3,MATCH(30,B1:B3,0))"),
+            (5, 3, "=IFERROR(1/0,\"none\")"),
+            (6, 3, "=XLOOKUP(\"North\",A1:A3,B1:B3)"),
+            (7, 3, "=DATE(2024,1,15)"),
+            (8, 3, "=ROUND(2.5,0)&\"-\"&LEFT(A1,2)"),
+        ]);
+        e.calculate().unwrap();
+        assert_eq!(e.value(&at(1, 3)), &num(40.0));
+        assert_eq!(e.value(&at(2, 3)), &num(1.0));
+        assert_eq!(e.value(&at(3, 3)), &num(20.0));
+        assert_eq!(e.value(&at(4, 3)), &num(30.0));
+        assert_eq!(e.value(&at(5, 3)), &Value::Text("none".into()));
+        assert_eq!(e.value(&at(6, 3)), &Value::Error(ErrorKind::NA));
+        assert_eq!(e.value(&at(7, 3)), &num(45306.0));
+        assert_eq!(e.value(&at(8, 3)), &Value::Text("3-Ea".into()));
+    }
+
+    #[test]
+    fn defined_names_expand() {
+        let mut e = engine(&[(1, 1, "4"), (2, 1, "6"), (1, 2, "=SUM(Inputs)")]);
+        e.define_name("Inputs", "Sheet1!$A$1:$A$2");
+        e.calculate().unwrap();
+        assert_eq!(e.value(&at(1, 2)), &num(10.0));
+    }
+
+    #[test]
+    fn parallel_levels_match_serial() {
+        let wide = |threads: usize| {
+            let mut e = Engine::new();
+            e.add_sheet("Sheet1");
+            e.set_threads(threads);
+            for row in 1..=2000 {
+                e.set_value(at(row, 1), num(row as f64));
+                e.set_formula(at(row, 2), &format!("=A{row}*2+SUM(A1:A10)"));
+                e.set_formula(at(row, 3), &format!("=IF(B{row}>1000,\"big\",B{row}+1)"));
+            }
+            e.set_formula(at(1, 4), "=SUM(B1:B2000)");
+            e
+        };
+        let (mut serial, mut parallel) = (wide(1), wide(4));
+        assert_eq!(parallel.calculate().unwrap(), serial.calculate().unwrap());
+        let change = [(at(5, 1), num(-7.0))];
+        assert_eq!(
+            parallel.recalculate(&change).unwrap(),
+            serial.recalculate(&change).unwrap()
+        );
+        assert_eq!(parallel.value(&at(1, 4)), serial.value(&at(1, 4)));
+    }
+}
@@ -0,0 +1,113 @@
+//! Expression evaluation against a [`Store`].
+
+use super::ast::{BinaryOp, Expr, UnaryOp};
+use super::functions::{call, Arg};
+use super::store::{Grid, Store};
+use super::value::{compare, ErrorKind, Value};
+
+/// Evaluation context: the cell values formulas read.
+pub(crate) struct Ctx<'a> {
+    pub store: &'a Store,
+}
+
+impl<'a> Ctx<'a> {
+    /// Evaluate `expr` to a single value. A multi-cell range in scalar
+    /// position is `#VALUE!`.
+    pub fn eval(&self, expr: &Expr) -> Value {
+        match expr {
+            Expr::Number(n) => Value::Number(*n),
+            Expr::Text(s) => Value::Text(s.clone()),
+            Expr::Bool(b) => Value::Bool(*b),
+            Expr::Error(e) => Value::Error(*e),
+            Expr::Missing => Value::Empty,
+            Expr::Cell(addr) => self.store.get(addr).clone(),
+            Expr::Range(_) | Expr::Call(..) => self.scalar(self.arg(expr)),
+            Expr::Unary(op, operand) => match self.eval(operand).to_number() {
+                Ok(n) => Value::number(match op {
+                    UnaryOp::Neg => -n,
+                    UnaryOp::Percent => n / 100.0,
+                }),
+                Err(e) => Value::Error(e),
+            },
+            Expr::Binary(op, left, right) => binary(*op, self.eval(left), self.eval(right)),
+        }
+    }
+
+    /// Evaluate a function argument, keeping ranges as references.
+    pub fn arg(&self, expr: &Expr) -> Arg {
+        match expr {
+            Expr::Range(range) => Arg::Range(*range),
+            Expr::Call(func, args) => call(self, *func, args),
+            _ => Arg::Value(self.eval(expr)),
+        }
+    }
+
+    /// The value of an argument in scalar position.
+    pub fn scalar(&self, arg: Arg) -> Value {
+        match arg {
+            Arg::Value(value) => value,
+            Arg::Range(range) => match range.single() {
+                Some(addr) => self.store.get(&addr).clone(),
+                None => Value::Error(ErrorKind::Value),
+            },
+        }
+    }
+
+    /// Positional view of an argument; scalars are a 1x1 grid.
+    pub fn grid<'g>(&'g self, arg: &'g Arg) -> Grid<'g> {
+        match arg {
+            Arg::Range(range) => self.store.grid(range),
+            Arg::Value(value) => Grid::single(value),
+        }
+    }
+}
+
+fn binary(op: BinaryOp, left: Value, right: Value) -> Value {
+    if let Value::Error(e) = left {
+        return Value::Error(e);
+    }
+    if let Value::Error(e) = right {
+        return Value::Error(e);
+    }
+    let ordering = || compare(&left, &right);
+    match op {
+        BinaryOp::Concat => match (left.to_text(), right.to_text()) {
+            (Ok(a), Ok(b)) => Value::Text(a + &b),
+            (Err(e), _) | (_, Err(e)) => Value::Error(e),
+        },
+        BinaryOp::Eq => Value::Bool(ordering().is_eq()),
+        BinaryOp::Ne => Value::Bool(ordering().is_ne()),
+        BinaryOp::Lt => Value::Bool(ordering().is_lt()),
+        BinaryOp::Le => Value::Bool(ordering().is_le()),
+        BinaryOp::Gt => Value::Bool(ordering().is_gt()),
+        BinaryOp::Ge => Value::Bool(ordering().is_ge()),
+        _ => {
+            let (a, b) = match (left.to_number(), right.to_number()) {
+                (Ok(a), Ok(b)) => (a, b),
+                (Err(e), _) | (_, Err(e)) => return Value::Error(e),
+            };
+            match op {
+                BinaryOp::Add => Value::number(a + b),
+                BinaryOp::Sub => Value::number(a - b),
+                BinaryOp::Mul => Value::number(a * b),
+                BinaryOp::Div if b == 0.0 => Value::Error(ErrorKind::Div0),
+                BinaryOp::Div => Value::number(a / b),
+                _ => power(a, b),
+            }
+        }
+    }
+}
+
+/// `a ^ b` with Excel's error cases.
+pub(crate) fn power(a: f64, b: f64) -> Value {
+    if a == 0.0 && b == 0.0 {
+        return Value::Error(ErrorKind::Num);
+    }
+    if a == 0.0 && b < 0.0 {
+        return Value::Error(ErrorKind::Div0);
+    }
+    if a < 0.0 && b.fract() != 0.0 {
+        return Value::Error(ErrorKind::Num);
+    }
+    Value::number(a.powf(b))
+}
@@ -0,0 +1,357 @@
+//! Financial and date/time functions.
+//!
+//! Dates are Excel serial numbers in the 1900 system, including the Lotus
+//! 1-2-3 phantom 1900-02-29 at serial 60, exactly as the Python evaluator
+//! computes them.
+
+use super::ast::Expr;
+use super::eval::Ctx;
+use super::functions::{arity, for_each_number, number, number_or, round_half_away, FnResult};
+use super::value::{ErrorKind, Value};
+
+// ---------------------------------------------------------------------------
+// Financial
+// ---------------------------------------------------------------------------
+
+/// The `rate, nper, x, [y], [type]` arguments PV / FV / PMT share.
+fn annuity_args(ctx: &Ctx<'_>, args: &[Expr]) -> Result<(f64, f64, f64, f64, f64), ErrorKind> {
+    arity(args, 3, 5)?;
+    Ok((
+        number(ctx, &args[0])?,
+        number(ctx, &args[1])?,
+        number(ctx, &args[2])?,
+        number_or(ctx, args, 3, 0.0)?,
+        number_or(ctx, args, 4, 0.0)?.trunc(),
+    ))
+}
+
+pub(crate) fn pv(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    let (rate, nper, pmt, fv, kind) = annuity_args(ctx, args)?;
+    if rate == 0.0 {
+        return Ok(Value::number(-(fv + pmt * nper)));
+    }
+    let annuity = pmt * (1.0 + rate * kind) * (1.0 - (1.0 + rate).powf(-nper)) / rate;
+    Ok(Value::number(-(annuity + fv / (1.0 + rate).powf(nper))))
+}
+
+pub(crate) fn fv(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    let (rate, nper, pmt, pv, kind) = annuity_args(ctx, args)?;
+    if rate == 0.0 {
+        return Ok(Value::number(-(pv + pmt * nper)));
+    }
+    let growth = (1.0 + rate).powf(nper);
+    let annuity = pmt * (1.0 + rate * kind) * (growth - 1.0) / rate;
+    Ok(Value::number(-(pv * growth + annuity)))
+}
+
+pub(crate) fn pmt(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    let (rate, nper, pv, fv, kind) = annuity_args(ctx, args)?;
+    if rate == 0.0 {
+        if nper == 0.0 {
+            return Err(ErrorKind::Div0);
+        }
+        return Ok(Value::number(-(pv + fv) / nper));
+    }
+    let pvif = (1.0 + rate).powf(nper);
+    Ok(Value::number(
+        -(rate * (pv * pvif + fv)) / (pvif - 1.0) / (1.0 + rate * kind),
+    ))
+}
+
+pub(crate) fn npv(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    arity(args, 2, usize::MAX)?;
+    let rate = number(ctx, &args[0])?;
+    let mut total = 0.0;
+    let mut period = 0;
+    for_each_number(ctx, &args[1..], |v| {
+        period += 1;
+        total += v / (1.0 + rate).powi(period);
+    })?;
+    Ok(Value::number(total))
+}
+
+/// Newton-Raphson from `guess`, then bisection over `[-0.999, 10]`.
+pub(crate) fn irr(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    arity(args, 1, 2)?;
+    let mut flows = Vec::new();
+    for_each_number(ctx, &args[..1], |v| flows.push(v))?;
+    let guess = number_or(ctx, args, 1, 0.1)?;
+    if flows.len() < 2 || !flows.iter().any(|v| *v > 0.0) || !flows.iter().any(|v| *v < 0.0) {
+        return Err(ErrorKind::Num);
+    }
+    let npv = |rate: f64| -> f64 {
+        flows
+            .iter()
+            .enumerate()
+            .map(|(i, v)| v / (1.0 + rate).powi(i as i32))
+            .sum()
+    };
+    let slope = |rate: f64| -> f64 {
+        flows
+            .iter()
+            .enumerate()
+            .map(|(i, v)| -(i as f64) * v / (1.0 + rate).powi(i as i32 + 1))
+            .sum()
+    };
+
+    let mut rate = guess;
+    for _ in 0..100 {
+        let value = npv(rate);
+        if value.abs() < 1e-10 {
+            return Ok(Value::number(rate));
+        }
+        let d = slope(rate);
+        if d.abs() < 1e-14 {
+            break;
+        }
+        let next = rate - value / d;
+        if (next - rate).abs() < 1e-10 {
+            return Ok(Value::number(next));
+        }
+        rate = next;
+    }
+
+    let (mut lo, mut hi) = (-0.999, 10.0);
+    if npv(lo) * npv(hi) > 0.0 {
+        return Err(ErrorKind::Num);
+    }
+    for _ in 0..200 {
+        let mid = (lo + hi) / 2.0;
+        if npv(mid).abs() < 1e-10 || hi - lo < 1e-12 {
+            return Ok(Value::number(mid));
+        }
+        if npv(lo) * npv(mid) < 0.0 {
+            hi = mid;
+        } else {
+            lo = mid;
+        }
+    }
+    Err(ErrorKind::Num)
+}
+
+pub(crate) fn sln(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    arity(args, 3, 3)?;
+    let cost = number(ctx, &args[0])?;
+    let salvage = number(ctx, &args[1])?;
+    let life = number(ctx, &args[2])?;
+    if life == 0.0 {
+        return Err(ErrorKind::Div0);
+    }
+    Ok(Value::number((cost - salvage) / life))
+}
+
+pub(crate) fn db(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    arity(args, 4, 5)?;
+    let cost = number(ctx, &args[0])?;
+    let salvage = number(ctx, &args[1])?;
+    let life = number(ctx, &args[2])?.trunc();
+    let period = number(ctx, &args[3])?.trunc();
+    let month = number_or(ctx, args, 4, 12.0)?.trunc();
+    if life <= 0.0 || period <= 0.0 {
+        return Err(ErrorKind::Num);
+    }
+    if cost <= 0.0 {
+        return Ok(Value::Number(0.0));
+    }
+    // Excel rounds the rate to three decimals.
+    let rate = round_half_away(1.0 - (salvage / cost).powf(1.0 / life), 3);
+    let mut book = cost;
+    let mut depreciation = 0.0;
+    for year in 1..=period as u32 {
+        depreciation = if year == 1 {
+            cost * rate * month / 12.0
+        } else if f64::from(year) == life + 1.0 {
+            book * rate * (12.0 - month) / 12.0
+        } else {
+            book * rate
+        };
+        book -= depreciation;
+    }
+    Ok(Value::number(depreciation))
+}
+
+// ---------------------------------------------------------------------------
+// Date serials
+// ---------------------------------------------------------------------------
+
+/// The phantom 1900-02-29.
+const LOTUS_BUG_SERIAL: i64 = 60;
+/// Days from 0000-03-01 (proleptic Gregorian) to 1899-12-31, serial 0.
+const EPOCH_DAYS: i64 = 693_900;
+/// Largest serial Excel accepts (9999-12-31).
+const MAX_SERIAL: i64 = 2_958_465;
+
+/// Days since 0000-03-01 for a proleptic Gregorian date.
+fn days_from_civil(year: i64, month: i64, day: i64) -> i64 {
+    let y = if month <= 2 { year - 1 } else { year };
+    let era = y.div_euclid(400);
+    let yoe = y - era * 400;
+    let mp = (month + 9) % 12;
+    let doy = (153 * mp + 2) / 5 + day - 1;
+    let doe = yoe * 365 + yoe / 4 - yoe / 100 + doy;
+    era * 146_097 + doe
+}
+
+/// Inverse of [`days_from_civil`].
+fn civil_from_days(days: i64) -> (i64, i64, i64) {
+    let era = days.div_euclid(146_097);
+    let doe = days - era * 146_097;
+    let yoe = (doe - doe / 1460 + doe / 36_524 - doe / 146_096) / 365;
+    let doy = doe - (365 * yoe + yoe / 4 - yoe / 100);
+    let mp = (5 * doy + 2) / 153;
+    let day = doy - (153 * mp + 2) / 5 + 1;
+    let month = if mp < 10 { mp + 3 } else { mp - 9 };
+    let year = yoe + era * 400 + i64::from(month <= 2);
+    (year, month, day)
+}
+
+fn days_in_month(year: i64, month: i64) -> i64 {
+    let (ny, nm) = if month == 12 {
+        (year + 1, 1)
+    } else {
+        (year, month + 1)
+    };
+    days_from_civil(ny, nm, 1) - days_from_civil(year, month, 1)
+}
+
+/// `(year, month, day)` → serial; month overflow rolls into the year.
+fn serial_from_date(year: i64, month: i64, day: i64) -> i64 {
+    let year = year + (month - 1).div_euclid(12);
+    let month = (month - 1).rem_euclid(12) + 1;
+    let serial = days_from_civil(year, month, day) - EPOCH_DAYS;
+    if serial >= LOTUS_BUG_SERIAL {
+        serial + 1
+    } else {
+        serial
+    }
+}
+
+fn date_from_serial(serial: i64) -> (i64, i64, i64) {
+    if serial == LOTUS_BUG_SERIAL {
+        return (1900, 2, 29);
+    }
+    let adjusted = if serial > LOTUS_BUG_SERIAL {
+        serial - 1
+    } else {
+        serial
+    };
+    civil_from_days(adjusted + EPOCH_DAYS)
+}
+
+/// A date argument as a whole serial; `#NUM!` outside Excel's calendar.
+fn serial_arg(ctx: &Ctx<'_>, expr: &Expr) -> Result<i64, ErrorKind> {
+    let serial = number(ctx, expr)?.trunc();
+    if !(0.0..=MAX_SERIAL as f64).contains(&serial) {
+        return Err(ErrorKind::Num);
+    }
+    Ok(serial as i64)
+}
+
+fn checked_serial(serial: i64) -> FnResult {
+    if (1..=MAX_SERIAL).contains(&serial) {
+        Ok(Value::Number(serial as f64))
+    } else {
+        Err(ErrorKind::Num)
+    }
+}
+
+/// `DATE(year, month, day)`: years below 1900 are offsets from 1900, and
+/// out-of-range months and days roll over as in Excel.
+pub(crate) fn date(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    arity(args, 3, 3)?;
+    let mut year = number(ctx, &args[0])?.trunc();
+    let month = number(ctx, &args[1])?.trunc();
+    let day = number(ctx, &args[2])?.trunc();
+    if !(0.0..10_000.0).contains(&year) || month.abs() > 1e6 || day.abs() > 1e8 {
+        return Err(ErrorKind::Num);
+    }
+    if year < 1900.0 {
+        year += 1900.0;
+    }
+    checked_serial(serial_from_date(year as i64, month as i64, 1) + day as i64 - 1)
+}
+
+#[derive(Debug, Clone, Copy)]
+pub(crate) enum DatePart {
+    Year,
+    Month,
+    Day,
+}
+
+pub(crate) fn date_part(ctx: &Ctx<'_>, args: &[Expr], part: DatePart) -> FnResult {
+    arity(args, 1, 1)?;
+    let (year, month, day) = date_from_serial(serial_arg(ctx, &args[0])?);
+    Ok(Value::Number(match part {
+        DatePart::Year => year,
+        DatePart::Month => month,
+        DatePart::Day => day,
+    } as f64))
+}
+
+/// `EDATE` (day clamped to the target month) or `EOMONTH` (`eomonth`).
+pub(crate) fn edate(ctx: &Ctx<'_>, args: &[Expr], eomonth: bool) -> FnResult {
+    arity(args, 2, 2)?;
+    let start = serial_arg(ctx, &args[0])?;
+    let months = number(ctx, &args[1])?.trunc();
+    if months.abs() > 120_000.0 {
+        return Err(ErrorKind::Num);
+    }
+    let (year, month, day) = date_from_serial(start);
+    let total = month - 1 + months as i64;
+    let (year, month) = (year + total.div_euclid(12), total.rem_euclid(12) + 1);
+    let last = days_in_month(year, month);
+    let day = if eomonth { last } else { day.min(last) };
+    checked_serial(serial_from_date(year, month, day))
+}
+
+pub(crate) fn days(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    arity(args, 2, 2)?;
+    let end = serial_arg(ctx, &args[0])?;
+    let start = serial_arg(ctx, &args[1])?;
+    Ok(Value::Number((end - start) as f64))
+}
+
+#[derive(Debug, Clone, Copy)]
+pub(crate) enum TimePart {
+    Hour,
+    Minute,
+    Second,
+}
+
+/// `HOUR` / `MINUTE` / `SECOND` of a serial's fractional day, rounded to
+/// the nearest second.
+pub(crate) fn time_part(ctx: &Ctx<'_>, args: &[Expr], part: TimePart) -> FnResult {
+    arity(args, 1, 1)?;
+    let serial = number(ctx, &args[0])?;
+    if serial < 0.0 {
+        return Err(ErrorKind::Num);
+    }
+    let seconds = (serial.fract() * 86_400.0).round() as i64 % 86_400;
+    Ok(Value::Number(match part {
+        TimePart::Hour => seconds / 3600,
+        TimePart::Minute => seconds % 3600 / 60,
+        TimePart::Second => seconds % 60,
+    } as f64))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::{date_from_serial, serial_from_date};
+
+    #[test]
+    fn serials_match_excel() {
+        assert_eq!(serial_from_date(1900, 1, 1), 1);
+        assert_eq!(serial_from_date(1900, 2, 28), 59);
+        assert_eq!(serial_from_date(1900, 3, 1), 61);
+        assert_eq!(serial_from_date(2024, 1, 15), 45306);
+        assert_eq!(serial_from_date(2020, 14, 1), serial_from_date(2021, 2, 1));
+    }
+
+    #[test]
+    fn serials_round_trip() {
+        assert_eq!(date_from_serial(60), (1900, 2, 29));
+        assert_eq!(date_from_serial(61), (1900, 3, 1));
+        assert_eq!(date_from_serial(45306), (2024, 1, 15));
+        assert_eq!(date_from_serial(1), (1900, 1, 1));
+    }
+}
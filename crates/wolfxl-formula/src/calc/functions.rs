@@ -0,0 +1,563 @@
+//! Built-in worksheet functions: dispatch, math, logic, text and the
+//! plain aggregates.
+//!
+//! Semantics follow the Python evaluator's builtins (`calc/_functions.py`)
+//! where that module documents a choice — numbers inside ranges skip text
+//! and errors, booleans count as 1/0 — and Excel elsewhere; where the
+//! Python code gives up on an argument, these return the Excel error.
+
+use super::ast::{Expr, RangeRef};
+use super::eval::{power, Ctx};
+use super::value::{ErrorKind, Value};
+use super::{criteria, finance, lookup};
+
+/// A function argument: a value, or a range kept as a reference.
+#[derive(Debug, Clone)]
+pub(crate) enum Arg {
+    Value(Value),
+    Range(RangeRef),
+}
+
+pub(crate) type FnResult = Result<Value, ErrorKind>;
+
+macro_rules! functions {
+    ($($variant:ident => $name:literal,)*) => {
+        /// Every function the native engine evaluates.
+        #[derive(Debug, Clone, Copy, PartialEq, Eq)]
+        pub(crate) enum Function {
+            $($variant,)*
+        }
+
+        impl Function {
+            pub(crate) fn from_name(name: &str) -> Option<Self> {
+                match name {
+                    $($name => Some(Function::$variant),)*
+                    _ => None,
+                }
+            }
+        }
+
+        /// Names of the functions the native engine evaluates.
+        pub const NATIVE_FUNCTIONS: &[&str] = &[$($name,)*];
+    };
+}
+
+functions! {
+    Sum => "SUM",
+    Abs => "ABS",
+    Round => "ROUND",
+    RoundUp => "ROUNDUP",
+    RoundDown => "ROUNDDOWN",
+    Int => "INT",
+    Mod => "MOD",
+    Power => "POWER",
+    Sqrt => "SQRT",
+    Sign => "SIGN",
+    If => "IF",
+    IfError => "IFERROR",
+    And => "AND",
+    Or => "OR",
+    Not => "NOT",
+    Count => "COUNT",
+    CountA => "COUNTA",
+    Min => "MIN",
+    Max => "MAX",
+    Average => "AVERAGE",
+    Left => "LEFT",
+    Right => "RIGHT",
+    Mid => "MID",
+    Len => "LEN",
+    Concatenate => "CONCATENATE",
+    Upper => "UPPER",
+    Lower => "LOWER",
+    Trim => "TRIM",
+    Substitute => "SUBSTITUTE",
+    Rept => "REPT",
+    Exact => "EXACT",
+    Find => "FIND",
+    Index => "INDEX",
+    Match => "MATCH",
+    VLookup => "VLOOKUP",
+    HLookup => "HLOOKUP",
+    XLookup => "XLOOKUP",
+    Choose => "CHOOSE",
+    SumIf => "SUMIF",
+    SumIfs => "SUMIFS",
+    CountIf => "COUNTIF",
+    CountIfs => "COUNTIFS",
+    AverageIf => "AVERAGEIF",
+    AverageIfs => "AVERAGEIFS",
+    MinIfs => "MINIFS",
+    MaxIfs => "MAXIFS",
+    Pv => "PV",
+    Fv => "FV",
+    Pmt => "PMT",
+    Npv => "NPV",
+    Irr => "IRR",
+    Sln => "SLN",
+    Db => "DB",
+    Date => "DATE",
+    Year => "YEAR",
+    Month => "MONTH",
+    Day => "DAY",
+    EDate => "EDATE",
+    EOMonth => "EOMONTH",
+    Days => "DAYS",
+    Hour => "HOUR",
+    Minute => "MINUTE",
+    Second => "SECOND",
+}
+
+/// Evaluate `func` over its argument expressions.
+pub(crate) fn call(ctx: &Ctx<'_>, func: Function, args: &[Expr]) -> Arg {
+    use Function::*;
+    let result = match func {
+        // These may pass a range through to an enclosing function.
+        If => return if_(ctx, args),
+        IfError => return if_error(ctx, args),
+        Choose => return lookup::choose(ctx, args),
+        Sum => sum(ctx, args),
+        Abs => unary(ctx, args, |n| Ok(n.abs())),
+        Round => round(ctx, args, Rounding::Nearest),
+        RoundUp => round(ctx, args, Rounding::Up),
+        RoundDown => round(ctx, args, Rounding::Down),
+        Int => unary(ctx, args, |n| Ok(n.floor())),
+        Mod => modulo(ctx, args),
+        Power => pow(ctx, args),
+        Sqrt => unary(ctx, args, |n| {
+            if n < 0.0 {
+                Err(ErrorKind::Num)
+            } else {
+                Ok(n.sqrt())
+            }
+        }),
+        Sign => unary(ctx, args, |n| Ok(if n == 0.0 { 0.0 } else { n.signum() })),
+        And => logical(ctx, args, true),
+        Or => logical(ctx, args, false),
+        Not => not(ctx, args),
+        Count => count(ctx, args),
+        CountA => count_a(ctx, args),
+        Min => extreme(ctx, args, f64::min),
+        Max => extreme(ctx, args, f64::max),
+        Average => average(ctx, args),
+        Left => left_right(ctx, args, true),
+        Right => left_right(ctx, args, false),
+        Mid => mid(ctx, args),
+        Len => len(ctx, args),
+        Concatenate => concatenate(ctx, args),
+        Upper => text_map(ctx, args, |s| s.to_uppercase()),
+        Lower => text_map(ctx, args, |s| s.to_lowercase()),
+        Trim => text_map(ctx, args, |s| {
+            s.split(' ')
+                .filter(|w| !w.is_empty())
+                .collect::<Vec<_>>()
+                .join(" ")
+        }),
+        Substitute => substitute(ctx, args),
+        Rept => rept(ctx, args),
+        Exact => exact(ctx, args),
+        Find => find(ctx, args),
+        Index => lookup::index(ctx, args),
+        Match => lookup::match_(ctx, args),
+        VLookup => lookup::vlookup(ctx, args, true),
+        HLookup => lookup::vlookup(ctx, args, false),
+        XLookup => lookup::xlookup(ctx, args),
+        SumIf => criteria::sum_if(ctx, args),
+        SumIfs => criteria::ifs(ctx, args, criteria::Aggregate::Sum),
+        CountIf => criteria::count_if(ctx, args),
+        CountIfs => criteria::count_ifs(ctx, args),
+        AverageIf => criteria::average_if(ctx, args),
+        AverageIfs => criteria::ifs(ctx, args, criteria::Aggregate::Average),
+        MinIfs => criteria::ifs(ctx, args, criteria::Aggregate::Min),
+        MaxIfs => criteria::ifs(ctx, args, criteria::Aggregate::Max),
+        Pv => finance::pv(ctx, args),
+        Fv => finance::fv(ctx, args),
+        Pmt => finance::pmt(ctx, args),
+        Npv => finance::npv(ctx, args),
+        Irr => finance::irr(ctx, args),
+        Sln => finance::sln(ctx, args),
+        Db => finance::db(ctx, args),
+        Date => finance::date(ctx, args),
+        Year => finance::date_part(ctx, args, finance::DatePart::Year),
+        Month => finance::date_part(ctx, args, finance::DatePart::Month),
+        Day => finance::date_part(ctx, args, finance::DatePart::Day),
+        EDate => finance::edate(ctx, args, false),
+        EOMonth => finance::edate(ctx, args, true),
+        Days => finance::days(ctx, args),
+        Hour => finance::time_part(ctx, args, finance::TimePart::Hour),
+        Minute => finance::time_part(ctx, args, finance::TimePart::Minute),
+        Second => finance::time_part(ctx, args, finance::TimePart::Second),
+    };
+    Arg::Value(result.unwrap_or_else(Value::Error))
+}
+
+// ---------------------------------------------------------------------------
+// Argument helpers
+// ---------------------------------------------------------------------------
+
+/// `#VALUE!` unless `min <= args.len() <= max`.
+pub(crate) fn arity(args: &[Expr], min: usize, max: usize) -> Result<(), ErrorKind> {
+    if args.len() < min || args.len() > max {
+        Err(ErrorKind::Value)
+    } else {
+        Ok(())
+    }
+}
+
+pub(crate) fn number(ctx: &Ctx<'_>, expr: &Expr) -> Result<f64, ErrorKind> {
+    ctx.eval(expr).to_number()
+}
+
+/// Optional numeric argument `idx`, `default` when absent or omitted.
+pub(crate) fn number_or(
+    ctx: &Ctx<'_>,
+    args: &[Expr],
+    idx: usize,
+    default: f64,
+) -> Result<f64, ErrorKind> {
+    match args.get(idx) {
+        None | Some(Expr::Missing) => Ok(default),
+        Some(expr) => number(ctx, expr),
+    }
+}
+
+pub(crate) fn text(ctx: &Ctx<'_>, expr: &Expr) -> Result<String, ErrorKind> {
+    ctx.eval(expr).to_text()
+}
+
+/// Call `f` with every number in `args`: numbers and booleans, skipping
+/// text and blanks; errors inside ranges are skipped, scalar errors
+/// propagate.
+pub(crate) fn for_each_number(
+    ctx: &Ctx<'_>,
+    args: &[Expr],
+    mut f: impl FnMut(f64),
+) -> Result<(), ErrorKind> {
+    for expr in args {
+        match ctx.arg(expr) {
+            Arg::Range(range) => ctx.store.visit(&range, |value| match value {
+                Value::Number(n) => f(*n),
+                Value::Bool(b) => f(f64::from(u8::from(*b))),
+                _ => {}
+            }),
+            Arg::Value(Value::Number(n)) => f(n),
+            Arg::Value(Value::Bool(b)) => f(f64::from(u8::from(b))),
+            Arg::Value(Value::Error(e)) => return Err(e),
+            Arg::Value(_) => {}
+        }
+    }
+    Ok(())
+}
+
+fn unary(ctx: &Ctx<'_>, args: &[Expr], f: impl Fn(f64) -> Result<f64, ErrorKind>) -> FnResult {
+    arity(args, 1, 1)?;
+    f(number(ctx, &args[0])?).map(Value::number)
+}
+
+// ---------------------------------------------------------------------------
+// Math
+// ---------------------------------------------------------------------------
+
+fn sum(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    let mut total = 0.0;
+    for_each_number(ctx, args, |n| total += n)?;
+    Ok(Value::number(total))
+}
+
+#[derive(Clone, Copy)]
+enum Rounding {
+    Nearest,
+    Up,
+    Down,
+}
+
+fn round(ctx: &Ctx<'_>, args: &[Expr], mode: Rounding) -> FnResult {
+    arity(args, 1, 2)?;
+    let n = number(ctx, &args[0])?;
+    let digits = number_or(ctx, args, 1, 0.0)?.trunc() as i32;
+    Ok(Value::number(round_to(n, digits, mode)))
+}
+
+/// Round `n` to `digits` decimals. The scaled value is first cut to 15
+/// significant digits so `1.005 * 100` rounds as the 100.5 it prints as.
+fn round_to(n: f64, digits: i32, mode: Rounding) -> f64 {
+    let factor = 10f64.powi(digits);
+    let scaled = n * factor;
+    let scaled: f64 = format!("{:.14e}", scaled).parse().unwrap_or(scaled);
+    let rounded = match mode {
+        Rounding::Nearest => scaled.round(),
+        Rounding::Up => {
+            if scaled >= 0.0 {
+                scaled.ceil()
+            } else {
+                scaled.floor()
+            }
+        }
+        Rounding::Down => scaled.trunc(),
+    };
+    rounded / factor
+}
+
+/// Round half away from zero, as `ROUND` does.
+pub(crate) fn round_half_away(n: f64, digits: i32) -> f64 {
+    round_to(n, digits, Rounding::Nearest)
+}
+
+fn modulo(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    arity(args, 2, 2)?;
+    let n = number(ctx, &args[0])?;
+    let d = number(ctx, &args[1])?;
+    if d == 0.0 {
+        return Err(ErrorKind::Div0);
+    }
+    // The result takes the sign of the divisor.
+    Ok(Value::number(n - d * (n / d).floor()))
+}
+
+fn pow(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    arity(args, 2, 2)?;
+    Ok(power(number(ctx, &args[0])?, number(ctx, &args[1])?))
+}
+
+// ---------------------------------------------------------------------------
+// Logic
+// ---------------------------------------------------------------------------
+
+fn if_(ctx: &Ctx<'_>, args: &[Expr]) -> Arg {
+    if arity(args, 2, 3).is_err() {
+        return Arg::Value(Value::Error(ErrorKind::Value));
+    }
+    match ctx.eval(&args[0]).to_bool() {
+        Ok(true) => ctx.arg(&args[1]),
+        Ok(false) => match args.get(2) {
+            Some(expr) => ctx.arg(expr),
+            None => Arg::Value(Value::Bool(false)),
+        },
+        Err(e) => Arg::Value(Value::Error(e)),
+    }
+}
+
+fn if_error(ctx: &Ctx<'_>, args: &[Expr]) -> Arg {
+    if arity(args, 2, 2).is_err() {
+        return Arg::Value(Value::Error(ErrorKind::Value));
+    }
+    match ctx.arg(&args[0]) {
+        Arg::Value(Value::Error(_)) => ctx.arg(&args[1]),
+        value => value,
+    }
+}
+
+/// `AND` (`all == true`) / `OR`: numbers and booleans count, text and
+/// blanks inside ranges are ignored.
+fn logical(ctx: &Ctx<'_>, args: &[Expr], all: bool) -> FnResult {
+    arity(args, 1, usize::MAX)?;
+    let mut seen = false;
+    let mut result = all;
+    let mut error = None;
+    for expr in args {
+        match ctx.arg(expr) {
+            Arg::Range(range) => ctx.store.visit(&range, |value| {
+                let flag = match value {
+                    Value::Number(n) => *n != 0.0,
+                    Value::Bool(b) => *b,
+                    Value::Error(e) => {
+                        error.get_or_insert(*e);
+                        return;
+                    }
+                    _ => return,
+                };
+                seen = true;
+                result = if all { result && flag } else { result || flag };
+            }),
+            Arg::Value(Value::Empty) => {}
+            Arg::Value(value) => {
+                let flag = value.to_bool()?;
+                seen = true;
+                result = if all { result && flag } else { result || flag };
+            }
+        }
+    }
+    if let Some(e) = error {
+        return Err(e);
+    }
+    if !seen {
+        return Err(ErrorKind::Value);
+    }
+    Ok(Value::Bool(result))
+}
+
+fn not(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    arity(args, 1, 1)?;
+    Ok(Value::Bool(!ctx.eval(&args[0]).to_bool()?))
+}
+
+// ---------------------------------------------------------------------------
+// Aggregates
+// ---------------------------------------------------------------------------
+
+fn count(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    let mut n = 0usize;
+    for expr in args {
+        match ctx.arg(expr) {
+            Arg::Range(range) => ctx.store.visit(&range, |value| {
+                if matches!(value, Value::Number(_) | Value::Bool(_)) {
+                    n += 1;
+                }
+            }),
+            Arg::Value(Value::Number(_) | Value::Bool(_)) => n += 1,
+            Arg::Value(_) => {}
+        }
+    }
+    Ok(Value::Number(n as f64))
+}
+
+fn count_a(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    let mut n = 0usize;
+    for expr in args {
+        match ctx.arg(expr) {
+            Arg::Range(range) => ctx.store.visit(&range, |_| n += 1),
+            Arg::Value(Value::Empty) => {}
+            Arg::Value(_) => n += 1,
+        }
+    }
+    Ok(Value::Number(n as f64))
+}
+
+/// `MIN` / `MAX`; 0 when there are no numbers.
+fn extreme(ctx: &Ctx<'_>, args: &[Expr], pick: fn(f64, f64) -> f64) -> FnResult {
+    let mut best: Option<f64> = None;
+    for_each_number(ctx, args, |n| best = Some(best.map_or(n, |b| pick(b, n))))?;
+    Ok(Value::Number(best.unwrap_or(0.0)))
+}
+
+fn average(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    let mut total = 0.0;
+    let mut n = 0usize;
+    for_each_number(ctx, args, |x| {
+        total += x;
+        n += 1;
+    })?;
+    if n == 0 {
+        return Err(ErrorKind::Div0);
+    }
+    Ok(Value::number(total / n as f64))
+}
+
+// ---------------------------------------------------------------------------
+// Text
+// ---------------------------------------------------------------------------
+
+fn left_right(ctx: &Ctx<'_>, args: &[Expr], left: bool) -> FnResult {
+    arity(args, 1, 2)?;
+    let s = text(ctx, &args[0])?;
+    let n = number_or(ctx, args, 1, 1.0)?.trunc();
+    if n < 0.0 {
+        return Err(ErrorKind::Value);
+    }
+    let chars: Vec<char> = s.chars().collect();
+    let n = (n as usize).min(chars.len());
+    let slice = if left {
+        &chars[..n]
+    } else {
+        &chars[chars.len() - n..]
+    };
+    Ok(Value::Text(slice.iter().collect()))
+}
+
+fn mid(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    arity(args, 3, 3)?;
+    let s = text(ctx, &args[0])?;
+    let start = number(ctx, &args[1])?.trunc();
+    let n = number(ctx, &args[2])?.trunc();
+    if start < 1.0 || n < 0.0 {
+        return Err(ErrorKind::Value);
+    }
+    Ok(Value::Text(
+        s.chars()
+            .skip(start as usize - 1)
+            .take(n as usize)
+            .collect(),
+    ))
+}
+
+fn len(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    arity(args, 1, 1)?;
+    Ok(Value::Number(text(ctx, &args[0])?.chars().count() as f64))
+}
+
+fn concatenate(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    arity(args, 1, usize::MAX)?;
+    let mut out = String::new();
+    for expr in args {
+        out.push_str(&text(ctx, expr)?);
+    }
+    Ok(Value::Text(out))
+}
+
+fn text_map(ctx: &Ctx<'_>, args: &[Expr], f: impl Fn(&str) -> String) -> FnResult {
+    arity(args, 1, 1)?;
+    Ok(Value::Text(f(&text(ctx, &args[0])?)))
+}
+
+fn substitute(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    arity(args, 3, 4)?;
+    let s = text(ctx, &args[0])?;
+    let old = text(ctx, &args[1])?;
+    let new = text(ctx, &args[2])?;
+    if old.is_empty() {
+        return Ok(Value::Text(s));
+    }
+    let Some(instance) = args.get(3).filter(|e| !matches!(e, Expr::Missing)) else {
+        return Ok(Value::Text(s.replace(&old, &new)));
+    };
+    let instance = number(ctx, instance)?.trunc();
+    if instance < 1.0 {
+        return Err(ErrorKind::Value);
+    }
+    // Replace only the Nth occurrence.
+    match s.match_indices(&old).nth(instance as usize - 1) {
+        Some((idx, _)) => Ok(Value::Text(format!(
+            "{}{}{}",
+            &s[..idx],
+            new,
+            &s[idx + old.len()..]
+        ))),
+        None => Ok(Value::Text(s)),
+    }
+}
+
+fn rept(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    arity(args, 2, 2)?;
+    let s = text(ctx, &args[0])?;
+    let n = number(ctx, &args[1])?.trunc();
+    if n < 0.0 || s.chars().count() as f64 * n > 32_767.0 {
+        return Err(ErrorKind::Value);
+    }
+    Ok(Value::Text(s.repeat(n as usize)))
+}
+
+fn exact(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    arity(args, 2, 2)?;
+    Ok(Value::Bool(text(ctx, &args[0])? == text(ctx, &args[1])?))
+}
+
+fn find(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    arity(args, 2, 3)?;
+    let needle = text(ctx, &args[0])?;
+    let haystack = text(ctx, &args[1])?;
+    let start = number_or(ctx, args, 2, 1.0)?.trunc();
+    let chars = haystack.chars().count();
+    if start < 1.0 || start as usize > chars.max(1) {
+        return Err(ErrorKind::Value);
+    }
+    let offset = haystack
+        .char_indices()
+        .nth(start as usize - 1)
+        .map_or(haystack.len(), |(i, _)| i);
+    match haystack[offset..].find(&needle) {
+        Some(i) => Ok(Value::Number(
+            (haystack[..offset + i].chars().count() + 1) as f64,
+        )),
+        None => Err(ErrorKind::Value),
+    }
+}
@@ -0,0 +1,322 @@
+//! Lookup functions: INDEX, MATCH, VLOOKUP / HLOOKUP, XLOOKUP, CHOOSE.
+
+use std::cmp::Ordering;
+
+use super::ast::Expr;
+use super::eval::Ctx;
+use super::functions::{arity, number, number_or, Arg, FnResult};
+use super::value::{compare, ErrorKind, Value};
+
+/// Exact-match equality: case-insensitive text, numbers, booleans; blanks
+/// never match.
+fn lookup_eq(needle: &Value, value: &Value) -> bool {
+    match (needle, value) {
+        (Value::Text(a), Value::Text(b)) => a.to_lowercase() == b.to_lowercase(),
+        (Value::Number(a), Value::Number(b)) => a == b,
+        (Value::Bool(a), Value::Bool(b)) => a == b,
+        _ => false,
+    }
+}
+
+/// Ordering of `value` against `needle` when both are numbers or both
+/// text; `None` for values an approximate lookup skips.
+fn lookup_cmp(needle: &Value, value: &Value) -> Option<Ordering> {
+    match (needle, value) {
+        (Value::Number(_), Value::Number(_)) | (Value::Text(_), Value::Text(_)) => {
+            Some(compare(value, needle))
+        }
+        _ => None,
+    }
+}
+
+/// Excel wildcard match (`*`, `?`, `~` escapes), case-insensitive.
+pub(crate) fn wildcard_match(pattern: &str, text: &str) -> bool {
+    let pattern: Vec<char> = pattern.to_lowercase().chars().collect();
+    let text: Vec<char> = text.to_lowercase().chars().collect();
+    enum Tok {
+        Lit(char),
+        Any,
+        Star,
+    }
+    let mut toks = Vec::with_capacity(pattern.len());
+    let mut i = 0;
+    while i < pattern.len() {
+        match pattern[i] {
+            '~' if i + 1 < pattern.len() => {
+                toks.push(Tok::Lit(pattern[i + 1]));
+                i += 1;
+            }
+            '*' => toks.push(Tok::Star),
+            '?' => toks.push(Tok::Any),
+            c => toks.push(Tok::Lit(c)),
+        }
+        i += 1;
+    }
+    // Greedy match with backtracking to the last star.
+    let (mut p, mut t) = (0, 0);
+    let mut star: Option<(usize, usize)> = None;
+    while t < text.len() {
+        match toks.get(p) {
+            Some(Tok::Star) => {
+                star = Some((p, t));
+                p += 1;
+            }
+            Some(Tok::Any) => {
+                p += 1;
+                t += 1;
+            }
+            Some(Tok::Lit(c)) if *c == text[t] => {
+                p += 1;
+                t += 1;
+            }
+            _ => match star {
+                Some((sp, st)) => {
+                    p = sp + 1;
+                    t = st + 1;
+                    star = Some((sp, st + 1));
+                }
+                None => return false,
+            },
+        }
+    }
+    toks[p..].iter().all(|tok| matches!(tok, Tok::Star))
+}
+
+fn exact_index<'a>(
+    needle: &Value,
+    values: impl Iterator<Item = (usize, &'a Value)>,
+    wildcard: bool,
+) -> Option<usize> {
+    for (i, value) in values {
+        let hit = match (needle, value) {
+            (Value::Text(p), Value::Text(s)) if wildcard => wildcard_match(p, s),
+            _ => lookup_eq(needle, value),
+        };
+        if hit {
+            return Some(i);
+        }
+    }
+    None
+}
+
+/// Last position whose value is `<= needle` (numbers with numbers, text
+/// with text), as a sorted approximate lookup finds it.
+fn last_lte<'a>(needle: &Value, values: impl Iterator<Item = (usize, &'a Value)>) -> Option<usize> {
+    let mut best = None;
+    for (i, value) in values {
+        if lookup_cmp(needle, value).is_some_and(|o| o != Ordering::Greater) {
+            best = Some(i);
+        }
+    }
+    best
+}
+
+fn lookup_value(ctx: &Ctx<'_>, expr: &Expr) -> Result<Value, ErrorKind> {
+    match ctx.eval(expr) {
+        Value::Error(e) => Err(e),
+        value => Ok(value),
+    }
+}
+
+pub(crate) fn choose(ctx: &Ctx<'_>, args: &[Expr]) -> Arg {
+    let pick = || -> Result<&Expr, ErrorKind> {
+        arity(args, 2, usize::MAX)?;
+        let idx = number(ctx, &args[0])?.trunc();
+        if idx < 1.0 || idx as usize >= args.len() {
+            return Err(ErrorKind::Value);
+        }
+        Ok(&args[idx as usize])
+    };
+    match pick() {
+        Ok(expr) => ctx.arg(expr),
+        Err(e) => Arg::Value(Value::Error(e)),
+    }
+}
+
+pub(crate) fn index(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    arity(args, 2, 3)?;
+    let array = ctx.arg(&args[0]);
+    let mut row = number_or(ctx, args, 1, 0.0)?.trunc();
+    let col = match args.get(2) {
+        None | Some(Expr::Missing) => None,
+        Some(expr) => Some(number(ctx, expr)?.trunc()),
+    };
+    let grid = ctx.grid(&array);
+    if row < 0.0 || col.is_some_and(|c| c < 0.0) {
+        return Err(ErrorKind::Value);
+    }
+    let (row, col) = match col {
+        Some(mut col) => {
+            // A zero index on a one-wide axis selects its only entry.
+            if row == 0.0 && grid.rows == 1 {
+                row = 1.0;
+            }
+            if col == 0.0 && grid.cols == 1 {
+                col = 1.0;
+            }
+            (row, col)
+        }
+        // One index on a single row walks the columns.
+        None if grid.rows == 1 => (1.0, row),
+        None => (row, 1.0),
+    };
+    if row < 1.0 || col < 1.0 || row as usize > grid.rows || col as usize > grid.cols {
+        return Err(ErrorKind::Ref);
+    }
+    Ok(grid.get(row as usize - 1, col as usize - 1).clone())
+}
+
+pub(crate) fn match_(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    arity(args, 2, 3)?;
+    let needle = lookup_value(ctx, &args[0])?;
+    let haystack = ctx.arg(&args[1]);
+    let mode = number_or(ctx, args, 2, 1.0)?.trunc();
+    let grid = ctx.grid(&haystack);
+    if grid.rows > 1 && grid.cols > 1 {
+        return Err(ErrorKind::NA);
+    }
+    let values = grid.flat().iter().copied().enumerate();
+    let found = if mode == 0.0 {
+        exact_index(&needle, values, false)
+    } else if mode > 0.0 {
+        last_lte(&needle, values)
+    } else {
+        // Smallest value >= needle over data sorted descending.
+        let mut best = None;
+        for (i, value) in values {
+            if lookup_cmp(&needle, value).is_some_and(|o| o != Ordering::Less) {
+                best = Some(i);
+            }
+        }
+        best
+    };
+    found
+        .map(|i| Value::Number((i + 1) as f64))
+        .ok_or(ErrorKind::NA)
+}
+
+/// `range_lookup` flag: omitted means approximate, an empty argument exact.
+fn approximate(ctx: &Ctx<'_>, args: &[Expr], idx: usize) -> Result<bool, ErrorKind> {
+    match args.get(idx) {
+        None => Ok(true),
+        Some(Expr::Missing) => Ok(false),
+        Some(expr) => ctx.eval(expr).to_bool(),
+    }
+}
+
+/// `VLOOKUP` (`vertical`) or `HLOOKUP`.
+pub(crate) fn vlookup(ctx: &Ctx<'_>, args: &[Expr], vertical: bool) -> FnResult {
+    arity(args, 3, 4)?;
+    let needle = lookup_value(ctx, &args[0])?;
+    let table = ctx.arg(&args[1]);
+    let offset = number(ctx, &args[2])?.trunc();
+    let approx = approximate(ctx, args, 3)?;
+    let grid = ctx.grid(&table);
+    let (keys, span) = if vertical {
+        (grid.rows, grid.cols)
+    } else {
+        (grid.cols, grid.rows)
+    };
+    if offset < 1.0 {
+        return Err(ErrorKind::Value);
+    }
+    if offset as usize > span {
+        return Err(ErrorKind::Ref);
+    }
+    let at = |key: usize, pos: usize| {
+        if vertical {
+            grid.get(key, pos)
+        } else {
+            grid.get(pos, key)
+        }
+    };
+    // Past the used area every key is blank, and blanks never match.
+    let stored_keys = if vertical {
+        grid.stored_rows()
+    } else {
+        grid.stored_cols()
+    };
+    let keys_iter = (0..keys.min(stored_keys)).map(|k| (k, at(k, 0)));
+    let found = if approx {
+        last_lte(&needle, keys_iter)
+    } else {
+        exact_index(&needle, keys_iter, false)
+    };
+    found
+        .map(|k| at(k, offset as usize - 1).clone())
+        .ok_or(ErrorKind::NA)
+}
+
+pub(crate) fn xlookup(ctx: &Ctx<'_>, args: &[Expr]) -> FnResult {
+    arity(args, 3, 6)?;
+    let needle = lookup_value(ctx, &args[0])?;
+    let lookup = ctx.arg(&args[1]);
+    let results = ctx.arg(&args[2]);
+    let mode = number_or(ctx, args, 4, 0.0)?.trunc();
+    let search = number_or(ctx, args, 5, 1.0)?.trunc();
+    if ![0.0, -1.0, 1.0, 2.0].contains(&mode) || ![1.0, -1.0].contains(&search) {
+        return Err(ErrorKind::Value);
+    }
+    let not_found = || match args.get(3) {
+        None | Some(Expr::Missing) => Err(ErrorKind::NA),
+        Some(expr) => Ok(ctx.eval(expr)),
+    };
+
+    let keys = ctx.grid(&lookup);
+    let values = ctx.grid(&results);
+    let flat = keys.flat();
+    let order: Box<dyn Iterator<Item = usize>> = if search > 0.0 {
+        Box::new(0..flat.len())
+    } else {
+        Box::new((0..flat.len()).rev())
+    };
+
+    let found = if mode == 0.0 || mode == 2.0 {
+        exact_index(&needle, order.map(|i| (i, flat[i])), mode == 2.0)
+    } else {
+        let Value::Number(target) = needle else {
+            return not_found();
+        };
+        // Closest value on the requested side; exact matches win.
+        let mut best: Option<(usize, f64)> = None;
+        for i in order {
+            let Value::Number(v) = flat[i] else { continue };
+            let on_side = if mode < 0.0 {
+                *v <= target
+            } else {
+                *v >= target
+            };
+            let closer = best.map_or(true, |(_, b)| if mode < 0.0 { *v > b } else { *v < b });
+            if on_side && closer {
+                best = Some((i, *v));
+            }
+        }
+        best.map(|(i, _)| i)
+    };
+    match found {
+        Some(i) if i < values.len() => {
+            let (row, col) = if values.rows == 1 {
+                (0, i)
+            } else {
+                (i / values.cols, i % values.cols)
+            };
+            Ok(values.get(row, col).clone())
+        }
+        _ => not_found(),
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::wildcard_match;
+
+    #[test]
+    fn wildcards() {
+        assert!(wildcard_match("app*", "Apple"));
+        assert!(wildcard_match("?pple", "apple"));
+        assert!(wildcard_match("*le", "apple"));
+        assert!(!wildcard_match("a?c", "abbc"));
+        assert!(wildcard_match("a~*", "a*"));
+        assert!(!wildcard_match("a~*", "ab"));
+    }
+}
@@ -0,0 +1,34 @@
+//! Native formula evaluation.
+//!
+//! [`Engine`] holds a workbook's cell values and formulas, compiles each
+//! formula once into an expression tree (parsed from the [`crate::tokenizer`]
+//! stream), orders them by topological level and evaluates them against
+//! a sparse cell store. It covers the functions in [`NATIVE_FUNCTIONS`];
+//! [`Engine::unsupported`] lists formulas that use anything else so callers
+//! can route the workbook to another evaluator.
+//!
+//! ```ignore
+//! use wolfxl_formula::calc::{CellAddr, Engine, Value};
+//!
+//! let mut engine = Engine::new();
+//! let sheet = engine.add_sheet("Sheet1");
+//! engine.set_value(CellAddr { sheet, row: 1, col: 1 }, Value::Number(2.0));
+//! engine.set_formula(CellAddr { sheet, row: 1, col: 2 }, "=A1*21");
+//! let values = engine.calculate().unwrap();
+//! assert_eq!(values[0].1, Value::Number(42.0));
+//! ```
+
+mod ast;
+mod criteria;
+mod engine;
+mod eval;
+mod finance;
+mod functions;
+mod lookup;
+mod store;
+mod value;
+
+pub use ast::CellAddr;
+pub use engine::{Engine, EngineError, Recalc};
+pub use functions::NATIVE_FUNCTIONS;
+pub use value::{format_number, ErrorKind, Value};
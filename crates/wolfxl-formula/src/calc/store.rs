@@ -0,0 +1,168 @@
+//! Sparse per-sheet cell storage with row-major range iteration.
+
+use std::collections::BTreeMap;
+
+use super::ast::{CellAddr, RangeRef};
+use super::value::{Value, EMPTY};
+
+#[derive(Debug, Default)]
+struct SheetCells {
+    /// `(row, col)` → value; blanks are never stored.
+    cells: BTreeMap<(u32, u32), Value>,
+    max_row: u32,
+    max_col: u32,
+}
+
+/// Values of every non-blank cell, input and formula alike.
+#[derive(Debug, Default)]
+pub(crate) struct Store {
+    sheets: Vec<SheetCells>,
+}
+
+impl Store {
+    pub fn add_sheet(&mut self) {
+        self.sheets.push(SheetCells::default());
+    }
+
+    pub fn get(&self, addr: &CellAddr) -> &Value {
+        self.sheets
+            .get(addr.sheet as usize)
+            .and_then(|sheet| sheet.cells.get(&(addr.row, addr.col)))
+            .unwrap_or(&EMPTY)
+    }
+
+    /// Store `value` at `addr`, returning the previous value.
+    pub fn set(&mut self, addr: CellAddr, value: Value) -> Value {
+        let Some(sheet) = self.sheets.get_mut(addr.sheet as usize) else {
+            return Value::Empty;
+        };
+        let key = (addr.row, addr.col);
+        if value.is_empty() {
+            return sheet.cells.remove(&key).unwrap_or_default();
+        }
+        sheet.max_row = sheet.max_row.max(addr.row);
+        sheet.max_col = sheet.max_col.max(addr.col);
+        sheet.cells.insert(key, value).unwrap_or_default()
+    }
+
+    /// `range` clipped to the sheet's used area, or `None` if nothing is left.
+    fn clip(&self, range: &RangeRef) -> Option<(&SheetCells, RangeRef)> {
+        let sheet = self.sheets.get(range.sheet as usize)?;
+        let clipped = RangeRef {
+            last_row: range.last_row.min(sheet.max_row),
+            last_col: range.last_col.min(sheet.max_col),
+            ..*range
+        };
+        (clipped.first_row <= clipped.last_row && clipped.first_col <= clipped.last_col)
+            .then_some((sheet, clipped))
+    }
+
+    /// Call `f` for every non-blank cell of `range`, row by row.
+    pub fn visit(&self, range: &RangeRef, mut f: impl FnMut(&Value)) {
+        let Some((sheet, r)) = self.clip(range) else {
+            return;
+        };
+        if r.rows() > sheet.cells.len() / r.cols().max(1) + 1 {
+            // Tall range over a sparse sheet: one scan, filtered by column.
+            let span = sheet.cells.range((r.first_row, 0)..=(r.last_row, u32::MAX));
+            for (&(_, col), value) in span {
+                if (r.first_col..=r.last_col).contains(&col) {
+                    f(value);
+                }
+            }
+        } else {
+            for row in r.first_row..=r.last_row {
+                for (_, value) in sheet.cells.range((row, r.first_col)..=(row, r.last_col)) {
+                    f(value);
+                }
+            }
+        }
+    }
+
+    /// Dense view of `range` for positional access.
+    pub fn grid(&self, range: &RangeRef) -> Grid<'_> {
+        let mut grid = Grid {
+            rows: range.rows(),
+            cols: range.cols(),
+            stored_rows: 0,
+            stored_cols: 0,
+            values: Vec::new(),
+        };
+        if let Some((_, r)) = self.clip(range) {
+            grid.stored_rows = r.rows();
+            grid.stored_cols = r.cols();
+            grid.values.reserve(r.rows() * r.cols());
+            for row in r.first_row..=r.last_row {
+                for col in r.first_col..=r.last_col {
+                    grid.values.push(self.get(&CellAddr {
+                        sheet: r.sheet,
+                        row,
+                        col,
+                    }));
+                }
+            }
+        }
+        grid
+    }
+}
+
+/// A range's values in row-major order. Only the part inside the sheet's
+/// used area is materialized; everything past it reads as blank, so whole
+/// column references stay cheap.
+#[derive(Debug)]
+pub(crate) struct Grid<'a> {
+    pub rows: usize,
+    pub cols: usize,
+    stored_rows: usize,
+    stored_cols: usize,
+    values: Vec<&'a Value>,
+}
+
+impl<'a> Grid<'a> {
+    /// A 1x1 grid over a scalar.
+    pub fn single(value: &'a Value) -> Self {
+        Grid {
+            rows: 1,
+            cols: 1,
+            stored_rows: 1,
+            stored_cols: 1,
+            values: vec![value],
+        }
+    }
+
+    /// Value at 0-based `(row, col)`; blank outside the stored area.
+    pub fn get(&self, row: usize, col: usize) -> &'a Value {
+        if row < self.stored_rows && col < self.stored_cols {
+            self.values[row * self.stored_cols + col]
+        } else {
+            &EMPTY
+        }
+    }
+
+    /// Stored `(row, col, value)` triples, row by row.
+    pub fn cells(&self) -> impl Iterator<Item = (usize, usize, &'a Value)> + '_ {
+        let cols = self.stored_cols.max(1);
+        self.values
+            .iter()
+            .enumerate()
+            .map(move |(i, value)| (i / cols, i % cols, *value))
+    }
+
+    /// Stored values flattened row by row, as lookups see a 1-D vector.
+    pub fn flat(&self) -> &[&'a Value] {
+        &self.values
+    }
+
+    /// Number of cells, including the blank tail past the stored area.
+    pub fn len(&self) -> usize {
+        self.rows * self.cols
+    }
+
+    pub fn stored_rows(&self) -> usize {
+        self.stored_rows
+    }
+
+    pub fn stored_cols(&self) -> usize {
+        self.stored_cols
+    }
+}
@@ -0,0 +1,203 @@
+//! Cell values and the coercions formulas apply to them.
+
+use std::cmp::Ordering;
+use std::fmt;
+
+/// An Excel error value. Errors propagate through operators and most
+/// functions until something like `IFERROR` absorbs them.
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
+pub enum ErrorKind {
+    /// `#NULL!`
+    Null,
+    /// `#DIV/0!`
+    Div0,
+    /// `#VALUE!`
+    Value,
+    /// `#REF!`
+    Ref,
+    /// `#NAME?`
+    Name,
+    /// `#NUM!`
+    Num,
+    /// `#N/A`
+    NA,
+}
+
+impl ErrorKind {
+    /// The error's literal spelling, e.g. `#DIV/0!`.
+    pub fn code(self) -> &'static str {
+        match self {
+            ErrorKind::Null => "#NULL!",
+            ErrorKind::Div0 => "#DIV/0!",
+            ErrorKind::Value => "#VALUE!",
+            ErrorKind::Ref => "#REF!",
+            ErrorKind::Name => "#NAME?",
+            ErrorKind::Num => "#NUM!",
+            ErrorKind::NA => "#N/A",
+        }
+    }
+
+    /// Parse an error literal (case-insensitive). `None` for anything else.
+    pub fn from_code(code: &str) -> Option<Self> {
+        Some(match code.to_ascii_uppercase().as_str() {
+            "#NULL!" => ErrorKind::Null,
+            "#DIV/0!" => ErrorKind::Div0,
+            "#VALUE!" => ErrorKind::Value,
+            "#REF!" => ErrorKind::Ref,
+            "#NAME?" => ErrorKind::Name,
+            "#NUM!" => ErrorKind::Num,
+            "#N/A" => ErrorKind::NA,
+            _ => return None,
+        })
+    }
+}
+
+impl fmt::Display for ErrorKind {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        f.write_str(self.code())
+    }
+}
+
+/// A cell value or the result of evaluating a formula.
+#[derive(Debug, Clone, PartialEq, Default)]
+pub enum Value {
+    /// A blank cell.
+    #[default]
+    Empty,
+    /// Every number, including dates as serial numbers.
+    Number(f64),
+    /// A string.
+    Text(String),
+    /// `TRUE` / `FALSE`.
+    Bool(bool),
+    /// An error value.
+    Error(ErrorKind),
+}
+
+/// Shared blank, handed out for cells that are not in the store.
+pub(crate) static EMPTY: Value = Value::Empty;
+
+impl Value {
+    /// `Value::Number`, mapping NaN and infinities to `#NUM!`.
+    pub fn number(n: f64) -> Self {
+        if n.is_finite() {
+            Value::Number(n)
+        } else {
+            Value::Error(ErrorKind::Num)
+        }
+    }
+
+    /// True for `Value::Empty`.
+    pub fn is_empty(&self) -> bool {
+        matches!(self, Value::Empty)
+    }
+
+    /// Numeric value in arithmetic context: blanks are 0, booleans 0/1,
+    /// numeric text is parsed, anything else is `#VALUE!`.
+    pub fn to_number(&self) -> Result<f64, ErrorKind> {
+        match self {
+            Value::Empty => Ok(0.0),
+            Value::Number(n) => Ok(*n),
+            Value::Bool(b) => Ok(if *b { 1.0 } else { 0.0 }),
+            Value::Text(s) => s.trim().parse::<f64>().map_err(|_| ErrorKind::Value),
+            Value::Error(e) => Err(*e),
+        }
+    }
+
+    /// Text value in string context (`&`, `LEFT`, ...).
+    pub fn to_text(&self) -> Result<String, ErrorKind> {
+        match self {
+            Value::Empty => Ok(String::new()),
+            Value::Number(n) => Ok(format_number(*n)),
+            Value::Bool(b) => Ok(if *b { "TRUE" } else { "FALSE" }.to_string()),
+            Value::Text(s) => Ok(s.clone()),
+            Value::Error(e) => Err(*e),
+        }
+    }
+
+    /// Truth value in logical context (`IF`, `AND`, ...).
+    pub fn to_bool(&self) -> Result<bool, ErrorKind> {
+        match self {
+            Value::Empty => Ok(false),
+            Value::Number(n) => Ok(*n != 0.0),
+            Value::Bool(b) => Ok(*b),
+            Value::Text(s) => {
+                if s.eq_ignore_ascii_case("TRUE") {
+                    Ok(true)
+                } else if s.eq_ignore_ascii_case("FALSE") {
+                    Ok(false)
+                } else {
+                    Err(ErrorKind::Value)
+                }
+            }
+            Value::Error(e) => Err(*e),
+        }
+    }
+}
+
+/// Render a number the way Excel's General format does in string
+/// context: integers without a decimal point, everything else rounded to
+/// 15 significant digits.
+pub fn format_number(n: f64) -> String {
+    if n == n.trunc() && n.abs() < 1e15 {
+        return format!("{}", n as i64);
+    }
+    let rounded: f64 = format!("{:.14e}", n).parse().unwrap_or(n);
+    format!("{}", rounded)
+}
+
+/// Excel comparison order for `=`, `<`, ... : numbers < text < booleans,
+/// text compared case-insensitively. A blank takes the type of the other
+/// side (0, `""` or `FALSE`).
+pub(crate) fn compare(a: &Value, b: &Value) -> Ordering {
+    fn rank(v: &Value) -> u8 {
+        match v {
+            Value::Number(_) | Value::Empty => 0,
+            Value::Text(_) => 1,
+            Value::Bool(_) => 2,
+            Value::Error(_) => 3,
+        }
+    }
+    match (a, b) {
+        (Value::Empty, Value::Empty) => Ordering::Equal,
+        (Value::Empty, Value::Text(t)) => "".cmp(t.as_str()),
+        (Value::Text(t), Value::Empty) => t.as_str().cmp(""),
+        (Value::Empty, Value::Bool(v)) => false.cmp(v),
+        (Value::Bool(v), Value::Empty) => v.cmp(&false),
+        (Value::Empty, Value::Number(y)) => 0.0f64.partial_cmp(y).unwrap_or(Ordering::Equal),
+        (Value::Number(x), Value::Empty) => x.partial_cmp(&0.0).unwrap_or(Ordering::Equal),
+        (Value::Number(x), Value::Number(y)) => x.partial_cmp(y).unwrap_or(Ordering::Equal),
+        (Value::Text(x), Value::Text(y)) => x.to_lowercase().cmp(&y.to_lowercase()),
+        (Value::Bool(x), Value::Bool(y)) => x.cmp(y),
+        _ => rank(a).cmp(&rank(b)),
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn numbers_render_like_general_format() {
+        assert_eq!(format_number(3.0), "3");
+        assert_eq!(format_number(-12.5), "-12.5");
+        assert_eq!(format_number(0.1 + 0.2), "0.3");
+    }
+
+    #[test]
+    fn comparison_orders_types() {
+        let n = Value::Number(5.0);
+        let t = Value::Text("abc".into());
+        assert_eq!(compare(&n, &t), Ordering::Less);
+        assert_eq!(compare(&t, &Value::Bool(false)), Ordering::Less);
+        assert_eq!(compare(&Value::Text("ABC".into()), &t), Ordering::Equal);
+        assert_eq!(compare(&Value::Empty, &Value::Number(0.0)), Ordering::Equal);
+    }
+
+    #[test]
+    fn text_coercion() {
+        assert_eq!(Value::Text(" 4 ".into()).to_number(), Ok(4.0));
+        assert_eq!(Value::Text("x".into()).to_number(), Err(ErrorKind::Value));
+        assert_eq!(Value::Number(2.0).to_text(), Ok("2".into()));
+    }
+}
@@ -20,6 +20,9 @@
 //! - [`translate`] — The public translation operations that mutate a
 //!   formula string in-place: row/col shift, sheet rename, range move,
 //!   range-clip on delete.
+//! - [`calc`] — A native evaluator built on the tokenizer: compiles
+//!   formulas to expression trees and evaluates a workbook's cells in
+//!   dependency order.
 //!
 //! # Public surface (entry points)
 //!
@@ -53,6 +56,7 @@
 
 #![deny(rust_2018_idioms)]
 
+pub mod calc;
 pub mod reference;
 pub mod tokenizer;
 pub mod translate;
@@ -0,0 +1,378 @@
+//! Compact, column-oriented storage for parsed worksheet cells.
+//!
+//! [`Cell`] is the convenient owned form the parsers produce, but every cell
+//! carries an A1 `String`, a copy of its shared string and four optional
+//! formula fields. [`CompactCells`] keeps the same information as parallel
+//! integer columns: coordinates are rebuilt on demand, shared strings stay
+//! indices into the workbook SST, and formula / rich-text metadata live in
+//! side tables that only formula and rich-text cells pay for. A sorted
+//! [`CellIndex`] replaces a per-cell `HashMap<(row, col), usize>`.
+//!
+//! The store is built from the parser's finished `Vec<Cell>`, so it lowers
+//! the memory a cached sheet holds, not the peak while the sheet is parsed:
+//! that peak still includes every cell's owned coordinate, shared-string copy
+//! and formula fields.
+
+use std::sync::Arc;
+
+use crate::{
+    row_col_to_a1, ArrayFormulaInfo, Cell, CellDataType, CellValue, RichTextRun, SharedStrings,
+};
+
+const NO_STYLE: u32 = u32::MAX;
+
+/// Sorted `(row, col)` → cell position lookup.
+///
+/// Costs four bytes per cell plus eight per populated row (and another four
+/// per cell when the source cells were not already in row-major order).
+#[derive(Debug, Clone, Default, PartialEq)]
+pub struct CellIndex {
+    /// `(row, first entry)` for every populated row, ascending by row.
+    rows: Vec<(u32, u32)>,
+    /// Column of each entry, ascending within a row.
+    cols: Vec<u32>,
+    /// Cell position of each entry. Empty when positions equal entries,
+    /// i.e. the cells were strictly row-major on input.
+    slots: Vec<u32>,
+}
+
+impl CellIndex {
+    /// Index cells given their `(row, col)` keys in storage order. When a
+    /// coordinate repeats, the last cell wins.
+    pub fn new(keys: &[(u32, u32)]) -> Self {
+        let row_major = keys.windows(2).all(|pair| pair[0] < pair[1]);
+        let slots = if row_major {
+            Vec::new()
+        } else {
+            let mut order: Vec<u32> = (0..keys.len() as u32).collect();
+            order.sort_by_key(|&pos| keys[pos as usize]);
+            let mut deduped: Vec<u32> = Vec::with_capacity(order.len());
+            for pos in order {
+                match deduped.last_mut() {
+                    Some(last) if keys[*last as usize] == keys[pos as usize] => *last = pos,
+                    _ => deduped.push(pos),
+                }
+            }
+            deduped
+        };
+        let entries = if row_major { keys.len() } else { slots.len() };
+        let mut rows: Vec<(u32, u32)> = Vec::new();
+        let mut cols = Vec::with_capacity(entries);
+        for entry in 0..entries {
+            let pos = if row_major { entry } else { slots[entry] as usize };
+            let (row, col) = keys[pos];
+            if rows.last().map(|&(last, _)| last) != Some(row) {
+                rows.push((row, entry as u32));
+            }
+            cols.push(col);
+        }
+        Self { rows, cols, slots }
+    }
+
+    /// Index a slice of parsed cells.
+    pub fn from_cells(cells: &[Cell]) -> Self {
+        let keys: Vec<(u32, u32)> = cells.iter().map(|cell| (cell.row, cell.col)).collect();
+        Self::new(&keys)
+    }
+
+    /// Position of the cell at 1-based `(row, col)`.
+    pub fn get(&self, row: u32, col: u32) -> Option<usize> {
+        let row_idx = self.rows.binary_search_by_key(&row, |&(r, _)| r).ok()?;
+        let (start, end) = self.row_entries(row_idx);
+        let offset = self.cols[start..end].binary_search(&col).ok()?;
+        Some(self.position(start + offset))
+    }
+
+    /// Positions of cells in rows `min_row..=max_row`, in row-major order.
+    pub fn positions_in_rows(
+        &self,
+        min_row: u32,
+        max_row: u32,
+    ) -> impl Iterator<Item = usize> + '_ {
+        let first_row = self.rows.partition_point(|&(r, _)| r < min_row);
+        let last_row = self.rows.partition_point(|&(r, _)| r <= max_row);
+        let start = self.rows.get(first_row).map_or(self.cols.len(), |&(_, e)| e as usize);
+        let end = self.rows.get(last_row).map_or(self.cols.len(), |&(_, e)| e as usize);
+        (start..end.max(start)).map(move |entry| self.position(entry))
+    }
+
+    /// Number of distinct indexed coordinates.
+    pub fn len(&self) -> usize {
+        self.cols.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.cols.is_empty()
+    }
+
+    fn row_entries(&self, row_idx: usize) -> (usize, usize) {
+        let start = self.rows[row_idx].1 as usize;
+        let end = self
+            .rows
+            .get(row_idx + 1)
+            .map_or(self.cols.len(), |&(_, e)| e as usize);
+        (start, end)
+    }
+
+    fn position(&self, entry: usize) -> usize {
+        if self.slots.is_empty() {
+            entry
+        } else {
+            self.slots[entry] as usize
+        }
+    }
+}
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+enum ValueKind {
+    Empty,
+    Number,
+    Bool,
+    SharedString,
+    String,
+    Error,
+}
+
+#[derive(Debug, Clone, PartialEq)]
+struct FormulaMeta {
+    formula: Option<String>,
+    kind: Option<String>,
+    shared_index: Option<String>,
+    array: Option<ArrayFormulaInfo>,
+}
+
+/// Column-oriented cells for one worksheet, built by
+/// [`NativeXlsxBook::compact_cells`](crate::NativeXlsxBook::compact_cells).
+#[derive(Debug, Clone)]
+pub struct CompactCells {
+    rows: Vec<u32>,
+    cols: Vec<u32>,
+    style_ids: Vec<u32>,
+    data_types: Vec<CellDataType>,
+    kinds: Vec<ValueKind>,
+    /// `f64` bits, a bool, an SST index, or an index into `strings`,
+    /// depending on `kinds`.
+    payload: Vec<u64>,
+    /// Inline, formula-result and ISO-date strings plus error codes.
+    strings: Vec<Box<str>>,
+    /// Formula metadata keyed by cell position, ascending.
+    formulas: Vec<(u32, FormulaMeta)>,
+    /// Inline rich-text runs keyed by cell position, ascending. Shared-string
+    /// runs are resolved through the SST instead.
+    rich_text: Vec<(u32, Vec<RichTextRun>)>,
+    shared_strings: Arc<SharedStrings>,
+    index: CellIndex,
+}
+
+impl CompactCells {
+    pub(crate) fn new(cells: Vec<Cell>, shared_strings: Arc<SharedStrings>) -> Self {
+        let len = cells.len();
+        let keys: Vec<(u32, u32)> = cells.iter().map(|cell| (cell.row, cell.col)).collect();
+        let mut out = Self {
+            rows: Vec::with_capacity(len),
+            cols: Vec::with_capacity(len),
+            style_ids: Vec::with_capacity(len),
+            data_types: Vec::with_capacity(len),
+            kinds: Vec::with_capacity(len),
+            payload: Vec::with_capacity(len),
+            strings: Vec::new(),
+            formulas: Vec::new(),
+            rich_text: Vec::new(),
+            shared_strings,
+            index: CellIndex::new(&keys),
+        };
+        drop(keys);
+        for (pos, cell) in cells.into_iter().enumerate() {
+            out.push(pos as u32, cell);
+        }
+        out.strings.shrink_to_fit();
+        out.formulas.shrink_to_fit();
+        out.rich_text.shrink_to_fit();
+        out
+    }
+
+    fn push(&mut self, pos: u32, cell: Cell) {
+        self.rows.push(cell.row);
+        self.cols.push(cell.col);
+        self.style_ids.push(cell.style_id.unwrap_or(NO_STYLE));
+        self.data_types.push(cell.data_type);
+        let shared = cell
+            .shared_string_index
+            .filter(|&idx| (idx as usize) < self.shared_strings.values.len());
+        let (kind, payload) = match (cell.value, shared) {
+            (CellValue::String(_), Some(idx)) => (ValueKind::SharedString, u64::from(idx)),
+            (CellValue::String(text), None) => (ValueKind::String, self.intern(text)),
+            (CellValue::Error(code), _) => (ValueKind::Error, self.intern(code)),
+            (CellValue::Number(n), _) => (ValueKind::Number, n.to_bits()),
+            (CellValue::Bool(b), _) => (ValueKind::Bool, u64::from(b)),
+            (CellValue::Empty, _) => (ValueKind::Empty, 0),
+        };
+        self.kinds.push(kind);
+        self.payload.push(payload);
+        if cell.formula.is_some()
+            || cell.formula_kind.is_some()
+            || cell.formula_shared_index.is_some()
+            || cell.array_formula.is_some()
+        {
+            self.formulas.push((
+                pos,
+                FormulaMeta {
+                    formula: cell.formula,
+                    kind: cell.formula_kind,
+                    shared_index: cell.formula_shared_index,
+                    array: cell.array_formula,
+                },
+            ));
+        }
+        if shared.is_none() {
+            if let Some(runs) = cell.rich_text {
+                self.rich_text.push((pos, runs));
+            }
+        }
+    }
+
+    fn intern(&mut self, text: String) -> u64 {
+        self.strings.push(text.into_boxed_str());
+        (self.strings.len() - 1) as u64
+    }
+
+    /// Number of stored cells.
+    pub fn len(&self) -> usize {
+        self.rows.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.rows.is_empty()
+    }
+
+    /// The sorted coordinate index.
+    pub fn index(&self) -> &CellIndex {
+        &self.index
+    }
+
+    /// Position of the cell at 1-based `(row, col)`.
+    pub fn find(&self, row: u32, col: u32) -> Option<usize> {
+        self.index.get(row, col)
+    }
+
+    pub fn row(&self, pos: usize) -> u32 {
+        self.rows[pos]
+    }
+
+    pub fn col(&self, pos: usize) -> u32 {
+        self.cols[pos]
+    }
+
+    pub fn style_id(&self, pos: usize) -> Option<u32> {
+        Some(self.style_ids[pos]).filter(|&id| id != NO_STYLE)
+    }
+
+    /// Formula text (without the leading `=`) of the cell at `pos`.
+    pub fn formula(&self, pos: usize) -> Option<&str> {
+        self.formula_meta(pos).and_then(|meta| meta.formula.as_deref())
+    }
+
+    /// Positions of formula cells, ascending.
+    pub fn formula_positions(&self) -> impl Iterator<Item = usize> + '_ {
+        self.formulas
+            .iter()
+            .filter(|(_, meta)| meta.formula.is_some())
+            .map(|(pos, _)| *pos as usize)
+    }
+
+    /// Owned cached value of the cell at `pos`.
+    pub fn value(&self, pos: usize) -> CellValue {
+        let payload = self.payload[pos];
+        match self.kinds[pos] {
+            ValueKind::Empty => CellValue::Empty,
+            ValueKind::Number => CellValue::Number(f64::from_bits(payload)),
+            ValueKind::Bool => CellValue::Bool(payload != 0),
+            ValueKind::SharedString => {
+                CellValue::String(self.shared_strings.values[payload as usize].clone())
+            }
+            ValueKind::String => CellValue::String(self.strings[payload as usize].to_string()),
+            ValueKind::Error => CellValue::Error(self.strings[payload as usize].to_string()),
+        }
+    }
+
+    /// Rich-text runs of the cell at `pos`, from the SST or the inline table.
+    pub fn rich_text(&self, pos: usize) -> Option<&[RichTextRun]> {
+        if self.kinds[pos] == ValueKind::SharedString {
+            return self
+                .shared_strings
+                .rich_text
+                .get(self.payload[pos] as usize)
+                .and_then(Option::as_deref);
+        }
+        let slot = self
+            .rich_text
+            .binary_search_by_key(&(pos as u32), |(p, _)| *p)
+            .ok()?;
+        Some(&self.rich_text[slot].1)
+    }
+
+    /// Rebuild the owned [`Cell`] at `pos`.
+    pub fn cell(&self, pos: usize) -> Cell {
+        let (row, col) = (self.rows[pos], self.cols[pos]);
+        let meta = self.formula_meta(pos);
+        Cell {
+            row,
+            col,
+            coordinate: row_col_to_a1(row, col),
+            style_id: self.style_id(pos),
+            data_type: self.data_types[pos],
+            value: self.value(pos),
+            formula: meta.and_then(|m| m.formula.clone()),
+            formula_kind: meta.and_then(|m| m.kind.clone()),
+            formula_shared_index: meta.and_then(|m| m.shared_index.clone()),
+            array_formula: meta.and_then(|m| m.array.clone()),
+            rich_text: self.rich_text(pos).map(<[RichTextRun]>::to_vec),
+            shared_string_index: (self.kinds[pos] == ValueKind::SharedString)
+                .then(|| self.payload[pos] as u32),
+        }
+    }
+
+    /// Owned cells in storage order.
+    pub fn iter(&self) -> impl Iterator<Item = Cell> + '_ {
+        (0..self.len()).map(|pos| self.cell(pos))
+    }
+
+    fn formula_meta(&self, pos: usize) -> Option<&FormulaMeta> {
+        let slot = self
+            .formulas
+            .binary_search_by_key(&(pos as u32), |(p, _)| *p)
+            .ok()?;
+        Some(&self.formulas[slot].1)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn index_matches_hash_lookup_for_unsorted_duplicates() {
+        let keys = [(2, 1), (1, 3), (1, 1), (2, 1), (5, 2)];
+        let index = CellIndex::new(&keys);
+
+        assert_eq!(index.len(), 4);
+        assert_eq!(index.get(1, 1), Some(2));
+        assert_eq!(index.get(1, 3), Some(1));
+        assert_eq!(index.get(2, 1), Some(3), "last duplicate wins");
+        assert_eq!(index.get(5, 2), Some(4));
+        assert_eq!(index.get(3, 1), None);
+        assert_eq!(index.get(1, 2), None);
+        assert_eq!(index.positions_in_rows(2, 4).collect::<Vec<_>>(), vec![3]);
+        assert_eq!(index.positions_in_rows(6, 9).count(), 0);
+    }
+
+    #[test]
+    fn row_major_index_stores_no_slots() {
+        let keys = [(1, 1), (1, 2), (3, 1)];
+        let index = CellIndex::new(&keys);
+
+        assert!(index.slots.is_empty());
+        assert_eq!(index.get(3, 1), Some(2));
+        assert_eq!(index.positions_in_rows(1, 3).collect::<Vec<_>>(), vec![0, 1, 2]);
+    }
+}
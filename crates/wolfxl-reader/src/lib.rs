@@ -6,16 +6,19 @@
 //! this API while preserving the same value-only public contract they have
 //! today.
 
+mod compact;
 mod xlsb;
 
 pub mod external_links;
 
+pub use compact::{CellIndex, CompactCells};
 pub use xlsb::NativeXlsbBook;
 
 use std::collections::{HashMap, HashSet};
 use std::fs;
 use std::io::{Cursor, Read, Seek};
 use std::path::{Path, PathBuf};
+use std::sync::Arc;
 
 use quick_xml::events::attributes::Attribute;
 use quick_xml::events::{BytesStart, Event};
@@ -28,6 +31,7 @@ const DEFAULT_MAX_ZIP_ENTRIES: usize = 200_000;
 const DEFAULT_MAX_ZIP_ENTRY_BYTES: u64 = 512 * 1024 * 1024;
 const DEFAULT_MAX_ZIP_TOTAL_BYTES: u64 = 4 * 1024 * 1024 * 1024;
 const DEFAULT_MAX_COMPRESSION_RATIO: u64 = 1_000;
+const DEFAULT_MMAP_MIN_BYTES: u64 = 16 * 1024 * 1024;
 
 /// Native reader result type.
 pub type Result<T> = std::result::Result<T, ReaderError>;
@@ -93,6 +97,67 @@ impl Default for SheetState {
     }
 }
 
+/// How much of a worksheet [`NativeXlsxBook::worksheet_with_profile`] parses.
+///
+/// Cell values, number formats, merged ranges and sheet-level structure are
+/// always read. Cheaper profiles skip whole subtrees of the sheet XML and the
+/// ancillary parts reached through the sheet relationships.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum ParseProfile {
+    /// Cell values only: skips comments, tables, drawings (images and
+    /// charts), conditional formatting, data validation, header/footer and
+    /// page-break metadata.
+    Values,
+    /// Values plus cell/row/column formatting and conditional formatting;
+    /// still skips comments, tables, drawings and print metadata.
+    ValuesAndStyles,
+    /// Everything the reader understands.
+    Full,
+}
+
+impl Default for ParseProfile {
+    fn default() -> Self {
+        Self::Full
+    }
+}
+
+impl ParseProfile {
+    /// Parse the `load_workbook(parse_profile=...)` spelling.
+    pub fn from_name(name: &str) -> Option<Self> {
+        match name {
+            "values" => Some(Self::Values),
+            "values+styles" => Some(Self::ValuesAndStyles),
+            "full" => Some(Self::Full),
+            _ => None,
+        }
+    }
+
+    /// True when the comments, tables, images and charts parts are read.
+    pub fn reads_ancillary_parts(self) -> bool {
+        self == Self::Full
+    }
+
+    /// True when the `<local_name>` worksheet subtree is skipped unparsed.
+    fn skips_element(self, local_name: &[u8]) -> bool {
+        match self {
+            Self::Full => false,
+            Self::ValuesAndStyles => matches!(
+                local_name,
+                b"dataValidations" | b"headerFooter" | b"rowBreaks" | b"colBreaks"
+            ),
+            Self::Values => matches!(
+                local_name,
+                b"dataValidations"
+                    | b"conditionalFormatting"
+                    | b"headerFooter"
+                    | b"rowBreaks"
+                    | b"colBreaks"
+                    | b"extLst"
+            ),
+        }
+    }
+}
+
 /// A decoded worksheet cell.
 #[derive(Debug, Clone, PartialEq)]
 pub struct Cell {
@@ -118,6 +183,8 @@ pub struct Cell {
     pub array_formula: Option<ArrayFormulaInfo>,
     /// Structured rich-text runs for shared-string or inline-string cells.
     pub rich_text: Option<Vec<RichTextRun>>,
+    /// Index into the workbook shared-string table when `value` came from it.
+    pub shared_string_index: Option<u32>,
 }
 
 /// Native cell value model shared by future readers.
@@ -1120,10 +1187,83 @@ pub struct RichTextRun {
     pub font: Option<InlineFontProps>,
 }
 
+/// Backing bytes of an opened package: an owned buffer or a read-only
+/// memory map of the source file. Cheap to clone (shared `Arc`).
+#[derive(Debug, Clone)]
+pub struct PackageSource(Arc<SourceBytes>);
+
+#[derive(Debug)]
+enum SourceBytes {
+    Owned(Vec<u8>),
+    Mapped(memmap2::Mmap),
+}
+
+impl PackageSource {
+    /// Wrap an in-memory package.
+    pub fn from_bytes(bytes: Vec<u8>) -> Self {
+        Self(Arc::new(SourceBytes::Owned(bytes)))
+    }
+
+    /// Open `path`, memory-mapping it when it is at least
+    /// `WOLFXL_MMAP_MIN_BYTES` (default 16 MiB) and reading it into memory
+    /// otherwise. Small packages gain nothing from a map, and an owned copy
+    /// is immune to the file being rewritten in place while the book is open.
+    ///
+    /// On Windows the file is always read: a mapped file cannot be
+    /// replaced, which would break modify-mode in-place saves.
+    ///
+    /// While a mapped book is open, another process truncating or
+    /// rewriting the file in place makes later part reads fault (SIGBUS
+    /// on Unix) instead of returning an error. Set `WOLFXL_MMAP_MIN_BYTES`
+    /// above the file size to read such files into memory instead.
+    pub fn open_path(path: impl AsRef<Path>) -> Result<Self> {
+        let path = path.as_ref();
+        if cfg!(windows) || fs::metadata(path)?.len() < mmap_min_bytes() {
+            return Ok(Self::from_bytes(fs::read(path)?));
+        }
+        Self::map_path(path)
+    }
+
+    /// Memory-map `path` read-only. Pages are faulted in (and inflated by
+    /// the ZIP reader) only when a part is actually read, so opening a
+    /// multi-GB package does not copy it into the heap. Falls back to
+    /// reading the file when it cannot be mapped (empty or special files).
+    pub fn map_path(path: impl AsRef<Path>) -> Result<Self> {
+        let file = fs::File::open(path.as_ref())?;
+        // SAFETY: the map is read-only and private to this process. As with
+        // every mmap-backed reader, truncating the file underneath an open
+        // book is undefined behaviour: touching a page past the new end of
+        // file raises SIGBUS and kills the process. WolfXL's own savers
+        // replace files via atomic rename, which leaves the mapped inode
+        // intact; see `open_path` for opting out of the map.
+        match unsafe { memmap2::Mmap::map(&file) } {
+            Ok(map) => Ok(Self(Arc::new(SourceBytes::Mapped(map)))),
+            Err(_) => Ok(Self::from_bytes(fs::read(path)?)),
+        }
+    }
+
+    /// True when the package is backed by a memory map.
+    pub fn is_mapped(&self) -> bool {
+        matches!(*self.0, SourceBytes::Mapped(_))
+    }
+}
+
+impl AsRef<[u8]> for PackageSource {
+    fn as_ref(&self) -> &[u8] {
+        match &*self.0 {
+            SourceBytes::Owned(bytes) => bytes,
+            SourceBytes::Mapped(map) => map,
+        }
+    }
+}
+
 /// Native XLSX/XLSM workbook reader.
 #[derive(Debug, Clone)]
 pub struct NativeXlsxBook {
-    bytes: Vec<u8>,
+    /// ZIP archive over the package source. The central directory is parsed
+    /// once at open; `ZipArchive` clones share it, so per-sheet reads skip
+    /// re-scanning the directory.
+    archive: ZipArchive<Cursor<PackageSource>>,
     sheets: Vec<SheetInfo>,
     named_ranges: Vec<NamedRange>,
     print_areas: HashMap<String, String>,
@@ -1134,7 +1274,7 @@ pub struct NativeXlsxBook {
     workbook_views: Vec<BookViewInfo>,
     custom_doc_properties: Vec<CustomPropertyInfo>,
     doc_properties: HashMap<String, String>,
-    shared_strings: SharedStrings,
+    shared_strings: Arc<SharedStrings>,
     styles: StyleTables,
     date1904: bool,
     /// Workbook-scoped person registry parsed from `xl/persons/personList.xml`.
@@ -1150,8 +1290,11 @@ impl NativeXlsxBook {
 
     /// Open an OOXML workbook from disk, optionally enabling malformed-topology
     /// recovery for legacy-compatible permissive loads.
+    ///
+    /// The file is memory-mapped rather than read into memory; see
+    /// [`PackageSource::open_path`].
     pub fn open_path_permissive(path: impl AsRef<Path>, permissive: bool) -> Result<Self> {
-        Self::open_bytes_permissive(fs::read(path)?, permissive)
+        Self::open_source_permissive(PackageSource::open_path(path)?, permissive)
     }
 
     /// Open an OOXML workbook from bytes.
@@ -1162,8 +1305,12 @@ impl NativeXlsxBook {
     /// Open an OOXML workbook from bytes, optionally enabling
     /// malformed-topology recovery for legacy-compatible permissive loads.
     pub fn open_bytes_permissive(bytes: impl Into<Vec<u8>>, permissive: bool) -> Result<Self> {
-        let bytes = bytes.into();
-        let mut zip = zip_from_bytes(&bytes)?;
+        Self::open_source_permissive(PackageSource::from_bytes(bytes.into()), permissive)
+    }
+
+    /// Open an OOXML workbook from an owned or memory-mapped package source.
+    pub fn open_source_permissive(source: PackageSource, permissive: bool) -> Result<Self> {
+        let mut zip = ZipArchive::new(Cursor::new(source)).map_err(ReaderError::Zip)?;
         validate_zip_archive(&mut zip)?;
         let workbook_xml = read_part_required(&mut zip, "xl/workbook.xml")?;
         let workbook_rels = read_part_required(&mut zip, "xl/_rels/workbook.xml.rels")?;
@@ -1221,7 +1368,7 @@ impl NativeXlsxBook {
         };
 
         Ok(Self {
-            bytes,
+            archive: zip,
             sheets,
             named_ranges,
             print_areas,
@@ -1232,13 +1379,18 @@ impl NativeXlsxBook {
             workbook_views,
             custom_doc_properties,
             doc_properties,
-            shared_strings,
+            shared_strings: Arc::new(shared_strings),
             styles,
             date1904,
             persons,
         })
     }
 
+    /// True when the package bytes are memory-mapped from disk.
+    pub fn is_memory_mapped(&self) -> bool {
+        self.archive.clone().into_inner().get_ref().is_mapped()
+    }
+
     /// Workbook-scoped persons registry for threaded comments (RFC-068).
     ///
     /// Returns an empty slice when the workbook has no threaded-comment
@@ -1362,12 +1514,29 @@ impl NativeXlsxBook {
         self.styles.named_style_for_style_id(style_id)
     }
 
+    /// Move parsed cells into a [`CompactCells`] store whose shared strings
+    /// stay indices into this workbook's SST. `cells` is consumed, but peak
+    /// memory still includes the full owned vector the parser built.
+    pub fn compact_cells(&self, cells: Vec<Cell>) -> CompactCells {
+        CompactCells::new(cells, Arc::clone(&self.shared_strings))
+    }
+
     /// Parse a worksheet into sparse decoded cells.
     pub fn worksheet(&self, sheet_name: &str) -> Result<WorksheetData> {
+        self.worksheet_with_profile(sheet_name, ParseProfile::Full)
+    }
+
+    /// Parse a worksheet, reading only what `profile` asks for. Fields the
+    /// profile skips are left empty.
+    pub fn worksheet_with_profile(
+        &self,
+        sheet_name: &str,
+        profile: ParseProfile,
+    ) -> Result<WorksheetData> {
         let Some(info) = self.sheets.iter().find(|s| s.name == sheet_name) else {
             return Err(ReaderError::SheetNotFound(sheet_name.to_string()));
         };
-        let mut zip = zip_from_bytes(&self.bytes)?;
+        let mut zip = self.archive.clone();
         let xml = read_part_required(&mut zip, &info.path)?;
         let rels = read_part_optional(&mut zip, &sheet_rels_path(&info.path))?
             .map(|xml| {
@@ -1375,6 +1544,16 @@ impl NativeXlsxBook {
                     .map_err(|e| ReaderError::Xml(format!("failed to parse sheet rels: {e}")))
             })
             .transpose()?;
+        if !profile.reads_ancillary_parts() {
+            return parse_worksheet_with_profile(
+                &xml,
+                &self.shared_strings,
+                rels.as_ref(),
+                Vec::new(),
+                Vec::new(),
+                profile,
+            );
+        }
         let comments = match rels.as_ref().and_then(comments_target) {
             Some(target) => read_part_optional(
                 &mut zip,
@@ -1421,7 +1600,7 @@ impl NativeXlsxBook {
         else {
             return Err(ReaderError::SheetNotFound(sheet_name.to_string()));
         };
-        let mut zip = zip_from_bytes(&self.bytes)?;
+        let mut zip = self.archive.clone();
         let rels = read_part_optional(&mut zip, &sheet_rels_path(&info.path))?
             .map(|xml| {
                 RelsGraph::parse(xml.as_bytes())
@@ -2812,10 +2991,29 @@ fn parse_worksheet(
     rels: Option<&RelsGraph>,
     comments: Vec<Comment>,
     tables: Vec<Table>,
+) -> Result<WorksheetData> {
+    parse_worksheet_with_profile(
+        xml,
+        shared_strings,
+        rels,
+        comments,
+        tables,
+        ParseProfile::Full,
+    )
+}
+
+fn parse_worksheet_with_profile(
+    xml: &str,
+    shared_strings: &SharedStrings,
+    rels: Option<&RelsGraph>,
+    comments: Vec<Comment>,
+    tables: Vec<Table>,
+    profile: ParseProfile,
 ) -> Result<WorksheetData> {
     let mut reader = XmlReader::from_str(xml);
     reader.config_mut().trim_text(false);
     let mut buf = Vec::new();
+    let mut skip_buf = Vec::new();
     let mut dimension = None;
     let mut merged_ranges = Vec::new();
     let mut hyperlink_nodes = Vec::new();
@@ -2854,6 +3052,13 @@ fn parse_worksheet(
 
     loop {
         match reader.read_event_into(&mut buf) {
+            Ok(Event::Start(e)) if profile.skips_element(e.local_name().as_ref()) => {
+                let end = e.to_end().into_owned();
+                reader
+                    .read_to_end_into(end.name(), &mut skip_buf)
+                    .map_err(|e| ReaderError::Xml(format!("failed to parse worksheet: {e}")))?;
+                skip_buf.clear();
+            }
             Ok(Event::Start(e)) => match e.local_name().as_ref() {
                 b"sheetPr" => {
                     sheet_properties = Some(SheetPropertiesInfo::from_start(&e));
@@ -5908,6 +6113,9 @@ impl CellBuilder {
             formula_shared_index: self.formula_shared_index,
             array_formula,
             rich_text,
+            shared_string_index: shared_string_idx
+                .filter(|&idx| idx < shared_strings.values.len())
+                .and_then(|idx| u32::try_from(idx).ok()),
         })
     }
 }
@@ -5919,10 +6127,6 @@ enum TextTarget {
     InlineString,
 }
 
-fn zip_from_bytes(bytes: &[u8]) -> Result<ZipArchive<Cursor<&[u8]>>> {
-    ZipArchive::new(Cursor::new(bytes)).map_err(ReaderError::Zip)
-}
-
 fn env_usize(name: &str, default: usize) -> usize {
     std::env::var(name)
         .ok()
@@ -5956,6 +6160,10 @@ fn max_zip_compression_ratio() -> u64 {
     )
 }
 
+fn mmap_min_bytes() -> u64 {
+    env_u64("WOLFXL_MMAP_MIN_BYTES", DEFAULT_MMAP_MIN_BYTES)
+}
+
 fn validate_zip_archive<R: Read + Seek>(zip: &mut ZipArchive<R>) -> Result<()> {
     if zip.len() > max_zip_entries() {
         return Err(ReaderError::Unsupported(format!(
@@ -6272,6 +6480,41 @@ mod tests {
         assert!(!sheet.cells.is_empty(), "fixture should have cells");
     }
 
+    #[test]
+    fn mapped_source_matches_bytes_open() {
+        let path = concat!(
+            env!("CARGO_MANIFEST_DIR"),
+            "/../../tests/fixtures/sprint_kappa_smoke.xlsx"
+        );
+        let source = PackageSource::map_path(path).expect("fixture maps");
+        let mapped = NativeXlsxBook::open_source_permissive(source, false).expect("mapped opens");
+        let owned = NativeXlsxBook::open_bytes(XLSX_BYTES).expect("fixture opens from bytes");
+        assert!(mapped.is_memory_mapped());
+        assert!(!owned.is_memory_mapped());
+        assert_eq!(mapped.sheet_names(), owned.sheet_names());
+        let first = owned.sheet_names()[0].to_string();
+        // Repeated sheet reads reuse the cached central directory.
+        for _ in 0..2 {
+            let a = mapped.worksheet(&first).expect("mapped sheet");
+            let b = owned.worksheet(&first).expect("owned sheet");
+            assert_eq!(a.cells.len(), b.cells.len());
+        }
+    }
+
+    #[test]
+    fn compact_cells_round_trip_parsed_cells() {
+        let book = NativeXlsxBook::open_bytes(XLSX_BYTES).expect("fixture opens");
+        for name in book.sheet_names() {
+            let cells = book.worksheet(name).expect("sheet parses").cells;
+            let compact = book.compact_cells(cells.clone());
+            assert_eq!(compact.len(), cells.len());
+            for (pos, cell) in cells.iter().enumerate() {
+                assert_eq!(&compact.cell(pos), cell);
+                assert_eq!(compact.find(cell.row, cell.col), Some(pos));
+            }
+        }
+    }
+
     #[test]
     fn parses_workbook_sheet_order_and_state() {
         let xml = r#"<workbook xmlns:r="r">
@@ -6679,6 +6922,49 @@ mod tests {
         );
     }
 
+    #[test]
+    fn values_profile_skips_validation_and_conditional_format_subtrees() {
+        let xml = r#"<worksheet><sheetData>
+            <row r="1"><c r="A1"><v>1</v></c><c r="B1"><v>2</v></c></row>
+        </sheetData>
+        <mergeCells count="1"><mergeCell ref="A1:B1"/></mergeCells>
+        <conditionalFormatting sqref="A1:B1">
+            <cfRule type="cellIs" dxfId="0" priority="1" operator="greaterThan"><formula>0</formula></cfRule>
+        </conditionalFormatting>
+        <dataValidations count="1">
+            <dataValidation type="whole" sqref="A1"><formula1>0</formula1></dataValidation>
+        </dataValidations>
+        <headerFooter><oddHeader>&amp;CTitle</oddHeader></headerFooter>
+        </worksheet>"#;
+        let parse = |profile| {
+            parse_worksheet_with_profile(
+                xml,
+                &SharedStrings::default(),
+                None,
+                Vec::new(),
+                Vec::new(),
+                profile,
+            )
+            .expect("parse worksheet")
+        };
+        let full = parse(ParseProfile::Full);
+        let styles = parse(ParseProfile::ValuesAndStyles);
+        let values = parse(ParseProfile::Values);
+
+        assert_eq!(full.conditional_formats.len(), 1);
+        assert_eq!(full.data_validations.len(), 1);
+        assert!(full.header_footer.is_some());
+        assert_eq!(styles.conditional_formats.len(), 1);
+        assert!(styles.data_validations.is_empty());
+        assert!(styles.header_footer.is_none());
+        assert!(values.conditional_formats.is_empty());
+        assert!(values.data_validations.is_empty());
+        for sheet in [&styles, &values] {
+            assert_eq!(sheet.cells, full.cells);
+            assert_eq!(sheet.merged_ranges, full.merged_ranges);
+        }
+    }
+
     #[test]
     fn expands_shared_formula_children() {
         let xml = r#"<worksheet><sheetData>
@@ -1125,6 +1125,7 @@ fn make_cell(
         formula_shared_index: None,
         array_formula: None,
         rich_text: None,
+        shared_string_index: None,
     }
 }
 
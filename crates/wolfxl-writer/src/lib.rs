@@ -358,9 +358,46 @@ fn package_emit_ops<W: std::io::Write + std::io::Seek>(
 
     let zip_to_io = |e: ::zip::result::ZipError| std::io::Error::other(e.to_string());
 
+    // Parallel mode: DEFLATE every buffered part on the worker pool up
+    // front, then raw-copy the shards in op order below. Streamed sheet
+    // bodies still compress inline since they never exist in memory.
+    let threads = crate::zip::compression_threads();
+    let mut shards = if threads > 1 {
+        let jobs: Vec<crate::zip::ShardJob<'_>> = ops
+            .iter()
+            .filter_map(|op| match op {
+                EmitOp::Bytes(entry) => Some(entry),
+                EmitOp::SheetStream { .. } => None,
+            })
+            .map(|entry| {
+                let method = if entry.bytes.len() < DEFLATE_MIN_BYTES {
+                    CompressionMethod::Stored
+                } else {
+                    CompressionMethod::Deflated
+                };
+                let mut opts = SimpleFileOptions::default().compression_method(method);
+                if let Some(dt) = epoch_override {
+                    opts = opts.last_modified_time(dt);
+                }
+                crate::zip::ShardJob {
+                    path: entry.path.clone(),
+                    bytes: &entry.bytes,
+                    options: opts,
+                }
+            })
+            .collect();
+        Some(crate::zip::compress_shards(&jobs, threads)?.into_iter())
+    } else {
+        None
+    };
+
     for op in ops {
         match op {
             EmitOp::Bytes(entry) => {
+                if let Some(shard) = shards.as_mut().and_then(|it| it.next()) {
+                    crate::zip::append_shard(&mut writer, shard)?;
+                    continue;
+                }
                 let method = if entry.bytes.len() < DEFLATE_MIN_BYTES {
                     CompressionMethod::Stored
                 } else {
@@ -26,16 +26,25 @@
 //!   for anything smaller — tiny XML stubs don't benefit from DEFLATE and
 //!   STORE keeps the hot path simple.
 //!
+//! - When `WOLFXL_ZIP_THREADS` is set above 1, entries are DEFLATEd on a
+//!   scoped worker pool first (each into its own single-entry shard) and
+//!   the finished compressed streams are raw-copied into the archive in
+//!   caller order. See [`compress_shards`].
+//!
 //! # Determinism
 //!
 //! Setting `WOLFXL_TEST_EPOCH=0` (or any integer) forces every entry's
 //! mtime to the same fixed Unix timestamp. Two calls to `package` with
-//! the same input produce byte-identical output in that mode.
+//! the same input produce byte-identical output in that mode. Parallel
+//! mode keeps that guarantee: each shard is compressed by the same code
+//! regardless of which worker picks it up, and shards are appended in
+//! input order, so the output does not depend on the thread count.
 
 use std::io::{Cursor, Seek, Write};
+use std::sync::atomic::{AtomicUsize, Ordering};
 
 use zip::write::SimpleFileOptions;
-use zip::{CompressionMethod, DateTime as ZipDateTime, ZipWriter};
+use zip::{CompressionMethod, DateTime as ZipDateTime, ZipArchive, ZipWriter};
 
 /// Entries below this size skip DEFLATE and use STORE. Small XML stubs
 /// (`_rels/.rels`, `docProps/app.xml`) gain nothing from compression.
@@ -77,20 +86,41 @@ pub fn package(entries: &[ZipEntry]) -> Result<Vec<u8>, std::io::Error> {
 pub fn package_to<W: Write + Seek>(
     entries: &[ZipEntry],
     dest: &mut W,
+) -> Result<(), std::io::Error> {
+    package_to_with_threads(entries, dest, compression_threads())
+}
+
+/// [`package_to`] with an explicit compression thread count.
+///
+/// `threads <= 1` compresses inline on the calling thread. Larger values
+/// DEFLATE every entry on a worker pool via [`compress_shards`] before
+/// appending them in input order.
+pub fn package_to_with_threads<W: Write + Seek>(
+    entries: &[ZipEntry],
+    dest: &mut W,
+    threads: usize,
 ) -> Result<(), std::io::Error> {
     let mut writer = ZipWriter::new(dest);
     let epoch_override = test_epoch_override().and_then(epoch_to_zip_datetime);
 
-    for entry in entries {
-        let method = if entry.bytes.len() < DEFLATE_MIN_BYTES {
-            CompressionMethod::Stored
-        } else {
-            CompressionMethod::Deflated
-        };
-        let mut opts = SimpleFileOptions::default().compression_method(method);
-        if let Some(dt) = epoch_override {
-            opts = opts.last_modified_time(dt);
+    if threads > 1 {
+        let jobs: Vec<ShardJob<'_>> = entries
+            .iter()
+            .map(|entry| ShardJob {
+                path: entry.path.clone(),
+                bytes: &entry.bytes,
+                options: entry_options(entry.bytes.len(), epoch_override),
+            })
+            .collect();
+        for shard in compress_shards(&jobs, threads)? {
+            append_shard(&mut writer, shard)?;
         }
+        writer.finish().map_err(zip_to_io)?;
+        return Ok(());
+    }
+
+    for entry in entries {
+        let opts = entry_options(entry.bytes.len(), epoch_override);
         writer
             .start_file(entry.path.clone(), opts)
             .map_err(zip_to_io)?;
@@ -100,6 +130,113 @@ pub fn package_to<W: Write + Seek>(
     Ok(())
 }
 
+/// STORE below [`DEFLATE_MIN_BYTES`], DEFLATE (level 6) otherwise, with
+/// the optional `WOLFXL_TEST_EPOCH` mtime applied.
+fn entry_options(len: usize, epoch_override: Option<ZipDateTime>) -> SimpleFileOptions {
+    let method = if len < DEFLATE_MIN_BYTES {
+        CompressionMethod::Stored
+    } else {
+        CompressionMethod::Deflated
+    };
+    let mut opts = SimpleFileOptions::default().compression_method(method);
+    if let Some(dt) = epoch_override {
+        opts = opts.last_modified_time(dt);
+    }
+    opts
+}
+
+/// Number of worker threads to use for part compression.
+///
+/// Reads `WOLFXL_ZIP_THREADS`: unset, empty, `0` or `1` keep the
+/// single-threaded packager; any larger integer sizes the worker pool;
+/// `auto` uses [`std::thread::available_parallelism`].
+pub fn compression_threads() -> usize {
+    match std::env::var("WOLFXL_ZIP_THREADS") {
+        Ok(raw) if raw.trim().eq_ignore_ascii_case("auto") => {
+            std::thread::available_parallelism().map_or(1, |n| n.get())
+        }
+        Ok(raw) => raw.trim().parse::<usize>().unwrap_or(1).max(1),
+        Err(_) => 1,
+    }
+}
+
+/// One part queued for off-thread compression.
+#[derive(Debug, Clone)]
+pub struct ShardJob<'a> {
+    /// Entry path inside the final archive.
+    pub path: String,
+    /// Uncompressed part body.
+    pub bytes: &'a [u8],
+    /// Options the entry would have been written with inline.
+    pub options: SimpleFileOptions,
+}
+
+/// Compress `jobs` on up to `threads` scoped workers.
+///
+/// Each job becomes a complete single-entry ZIP archive ("shard") holding
+/// the compressed stream plus its CRC and sizes. The returned vector is in
+/// job order; hand each shard to [`append_shard`] to move its compressed
+/// bytes into the real archive without re-deflating.
+pub fn compress_shards(
+    jobs: &[ShardJob<'_>],
+    threads: usize,
+) -> Result<Vec<Vec<u8>>, std::io::Error> {
+    let workers = threads.min(jobs.len()).max(1);
+    if workers == 1 {
+        return jobs.iter().map(compress_shard).collect();
+    }
+
+    let next = AtomicUsize::new(0);
+    let mut results: Vec<Option<Result<Vec<u8>, std::io::Error>>> =
+        (0..jobs.len()).map(|_| None).collect();
+    std::thread::scope(|scope| {
+        let handles: Vec<_> = (0..workers)
+            .map(|_| {
+                scope.spawn(|| {
+                    let mut done = Vec::new();
+                    loop {
+                        let idx = next.fetch_add(1, Ordering::Relaxed);
+                        let Some(job) = jobs.get(idx) else {
+                            break;
+                        };
+                        done.push((idx, compress_shard(job)));
+                    }
+                    done
+                })
+            })
+            .collect();
+        for handle in handles {
+            for (idx, shard) in handle.join().expect("zip compression worker panicked") {
+                results[idx] = Some(shard);
+            }
+        }
+    });
+    results
+        .into_iter()
+        .map(|shard| shard.expect("every shard job is claimed by a worker"))
+        .collect()
+}
+
+fn compress_shard(job: &ShardJob<'_>) -> Result<Vec<u8>, std::io::Error> {
+    let mut shard = ZipWriter::new(Cursor::new(Vec::with_capacity(job.bytes.len() / 4 + 256)));
+    shard
+        .start_file(job.path.clone(), job.options)
+        .map_err(zip_to_io)?;
+    shard.write_all(job.bytes)?;
+    Ok(shard.finish().map_err(zip_to_io)?.into_inner())
+}
+
+/// Raw-copy the single entry of a shard produced by [`compress_shards`]
+/// into `writer`, keeping its compressed bytes, CRC and sizes.
+pub fn append_shard<W: Write + Seek>(
+    writer: &mut ZipWriter<W>,
+    shard: Vec<u8>,
+) -> Result<(), std::io::Error> {
+    let mut archive = ZipArchive::new(Cursor::new(shard)).map_err(zip_to_io)?;
+    let file = archive.by_index_raw(0).map_err(zip_to_io)?;
+    writer.raw_copy_file(file).map_err(zip_to_io)
+}
+
 /// Read the `WOLFXL_TEST_EPOCH` env var; if set (to any value including
 /// "0"), return it as the mtime to stamp on every entry. Otherwise
 /// return `None` and the packager uses the `zip` crate's default.
@@ -268,6 +405,53 @@ mod tests {
         assert!(dt.is_valid());
     }
 
+    #[test]
+    fn parallel_packaging_is_deterministic_across_thread_counts() {
+        let _guard = EpochGuard::set("0");
+        let entries: Vec<ZipEntry> = (0..12)
+            .map(|i| ZipEntry {
+                path: format!("xl/worksheets/sheet{}.xml", i + 1),
+                bytes: format!("<row r=\"{i}\"><c><v>{i}</v></c></row>")
+                    .repeat(40 + i)
+                    .into_bytes(),
+            })
+            .chain(std::iter::once(ZipEntry {
+                path: "_rels/.rels".to_string(),
+                bytes: b"<r/>".to_vec(),
+            }))
+            .collect();
+
+        let mut serial = Cursor::new(Vec::<u8>::new());
+        package_to_with_threads(&entries, &mut serial, 1).expect("serial");
+        let mut two = Cursor::new(Vec::<u8>::new());
+        package_to_with_threads(&entries, &mut two, 2).expect("2 threads");
+        let mut eight = Cursor::new(Vec::<u8>::new());
+        package_to_with_threads(&entries, &mut eight, 8).expect("8 threads");
+        assert_eq!(
+            serial.get_ref(),
+            two.get_ref(),
+            "raw-copied shards must match inline compression byte for byte"
+        );
+        assert_eq!(
+            two.get_ref(),
+            eight.get_ref(),
+            "thread count must not leak into bytes"
+        );
+
+        let mut archive = zip::ZipArchive::new(Cursor::new(two.into_inner())).expect("open");
+        let names: Vec<String> = archive.file_names().map(|s| s.to_string()).collect();
+        let expected: Vec<String> = entries.iter().map(|e| e.path.clone()).collect();
+        assert_eq!(names, expected, "input order is preserved");
+        for entry in &entries {
+            let mut file = archive.by_name(&entry.path).expect("entry");
+            let mut body = Vec::new();
+            file.read_to_end(&mut body).expect("inflate");
+            assert_eq!(body, entry.bytes);
+        }
+        let rels = archive.by_name("_rels/.rels").expect("rels");
+        assert_eq!(rels.compression(), CompressionMethod::Stored);
+    }
+
     #[test]
     fn package_to_matches_package_byte_for_byte() {
         // The streaming `package_to` path and the buffered `package` path
@@ -64,6 +64,9 @@ __all__ = [
 ]
 
 
+_PARSE_PROFILES = ("values", "values+styles", "full")
+
+
 def load_workbook(
     filename: (
         str
@@ -81,6 +84,7 @@ def load_workbook(
     permissive: bool = False,
     rich_text: bool = False,
     password: str | bytes | None = None,
+    parse_profile: str = "full",
 ) -> Workbook:
     """Open a workbook for reading, streaming, or modify-mode saves.
 
@@ -103,16 +107,30 @@ def load_workbook(
             shared-string runs.
         password: Decrypt OOXML-encrypted ``.xlsx`` inputs with the optional
             ``wolfxl[encrypted]`` dependency.
+        parse_profile: How much of each ``.xlsx`` worksheet to parse in
+            read mode. ``"full"`` (default) reads everything;
+            ``"values+styles"`` skips comments, tables, images, charts, data
+            validation and print metadata; ``"values"`` additionally skips
+            conditional formatting. Skipped features read back empty.
 
     Returns:
         A :class:`Workbook` in read, streaming, or modify mode.
 
+    Note:
+        ``.xlsx`` files of 16 MiB or more are memory-mapped rather than read
+        into memory (except on Windows). Truncating or rewriting such a file
+        in place from another process while the workbook is open crashes
+        the interpreter with ``SIGBUS`` on the next read; saving over it
+        with wolfxl is safe. Set the ``WOLFXL_MMAP_MIN_BYTES`` environment
+        variable to a larger byte count to change the threshold.
+
     Raises:
         InvalidFileException: If the input format cannot be identified.
         NotImplementedError: If the requested mode is unsupported for the
             detected format, such as modify mode for ``.xlsb``.
         ValueError: If an encrypted workbook needs a password or the supplied
-            password cannot decrypt it.
+            password cannot decrypt it, or ``parse_profile`` is unknown or
+            combined with modify mode.
     """
     from wolfxl._loader import classify_input
     from wolfxl._workbook_sources import open_workbook_source
@@ -139,6 +157,17 @@ def load_workbook(
     if keep_vba and not modify:
         modify = True
 
+    if parse_profile not in _PARSE_PROFILES:
+        raise ValueError(
+            f"parse_profile must be one of {', '.join(map(repr, _PARSE_PROFILES))}; "
+            f"got {parse_profile!r}"
+        )
+    if modify and parse_profile != "full":
+        raise ValueError(
+            "parse_profile is read-mode only; modify mode needs the full "
+            "worksheet model to save losslessly"
+        )
+
     if fmt in ("xlsb", "xls"):
         if modify:
             raise NotImplementedError(
@@ -188,6 +217,10 @@ def load_workbook(
     )
 
     wb._rich_text = rich_text  # noqa: SLF001
+    if parse_profile != "full":
+        set_profile = getattr(wb._rust_reader, "set_parse_profile", None)  # noqa: SLF001
+        if set_profile is not None:
+            set_profile(parse_profile)
     return wb
 
 
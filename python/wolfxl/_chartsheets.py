@@ -8,10 +8,7 @@ reused without adding a second writer model.
 
 from __future__ import annotations
 
-import os
 import re
-import tempfile
-import zipfile
 from typing import Any
 from xml.etree import ElementTree as ET
 
@@ -54,8 +51,8 @@ def create_chartsheet(wb: Any, title: str | None = None, index: int | None = Non
     return cs
 
 
-def apply_chartsheets_to_xlsx(path: str, wb: Any) -> None:
-    """Rewrite ``path`` to include any authored chartsheets."""
+def apply_chartsheets_to_package(package: Any, wb: Any) -> None:
+    """Add any authored chartsheets to a ``SavePackage``."""
     chartsheets = [
         wb._chartsheets[name]  # noqa: SLF001
         for name in wb._sheet_names  # noqa: SLF001
@@ -65,11 +62,10 @@ def apply_chartsheets_to_xlsx(path: str, wb: Any) -> None:
     if not chartsheets:
         return
 
-    with zipfile.ZipFile(path, "r") as src:
-        workbook_xml = src.read("xl/workbook.xml")
-        workbook_rels_xml = src.read("xl/_rels/workbook.xml.rels")
-        content_types_xml = src.read("[Content_Types].xml")
-        names = src.namelist()
+    workbook_xml = package.read("xl/workbook.xml")
+    workbook_rels_xml = package.read("xl/_rels/workbook.xml.rels")
+    content_types_xml = package.read("[Content_Types].xml")
+    names = package.namelist()
 
     next_chartsheet = _next_index(names, r"^xl/chartsheets/sheet(\d+)\.xml$")
     next_drawing = _next_index(names, r"^xl/drawings/drawing(\d+)\.xml$")
@@ -122,23 +118,8 @@ def apply_chartsheets_to_xlsx(path: str, wb: Any) -> None:
         content_type_overrides,
     )
 
-    fd, tmp_name = tempfile.mkstemp(prefix="wolfxl-chartsheets-", suffix=".xlsx")
-    os.close(fd)
-    try:
-        with zipfile.ZipFile(path, "r") as src, zipfile.ZipFile(
-            tmp_name, "w", zipfile.ZIP_DEFLATED
-        ) as dst:
-            for info in src.infolist():
-                if info.filename in generated:
-                    continue
-                with src.open(info, "r") as handle:
-                    dst.writestr(info, handle.read())
-            for name in sorted(generated):
-                dst.writestr(name, generated[name])
-        os.replace(tmp_name, path)
-    finally:
-        if os.path.exists(tmp_name):
-            os.unlink(tmp_name)
+    for name in sorted(generated):
+        package.write(name, generated[name])
     wb._chartsheets_dirty = False  # noqa: SLF001
 
 
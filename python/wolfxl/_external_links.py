@@ -25,9 +25,7 @@ collection is dirty; unchanged collections preserve source bytes.
 from __future__ import annotations
 
 import zipfile
-import os
 import re
-import tempfile
 from dataclasses import dataclass, field
 from typing import Any
 from xml.etree import ElementTree as ET
@@ -253,17 +251,16 @@ def load_external_links_from_bytes(data: bytes | bytearray | memoryview) -> Exte
         return ExternalLinkCollection()
 
 
-def apply_authoring_to_xlsx(path: str, links: ExternalLinkCollection) -> None:
-    """Rewrite workbook external-link parts to match ``links``."""
+def apply_authoring_to_package(package: Any, links: ExternalLinkCollection) -> None:
+    """Rewrite the external-link parts of a ``SavePackage`` to match ``links``."""
     if not links.dirty:
         return
-    with zipfile.ZipFile(path, "r") as src:
-        try:
-            workbook_xml = src.read("xl/workbook.xml").decode("utf-8")
-            workbook_rels_xml = src.read("xl/_rels/workbook.xml.rels")
-            content_types_xml = src.read("[Content_Types].xml")
-        except KeyError as exc:
-            raise ValueError(f"workbook missing required OOXML part: {exc.args[0]}") from exc
+    try:
+        workbook_xml = package.read("xl/workbook.xml").decode("utf-8")
+        workbook_rels_xml = package.read("xl/_rels/workbook.xml.rels")
+        content_types_xml = package.read("[Content_Types].xml")
+    except KeyError as exc:
+        raise ValueError(f"workbook missing required OOXML part: {exc.args[0]}") from exc
 
     link_list = list(links)
     formula_replacements = _external_link_formula_replacements(link_list)
@@ -286,29 +283,20 @@ def apply_authoring_to_xlsx(path: str, links: ExternalLinkCollection) -> None:
             _render_external_link_rels_xml(link)
         )
 
-    fd, tmp_name = tempfile.mkstemp(prefix="wolfxl-extlinks-", suffix=".xlsx")
-    os.close(fd)
-    try:
-        with zipfile.ZipFile(path, "r") as src, zipfile.ZipFile(
-            tmp_name, "w", zipfile.ZIP_DEFLATED
-        ) as dst:
-            for info in src.infolist():
-                name = info.filename
-                if name.startswith("xl/externalLinks/") or name in generated:
-                    continue
-                with src.open(info, "r") as handle:
-                    data = _rewrite_part_external_formula_targets(
-                        name,
-                        handle.read(),
-                        formula_replacements,
-                    )
-                    dst.writestr(info, data)
-            for name in sorted(generated):
-                dst.writestr(name, generated[name])
-        os.replace(tmp_name, path)
-    finally:
-        if os.path.exists(tmp_name):
-            os.unlink(tmp_name)
+    for name in package.namelist():
+        if name in generated:
+            continue
+        if name.startswith("xl/externalLinks/"):
+            package.delete(name)
+            continue
+        if not formula_replacements or not name.startswith(_FORMULA_PART_PREFIXES):
+            continue
+        data = package.read(name)
+        rewritten = _rewrite_part_external_formula_targets(name, data, formula_replacements)
+        if rewritten != data:
+            package.write(name, rewritten)
+    for name in sorted(generated):
+        package.write(name, generated[name])
     links.mark_clean()
 
 
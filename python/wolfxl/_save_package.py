@@ -0,0 +1,47 @@
+"""Part-level view of the package an ``XlsxPatcher`` is about to save.
+
+Post-save authoring steps (external links, chartsheets, source charts,
+pivot layouts) used to reopen the saved file with :mod:`zipfile` and
+rewrite the whole archive once each. :class:`SavePackage` lets them edit
+parts of the patcher's pending output instead, so the patcher writes the
+archive once and only the parts that changed are compressed.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class SavePackage:
+    """Read and edit the parts of a patcher's pending save.
+
+    The first access runs the patcher's queued save phases
+    (``prepare_save``); reads then see the patched package, and writes
+    and deletes land in the archive written by the next ``save`` /
+    ``save_in_place``. :meth:`read` raises :class:`KeyError` for a
+    missing part, like :meth:`zipfile.ZipFile.read`.
+    """
+
+    __slots__ = ("_patcher",)
+
+    def __init__(self, patcher: Any) -> None:
+        self._patcher = patcher
+
+    def namelist(self) -> list[str]:
+        return list(self._patcher.part_names())
+
+    def get(self, name: str) -> bytes | None:
+        data = self._patcher.read_part(name)
+        return None if data is None else bytes(data)
+
+    def read(self, name: str) -> bytes:
+        data = self.get(name)
+        if data is None:
+            raise KeyError(name)
+        return data
+
+    def write(self, name: str, data: bytes) -> None:
+        self._patcher.write_part(name, bytes(data))
+
+    def delete(self, name: str) -> None:
+        self._patcher.delete_part(name)
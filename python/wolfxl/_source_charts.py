@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-import os
 import posixpath
-import tempfile
 import zipfile
 from typing import Any
 from xml.etree import ElementTree as ET
@@ -35,8 +33,8 @@ def source_chart_refs(path: str | None, sheet_title: str) -> list[dict[str, str]
         return []
 
 
-def apply_source_chart_authoring_to_xlsx(path: str, ops: list[dict[str, Any]]) -> None:
-    """Apply source-chart remove/replace operations to ``path`` in-place."""
+def apply_source_chart_authoring_to_package(package: Any, ops: list[dict[str, Any]]) -> None:
+    """Apply source-chart remove/replace operations to a ``SavePackage``."""
     if not ops:
         return
 
@@ -44,56 +42,41 @@ def apply_source_chart_authoring_to_xlsx(path: str, ops: list[dict[str, Any]]) -
     deletes: set[str] = set()
     remove_chart_paths: set[str] = set()
 
-    with zipfile.ZipFile(path, "r") as src:
-        content_types = ET.fromstring(src.read("[Content_Types].xml"))
+    content_types = ET.fromstring(package.read("[Content_Types].xml"))
 
-        for op in ops:
-            meta = op["meta"]
-            chart_path = meta["chart_path"]
-            if op["op"] in {"replace", "title"}:
-                generated[chart_path] = op["chart_xml"]
-                continue
+    for op in ops:
+        meta = op["meta"]
+        chart_path = meta["chart_path"]
+        if op["op"] in {"replace", "title"}:
+            generated[chart_path] = op["chart_xml"]
+            continue
 
-            if op["op"] != "remove":
-                continue
+        if op["op"] != "remove":
+            continue
 
-            drawing_path = meta["drawing_path"]
-            drawing_rels_path = meta["drawing_rels_path"]
-            chart_rid = meta["chart_rid"]
+        drawing_path = meta["drawing_path"]
+        drawing_rels_path = meta["drawing_rels_path"]
+        chart_rid = meta["chart_rid"]
 
-            drawing_xml = generated.get(drawing_path) or src.read(drawing_path)
-            generated[drawing_path] = _remove_chart_anchor(drawing_xml, chart_rid)
+        drawing_xml = generated.get(drawing_path) or package.read(drawing_path)
+        generated[drawing_path] = _remove_chart_anchor(drawing_xml, chart_rid)
 
-            drawing_rels = generated.get(drawing_rels_path) or src.read(drawing_rels_path)
-            generated[drawing_rels_path] = _remove_rel_by_id(drawing_rels, chart_rid)
+        drawing_rels = generated.get(drawing_rels_path) or package.read(drawing_rels_path)
+        generated[drawing_rels_path] = _remove_rel_by_id(drawing_rels, chart_rid)
 
-            deletes.add(chart_path)
-            remove_chart_paths.add(chart_path)
+        deletes.add(chart_path)
+        remove_chart_paths.add(chart_path)
 
-        if remove_chart_paths:
-            _remove_content_type_overrides(content_types, remove_chart_paths)
-            generated["[Content_Types].xml"] = ET.tostring(
-                content_types, encoding="utf-8", xml_declaration=True
-            )
+    if remove_chart_paths:
+        _remove_content_type_overrides(content_types, remove_chart_paths)
+        generated["[Content_Types].xml"] = ET.tostring(
+            content_types, encoding="utf-8", xml_declaration=True
+        )
 
-    fd, tmp_name = tempfile.mkstemp(prefix="wolfxl-source-charts-", suffix=".xlsx")
-    os.close(fd)
-    try:
-        with zipfile.ZipFile(path, "r") as src, zipfile.ZipFile(
-            tmp_name, "w", zipfile.ZIP_DEFLATED
-        ) as dst:
-            for info in src.infolist():
-                name = info.filename
-                if name in deletes or name in generated:
-                    continue
-                with src.open(info, "r") as handle:
-                    dst.writestr(info, handle.read())
-            for name in sorted(generated):
-                dst.writestr(name, generated[name])
-        os.replace(tmp_name, path)
-    finally:
-        if os.path.exists(tmp_name):
-            os.unlink(tmp_name)
+    for name in sorted(deletes):
+        package.delete(name)
+    for name in sorted(generated):
+        package.write(name, generated[name])
 
 
 def _sheet_path_for_title(zf: zipfile.ZipFile, sheet_title: str) -> str | None:
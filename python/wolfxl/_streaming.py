@@ -1,8 +1,9 @@
 """Streaming read path — Sprint Ι Pod-β.
 
 Public entry-point: :func:`stream_iter_rows`. Activated by
-``load_workbook(path, read_only=True)`` or auto-trigger when a sheet has
-more than ``AUTO_STREAM_ROW_THRESHOLD`` rows. Wraps the Rust
+``load_workbook(source, read_only=True)`` (a path, ``bytes`` or a file
+object) or auto-trigger when a sheet has more than
+``AUTO_STREAM_ROW_THRESHOLD`` rows. Wraps the Rust
 ``StreamingSheetReader`` and converts its row tuples into either:
 
 - ``StreamingCell`` instances (mutation-rejected proxies that lazily look
@@ -10,15 +11,17 @@ more than ``AUTO_STREAM_ROW_THRESHOLD`` rows. Wraps the Rust
 - plain value tuples (when ``values_only=True``), padded by the configured
   column bounds.
 
-The streaming path bypasses eager sheet materialization for the value scan but
-still uses the eager workbook reader's style table for ``StreamingCell.font`` /
-``.fill`` / etc. That table is loaded once on first style access and shared
-across every cell in the iteration.
+The streaming path bypasses eager sheet materialization for the value scan.
+``StreamingCell.font`` / ``.fill`` / etc. resolve the cell's ``style_id``
+against the workbook reader's style table through a per-workbook
+:class:`StyleIdCache`, so touching a style never parses the sheet eagerly
+and each distinct style is converted once.
 """
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
+import io
 import posixpath
 import re
 from typing import TYPE_CHECKING, Any
@@ -44,6 +47,10 @@ if TYPE_CHECKING:
 #: sheets without exhausting RSS.
 AUTO_STREAM_ROW_THRESHOLD = 50_000
 
+#: Rows requested per ``StreamingSheetReader.read_next_block`` call. One FFI
+#: crossing per block instead of per row; the block is the only extra memory.
+STREAM_BLOCK_ROWS = 1024
+
 _DIMENSION_REF_RE = re.compile(rb"<(?:[A-Za-z0-9_]+:)?dimension\b[^>]*\bref=[\"']([^\"']+)[\"']")
 _ROW_TAG_RE = re.compile(rb"<(?:[A-Za-z0-9_]+:)?row(?:\s|>)")
 
@@ -164,9 +171,23 @@ def _bounds_from_dimension_ref(ref: str) -> tuple[int, int, int, int] | None:
     )
 
 
-def _source_dimension_bounds(path: str, sheet_title: str) -> tuple[int, int, int, int] | None:
+def package_source(wb: Any) -> str | bytes | None:
+    """The path or in-memory ``bytes`` ``wb`` was loaded from, if any."""
+    path = getattr(wb, "_source_path", None)
+    if path:
+        return path
+    return getattr(wb, "_source_bytes", None)
+
+
+def _open_package(source: str | bytes) -> zipfile.ZipFile:
+    return zipfile.ZipFile(io.BytesIO(source) if isinstance(source, bytes) else source)
+
+
+def _source_dimension_bounds(
+    source: str | bytes, sheet_title: str
+) -> tuple[int, int, int, int] | None:
     try:
-        with zipfile.ZipFile(path) as zf:
+        with _open_package(source) as zf:
             validate_zipfile(zf)
             sheet_path = _sheet_path_from_workbook(zf, sheet_title)
             if sheet_path is None:
@@ -177,9 +198,9 @@ def _source_dimension_bounds(path: str, sheet_title: str) -> tuple[int, int, int
         return None
 
 
-def _source_dimension_max_row(path: str, sheet_title: str) -> int | None:
+def _source_dimension_max_row(source: str | bytes, sheet_title: str) -> int | None:
     try:
-        with zipfile.ZipFile(path) as zf:
+        with _open_package(source) as zf:
             validate_zipfile(zf)
             sheet_path = _sheet_path_from_workbook(zf, sheet_title)
             if sheet_path is None:
@@ -237,12 +258,101 @@ def _maybe_datetime_from_serial(value: Any, num_fmt: str | None) -> Any:
         return value
 
 
+def _number_format(payload: dict[str, Any]) -> str:
+    return payload.get("number_format") or "General"
+
+
+class StyleIdCache:
+    """Resolved styles of one workbook, keyed by cell style id.
+
+    Streaming cells carry the ``s=`` style id from the sheet XML, so their
+    styles come straight from the reader's style table
+    (``read_style_format`` / ``read_style_border``) rather than the
+    coordinate-keyed ``read_cell_format``, which builds the sheet's cell
+    index first. Each ``(attribute, style_id)`` pair is converted once;
+    the style objects are frozen, so every cell sharing an id shares them.
+    """
+
+    __slots__ = ("_reader", "_resolved")
+
+    def __init__(self, reader: Any) -> None:
+        self._reader = reader
+        self._resolved: dict[tuple[str, int | None], Any] = {}
+
+    def font(self, style_id: int | None) -> Font:
+        from wolfxl._cell import _format_to_font
+
+        return self._resolve("font", style_id, _format_to_font)
+
+    def fill(self, style_id: int | None) -> PatternFill:
+        from wolfxl._cell import _format_to_fill
+
+        return self._resolve("fill", style_id, _format_to_fill)
+
+    def alignment(self, style_id: int | None) -> Alignment:
+        from wolfxl._cell import _format_to_alignment
+
+        return self._resolve("alignment", style_id, _format_to_alignment)
+
+    def number_format(self, style_id: int | None) -> str:
+        return self._resolve("number_format", style_id, _number_format)
+
+    def border(self, style_id: int | None) -> Border:
+        key = ("border", style_id)
+        try:
+            return self._resolved[key]
+        except KeyError:
+            pass
+        from wolfxl._cell import _border_payload_to_border
+
+        payload = {} if style_id is None else self._reader.read_style_border(style_id)
+        border = self._resolved[key] = _border_payload_to_border(payload)
+        return border
+
+    def _format(self, style_id: int | None) -> dict[str, Any]:
+        key = ("format", style_id)
+        try:
+            return self._resolved[key]
+        except KeyError:
+            pass
+        payload = {} if style_id is None else self._reader.read_style_format(style_id)
+        if not isinstance(payload, dict):
+            payload = {}
+        self._resolved[key] = payload
+        return payload
+
+    def _resolve(
+        self,
+        attr: str,
+        style_id: int | None,
+        convert: Callable[[dict[str, Any]], Any],
+    ) -> Any:
+        key = (attr, style_id)
+        try:
+            return self._resolved[key]
+        except KeyError:
+            pass
+        value = self._resolved[key] = convert(self._format(style_id))
+        return value
+
+
+def style_id_cache(wb: Any) -> StyleIdCache | None:
+    """The workbook's :class:`StyleIdCache`, or None without a reader."""
+    reader = wb._rust_reader  # noqa: SLF001
+    if reader is None:
+        return None
+    cache = getattr(wb, "_style_id_cache", None)
+    if cache is None or cache._reader is not reader:  # noqa: SLF001
+        cache = wb._style_id_cache = StyleIdCache(reader)  # noqa: SLF001
+    return cache
+
+
 class StreamingCell:
     """Read-only cell proxy yielded by streaming ``iter_rows()``.
 
     Holds a snapshot of the value (parsed by the Rust SAX scanner) plus
-    the originating row/column and a reference back to the Worksheet so
-    style lookups can defer to the workbook reader's ``read_cell_format`` path.
+    the originating row/column, its style id and a reference back to the
+    Worksheet; styles resolve by style id through :func:`style_id_cache`.
     Style attributes are
     fully featured (font, fill, border, alignment, number_format) and
     behave identically to the eager ``Cell`` properties — the difference
@@ -325,79 +435,59 @@ class StreamingCell:
         }.get(self._cell_type, "n")
 
     # ------------------------------------------------------------------
-    # Style lookups — defer to the eager workbook reader.
-    # The streaming path does NOT re-implement xl/styles.xml parsing;
-    # the styles table is small (~KB) regardless of sheet size and the
-    # eager reader caches it after first access.
+    # Style lookups — resolved by style id from the workbook reader's
+    # style table. The streaming path does NOT re-implement
+    # xl/styles.xml parsing; the table is small (~KB) regardless of
+    # sheet size.
     # ------------------------------------------------------------------
 
     @property
     def font(self) -> Font:
         """Return the resolved cell font."""
-        from wolfxl._cell import _format_to_font
-
-        wb = self._ws._workbook  # noqa: SLF001
-        reader = wb._rust_reader  # noqa: SLF001
-        if reader is None:
+        styles = style_id_cache(self._ws._workbook)  # noqa: SLF001
+        if styles is None:
             from wolfxl._styles import Font as _Font
 
             return _Font()
-        payload = reader.read_cell_format(self._ws.title, self.coordinate)
-        return _format_to_font(payload)
+        return styles.font(self._style_id)
 
     @property
     def fill(self) -> PatternFill:
         """Return the resolved cell fill."""
-        from wolfxl._cell import _format_to_fill
-
-        wb = self._ws._workbook  # noqa: SLF001
-        reader = wb._rust_reader  # noqa: SLF001
-        if reader is None:
+        styles = style_id_cache(self._ws._workbook)  # noqa: SLF001
+        if styles is None:
             from wolfxl._styles import PatternFill as _PF
 
             return _PF()
-        payload = reader.read_cell_format(self._ws.title, self.coordinate)
-        return _format_to_fill(payload)
+        return styles.fill(self._style_id)
 
     @property
     def border(self) -> Border:
         """Return the resolved cell border."""
-        from wolfxl._cell import _border_payload_to_border
-
-        wb = self._ws._workbook  # noqa: SLF001
-        reader = wb._rust_reader  # noqa: SLF001
-        if reader is None:
+        styles = style_id_cache(self._ws._workbook)  # noqa: SLF001
+        if styles is None:
             from wolfxl._styles import Border as _B
 
             return _B()
-        payload = reader.read_cell_border(self._ws.title, self.coordinate)
-        return _border_payload_to_border(payload)
+        return styles.border(self._style_id)
 
     @property
     def alignment(self) -> Alignment:
         """Return the resolved cell alignment."""
-        from wolfxl._cell import _format_to_alignment
-
-        wb = self._ws._workbook  # noqa: SLF001
-        reader = wb._rust_reader  # noqa: SLF001
-        if reader is None:
+        styles = style_id_cache(self._ws._workbook)  # noqa: SLF001
+        if styles is None:
             from wolfxl._styles import Alignment as _A
 
             return _A()
-        payload = reader.read_cell_format(self._ws.title, self.coordinate)
-        return _format_to_alignment(payload)
+        return styles.alignment(self._style_id)
 
     @property
     def number_format(self) -> str | None:
         """Return the resolved number format string."""
-        wb = self._ws._workbook  # noqa: SLF001
-        reader = wb._rust_reader  # noqa: SLF001
-        if reader is None:
+        styles = style_id_cache(self._ws._workbook)  # noqa: SLF001
+        if styles is None:
             return None
-        payload = reader.read_cell_format(self._ws.title, self.coordinate)
-        if isinstance(payload, dict):
-            return payload.get("number_format") or "General"
-        return "General"
+        return styles.number_format(self._style_id)
 
     # ------------------------------------------------------------------
     # Mutation — strictly rejected. Sprint Ι Pod-β contract.
@@ -436,6 +526,17 @@ class StreamingCell:
         )
 
 
+def _iter_reader_rows(reader: Any) -> Iterator[tuple[int, list[tuple[Any, ...]]]]:
+    """Yield ``(row_idx, cells)`` from a Rust streaming reader, a block at a time."""
+    read_block = getattr(reader, "read_next_block", None)
+    if read_block is None:
+        while (row := reader.read_next_row()) is not None:
+            yield row
+        return
+    while block := read_block(STREAM_BLOCK_ROWS):
+        yield from block
+
+
 def _resolve_bounds(
     ws: Worksheet,
     min_row: int | None,
@@ -471,44 +572,37 @@ def stream_iter_rows(
     from wolfxl import _rust
 
     wb = ws._workbook  # noqa: SLF001
-    path = getattr(wb, "_source_path", None)
-    if path is None:
+    source = package_source(wb)
+    if source is None:
         raise RuntimeError(
-            "stream_iter_rows requires a source-path-bearing workbook "
-            "(use load_workbook to obtain one)"
+            "stream_iter_rows requires a workbook loaded from a path, bytes "
+            "or a file object (use load_workbook to obtain one)"
         )
     mn_r, mx_r, mn_c, mx_c = _resolve_bounds(ws, min_row, max_row, min_col, max_col)
-    source_bounds = _source_dimension_bounds(path, ws.title)
+    source_bounds = _source_dimension_bounds(source, ws.title)
+    # In-memory packages are handed over as bytes and read in place.
     reader = _rust.StreamingSheetReader.open(
-        path, ws.title, mn_r, mx_r, mn_c, mx_c
+        source, ws.title, mn_r, mx_r, mn_c, mx_c
     )
 
     # Sprint Λ Pod-γ: cache style_id → (number_format, is_date) so we
     # resolve a date format once per distinct style rather than once per
     # cell. Sentinel `_NO_STYLE` covers the (style_id is None) case.
     style_date_cache: dict[int | None, tuple[str | None, bool]] = {}
-    rust_reader = wb._rust_reader  # noqa: SLF001
+    styles = style_id_cache(wb)
 
-    def _is_date_style(style_id: int | None, row_idx: int, col: int) -> bool:
+    def _is_date_style(style_id: int | None) -> bool:
         cached = style_date_cache.get(style_id)
         if cached is not None:
             return cached[1]
-        if style_id is None or rust_reader is None:
+        if style_id is None or styles is None:
             style_date_cache[style_id] = (None, False)
             return False
-        # The Rust reader exposes number_format only via cell coordinate.
-        # The lookup is keyed off the cell's style_id internally, so any
-        # cell that shares this style_id will resolve to the same format
-        # — caching by style_id keeps this O(unique-styles) rather than
-        # O(cells).
         try:
-            payload = rust_reader.read_cell_format(
-                ws.title, rowcol_to_a1(row_idx, col)
-            )
+            num_fmt = styles.number_format(style_id)
         except Exception:
             style_date_cache[style_id] = (None, False)
             return False
-        num_fmt = payload.get("number_format") if isinstance(payload, dict) else None
         is_date = is_date_format(num_fmt)
         style_date_cache[style_id] = (num_fmt, is_date)
         return is_date
@@ -523,15 +617,11 @@ def stream_iter_rows(
     try:
         if values_only:
             counter = mn_r if mn_r is not None else 1
-            # Switch to ``read_next_row`` rather than ``read_next_values``
-            # so we have access to each cell's style_id. The slight extra
-            # work (vs Rust-side tuple padding) is offset by skipping a
-            # second materialization of the tuple in Python.
-            while True:
-                row = reader.read_next_row()
-                if row is None:
-                    break
-                row_idx, cells = row
+            # Use row records rather than ``read_next_values`` so we have
+            # access to each cell's style_id. The slight extra work (vs
+            # Rust-side tuple padding) is offset by skipping a second
+            # materialization of the tuple in Python.
+            for row_idx, cells in _iter_reader_rows(reader):
                 cmin = mn_c if mn_c is not None else 1
                 cmax = _resolved_cmax(cells)
                 empty_row = (None,) * max(0, cmax + 1 - cmin)
@@ -554,7 +644,7 @@ def stream_iter_rows(
                     if (
                         isinstance(py_val, (int, float))
                         and not isinstance(py_val, bool)
-                        and _is_date_style(style_id, row_idx, col)
+                        and _is_date_style(style_id)
                     ):
                         py_val = _maybe_datetime_from_serial(
                             py_val, style_date_cache[style_id][0]
@@ -573,11 +663,7 @@ def stream_iter_rows(
                     counter += 1
         else:
             counter = mn_r if mn_r is not None else 1
-            while True:
-                row = reader.read_next_row()
-                if row is None:
-                    break
-                row_idx, cells = row
+            for row_idx, cells in _iter_reader_rows(reader):
                 # Determine emitted column bounds: explicit min/max wins,
                 # else span observed cells.
                 cmin = mn_c if mn_c is not None else 1
@@ -632,9 +718,8 @@ def should_auto_stream(ws: Worksheet) -> bool:
     of ``Worksheet._max_row()``, because the normal dimensions API may parse
     and cache the full sheet before streaming can engage.
     """
-    wb = ws._workbook  # noqa: SLF001
-    path = getattr(wb, "_source_path", None)
-    if not path:
+    source = package_source(ws._workbook)  # noqa: SLF001
+    if not source:
         return False
-    rows = _source_dimension_max_row(path, ws.title)
+    rows = _source_dimension_max_row(source, ws.title)
     return rows is not None and rows > AUTO_STREAM_ROW_THRESHOLD
@@ -10,7 +10,7 @@ from __future__ import annotations
 import os
 import zipfile
 from xml.etree import ElementTree as ET
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 from wolfxl._workbook_state import CopyOptions as CopyOptions
 from wolfxl._workbook_state import initialize_pending_state
@@ -28,7 +28,9 @@ from wolfxl._worksheet import Worksheet
 
 
 if TYPE_CHECKING:
-    from wolfxl.calc._protocol import RecalcResult
+    from collections.abc import Sequence
+
+    from wolfxl.calc._protocol import BatchRecalcResult, RecalcResult
 
 
 class Workbook:
@@ -882,7 +884,7 @@ class Workbook:
 
     def save(
         self,
-        filename: str | os.PathLike[str],
+        filename: str | os.PathLike[str] | BinaryIO,
         *,
         password: str | bytes | None = None,
     ) -> None:
@@ -891,7 +893,8 @@ class Workbook:
         Args:
             filename: Destination path. In modify mode this may be the original
                 source path; WolfXL writes that case through its safe in-place
-                save path.
+                save path. A writable binary file object is also accepted;
+                seekable ones receive the archive directly, without a temp file.
             password: Optional encryption password for the final ``.xlsx``
                 payload. Install ``wolfxl[encrypted]`` to enable encryption.
 
@@ -902,21 +905,38 @@ class Workbook:
         """
         _workbook_save.save_workbook(self, filename, password=password)
 
+    def save_bytes(self, *, password: str | bytes | None = None) -> bytes:
+        """Flush all pending writes and return the saved workbook as bytes.
+
+        Unlike saving to a temporary path and reading it back, the archive
+        is built in memory by the native backend, so nothing touches disk.
+
+        Args:
+            password: Optional encryption password, as for :meth:`save`.
+
+        Returns:
+            The complete ``.xlsx`` payload.
+
+        Raises:
+            ValueError: If ``password`` is empty.
+            RuntimeError: If the workbook mode cannot save the requested
+                pending changes.
+        """
+        return _workbook_save.save_workbook_to_bytes(self, password=password)
+
     def _save_encrypted(
         self,
         filename: str,
         password: str | bytes,
     ) -> None:
-        """Save plaintext to a tempfile then re-route through encryption.
+        """Build the plaintext package in memory, then encrypt it.
 
         Write-side encryption stays Python-side; the Rust writer/patcher
-        is unchanged. We materialise the unencrypted xlsx via the normal
-        save path, slurp it back as bytes, hand it to
+        is unchanged. The unencrypted xlsx comes from the in-memory save
+        path and goes straight to
         :func:`wolfxl._encryption.encrypt_xlsx_to_path` for the
-        in-place encryption + atomic rename onto ``filename``.
-
-        The plaintext tempfile is always cleaned up — including on
-        error paths — so we never leak unencrypted user data on disk.
+        encryption + atomic rename onto ``filename``, so plaintext never
+        touches disk.
         """
         _workbook_save.save_encrypted(self, filename, password)
 
@@ -1348,16 +1368,27 @@ class Workbook:
     # Formula evaluation (requires wolfxl.calc)
     # ------------------------------------------------------------------
 
-    def calculate(self) -> dict[str, Any]:
+    def calculate(self, threads: int = 1, *, native: bool = False) -> dict[str, Any]:
         """Evaluate all formulas in the workbook.
 
         Returns a dict of cell_ref -> computed value for all formula cells.
         Requires the ``wolfxl.calc`` module (install via ``pip install wolfxl[calc]``).
 
+        With *native* the Rust calc engine is used when it can run every
+        formula in the workbook, falling back to the Python evaluator
+        otherwise. Its results differ in type: every number comes back as
+        ``float``, dates are read as Excel serial numbers, and empty cells
+        count as ``0`` in arithmetic as they do in Excel. *threads* > 1
+        (or ``0`` for one per CPU) implies *native*: the engine evaluates
+        independent formulas of each dependency level in parallel, with the
+        same results as a serial run. If the workbook has to fall back to
+        the Python evaluator, a ``RuntimeWarning`` says the threads were
+        dropped.
+
         The internal evaluator is cached so that a subsequent
         :meth:`recalculate` call can reuse it without rescanning.
         """
-        return _workbook_calc.calculate_workbook(self)
+        return _workbook_calc.calculate_workbook(self, threads, native)
 
     def cached_formula_values(self) -> dict[str, Any]:
         """Return Excel-saved cached formula results for every sheet.
@@ -1384,6 +1415,26 @@ class Workbook:
         """
         return _workbook_calc.recalculate_workbook(self, perturbations, tolerance)
 
+    def recalculate_batch(
+        self,
+        scenarios: Any,
+        outputs: Sequence[str] | None = None,
+        *,
+        inputs: Sequence[str] | None = None,
+    ) -> BatchRecalcResult:
+        """Evaluate many perturbation scenarios in one pass.
+
+        *scenarios* is a list of ``{cell_ref: value}`` dicts, or a 2-D array
+        of shape ``(n_scenarios, len(inputs))``. Returns a
+        ``BatchRecalcResult`` whose ``values`` is an
+        ``(n_scenarios, len(outputs))`` array. Requires the ``wolfxl.calc``
+        module and NumPy; the cached evaluator is reused as in
+        :meth:`recalculate` and its values are left unchanged.
+        """
+        return _workbook_calc.recalculate_batch_workbook(
+            self, scenarios, outputs, inputs=inputs
+        )
+
     # ------------------------------------------------------------------
     # Context manager + cleanup
     # ------------------------------------------------------------------
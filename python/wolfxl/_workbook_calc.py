@@ -5,15 +5,58 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from wolfxl.calc._protocol import RecalcResult
+    from collections.abc import Sequence
 
+    from wolfxl.calc._protocol import BatchRecalcResult, CalcEngine, RecalcResult
+
+
+def load_evaluator(wb: Any, threads: int = 1, native: bool = False) -> "CalcEngine":
+    """Load *wb* into the Python evaluator, or the native engine when asked.
+
+    With *native* the Rust engine is tried first and the Python evaluator
+    is used only if the extension lacks it or the workbook holds anything
+    it cannot run. *threads* other than ``1`` implies *native*, since only
+    :class:`NativeEvaluator` evaluates in parallel; a ``RuntimeWarning`` is
+    emitted when those threads are dropped for the serial Python evaluator.
+    """
+    from wolfxl.calc._native import NativeEvaluator, native_engine_available
+
+    if threads < 0:
+        raise ValueError(f"threads must be >= 0, got {threads}")
+    if threads != 1:
+        native = True
+
+    reason = None
+    if native and native_engine_available():
+        engine = NativeEvaluator(threads=threads)
+        engine.load(wb)
+        if not engine.unsupported:
+            return engine
+        ref, why = engine.unsupported[0]
+        reason = f"the native engine cannot evaluate {ref} ({why})"
+    elif native:
+        reason = "the extension was built without the native calc engine"
+
+    if threads != 1:
+        import warnings
+
+        warnings.warn(
+            f"wolfxl.calc: {reason}; evaluating serially with the Python "
+            f"evaluator instead of on {threads or 'all'} thread(s).",
+            RuntimeWarning,
+            stacklevel=4,  # Workbook.calculate -> calculate_workbook -> here
+        )
 
-def calculate_workbook(wb: Any) -> dict[str, Any]:
-    """Evaluate all formulas and cache the evaluator for future recalcs."""
     from wolfxl.calc._evaluator import WorkbookEvaluator
 
     ev = WorkbookEvaluator()
     ev.load(wb)
+    return ev
+
+
+def calculate_workbook(wb: Any, threads: int = 1, native: bool = False) -> dict[str, Any]:
+    """Evaluate all formulas and cache the evaluator for future recalcs."""
+    ev = load_evaluator(wb, threads, native)
     result = ev.calculate()
     wb._evaluator = ev  # noqa: SLF001
     return result
@@ -36,12 +79,25 @@ def recalculate_workbook(
     tolerance: float = 1e-10,
 ) -> "RecalcResult":
     """Recompute affected formulas, loading and caching an evaluator if needed."""
+    return _cached_evaluator(wb).recalculate(perturbations, tolerance)
+
+
+def recalculate_batch_workbook(
+    wb: Any,
+    scenarios: Any,
+    outputs: Sequence[str] | None = None,
+    *,
+    inputs: Sequence[str] | None = None,
+) -> "BatchRecalcResult":
+    """Evaluate many perturbation scenarios against the cached evaluator."""
+    return _cached_evaluator(wb).recalculate_batch(scenarios, outputs, inputs=inputs)
+
+
+def _cached_evaluator(wb: Any) -> Any:
+    """Return the workbook's calculated evaluator, building it on first use."""
     ev = wb._evaluator  # noqa: SLF001
     if ev is None:
-        from wolfxl.calc._evaluator import WorkbookEvaluator
-
-        ev = WorkbookEvaluator()
-        ev.load(wb)
+        ev = load_evaluator(wb)
         ev.calculate()
         wb._evaluator = ev  # noqa: SLF001
-    return ev.recalculate(perturbations, tolerance)
+    return ev
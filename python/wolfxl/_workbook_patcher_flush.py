@@ -726,9 +726,14 @@ def _queue_slicer_add(patcher: Any, sheet_title: str, slicer: Any) -> None:
         ) from exc
 
 
-def flush_pending_pivots_to_patcher(wb: Any) -> None:
-    """Drain pending pivot caches and tables into the Rust patcher."""
-    patcher = wb._rust_patcher  # noqa: SLF001
+def flush_pending_pivots_to_patcher(wb: Any, patcher: Any = None) -> None:
+    """Drain pending pivot caches and tables into the Rust patcher.
+
+    ``patcher`` defaults to the workbook's modify-mode patcher; write-mode
+    saves pass the patcher opened over the writer's output.
+    """
+    if patcher is None:
+        patcher = wb._rust_patcher  # noqa: SLF001
     if patcher is None:
         return
 
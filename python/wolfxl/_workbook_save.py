@@ -7,8 +7,10 @@ preserving the exact writer/patcher flush order used by the save pipeline.
 from __future__ import annotations
 
 import os
+import shutil
 from typing import Any, BinaryIO
 
+from wolfxl._save_package import SavePackage
 from wolfxl._workbook_state import same_existing_path
 
 
@@ -32,16 +34,7 @@ def save_workbook(
         save_workbook_to_fileobj(wb, filename, password=password)
         return
     filename = str(filename)
-    # G20: write-only mode is consumed-on-save. A second save raises
-    # WorkbookAlreadySaved (matches openpyxl's `_write_only.py`).
-    # Eager-mode workbooks remain re-savable.
-    if getattr(wb, "_saved", False) and getattr(wb, "_write_only", False):
-        from wolfxl.utils.exceptions import WorkbookAlreadySaved
-
-        raise WorkbookAlreadySaved(
-            "Workbook(write_only=True) is consumed-on-save; "
-            "open a new workbook to write again"
-        )
+    _check_not_consumed(wb)
 
     if password is not None:
         # Validate password early so we don't write a plaintext tempfile that
@@ -63,6 +56,23 @@ def save_workbook(
         save_read_mode(wb, filename)
     else:
         raise RuntimeError("save requires write or modify mode")
+    _mark_saved(wb)
+
+
+def _check_not_consumed(wb: Any) -> None:
+    # G20: write-only mode is consumed-on-save. A second save raises
+    # WorkbookAlreadySaved (matches openpyxl's `_write_only.py`).
+    # Eager-mode workbooks remain re-savable.
+    if getattr(wb, "_saved", False) and getattr(wb, "_write_only", False):
+        from wolfxl.utils.exceptions import WorkbookAlreadySaved
+
+        raise WorkbookAlreadySaved(
+            "Workbook(write_only=True) is consumed-on-save; "
+            "open a new workbook to write again"
+        )
+
+
+def _mark_saved(wb: Any) -> None:
     # Mark consumed AFTER save succeeds so a write failure leaves the
     # workbook in a re-tryable state for the eager path. Write-only
     # mode flips this once and never re-saves.
@@ -82,27 +92,117 @@ def save_workbook_to_fileobj(
     *,
     password: str | bytes | None = None,
 ) -> None:
-    """Save to a binary file-like object using the path-oriented backends."""
+    """Save to a binary file-like object without staging a temp file.
+
+    The target is rewound and truncated only once the save has been
+    dispatched and prepared, so a workbook that cannot be saved leaves it
+    untouched; an error inside the native write itself can still leave it
+    partially written. Seekable targets receive the archive straight from
+    the native backend; anything else (and encrypted output) is written
+    from :func:`save_workbook_to_bytes`.
+    """
+    seekable = getattr(fileobj, "seekable", None)
+    if password is None and seekable is not None and seekable():
+        _save_in_memory(wb, fileobj)
+    else:
+        data = save_workbook_to_bytes(wb, password=password)
+        _reset_stream(fileobj)
+        fileobj.write(data)
+    try:
+        fileobj.flush()
+        fileobj.seek(0)
+    except Exception:
+        pass
+
+
+def save_workbook_to_bytes(wb: Any, *, password: str | bytes | None = None) -> bytes:
+    """Return the saved ``.xlsx`` as ``bytes`` without writing to disk."""
+    if password is None:
+        return _save_in_memory(wb, None)
+    from wolfxl._encryption import _coerce_password, encrypt_xlsx_bytes
+
+    _coerce_password(password)  # raises ValueError on empty
+    return encrypt_xlsx_bytes(_save_in_memory(wb, None), password)
+
+
+def _reset_stream(stream: BinaryIO) -> None:
+    """Rewind and truncate ``stream`` before the archive is written."""
+    try:
+        stream.seek(0)
+        stream.truncate()
+    except Exception:
+        pass
+
+
+def _save_in_memory(wb: Any, stream: BinaryIO | None) -> Any:
+    """Save into ``stream``, or return ``bytes`` when ``stream`` is None.
+
+    Mirrors :func:`save_workbook`'s mode dispatch, ending in the native
+    ``save_to`` / ``save_bytes`` calls instead of a path. Saves that
+    still finish with a path-based pass (write-mode pivots, external
+    links and chartsheets; ``keep_vba`` package normalization) are
+    staged through :func:`_save_via_tempfile`.
+    """
+    _check_not_consumed(wb)
+    if bool(getattr(wb, "_keep_vba", False)):
+        return _save_via_tempfile(wb, stream)
+    source_path = getattr(wb, "_source_path", None)
+    if wb._rust_patcher is None and wb._rust_writer is None:  # noqa: SLF001
+        if getattr(wb, "_rust_reader", None) is None or not source_path:
+            raise RuntimeError("save requires write or modify mode")
+        if _read_mode_has_pending_changes(wb):
+            if getattr(wb, "_read_only", False):
+                raise RuntimeError(
+                    "save() on a read_only=True workbook would discard pending changes; "
+                    "reopen with modify=True before editing"
+                )
+            _promote_read_mode_to_patcher(wb, source_path)
+
+    if wb._rust_patcher is not None:  # noqa: SLF001
+        backend = wb._rust_patcher  # noqa: SLF001
+        if _modify_mode_has_pending_changes(wb):
+            prepare_modify_save(wb)
+    elif wb._rust_writer is not None:  # noqa: SLF001
+        if _writer_save_needs_patcher(wb):
+            return _save_via_tempfile(wb, stream)
+        backend = wb._rust_writer  # noqa: SLF001
+        prepare_writer_save(wb)
+    else:
+        # Unmodified read-mode workbook: the source package is the output.
+        backend = None
+
+    data = None
+    if backend is None:
+        with open(source_path, "rb") as src:
+            if stream is None:
+                data = src.read()
+            else:
+                _reset_stream(stream)
+                shutil.copyfileobj(src, stream)
+    elif stream is None:
+        data = bytes(backend.save_bytes())
+    else:
+        _reset_stream(stream)
+        backend.save_to(stream)
+    _mark_saved(wb)
+    return data
+
+
+def _save_via_tempfile(wb: Any, stream: BinaryIO | None) -> Any:
+    """Path-based save, read back into ``stream`` or returned as bytes."""
     import tempfile
 
     tmp = tempfile.NamedTemporaryFile(prefix="wolfxl-save-", suffix=".xlsx", delete=False)
     tmp_path = tmp.name
     tmp.close()
     try:
-        save_workbook(wb, tmp_path, password=password)
+        save_workbook(wb, tmp_path)
         with open(tmp_path, "rb") as src:
-            data = src.read()
-        try:
-            fileobj.seek(0)
-            fileobj.truncate()
-        except Exception:
-            pass
-        fileobj.write(data)
-        try:
-            fileobj.flush()
-            fileobj.seek(0)
-        except Exception:
-            pass
+            if stream is None:
+                return src.read()
+            _reset_stream(stream)
+            shutil.copyfileobj(src, stream)
+        return None
     finally:
         try:
             os.unlink(tmp_path)
@@ -112,8 +212,6 @@ def save_workbook_to_fileobj(
 
 def save_read_mode(wb: Any, filename: str) -> None:
     """Save an unmodified path-backed read workbook by copying the source package."""
-    import shutil
-
     source_path = getattr(wb, "_source_path", None)
     if source_path is None:
         raise RuntimeError("save requires write or modify mode")
@@ -161,6 +259,7 @@ def _read_mode_has_pending_changes(wb: Any) -> bool:
         "_dirty",
         "_append_buffer",
         "_bulk_writes",
+        "_column_writes",
         "_pending_comments",
         "_pending_threaded_comments",
         "_pending_hyperlinks",
@@ -200,25 +299,26 @@ def save_write_only_mode(wb: Any, filename: str) -> None:
     eager save is that ``sheet_xml::emit`` splices the temp file into
     the ``<sheetData>`` slot instead of walking ``Worksheet.rows``.
     """
-    # Workbook-level metadata flush (defined names, properties) still
-    # composes through the writer-side path; sheet-level flush is a
-    # no-op for write-only sheets because the temp files have been
-    # written incrementally.
-    wb._flush_workbook_writes()  # noqa: SLF001
-    wb._rust_writer.finalize_streaming_sheets()  # noqa: SLF001
+    prepare_writer_save(wb)
     wb._rust_writer.save(filename)  # noqa: SLF001
-    flush_chartsheets_authoring(wb, filename)
+    finish_writer_save(wb, filename)
 
 
 def save_modify_mode(wb: Any, filename: str) -> None:
     """Flush pending modify-mode queues and write through ``XlsxPatcher``."""
-    if not _modify_mode_has_pending_changes(wb):
-        if same_existing_path(filename, wb._source_path):  # noqa: SLF001
-            wb._rust_patcher.save_in_place()  # noqa: SLF001
-        else:
-            wb._rust_patcher.save(filename)  # noqa: SLF001
-        return
+    pending = _modify_mode_has_pending_changes(wb)
+    if pending:
+        prepare_modify_save(wb)
+    if same_existing_path(filename, wb._source_path):  # noqa: SLF001
+        wb._rust_patcher.save_in_place()  # noqa: SLF001
+    else:
+        wb._rust_patcher.save(filename)  # noqa: SLF001
+    if pending:
+        normalize_openpyxl_package_shape(wb, filename)
 
+
+def prepare_modify_save(wb: Any) -> None:
+    """Drain every modify-mode queue into the patcher, in save order."""
     # Workbook-level metadata flushes before per-sheet drains so the patcher
     # composes workbook.xml once, with all pending workbook-scoped edits.
     if wb._properties_dirty:  # noqa: SLF001
@@ -277,15 +377,9 @@ def save_modify_mode(wb: Any, filename: str) -> None:
     # AutoFilter dicts.
     wb._flush_pending_autofilters_to_patcher()  # noqa: SLF001
 
-    if same_existing_path(filename, wb._source_path):  # noqa: SLF001
-        wb._rust_patcher.save_in_place()  # noqa: SLF001
-    else:
-        wb._rust_patcher.save(filename)  # noqa: SLF001
-    flush_pivot_layout_authoring(wb, filename)
-    flush_external_links_authoring(wb, filename)
-    flush_source_chart_authoring(wb, filename)
-    flush_chartsheets_authoring(wb, filename)
-    normalize_openpyxl_package_shape(wb, filename)
+    # Python-authored parts join the patcher's own rewrite rather than
+    # re-reading and re-compressing the saved archive once per step.
+    apply_package_authoring(wb, SavePackage(wb._rust_patcher))  # noqa: SLF001
 
 
 def _modify_mode_has_pending_changes(wb: Any) -> bool:
@@ -320,57 +414,108 @@ def _has_pending_source_chart_authoring(wb: Any) -> bool:
 def save_write_mode(wb: Any, filename: str) -> None:
     """Flush pending write-mode queues and save through ``NativeWorkbook``.
 
-    Write-mode pivot construction (G17 / RFC-070 §8.7 reach-extension):
-    when pending pivot caches or pivot tables are queued, a two-phase
-    save runs — the native writer emits cell data + sheet structure
-    to a tempfile, then the same tempfile is reopened in modify mode
-    and the patcher's ``apply_pivot_adds_phase`` stamps in the pivot
-    parts. Final bytes copy onto ``filename``.
+    Parts the native writer does not emit - pivot caches and tables
+    (G17 / RFC-070 §8.7 reach-extension), edited external links and
+    authored chartsheets - are added by :func:`finish_writer_save`.
     """
-    has_pending_pivots = bool(getattr(wb, "_pending_pivot_caches", None)) or any(
+    prepare_writer_save(wb)
+    wb._rust_writer.save(filename)  # noqa: SLF001
+    finish_writer_save(wb, filename)
+
+
+def prepare_writer_save(wb: Any) -> None:
+    """Flush pending workbook and sheet state into ``NativeWorkbook``."""
+    wb._flush_workbook_writes()  # noqa: SLF001
+    if getattr(wb, "_write_only", False):
+        # Sheet-level flush is a no-op for write-only sheets because their
+        # temp files have been written incrementally.
+        wb._rust_writer.finalize_streaming_sheets()  # noqa: SLF001
+        return
+    for ws in wb._sheets.values():  # noqa: SLF001
+        ws._flush()  # noqa: SLF001
+
+
+def finish_writer_save(wb: Any, filename: str) -> None:
+    """Add pivots, external links and chartsheets to a writer-emitted file.
+
+    One ``XlsxPatcher`` pass over ``filename`` handles all of them: pivot
+    adds go through the patcher's pivot phase and the Python-authored
+    parts through a :class:`SavePackage`. The patcher raw-copies every
+    untouched entry, so only the parts that change are recompressed.
+    """
+    if not _writer_save_needs_patcher(wb):
+        return
+    from wolfxl import _rust
+    from wolfxl._workbook_patcher_flush import flush_pending_pivots_to_patcher
+
+    patcher = _rust.XlsxPatcher.open(filename, False)
+    flush_pending_pivots_to_patcher(wb, patcher)
+    package = SavePackage(patcher)
+    flush_external_links_authoring(wb, package)
+    flush_chartsheets_authoring(wb, package)
+    patcher.save_in_place()
+
+
+def _writer_save_needs_patcher(wb: Any) -> bool:
+    return (
+        _has_pending_pivots(wb)
+        or _has_external_links_authoring(wb)
+        or _has_chartsheets_authoring(wb)
+    )
+
+
+def apply_package_authoring(wb: Any, package: SavePackage) -> None:
+    """Apply every Python-side part rewrite to a pending patcher save."""
+    flush_pivot_layout_authoring(wb, package)
+    flush_external_links_authoring(wb, package)
+    flush_source_chart_authoring(wb, package)
+    flush_chartsheets_authoring(wb, package)
+
+
+def _has_pending_pivots(wb: Any) -> bool:
+    return bool(getattr(wb, "_pending_pivot_caches", None)) or any(
         getattr(ws, "_pending_pivot_tables", None) for ws in wb._sheets.values()  # noqa: SLF001
     )
-    if not has_pending_pivots:
-        wb._flush_workbook_writes()  # noqa: SLF001
-        for ws in wb._sheets.values():  # noqa: SLF001
-            ws._flush()  # noqa: SLF001
-        wb._rust_writer.save(filename)  # noqa: SLF001
-        flush_external_links_authoring(wb, filename)
-        flush_chartsheets_authoring(wb, filename)
-        return
 
-    _save_write_mode_with_pivots(wb, filename)
-    flush_external_links_authoring(wb, filename)
-    flush_chartsheets_authoring(wb, filename)
 
+def _has_external_links_authoring(wb: Any) -> bool:
+    if getattr(wb, "_strip_external_links_on_save", False):
+        return True
+    links = getattr(wb, "_external_links_cache", None)
+    return links is not None and bool(getattr(links, "dirty", False))
 
-def flush_external_links_authoring(wb: Any, filename: str) -> None:
+
+def _has_chartsheets_authoring(wb: Any) -> bool:
+    chartsheets = getattr(wb, "_chartsheets", None)
+    return bool(chartsheets) and any(
+        not getattr(cs, "_source_chartsheet", False) for cs in chartsheets.values()
+    )
+
+
+def flush_external_links_authoring(wb: Any, package: SavePackage) -> None:
+    if not _has_external_links_authoring(wb):
+        return
     links = getattr(wb, "_external_links_cache", None)
     strip_links = bool(getattr(wb, "_strip_external_links_on_save", False))
-    if links is None and strip_links:
+    if links is None:
         links = wb._external_links  # noqa: SLF001
-    if links is None or (not getattr(links, "dirty", False) and not strip_links):
-        return
     from wolfxl import _external_links as _el
 
     if strip_links:
         links._mark_dirty()  # noqa: SLF001
-    _el.apply_authoring_to_xlsx(filename, links)
+    _el.apply_authoring_to_package(package, links)
     wb._strip_external_links_on_save = False  # noqa: SLF001
 
 
-def flush_chartsheets_authoring(wb: Any, filename: str) -> None:
-    chartsheets = getattr(wb, "_chartsheets", None)
-    if not chartsheets or not any(
-        not getattr(cs, "_source_chartsheet", False) for cs in chartsheets.values()
-    ):
+def flush_chartsheets_authoring(wb: Any, package: SavePackage) -> None:
+    if not _has_chartsheets_authoring(wb):
         return
     from wolfxl import _chartsheets
 
-    _chartsheets.apply_chartsheets_to_xlsx(filename, wb)
+    _chartsheets.apply_chartsheets_to_package(package, wb)
 
 
-def flush_source_chart_authoring(wb: Any, filename: str) -> None:
+def flush_source_chart_authoring(wb: Any, package: SavePackage) -> None:
     ops = list(getattr(wb, "_pending_source_chart_ops", []))
     touched = {
         op.get("meta", {}).get("chart_path")
@@ -399,7 +544,7 @@ def flush_source_chart_authoring(wb: Any, filename: str) -> None:
             op = dict(op)
             op["chart_xml"] = _serialize_chart_xml(op["chart"])
         materialized.append(op)
-    _source_charts.apply_source_chart_authoring_to_xlsx(filename, materialized)
+    _source_charts.apply_source_chart_authoring_to_package(package, materialized)
     wb._pending_source_chart_ops.clear()  # noqa: SLF001
 
 
@@ -427,105 +572,17 @@ def _source_chart_title_signature(chart: Any) -> Any:
     return str(title)
 
 
-def flush_pivot_layout_authoring(wb: Any, filename: str) -> None:
-    from wolfxl.pivot._handle import apply_pivot_layout_authoring_to_xlsx
-
-    apply_pivot_layout_authoring_to_xlsx(filename, wb)
-
-
-def _save_write_mode_with_pivots(wb: Any, filename: str) -> None:
-    """Two-phase save: writer → tempfile → patcher → final destination.
-
-    This unblocks the openpyxl-shaped pattern used by the G17 oracle
-    probe:
-
-    .. code-block:: python
-
-        wb = wolfxl.Workbook()
-        wb.add_pivot_cache(cache)
-        ws.add_pivot_table(pt, "A1")
-        wb.save(path)
-
-    by emitting cell data through the native writer, then surgically
-    grafting the pivot parts on via the existing modify-mode patcher
-    pipeline. No new pivot emit code is introduced.
-    """
-    import tempfile
-
-    # Stash the pending pivot queues — the writer-side flush would
-    # otherwise observe them and (in some future hardening) try to
-    # double-emit. Re-attach them onto the modify-mode workbook below.
-    pending_caches = list(getattr(wb, "_pending_pivot_caches", []))
-    pending_tables_by_sheet: dict[str, list[Any]] = {}
-    for ws in wb._sheets.values():  # noqa: SLF001
-        title = ws.title
-        pending_tables_by_sheet[title] = list(
-            getattr(ws, "_pending_pivot_tables", [])
-        )
-        ws._pending_pivot_tables = []  # noqa: SLF001
-    wb._pending_pivot_caches = []  # noqa: SLF001
-    # Reset cache id allocator and clear cache._cache_id stamps so the
-    # modify-mode add_pivot_cache call re-allocates cleanly.
-    wb._next_pivot_cache_id = 0  # noqa: SLF001
-    for cache in pending_caches:
-        cache._cache_id = None  # noqa: SLF001
-
-    # Stage 1 — writer emits the workbook (cells, sheets, formats, etc.).
-    wb._flush_workbook_writes()  # noqa: SLF001
-    for ws in wb._sheets.values():  # noqa: SLF001
-        ws._flush()  # noqa: SLF001
-
-    tmp_fd, tmp_name = tempfile.mkstemp(prefix=".wolfxl-pivot-", suffix=".xlsx")
-    os.close(tmp_fd)
-    try:
-        wb._rust_writer.save(tmp_name)  # noqa: SLF001
-
-        # Stage 2 — reopen the tempfile in modify mode and replay the
-        # pivot adds.
-        import wolfxl as _wolfxl
+def flush_pivot_layout_authoring(wb: Any, package: SavePackage) -> None:
+    from wolfxl.pivot._handle import apply_pivot_layout_authoring_to_package
 
-        modify_wb = _wolfxl.load_workbook(tmp_name, modify=True)
-        for cache in pending_caches:
-            modify_wb.add_pivot_cache(cache)
-        for sheet_title, pts in pending_tables_by_sheet.items():
-            if not pts:
-                continue
-            target = modify_wb._sheets.get(sheet_title)  # noqa: SLF001
-            if target is None:
-                continue
-            for pt in pts:
-                # add_pivot_table on Worksheet expects a single arg in
-                # write/modify mode; the anchor is captured on the
-                # PivotTable's `location` attr at construction time.
-                target.add_pivot_table(pt)
-        modify_wb.save(filename)
-    finally:
-        try:
-            os.unlink(tmp_name)
-        except OSError:
-            pass
+    apply_pivot_layout_authoring_to_package(package, wb)
 
 
 def save_encrypted(wb: Any, filename: str, password: str | bytes) -> None:
-    """Save plaintext to a tempfile, then encrypt it atomically."""
-    import tempfile
-
+    """Build the plaintext package in memory, then encrypt it atomically."""
     from wolfxl._encryption import encrypt_xlsx_to_path
 
-    tmp_fd, tmp_name = tempfile.mkstemp(
-        prefix=".wolfxl-plain-",
-        suffix=".xlsx",
-    )
-    os.close(tmp_fd)
-    try:
-        # Re-enter the normal plaintext save path so writer and patcher modes
-        # exercise the same pipeline before encryption.
-        save_workbook(wb, tmp_name)
-        with open(tmp_name, "rb") as fp:
-            plaintext_bytes = fp.read()
-        encrypt_xlsx_to_path(plaintext_bytes, password, filename)
-    finally:
-        try:
-            os.unlink(tmp_name)
-        except OSError:
-            pass
+    # Re-enter the normal plaintext save pipeline so writer and patcher
+    # modes produce the same package before encryption.
+    plaintext_bytes = save_workbook_to_bytes(wb)
+    encrypt_xlsx_to_path(plaintext_bytes, password, filename)
@@ -6,6 +6,7 @@ import re
 from typing import Any
 
 from wolfxl._worksheet import Worksheet
+from wolfxl._worksheet_column_writes import materialize_column_writes
 
 
 def remove_sheet(wb: Any, worksheet: Worksheet) -> None:
@@ -181,6 +182,8 @@ def _materialize_copy_source(source: Worksheet) -> None:
         source._materialize_append_buffer()  # noqa: SLF001
     if source._bulk_writes:  # noqa: SLF001
         source._materialize_bulk_writes()  # noqa: SLF001
+    if source._column_writes:  # noqa: SLF001
+        materialize_column_writes(source)
 
 
 def _copy_cells_write_mode(source: Worksheet, dst: Worksheet) -> None:
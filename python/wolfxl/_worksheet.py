@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from typing import TYPE_CHECKING, Any
 
 from wolfxl._cell import Cell
@@ -25,6 +25,9 @@ from wolfxl._worksheet_collections import AutoFilter as _AutoFilter
 from wolfxl._worksheet_collections import MergedCellsProxy as _MergedCellsProxy
 from wolfxl._worksheet_collections import merge_cells as _merge_cells
 from wolfxl._worksheet_collections import unmerge_cells as _unmerge_cells
+from wolfxl._worksheet_column_writes import write_columns as _write_columns
+from wolfxl._worksheet_columns import worksheet_to_arrow as _worksheet_to_arrow
+from wolfxl._worksheet_columns import worksheet_to_numpy as _worksheet_to_numpy
 from wolfxl._worksheet_dimensions import ColumnDimensionProxy, RowDimensionProxy
 from wolfxl._worksheet_features import (
     add_data_validation as _add_data_validation,
@@ -296,7 +299,7 @@ class Worksheet:
     __slots__ = (
         "_workbook", "_title", "_cells", "_dirty", "_dimensions",
         "_max_col_idx", "_next_append_row",
-        "_append_buffer", "_append_buffer_start", "_bulk_writes",
+        "_append_buffer", "_append_buffer_start", "_bulk_writes", "_column_writes",
         "_freeze_panes", "_auto_filter",
         "_row_heights", "_col_widths", "_sheet_state",
         "_merged_ranges", "_print_area", "_sheet_visibility_cache",
@@ -938,6 +941,62 @@ class Worksheet:
         """
         _write_rows(self, rows, start_row, start_col)
 
+    def write_columns(
+        self,
+        data: Any,
+        *,
+        start_row: int = 1,
+        start_col: int = 1,
+        header: bool | None = None,
+        number_formats: Mapping[Any, str] | None = None,
+    ) -> None:
+        """Bulk-write typed columns with the top-left cell at (start_row, start_col).
+
+        ``data`` is a pandas DataFrame, a pyarrow Table, a mapping of
+        ``name -> column``, or a sequence of columns; each column may be a
+        NumPy array, pandas Series, pyarrow array, or list. Numeric, bool,
+        and ``datetime64`` columns are handed to the Rust writer as typed
+        buffers at save, so no per-cell Python objects are created;
+        datetimes become Excel serials with a default date-time format.
+        Missing values (``None``, ``NaN``, ``NaT``, Arrow nulls) leave the
+        cell empty.
+
+        ``header`` writes the column labels as a first row (default: when
+        ``data`` carries labels). ``number_formats`` maps a column label or
+        0-based position to a number format applied to the whole column.
+        Subsequent ``append()`` calls continue below the written block.
+        """
+        _write_columns(
+            self,
+            data,
+            start_row=start_row,
+            start_col=start_col,
+            header=header,
+            number_formats=number_formats,
+        )
+
+    def write_dataframe(
+        self,
+        df: Any,
+        *,
+        index: bool = False,
+        header: bool = True,
+        start_row: int = 1,
+        start_col: int = 1,
+        number_formats: Mapping[Any, str] | None = None,
+    ) -> None:
+        """Bulk-write a pandas DataFrame through :meth:`write_columns`.
+
+        ``index=True`` writes the index levels as leading columns.
+        """
+        self.write_columns(
+            df.reset_index() if index else df,
+            start_row=start_row,
+            start_col=start_col,
+            header=header,
+            number_formats=number_formats,
+        )
+
     def _materialize_bulk_writes(self) -> None:
         """Convert bulk write buffers into Cell objects.
 
@@ -954,8 +1013,13 @@ class Worksheet:
         max_row: int | None = None,
         min_col: int | None = None,
         max_col: int | None = None,
+        columnar: bool = False,
     ) -> Any:
-        """Return worksheet values as a pandas DataFrame."""
+        """Return worksheet values as a pandas DataFrame.
+
+        ``columnar=True`` builds the frame from the native typed column
+        buffers; see :func:`wolfxl.utils.dataframe.worksheet_to_dataframe`.
+        """
         from wolfxl.utils.dataframe import worksheet_to_dataframe
 
         return worksheet_to_dataframe(
@@ -965,6 +1029,62 @@ class Worksheet:
             max_row=max_row,
             min_col=min_col,
             max_col=max_col,
+            columnar=columnar,
+        )
+
+    def to_numpy(
+        self,
+        columns: Sequence[str | int] | None = None,
+        *,
+        header: bool = True,
+        min_row: int | None = None,
+        max_row: int | None = None,
+        min_col: int | None = None,
+        max_col: int | None = None,
+    ) -> dict[str, Any]:
+        """Return worksheet columns as ``{name: numpy.ndarray}``.
+
+        In read mode the arrays are built from typed Rust column buffers
+        (``int64``, ``float64``, ``bool``, ``datetime64[ms]``) without a
+        Python object per cell; string and mixed columns are ``object``
+        arrays. ``columns`` selects by header label, column letter, or
+        1-based index. Names are header values, or column letters when
+        ``header=False`` or the header cell is empty.
+        """
+        return _worksheet_to_numpy(
+            self,
+            columns,
+            header=header,
+            min_row=min_row,
+            max_row=max_row,
+            min_col=min_col,
+            max_col=max_col,
+        )
+
+    def to_arrow(
+        self,
+        columns: Sequence[str | int] | None = None,
+        *,
+        header: bool = True,
+        min_row: int | None = None,
+        max_row: int | None = None,
+        min_col: int | None = None,
+        max_col: int | None = None,
+    ) -> Any:
+        """Return worksheet columns as a ``pyarrow.Table``.
+
+        Accepts the same arguments as :meth:`to_numpy`. In read mode each
+        Arrow array wraps the Rust-built value, offset, and validity buffers
+        directly.
+        """
+        return _worksheet_to_arrow(
+            self,
+            columns,
+            header=header,
+            min_row=min_row,
+            max_row=max_row,
+            min_col=min_col,
+            max_col=max_col,
         )
 
     @staticmethod
@@ -1074,7 +1194,7 @@ class Worksheet:
         min_col: int | None,
         max_col: int | None,
     ) -> Iterator[tuple[Any, ...]]:
-        """Bulk-read values via a single Rust FFI call (values_only fast path).
+        """Bulk-read values in row blocks, one Rust FFI call per block.
 
         Uses ``read_sheet_values_plain()`` when available (returns native
         Python objects), falling back to ``read_sheet_values()`` + per-cell
@@ -0,0 +1,218 @@
+"""Columnar bulk writes from NumPy / Arrow / pandas columns.
+
+Each input column is normalized once into a write descriptor: a contiguous
+``int64`` / ``float64`` / ``uint8`` / ``datetime64[ms]``-as-``int64`` array
+the Rust writer reads through the buffer protocol, or a plain list for
+string and mixed columns. Descriptors are queued on the worksheet and
+serialized by ``write_columns`` (eager sheets, at save) or
+``append_streaming_columns`` (write-only sheets, immediately), so numeric
+and date columns never become per-cell Python objects. NumPy is imported
+lazily.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from wolfxl._worksheet import Worksheet
+
+
+def named_columns(data: Any) -> list[tuple[Any, Any]]:
+    """Split a DataFrame, Arrow table, mapping, or sequence into ``(label, column)``."""
+    if hasattr(data, "iloc") and hasattr(data, "columns"):
+        return [(label, data.iloc[:, idx]) for idx, label in enumerate(data.columns)]
+    if hasattr(data, "column_names") and hasattr(data, "column"):
+        return [(name, data.column(idx)) for idx, name in enumerate(data.column_names)]
+    if isinstance(data, Mapping):
+        return list(data.items())
+    return [(None, column) for column in data]
+
+
+def column_descriptor(values: Any, number_format: str | None = None) -> dict[str, Any]:
+    """Normalize one NumPy / Arrow / pandas / list column into a write descriptor."""
+    import numpy as np
+
+    mask = None
+    if hasattr(values, "is_null") and hasattr(values, "to_numpy"):
+        # pyarrow Array / ChunkedArray
+        mask = np.asarray(values.is_null().to_numpy(zero_copy_only=False), dtype=bool)
+        values = values.to_numpy(zero_copy_only=False)
+    elif hasattr(values, "isna") and hasattr(values, "to_numpy"):
+        # pandas Series
+        mask = np.asarray(values.isna().to_numpy(), dtype=bool)
+        values = values.to_numpy()
+    arr = np.asarray(values)
+    if arr.ndim != 1:
+        raise ValueError(f"write_columns expects one-dimensional columns, got shape {arr.shape}")
+    if mask is not None and not mask.any():
+        mask = None
+
+    desc: dict[str, Any] = {"number_format": number_format, "length": len(arr)}
+    kind = arr.dtype.kind
+    if kind == "b":
+        desc.update(kind="bool", values=np.ascontiguousarray(arr, dtype=np.uint8))
+    elif kind in "iu":
+        desc.update(kind="int64", values=np.ascontiguousarray(arr, dtype=np.int64))
+    elif kind == "f":
+        desc.update(kind="float64", values=np.ascontiguousarray(arr, dtype=np.float64))
+    elif kind == "M":
+        millis = arr.astype("datetime64[ms]").view(np.int64)
+        desc.update(kind="datetime64[ms]", values=np.ascontiguousarray(millis))
+    else:
+        items = [_plain_value(item) for item in arr.tolist()]
+        if mask is not None:
+            items = [None if missing else item for item, missing in zip(items, mask.tolist())]
+            mask = None
+        is_text = all(
+            item is None or (isinstance(item, str) and not item.startswith("="))
+            for item in items
+        )
+        desc.update(kind="string" if is_text else "object", values=items)
+    if mask is not None:
+        desc["mask"] = np.ascontiguousarray(mask, dtype=np.uint8)
+    return desc
+
+
+def column_descriptors(
+    data: Any,
+    number_formats: Mapping[Any, str] | None = None,
+) -> tuple[list[Any], list[dict[str, Any]]]:
+    """Return ``(labels, descriptors)`` for every column in ``data``.
+
+    ``number_formats`` is keyed by column label or 0-based column position.
+    """
+    formats = dict(number_formats or {})
+    labels: list[Any] = []
+    descriptors: list[dict[str, Any]] = []
+    for idx, (label, values) in enumerate(named_columns(data)):
+        number_format = formats.get(idx)
+        if label is not None:
+            number_format = formats.get(label, number_format)
+        labels.append(label)
+        descriptors.append(column_descriptor(values, number_format))
+    lengths = {desc["length"] for desc in descriptors}
+    if len(lengths) > 1:
+        raise ValueError("write_columns: all columns must have the same length")
+    return labels, descriptors
+
+
+def native_descriptor(desc: dict[str, Any], python_value_to_payload: Any) -> dict[str, Any]:
+    """Descriptor as ``write_columns`` expects it: object values become payloads."""
+    if desc["kind"] != "object":
+        return desc
+    payloads = [
+        None if value is None else python_value_to_payload(value) for value in desc["values"]
+    ]
+    return {**desc, "values": payloads}
+
+
+def python_values(desc: dict[str, Any]) -> list[Any]:
+    """Plain Python values for a descriptor, ``None`` where missing.
+
+    Rejects ±inf in float columns with ``ValueError`` as the native column
+    writer does, so every save path accepts the same data.
+    """
+    import numpy as np
+
+    kind = desc["kind"]
+    values = desc["values"]
+    if kind == "bool":
+        out = values.astype(bool).tolist()
+    elif kind == "int64":
+        out = values.tolist()
+    elif kind == "float64":
+        out = [None if value != value else value for value in values.tolist()]
+        for value in out:
+            if value is not None and math.isinf(value):
+                raise ValueError(
+                    "write_columns: non-finite floats are not representable in xlsx; "
+                    f"got {value}"
+                )
+    elif kind == "datetime64[ms]":
+        out = values.view("datetime64[ms]").tolist()
+    else:
+        out = list(values)
+    mask = desc.get("mask")
+    if mask is not None:
+        missing = np.asarray(mask, dtype=bool).tolist()
+        out = [None if gap else value for value, gap in zip(out, missing)]
+    return out
+
+
+def write_columns(
+    ws: Worksheet,
+    data: Any,
+    *,
+    start_row: int = 1,
+    start_col: int = 1,
+    header: bool | None = None,
+    number_formats: Mapping[Any, str] | None = None,
+) -> None:
+    """Queue typed columns on an eager worksheet for a native write at save.
+
+    Without a native writer (modify mode) the columns are materialized into
+    cells right away so they join the regular patcher flush.
+    """
+    labels, descriptors = column_descriptors(data, number_formats)
+    if header is None:
+        header = any(label is not None for label in labels)
+    row = start_row
+    if header and descriptors:
+        names = [None if label is None else str(label) for label in labels]
+        ws.write_rows([names], row, start_col)
+        row += 1
+    rows = descriptors[0]["length"] if descriptors else 0
+    if rows:
+        ws._column_writes.append((descriptors, row, start_col))  # noqa: SLF001
+    end_row = row + rows - 1
+    if end_row >= ws._next_append_row:  # noqa: SLF001
+        ws._next_append_row = end_row + 1  # noqa: SLF001
+    end_col = start_col + len(descriptors) - 1
+    if end_col > ws._max_col_idx:  # noqa: SLF001
+        ws._max_col_idx = end_col  # noqa: SLF001
+    if ws._workbook._rust_writer is None:  # noqa: SLF001
+        materialize_column_writes(ws)
+
+
+def materialize_column_writes(ws: Worksheet) -> None:
+    """Convert queued column writes into dirty Cell objects."""
+    writes = ws._column_writes  # noqa: SLF001
+    if not writes:
+        return
+    ws._column_writes = []  # noqa: SLF001
+    for descriptors, start_row, start_col in writes:
+        for col_offset, desc in enumerate(descriptors):
+            col = start_col + col_offset
+            number_format = desc.get("number_format")
+            for row_offset, value in enumerate(python_values(desc)):
+                if value is None:
+                    continue
+                cell = ws.cell(row=start_row + row_offset, column=col, value=value)
+                if number_format is not None:
+                    cell.number_format = number_format
+
+
+def column_writes_bounds(ws: Worksheet) -> tuple[int, int, int, int] | None:
+    """Bounds covered by queued column writes as ``(min_row, min_col, max_row, max_col)``."""
+    writes = ws._column_writes  # noqa: SLF001
+    if not writes:
+        return None
+    return (
+        min(start_row for _, start_row, _ in writes),
+        min(start_col for _, _, start_col in writes),
+        max(start_row + descriptors[0]["length"] - 1 for descriptors, start_row, _ in writes),
+        max(start_col + len(descriptors) - 1 for descriptors, _, start_col in writes),
+    )
+
+
+def _plain_value(value: Any) -> Any:
+    """Unwrap NumPy scalars and map float NaN to ``None``."""
+    if hasattr(value, "item") and type(value).__module__ == "numpy":
+        value = value.item()
+    if isinstance(value, float) and value != value:
+        return None
+    return value
+
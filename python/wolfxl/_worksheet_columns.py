@@ -0,0 +1,257 @@
+"""Columnar worksheet export to NumPy arrays and Arrow tables.
+
+In read mode the Rust reader's ``read_sheet_columns`` returns one typed
+buffer per column (``int64`` / ``float64`` / ``bool`` / ``datetime64[ms]``
+values, or Arrow offsets + UTF-8 data for strings) plus an Arrow validity
+bitmap, so numeric and date columns reach NumPy / Arrow without creating a
+Python object per cell. Other worksheets fall back to ``iter_cols`` and the
+same descriptor shape. NumPy and pyarrow are imported lazily.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from wolfxl._utils import column_index, column_letter, rowcol_to_a1
+
+if TYPE_CHECKING:
+    from wolfxl._worksheet import Worksheet
+
+_FIXED_WIDTH_KINDS = ("int64", "float64", "datetime64[ms]")
+
+
+def column_buffers(
+    ws: Worksheet,
+    columns: Sequence[str | int] | None = None,
+    *,
+    header: bool = True,
+    min_row: int | None = None,
+    max_row: int | None = None,
+    min_col: int | None = None,
+    max_col: int | None = None,
+) -> tuple[list[Any], list[dict[str, Any]]]:
+    """Return ``(labels, descriptors)`` for the selected worksheet columns.
+
+    ``labels`` holds the raw header value per column (``None`` when
+    ``header=False``). ``columns`` selects by header label, column letter,
+    or 1-based column index.
+    """
+    row_min = min_row or 1
+    row_max = max_row or ws._max_row()  # noqa: SLF001
+    col_min = min_col or 1
+    col_max = max_col or ws._max_col()  # noqa: SLF001
+
+    labels: list[Any] = [None] * (col_max - col_min + 1)
+    if header:
+        first = next(
+            ws.iter_rows(
+                min_row=row_min,
+                max_row=row_min,
+                min_col=col_min,
+                max_col=col_max,
+                values_only=True,
+            ),
+            (),
+        )
+        labels = list(first) + labels[len(first):]
+        row_min += 1
+
+    selected = list(range(col_min, col_max + 1))
+    if columns is not None:
+        selected = [_resolve_column(ws, key, labels, col_min, col_max) for key in columns]
+    selected_labels = [labels[col - col_min] for col in selected]
+
+    if row_max < row_min or not selected:
+        length = max(row_max - row_min + 1, 0)
+        return selected_labels, [_object_descriptor(col, [None] * length) for col in selected]
+
+    reader = ws._workbook._rust_reader  # noqa: SLF001
+    data_only = getattr(ws._workbook, "_data_only", False)  # noqa: SLF001
+    if (
+        reader is not None
+        and hasattr(reader, "read_sheet_columns")
+        and not ws._collect_pending_overlay()  # noqa: SLF001
+    ):
+        range_str = f"{rowcol_to_a1(row_min, col_min)}:{rowcol_to_a1(row_max, col_max)}"
+        sheet = ws._title  # noqa: SLF001
+        descriptors = reader.read_sheet_columns(sheet, range_str, data_only, selected)
+        return selected_labels, list(descriptors)
+
+    descriptors = []
+    for col in selected:
+        values = next(
+            ws.iter_cols(
+                min_col=col,
+                max_col=col,
+                min_row=row_min,
+                max_row=row_max,
+                values_only=True,
+            )
+        )
+        descriptors.append(_object_descriptor(col, list(values)))
+    return selected_labels, descriptors
+
+
+def column_names(labels: Sequence[Any], descriptors: Sequence[dict[str, Any]]) -> list[str]:
+    """String keys for ``to_numpy``: header text, else the column letter."""
+    return [
+        column_letter(desc["column"]) if label is None else str(label)
+        for label, desc in zip(labels, descriptors)
+    ]
+
+
+def to_numpy_array(desc: dict[str, Any]) -> Any:
+    """Convert one column descriptor to a NumPy array.
+
+    Fixed-width kinds are read-only views over the Rust-built buffer. Missing
+    numbers are ``NaN`` and missing dates ``NaT``; string, mixed, and
+    bool-with-missing columns become ``object`` arrays holding ``None``.
+    """
+    import numpy as np
+
+    kind = desc["kind"]
+    length = desc["length"]
+    if kind in _FIXED_WIDTH_KINDS:
+        return np.frombuffer(desc["data"], dtype=kind)
+    if kind == "bool":
+        values = np.frombuffer(desc["data"], dtype=np.bool_)
+        if not desc["null_count"]:
+            return values
+        out = values.astype(object)
+        out[~_validity_mask(desc)] = None
+        return out
+    if kind == "string":
+        data = desc["data"]
+        offsets = np.frombuffer(desc["offsets"], dtype=np.int64).tolist()
+        valid = _validity_mask(desc).tolist()
+        out = np.empty(length, dtype=object)
+        for idx in range(length):
+            if valid[idx]:
+                out[idx] = data[offsets[idx]:offsets[idx + 1]].decode("utf-8")
+        return out
+    if kind == "null":
+        return np.full(length, None, dtype=object)
+    return _infer_object_array(desc["values"])
+
+
+def to_arrow_array(desc: dict[str, Any]) -> Any:
+    """Convert one column descriptor to a ``pyarrow.Array`` over its buffers.
+
+    Mixed-kind columns have no single Arrow type, so their non-null values
+    are exported as strings.
+    """
+    import pyarrow as pa
+
+    kind = desc["kind"]
+    length = desc["length"]
+    null_count = desc["null_count"]
+    validity = pa.py_buffer(desc["validity"]) if null_count and "validity" in desc else None
+    if kind in _FIXED_WIDTH_KINDS:
+        arrow_type = {
+            "int64": pa.int64(),
+            "float64": pa.float64(),
+            "datetime64[ms]": pa.timestamp("ms"),
+        }[kind]
+        return pa.Array.from_buffers(
+            arrow_type, length, [validity, pa.py_buffer(desc["data"])], null_count=null_count
+        )
+    if kind == "bool":
+        as_bytes = pa.Array.from_buffers(
+            pa.uint8(), length, [validity, pa.py_buffer(desc["data"])], null_count=null_count
+        )
+        return as_bytes.cast(pa.bool_())
+    if kind == "string":
+        return pa.Array.from_buffers(
+            pa.large_string(),
+            length,
+            [validity, pa.py_buffer(desc["offsets"]), pa.py_buffer(desc["data"])],
+            null_count=null_count,
+        )
+    if kind == "null":
+        return pa.nulls(length)
+    values = desc["values"]
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array(
+            [None if value is None else str(value) for value in values],
+            type=pa.large_string(),
+        )
+
+
+def worksheet_to_numpy(
+    ws: Worksheet,
+    columns: Sequence[str | int] | None = None,
+    **bounds: Any,
+) -> dict[str, Any]:
+    """Return ``{column name: ndarray}`` for the selected worksheet columns."""
+    labels, descriptors = column_buffers(ws, columns, **bounds)
+    names = column_names(labels, descriptors)
+    return {name: to_numpy_array(desc) for name, desc in zip(names, descriptors)}
+
+
+def worksheet_to_arrow(
+    ws: Worksheet,
+    columns: Sequence[str | int] | None = None,
+    **bounds: Any,
+) -> Any:
+    """Return the selected worksheet columns as a ``pyarrow.Table``."""
+    import pyarrow as pa
+
+    labels, descriptors = column_buffers(ws, columns, **bounds)
+    names = column_names(labels, descriptors)
+    return pa.Table.from_arrays([to_arrow_array(desc) for desc in descriptors], names=names)
+
+
+def _resolve_column(
+    ws: Worksheet, key: str | int, labels: list[Any], col_min: int, col_max: int
+) -> int:
+    if isinstance(key, int) and not isinstance(key, bool):
+        col = key
+    elif key in labels:
+        col = col_min + labels.index(key)
+    elif isinstance(key, str) and key.isalpha():
+        col = column_index(key)
+    else:
+        raise KeyError(f"Unknown column {key!r} in worksheet {ws.title!r}")
+    if not col_min <= col <= col_max:
+        raise KeyError(f"Column {key!r} is outside the requested range")
+    return col
+
+
+def _object_descriptor(col: int, values: list[Any]) -> dict[str, Any]:
+    nulls = sum(value is None for value in values)
+    return {
+        "column": col,
+        "kind": "null" if nulls == len(values) else "object",
+        "length": len(values),
+        "null_count": nulls,
+        "values": values,
+    }
+
+
+def _validity_mask(desc: dict[str, Any]) -> Any:
+    import numpy as np
+
+    bits = np.frombuffer(desc["validity"], dtype=np.uint8)
+    return np.unpackbits(bits, bitorder="little")[: desc["length"]].astype(bool)
+
+
+def _infer_object_array(values: list[Any]) -> Any:
+    """Best-effort typed array for Python-side values (bools, ints, floats)."""
+    import numpy as np
+
+    present = [value for value in values if value is not None]
+    if present and len(present) == len(values):
+        if all(isinstance(value, bool) for value in present):
+            return np.array(values, dtype=np.bool_)
+        if all(isinstance(value, int) and not isinstance(value, bool) for value in present):
+            return np.array(values, dtype=np.int64)
+    if present and all(
+        isinstance(value, (int, float)) and not isinstance(value, bool) for value in present
+    ):
+        return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+    out = np.empty(len(values), dtype=object)
+    out[:] = values
+    return out
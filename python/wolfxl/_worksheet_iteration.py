@@ -10,6 +10,10 @@ from wolfxl._utils import rowcol_to_a1
 if TYPE_CHECKING:
     from wolfxl._worksheet import Worksheet
 
+# Rows fetched per ``read_sheet_values_plain`` call in ``iter_rows_bulk``.
+# Bounds the Python-side peak to one block instead of the whole range.
+BULK_CHUNK_ROWS = 4096
+
 
 def iter_rows(
     ws: Worksheet,
@@ -21,7 +25,9 @@ def iter_rows(
 ) -> Iterator[tuple[Any, ...]]:
     """Iterate worksheet rows with streaming and bulk-read fast paths."""
     workbook = ws._workbook  # noqa: SLF001
-    if workbook._rust_reader is not None and getattr(workbook, "_source_path", None):  # noqa: SLF001
+    if workbook._rust_reader is not None and (  # noqa: SLF001
+        getattr(workbook, "_source_path", None) or getattr(workbook, "_source_bytes", None)
+    ):
         from wolfxl._streaming import should_auto_stream, stream_iter_rows
 
         stream_now = bool(getattr(workbook, "_read_only", False)) or should_auto_stream(ws)
@@ -149,7 +155,7 @@ def iter_rows_bulk(
     min_col: int | None,
     max_col: int | None,
 ) -> Iterator[tuple[Any, ...]]:
-    """Bulk-read row values through one Rust FFI call."""
+    """Bulk-read row values, one Rust FFI call per ``BULK_CHUNK_ROWS`` block."""
     from wolfxl._cell import _payload_to_python
 
     reader = ws._workbook._rust_reader  # noqa: SLF001
@@ -160,25 +166,28 @@ def iter_rows_bulk(
     row_max = max_row or ws._max_row()  # noqa: SLF001
     col_min = min_col or 1
     col_max = max_col or ws._max_col()  # noqa: SLF001
-    range_str = f"{rowcol_to_a1(row_min, col_min)}:{rowcol_to_a1(row_max, col_max)}"
 
     use_plain = hasattr(reader, "read_sheet_values_plain")
-    if use_plain:
-        rows = reader.read_sheet_values_plain(sheet, range_str, data_only)
-    else:
-        rows = reader.read_sheet_values(sheet, range_str, data_only)
-
-    if not rows:
-        return
-
     expected_cols = col_max - col_min + 1
-    for row in rows:
+    for block_min in range(row_min, row_max + 1, BULK_CHUNK_ROWS):
+        block_max = min(block_min + BULK_CHUNK_ROWS - 1, row_max)
+        range_str = f"{rowcol_to_a1(block_min, col_min)}:{rowcol_to_a1(block_max, col_max)}"
         if use_plain:
-            values = list(row)
+            rows = reader.read_sheet_values_plain(sheet, range_str, data_only)
         else:
-            values = [_payload_to_python(cell) for cell in row]
-        width = len(values)
-        if width >= expected_cols:
-            yield tuple(values[:expected_cols])
-        else:
-            yield tuple(values) + (None,) * (expected_cols - width)
+            rows = reader.read_sheet_values(sheet, range_str, data_only)
+
+        if not rows:
+            return
+
+        for row in rows:
+            if use_plain:
+                values = list(row)
+            else:
+                values = [_payload_to_python(cell) for cell in row]
+            width = len(values)
+            if width >= expected_cols:
+                yield tuple(values[:expected_cols])
+            else:
+                yield tuple(values) + (None,) * (expected_cols - width)
+        del rows
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from wolfxl._worksheet_column_writes import column_writes_bounds, python_values
+
 if TYPE_CHECKING:
     from wolfxl._worksheet import Worksheet
 
@@ -25,6 +27,12 @@ def collect_pending_overlay(ws: Worksheet) -> dict[tuple[int, int], Any]:
         for row_offset, row_values in enumerate(grid):
             for col_offset, value in enumerate(row_values):
                 overlay[(start_row + row_offset, start_col + col_offset)] = value
+    for descriptors, start_row, start_col in ws._column_writes:  # noqa: SLF001
+        for col_offset, desc in enumerate(descriptors):
+            # Gaps leave existing cells alone, as materialize_column_writes does.
+            for row_offset, value in enumerate(python_values(desc)):
+                if value is not None:
+                    overlay[(start_row + row_offset, start_col + col_offset)] = value
     return overlay
 
 
@@ -33,7 +41,8 @@ def pending_writes_bounds(ws: Worksheet) -> tuple[int, int, int, int] | None:
     dirty = ws._dirty  # noqa: SLF001
     buf = ws._append_buffer  # noqa: SLF001
     bulk = ws._bulk_writes  # noqa: SLF001
-    if not dirty and not buf and not bulk:
+    columns = column_writes_bounds(ws)
+    if not dirty and not buf and not bulk and columns is None:
         return None
 
     min_r = min_c = None
@@ -83,6 +92,14 @@ def pending_writes_bounds(ws: Worksheet) -> tuple[int, int, int, int] | None:
         if grid_max_c > max_c:
             max_c = grid_max_c
 
+    if columns is not None:
+        if min_r is None or columns[0] < min_r:
+            min_r = columns[0]
+        if min_c is None or columns[1] < min_c:
+            min_c = columns[1]
+        max_r = max(max_r, columns[2])
+        max_c = max(max_c, columns[3])
+
     if min_r is None or min_c is None:
         return None
     return min_r, min_c, max_r, max_c
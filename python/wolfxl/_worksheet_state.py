@@ -28,6 +28,7 @@ def initialize_worksheet_state(
     ws._append_buffer: list[list[Any]] = []  # noqa: SLF001
     ws._append_buffer_start = 1  # noqa: SLF001
     ws._bulk_writes: list[tuple[list[list[Any]], int, int]] = []  # noqa: SLF001
+    ws._column_writes: list[tuple[list[dict[str, Any]], int, int]] = []  # noqa: SLF001
 
     ws._freeze_panes: str | None = None  # noqa: SLF001
     ws._auto_filter = AutoFilter()  # noqa: SLF001
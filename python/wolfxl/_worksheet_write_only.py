@@ -33,7 +33,7 @@ distinct styles only crosses the FFI 5 times — not 10.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Iterable
+from typing import TYPE_CHECKING, Any, Iterable, Mapping
 
 from wolfxl._cell_payloads import (
     border_to_rust_dict,
@@ -41,6 +41,7 @@ from wolfxl._cell_payloads import (
     font_to_format_dict,
     python_value_to_payload,
 )
+from wolfxl._worksheet_column_writes import column_descriptors, native_descriptor
 from wolfxl.utils.exceptions import WorkbookAlreadySaved
 
 if TYPE_CHECKING:
@@ -200,6 +201,53 @@ class WriteOnlyWorksheet:
         backend = self._workbook._rust_writer  # noqa: SLF001
         backend.append_streaming_row(self.title, self._row_counter, cells_payload)
 
+    def write_columns(
+        self,
+        data: Any,
+        *,
+        header: bool | None = None,
+        number_formats: Mapping[Any, str] | None = None,
+    ) -> None:
+        """Append typed columns as consecutive rows in one FFI call.
+
+        Accepts the same ``data`` / ``header`` / ``number_formats`` as
+        :meth:`wolfxl._worksheet.Worksheet.write_columns`. Numeric, bool,
+        and ``datetime64`` columns cross as typed buffers and the Rust side
+        encodes every ``<row>`` straight from them, instead of one payload
+        dict per cell as in :meth:`append`. Columns start at ``A``.
+        """
+        if self._closed:
+            raise WorkbookAlreadySaved(
+                "cannot append to a write-only worksheet after save"
+            )
+        labels, descriptors = column_descriptors(data, number_formats)
+        if header is None:
+            header = any(label is not None for label in labels)
+        if header and descriptors:
+            self.append([None if label is None else str(label) for label in labels])
+        if not descriptors or not descriptors[0]["length"]:
+            return
+        columns = [native_descriptor(desc, python_value_to_payload) for desc in descriptors]
+        backend = self._workbook._rust_writer  # noqa: SLF001
+        self._row_counter += backend.append_streaming_columns(
+            self.title, self._row_counter + 1, columns
+        )
+
+    def write_dataframe(
+        self,
+        df: Any,
+        *,
+        index: bool = False,
+        header: bool = True,
+        number_formats: Mapping[Any, str] | None = None,
+    ) -> None:
+        """Append a pandas DataFrame through :meth:`write_columns`."""
+        self.write_columns(
+            df.reset_index() if index else df,
+            header=header,
+            number_formats=number_formats,
+        )
+
     # ------------------------------------------------------------------
     # Style resolution
     # ------------------------------------------------------------------
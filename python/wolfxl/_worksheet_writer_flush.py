@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from wolfxl._utils import rowcol_to_a1
+from wolfxl._worksheet_column_writes import native_descriptor
 
 if TYPE_CHECKING:
     from wolfxl._worksheet import Worksheet
@@ -35,6 +36,7 @@ def flush_to_writer(
     """
     _flush_append_buffer(ws, writer, python_value_to_payload)
     _flush_bulk_writes(ws, writer, python_value_to_payload)
+    _flush_column_writes(ws, writer, python_value_to_payload)
 
     batch_values, individual_values, format_cells = _partition_dirty_cells(ws)
     _write_batch_values(ws, writer, batch_values)
@@ -102,6 +104,19 @@ def _flush_bulk_writes(
     ws._bulk_writes = []  # noqa: SLF001
 
 
+def _flush_column_writes(
+    ws: Worksheet,
+    writer: Any,
+    python_value_to_payload: Any,
+) -> None:
+    """Flush columns queued via ``write_columns()`` as typed native buffers."""
+    for descriptors, start_row, start_col in ws._column_writes:  # noqa: SLF001
+        columns = [native_descriptor(desc, python_value_to_payload) for desc in descriptors]
+        writer.write_columns(ws._title, start_row, start_col, columns)  # noqa: SLF001
+
+    ws._column_writes = []  # noqa: SLF001
+
+
 def _partition_dirty_cells(
     ws: Worksheet,
 ) -> tuple[list[tuple[int, int, Any]], list[tuple[int, int, Any]], list[tuple[int, int, Any]]]:
@@ -11,9 +11,10 @@ from wolfxl.calc._functions import (
 )
 from wolfxl.calc._graph import DependencyGraph
 from wolfxl.calc._parser import FormulaParser, all_references, expand_range
-from wolfxl.calc._protocol import CalcEngine, CellDelta, RecalcResult
+from wolfxl.calc._protocol import BatchRecalcResult, CalcEngine, CellDelta, RecalcResult
 
 __all__ = [
+    "BatchRecalcResult",
     "CalcEngine",
     "CellDelta",
     "DependencyGraph",
@@ -0,0 +1,474 @@
+"""Batch recalculation: many perturbation scenarios in one pass.
+
+Every affected formula is evaluated once for all scenarios. A cell's
+value across scenarios is a *column*: a NumPy ``int64`` / ``float64`` /
+``bool`` array of length ``n_scenarios`` (``int64`` keeps integer inputs
+integral, as the scalar evaluator does), or a plain list when the values
+are not all numeric. Formulas built from ``+ - * /``, comparisons, unary minus,
+numeric literals, cell references, ``SUM``, ``AVERAGE`` and ``IF`` compile
+to vector nodes that operate on whole columns. Anything else, or a vector
+node that meets an operand needing scalar semantics (text, blanks, errors,
+division by zero), is evaluated per scenario with the regular compiled
+formula, so results match :meth:`WorkbookEvaluator.recalculate`.
+
+Imported lazily by the evaluator; requires NumPy.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Callable
+
+import numpy as np
+
+from wolfxl.calc._evaluator import (
+    _cell_key,
+    _find_matching_paren,
+    _find_top_level_split,
+    _has_top_level_colon,
+    _match_function_call,
+    _range_key,
+    _split_function_args,
+)
+from wolfxl.calc._functions import _builtin_average, _builtin_if, _builtin_sum
+from wolfxl.calc._parser import _SINGLE_REF_RE, expand_range
+from wolfxl.calc._protocol import BatchRecalcResult
+
+if TYPE_CHECKING:
+    from wolfxl.calc._evaluator import WorkbookEvaluator
+
+_VECTOR_FUNCTIONS = {"SUM": _builtin_sum, "AVERAGE": _builtin_average, "IF": _builtin_if}
+_COMPARE = {
+    '=': np.equal,
+    '<>': np.not_equal,
+    '>': np.greater,
+    '<': np.less,
+    '>=': np.greater_equal,
+    '<=': np.less_equal,
+}
+
+
+class _Fallback(Exception):
+    """A vector node met a value that needs per-scenario scalar semantics."""
+
+
+class _BatchEnv:
+    """Columns for perturbed and recomputed cells over the base cell values.
+
+    ``raw`` keeps the original Python values behind columns that came from
+    scenario dicts or per-scenario evaluation, so the scalar path sees ``12``
+    rather than the ``12.0`` of a mixed int/float column.
+    """
+
+    __slots__ = ("base", "columns", "raw", "size")
+
+    def __init__(self, base: dict[str, Any], columns: dict[str, Any], size: int) -> None:
+        self.base = base
+        self.columns = columns
+        self.raw: dict[str, list[Any]] = {}
+        self.size = size
+
+
+class _ScenarioValues:
+    """Read-only ``_cell_values`` stand-in for one scenario of a batch."""
+
+    __slots__ = ("env", "index")
+
+    def __init__(self, env: _BatchEnv) -> None:
+        self.env = env
+        self.index = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        env = self.env
+        raw = env.raw.get(key)
+        if raw is not None:
+            return raw[self.index]
+        column = env.columns.get(key)
+        if column is None:
+            return env.base.get(key, default)
+        value = column[self.index]
+        return value.item() if isinstance(column, np.ndarray) else value
+
+
+_VectorNode = Callable[[_BatchEnv], Any]
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+
+def recalculate_batch(
+    ev: WorkbookEvaluator,
+    scenarios: Any,
+    outputs: Sequence[str] | None = None,
+    *,
+    inputs: Sequence[str] | None = None,
+) -> BatchRecalcResult:
+    """Evaluate every scenario against *ev*'s current values without mutating them."""
+    input_refs, raw, size = _scenario_columns(ev, scenarios, inputs)
+    affected, _ = ev._graph.dirty_cells(set(input_refs))  # noqa: SLF001
+    env = _BatchEnv(ev._cell_values, {}, size)  # noqa: SLF001
+    for ref, values in raw.items():
+        _store(env, ref, values)
+
+    for cell_ref in affected:
+        formula = ev._graph.formulas[cell_ref]  # noqa: SLF001
+        sheet = ev._sheet_from_ref(cell_ref)  # noqa: SLF001
+        node = _vector_formula(ev, formula, sheet)
+        column = None
+        if node is not None:
+            try:
+                column = _as_column(node(env), size)
+            except _Fallback:
+                column = None
+        if column is None:
+            _store(env, cell_ref, _scalar_values(ev, env, cell_ref, formula))
+        else:
+            env.columns[cell_ref] = column
+
+    out = list(affected) if outputs is None else list(outputs)
+    return BatchRecalcResult(
+        inputs=tuple(input_refs),
+        outputs=tuple(out),
+        values=_matrix(env, out),
+    )
+
+
+def _scenario_columns(
+    ev: WorkbookEvaluator,
+    scenarios: Any,
+    inputs: Sequence[str] | None,
+) -> tuple[list[str], dict[str, Any], int]:
+    """Normalize scenarios into per-cell values: arrays, or lists from dicts."""
+    if inputs is not None:
+        matrix = np.asarray(scenarios)
+        if matrix.dtype.kind not in "biuf":
+            raise TypeError("recalculate_batch: scenario arrays must be numeric")
+        if matrix.dtype.kind == "u":
+            matrix = matrix.astype(np.int64)
+        if matrix.ndim != 2 or matrix.shape[1] != len(inputs):
+            raise ValueError(
+                "recalculate_batch: scenarios must have shape (n_scenarios, len(inputs)), "
+                f"got {matrix.shape}"
+            )
+        refs = list(inputs)
+        columns = {ref: np.ascontiguousarray(matrix[:, j]) for j, ref in enumerate(refs)}
+        return refs, columns, matrix.shape[0]
+
+    scenarios = list(scenarios)
+    refs: list[str] = []
+    seen: set[str] = set()
+    for scenario in scenarios:
+        if not isinstance(scenario, Mapping):
+            raise TypeError(
+                "recalculate_batch: scenarios must be {cell_ref: value} mappings "
+                "or a 2-D array together with inputs="
+            )
+        for ref in scenario:
+            if ref not in seen:
+                seen.add(ref)
+                refs.append(ref)
+    base = ev._cell_values  # noqa: SLF001
+    values = {ref: [scenario.get(ref, base.get(ref)) for scenario in scenarios] for ref in refs}
+    return refs, values, len(scenarios)
+
+
+# ---------------------------------------------------------------------------
+# Columns
+# ---------------------------------------------------------------------------
+
+
+def _store(env: _BatchEnv, ref: str, values: Any) -> None:
+    """Record a cell's values: arrays as-is, lists as a column plus raw values."""
+    if isinstance(values, np.ndarray):
+        env.columns[ref] = values
+        return
+    env.columns[ref] = _column_from_values(values)
+    env.raw[ref] = values
+
+
+def _column_from_values(values: list[Any]) -> Any:
+    """Typed array when every value is numeric (or every value bool), else the list."""
+    if all(isinstance(v, bool) for v in values):
+        return np.array(values, dtype=np.bool_)
+    if all(isinstance(v, int) and not isinstance(v, bool) for v in values):
+        column = np.array(values)
+        # Integers beyond int64 stay Python objects.
+        return values if column.dtype == object else column
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+        return np.array(values, dtype=np.float64)
+    return values
+
+
+def _as_column(result: Any, size: int) -> Any:
+    """Broadcast a vector node's result to a full column."""
+    if isinstance(result, np.generic):
+        result = result.item()
+    if isinstance(result, np.ndarray):
+        if result.shape == (size,):
+            return result
+        return np.broadcast_to(result, (size,)).copy()
+    if isinstance(result, bool):
+        return np.full(size, result, dtype=np.bool_)
+    if isinstance(result, (int, float)):
+        column = np.full(size, result)
+        if column.dtype == object:
+            raise _Fallback
+        return column
+    raise _Fallback
+
+
+def _scalar_values(
+    ev: WorkbookEvaluator,
+    env: _BatchEnv,
+    cell_ref: str,
+    formula: str,
+) -> list[Any]:
+    """Evaluate *formula* once per scenario through the scalar evaluator."""
+    view = _ScenarioValues(env)
+    saved = ev._cell_values  # noqa: SLF001
+    # Raw-arg functions and the formulas fallback read ev._cell_values.
+    ev._cell_values = view  # type: ignore[assignment]  # noqa: SLF001
+    try:
+        values = []
+        for idx in range(env.size):
+            view.index = idx
+            values.append(ev._evaluate_formula(cell_ref, formula))  # noqa: SLF001
+    finally:
+        ev._cell_values = saved  # noqa: SLF001
+    return values
+
+
+def _matrix(env: _BatchEnv, outputs: list[str]) -> Any:
+    """``(n_scenarios, len(outputs))`` array: ``float64`` if all numeric, else object."""
+    columns = []
+    for ref in outputs:
+        column = env.columns.get(ref)
+        if column is None:
+            column = _column_from_values([env.base.get(ref)] * env.size)
+        columns.append(column)
+    if all(isinstance(column, np.ndarray) for column in columns):
+        out = np.empty((env.size, len(columns)), dtype=np.float64)
+        for j, column in enumerate(columns):
+            out[:, j] = column
+        return out
+    out = np.empty((env.size, len(columns)), dtype=object)
+    for j, (ref, column) in enumerate(zip(outputs, columns)):
+        values = env.raw.get(ref)
+        if values is None:
+            values = column.tolist() if isinstance(column, np.ndarray) else column
+        for i, value in enumerate(values):
+            out[i, j] = value
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Vector compilation
+# ---------------------------------------------------------------------------
+
+
+def _vector_formula(ev: WorkbookEvaluator, formula: str, sheet: str) -> _VectorNode | None:
+    """Vector node for *formula*, or ``None`` when it needs the scalar path."""
+    cache = ev._batch_cache  # noqa: SLF001
+    key = (sheet, formula)
+    if key not in cache:
+        body = formula.strip()
+        if body.startswith('='):
+            body = body[1:]
+        cache[key] = _compile_vector(ev, body.strip(), sheet)
+    return cache[key]
+
+
+def _compile_vector(ev: WorkbookEvaluator, expr: str, sheet: str) -> _VectorNode | None:
+    """Mirror of ``WorkbookEvaluator._compile_expr`` for the vectorizable subset."""
+    expr = expr.strip()
+    if not expr:
+        return None
+
+    split = _find_top_level_split(expr)
+    if split:
+        left_str, op, right_str = split
+        left = _compile_vector(ev, left_str, sheet)
+        right = _compile_vector(ev, right_str, sheet)
+        if left is None or right is None:
+            return None
+        if op in ('+', '-', '*', '/'):
+            return _arithmetic_node(left, op, right)
+        if op in _COMPARE:
+            return _compare_node(left, op, right)
+        return None
+
+    if expr.startswith('('):
+        close = _find_matching_paren(expr, 0)
+        if close == len(expr) - 1:
+            return _compile_vector(ev, expr[1:close], sheet)
+
+    func = _match_function_call(expr)
+    if func:
+        return _compile_vector_function(ev, func[0].upper(), func[1], sheet)
+
+    if expr.startswith('-'):
+        operand = _compile_vector(ev, expr[1:], sheet)
+        if operand is None:
+            return None
+        return lambda env: -_number(operand(env))
+    if expr.startswith('+'):
+        return _compile_vector(ev, expr[1:], sheet)
+
+    try:
+        num = float(expr)
+    except ValueError:
+        pass
+    else:
+        return lambda env: num
+
+    if expr[0] == '"':
+        return None
+    upper = expr.upper()
+    if upper in ('TRUE', 'FALSE'):
+        flag = upper == 'TRUE'
+        return lambda env: flag
+
+    refers_to = ev._names.resolve(expr, sheet)  # noqa: SLF001
+    if refers_to is not None:
+        if not _SINGLE_REF_RE.fullmatch(refers_to.strip()):
+            return None
+        return _cell_node(_cell_key(refers_to, sheet))
+
+    return _cell_node(_cell_key(expr, sheet))
+
+
+def _compile_vector_function(
+    ev: WorkbookEvaluator, name: str, args_str: str, sheet: str
+) -> _VectorNode | None:
+    if name not in _VECTOR_FUNCTIONS:
+        return None
+    if ev._functions.get(name) is not _VECTOR_FUNCTIONS[name]:  # noqa: SLF001
+        return None  # overridden by a registered function
+
+    args = _split_function_args(args_str)
+    if name == "IF":
+        if len(args) not in (2, 3):
+            return None
+        nodes = [_compile_vector(ev, arg, sheet) for arg in args]
+        if any(node is None for node in nodes):
+            return None
+        otherwise = nodes[2] if len(nodes) > 2 else (lambda env: False)
+        return _if_node(nodes[0], nodes[1], otherwise)
+
+    parts: list[tuple[list[str] | None, _VectorNode | None]] = []
+    names = ev._names  # noqa: SLF001
+    for arg in args:
+        if not arg:
+            continue
+        if _has_top_level_colon(arg) and not arg.startswith('"'):
+            parts.append((_range_cells(_range_key(arg, sheet)), None))
+            continue
+        refers_to = names.resolve(arg.strip(), sheet)
+        if refers_to is not None and ':' in refers_to:
+            parts.append((_range_cells(_range_key(refers_to, sheet)), None))
+            continue
+        node = _compile_vector(ev, arg, sheet)
+        if node is None:
+            return None
+        parts.append((None, node))
+    if any(cells is None and node is None for cells, node in parts):
+        return None
+    return _aggregate_node(parts, average=name == "AVERAGE")
+
+
+def _range_cells(range_ref: str) -> list[str] | None:
+    try:
+        return expand_range(range_ref)
+    except ValueError:
+        return None
+
+
+def _number(value: Any) -> Any:
+    """Numeric operand for a vector op, or :class:`_Fallback`."""
+    if isinstance(value, np.ndarray):
+        return value.astype(np.float64) if value.dtype == np.bool_ else value
+    if isinstance(value, (int, float)):
+        return value
+    raise _Fallback
+
+
+def _cell_node(key: str) -> _VectorNode:
+    def cell(env: _BatchEnv) -> Any:
+        column = env.columns.get(key)
+        if column is None:
+            return env.base.get(key)
+        if isinstance(column, list):
+            raise _Fallback
+        return column
+
+    return cell
+
+
+def _arithmetic_node(left: _VectorNode, op: str, right: _VectorNode) -> _VectorNode:
+    def arithmetic(env: _BatchEnv) -> Any:
+        a = _number(left(env))
+        b = _number(right(env))
+        if op == '+':
+            return np.add(a, b)
+        if op == '-':
+            return np.subtract(a, b)
+        if op == '*':
+            return np.multiply(a, b)
+        if np.any(np.equal(b, 0)):
+            raise _Fallback  # #DIV/0! in some scenario
+        return np.divide(a, b)
+
+    return arithmetic
+
+
+def _compare_node(left: _VectorNode, op: str, right: _VectorNode) -> _VectorNode:
+    compare = _COMPARE[op]
+    return lambda env: compare(_number(left(env)), _number(right(env)))
+
+
+def _if_node(condition: _VectorNode, then: _VectorNode, otherwise: _VectorNode) -> _VectorNode:
+    def branch(env: _BatchEnv) -> Any:
+        mask = np.not_equal(_number(condition(env)), 0)
+        if np.all(mask):
+            return then(env)
+        if not np.any(mask):
+            return otherwise(env)
+        return np.where(mask, _number(then(env)), _number(otherwise(env)))
+
+    return branch
+
+
+def _aggregate_node(
+    parts: list[tuple[list[str] | None, _VectorNode | None]],
+    *,
+    average: bool,
+) -> _VectorNode:
+    """SUM / AVERAGE with ``_coerce_numeric`` semantics, one column at a time."""
+
+    def aggregate(env: _BatchEnv) -> Any:
+        total: Any = 0.0
+        count = 0
+        for cells, node in parts:
+            values = (
+                [env.columns.get(key, env.base.get(key)) for key in cells]
+                if cells is not None
+                else [node(env)]  # type: ignore[misc]
+            )
+            for value in values:
+                if isinstance(value, np.ndarray):
+                    total = total + _number(value)
+                    count += 1
+                elif isinstance(value, list):
+                    raise _Fallback
+                elif isinstance(value, (int, float)):
+                    total = total + float(value)
+                    count += 1
+        if not average:
+            return total
+        if count == 0:
+            raise _Fallback
+        return total / count
+
+    return aggregate
@@ -13,18 +13,37 @@ from __future__ import annotations
 import inspect
 import logging
 import re
-from typing import TYPE_CHECKING, Any
-
-from wolfxl.calc._functions import ExcelError, FunctionRegistry, RangeValue, first_error
-from wolfxl.calc._graph import DependencyGraph
-from wolfxl.calc._parser import expand_range, range_shape
-from wolfxl.calc._protocol import CellDelta, RecalcResult
+from typing import TYPE_CHECKING, Any, Callable
+
+from wolfxl.calc._functions import (
+    ExcelError,
+    FunctionRegistry,
+    RangeValue,
+    _patch_range,
+    first_error,
+)
+from wolfxl.calc._graph import (
+    CellRange,
+    DependencyGraph,
+    _parse_range,
+    _RangeIndex,
+    _split_ref,
+)
+from wolfxl.calc._loader import iter_workbook_cells
+from wolfxl.calc._names import NameTable
+from wolfxl.calc._parser import _SINGLE_REF_RE, expand_range, range_shape
+from wolfxl.calc._protocol import BatchRecalcResult, CellDelta, RecalcResult
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from wolfxl._workbook import Workbook
 
 logger = logging.getLogger(__name__)
 
+# A compiled expression: cell-value mapping in, evaluated value out.
+_Node = Callable[[dict[str, Any]], Any]
+
 # ---------------------------------------------------------------------------
 # formulas library availability
 # ---------------------------------------------------------------------------
@@ -190,6 +209,154 @@ def _has_top_level_colon(expr: str) -> bool:
     return False
 
 
+def _split_function_args(args_str: str) -> list[str]:
+    """Split function arguments on commas at depth 0, respecting strings.
+
+    Pieces are stripped; an empty trailing piece is dropped so ``F(a,)``
+    has one argument while ``F(,a)`` keeps its leading empty one.
+    """
+    args: list[str] = []
+    depth = 0
+    in_string = False
+    current = ""
+    i = 0
+    length = len(args_str)
+
+    while i < length:
+        ch = args_str[i]
+
+        if ch == '"':
+            if in_string:
+                # Handle Excel escaped quote ("")
+                if i + 1 < length and args_str[i + 1] == '"':
+                    current += '""'
+                    i += 2
+                    continue
+                in_string = False
+            else:
+                in_string = True
+            current += ch
+        elif not in_string:
+            if ch == '(':
+                depth += 1
+                current += ch
+            elif ch == ')':
+                depth -= 1
+                current += ch
+            elif ch == ',' and depth == 0:
+                args.append(current.strip())
+                current = ""
+            else:
+                current += ch
+        else:
+            current += ch
+
+        i += 1
+
+    if current.strip():
+        args.append(current.strip())
+
+    return args
+
+
+def _cell_key(expr: str, sheet: str) -> str:
+    """Canonical ``Sheet!A1`` key for a cell reference token."""
+    clean = expr.strip().replace('$', '')
+    if '!' in clean:
+        ref_sheet, ref = clean.split('!', 1)
+        ref_sheet = ref_sheet.strip("'")
+        return f"{ref_sheet}!{ref.upper()}"
+    return f"{sheet}!{clean.upper()}"
+
+
+def _range_key(arg: str, sheet: str) -> str:
+    """Canonical ``Sheet!A1:B5`` key for a range reference token."""
+    return _cell_key(arg, sheet)
+
+
+def _constant(value: Any) -> _Node:
+    return lambda values: value
+
+
+def _cell_node(key: str) -> _Node:
+    return lambda values: values.get(key)
+
+
+def _range_node(range_ref: str) -> _Node:
+    """Node producing a :class:`RangeValue`; cell keys are expanded once.
+
+    Expansion waits for the first evaluation, since nodes whose range is
+    served from :class:`_SharedRanges` may never resolve it themselves.
+    """
+    try:
+        n_rows, n_cols = range_shape(range_ref)
+    except ValueError as exc:
+        # Malformed range: keep failing at evaluation time, as before.
+        message = exc.args
+
+        def invalid(values: dict[str, Any]) -> RangeValue:
+            raise ValueError(*message)
+
+        return invalid
+
+    cells: list[str] = []
+
+    def resolve(values: dict[str, Any]) -> RangeValue:
+        if not cells:
+            cells.extend(expand_range(range_ref))
+        get = values.get
+        return RangeValue(values=[get(c) for c in cells], n_rows=n_rows, n_cols=n_cols)
+
+    resolve.range_ref = range_ref  # type: ignore[attr-defined]
+    return resolve
+
+
+class _SharedRanges:
+    """Resolved ranges shared by every call of a ``_shared_ranges`` function.
+
+    Lookup and criteria builtins memoize vectors, hash / sorted indexes and
+    criteria buckets on the :class:`RangeValue` they are handed, so once a
+    table is shared each VLOOKUP or SUMIFS against it reads an index
+    instead of scanning. Entries are keyed by canonical range key and only
+    describe *store*; :meth:`update` patches every entry covering a changed
+    cell, found through the dependency graph's row-band index.
+    """
+
+    __slots__ = ("_entries", "_index", "store")
+
+    def __init__(self, store: dict[str, Any]) -> None:
+        self.store = store
+        # range key -> (shared value, its rectangle)
+        self._entries: dict[str, tuple[RangeValue, CellRange]] = {}
+        self._index = _RangeIndex()
+
+    def resolve(self, range_ref: str, node: _Node) -> RangeValue:
+        entry = self._entries.get(range_ref)
+        if entry is None:
+            rng = node(self.store)
+            rng._indexes = {}
+            entry = self._entries[range_ref] = (rng, _parse_range(range_ref))
+            self._index.add(entry[1], range_ref)
+        return entry[0]
+
+    def update(self, cell_ref: str, value: Any) -> None:
+        """Reflect ``store[cell_ref] = value`` in every shared range covering it."""
+        if not self._entries:
+            return
+        try:
+            sheet, row, col = _split_ref(cell_ref)
+        except ValueError:
+            self.clear()
+            return
+        for range_ref in self._index.containing(sheet, row, col):
+            rng, (_, min_row, min_col, _, _) = self._entries[range_ref]
+            _patch_range(rng, row - min_row + 1, col - min_col + 1, value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._index = _RangeIndex()
+
+
 def _binary_op(left: Any, op: str, right: Any) -> Any:
     """Evaluate an arithmetic or string binary operation."""
     # Error propagation: if either operand is an error, propagate it
@@ -294,37 +461,45 @@ class WorkbookEvaluator:
         self._graph = DependencyGraph()
         self._functions = FunctionRegistry()
         self._named_ranges: dict[str, str] = {}  # NAME -> refers_to
+        # Workbook names (``_named_ranges``) plus sheet-scoped ones
+        self._names = NameTable(self._named_ranges)
         self._loaded = False
         self._use_formulas = _check_formulas()
         self._compiled_cache: dict[str, Any] = {}  # formula -> compiled callable
+        self._formula_cache: dict[tuple[str, str], _Node] = {}  # (sheet, formula) -> node
+        self._expr_cache: dict[tuple[str, str], _Node] = {}  # (sheet, expr) -> node
+        self._batch_cache: dict[tuple[str, str], Any] = {}  # (sheet, formula) -> vector node
+        self._shared_ranges = _SharedRanges(self._cell_values)
 
     def load(self, workbook: Workbook) -> None:
         """Scan workbook, store cell values, build dependency graph."""
         self._cell_values.clear()
         self._graph = DependencyGraph()
-        self._named_ranges.clear()
+        self._names.clear()
+        # Compiled nodes bake in named ranges, so they do not survive a reload.
+        self._formula_cache.clear()
+        self._expr_cache.clear()
+        self._batch_cache.clear()
+        self._shared_ranges.clear()
 
         # Load named ranges first (needed for dependency graph)
-        for name, refers_to in workbook.defined_names.items():
-            self._named_ranges[name.upper()] = refers_to
+        for name, defined in workbook.defined_names.items():
+            self._names.define(name, getattr(defined, "value", defined))
+        for sheet_name in workbook.sheetnames:
+            for name, defined in workbook[sheet_name].defined_names.items():
+                self._names.define(name, getattr(defined, "value", defined), sheet_name)
 
-        nr = self._named_ranges if self._named_ranges else None
+        nr = self._names if self._names else None
 
-        for sheet_name in workbook.sheetnames:
-            ws = workbook[sheet_name]
-            for row in ws.iter_rows(values_only=False):
-                for cell in row:
-                    val = cell.value
-                    cell_ref = f"{sheet_name}!{cell.coordinate}"
-                    if isinstance(val, str) and val.startswith("="):
-                        # Formula cell: store formula string, register in graph
-                        self._cell_values[cell_ref] = val
-                        self._graph.add_formula(
-                            cell_ref, val, sheet_name, named_ranges=nr,
-                        )
-                    elif val is not None:
-                        # Value cell: store the value
-                        self._cell_values[cell_ref] = val
+        for cells in iter_workbook_cells(workbook):
+            sheet_name = cells.sheet
+            for cell_ref, val in cells.refs():
+                self._cell_values[cell_ref] = val
+                if isinstance(val, str) and val.startswith("="):
+                    # Formula cell: the stored formula string is also a graph node
+                    self._graph.add_formula(
+                        cell_ref, val, sheet_name, named_ranges=nr,
+                    )
 
         self._loaded = True
 
@@ -338,6 +513,9 @@ class WorkbookEvaluator:
 
         order = self._graph.topological_order()
         results: dict[str, Any] = {}
+        # Topological order finishes every cell of a range before anything
+        # reads it, so ranges shared from here on stay valid for the pass.
+        self._shared_ranges.clear()
 
         for cell_ref in order:
             formula = self._graph.formulas[cell_ref]
@@ -356,21 +534,27 @@ class WorkbookEvaluator:
         if not self._loaded:
             raise RuntimeError("Call load() before recalculate()")
 
+        # Only the subgraph reachable from the perturbed cells is dirty; it
+        # comes back in level order together with its longest chain.
+        affected, max_depth = self._graph.dirty_cells(set(perturbations.keys()))
+
         # Snapshot old values for delta computation
-        old_values: dict[str, Any] = {}
-        for cell_ref in self._graph.formulas:
-            old_values[cell_ref] = self._cell_values.get(cell_ref)
+        old_values: dict[str, Any] = {
+            cell_ref: self._cell_values.get(cell_ref) for cell_ref in affected
+        }
 
         # Apply perturbations
+        shared = self._shared_ranges
         for cell_ref, value in perturbations.items():
             self._cell_values[cell_ref] = value
+            shared.update(cell_ref, value)
 
-        # Find and evaluate affected cells
-        affected = self._graph.affected_cells(set(perturbations.keys()))
+        # Evaluate affected cells
         for cell_ref in affected:
             formula = self._graph.formulas[cell_ref]
             value = self._evaluate_formula(cell_ref, formula)
             self._cell_values[cell_ref] = value
+            shared.update(cell_ref, value)
 
         # Build deltas
         deltas: list[CellDelta] = []
@@ -387,8 +571,6 @@ class WorkbookEvaluator:
                     formula=self._graph.formulas.get(cell_ref),
                 ))
 
-        max_depth = self._graph.max_depth(set(perturbations.keys()))
-
         return RecalcResult(
             perturbations=dict(perturbations),
             deltas=tuple(deltas),
@@ -397,21 +579,44 @@ class WorkbookEvaluator:
             max_chain_depth=max_depth,
         )
 
+    def recalculate_batch(
+        self,
+        scenarios: Any,
+        outputs: Sequence[str] | None = None,
+        *,
+        inputs: Sequence[str] | None = None,
+    ) -> BatchRecalcResult:
+        """Evaluate many perturbation scenarios in one pass.
+
+        *scenarios* is a sequence of ``{cell_ref: value}`` dicts, or a 2-D
+        array of shape ``(n_scenarios, len(inputs))`` whose columns are the
+        *inputs* cell refs. Each affected formula is evaluated once across
+        all scenarios, with vectorized arithmetic, comparisons, ``SUM``,
+        ``AVERAGE`` and ``IF``; other formulas run per scenario.
+
+        Returns a :class:`BatchRecalcResult` whose ``values`` is an
+        ``(n_scenarios, len(outputs))`` array. *outputs* defaults to the
+        affected formula cells in evaluation order. The evaluator's own
+        cell values are left unchanged. Requires NumPy.
+        """
+        if not self._loaded:
+            raise RuntimeError("Call load() before recalculate_batch()")
+        from wolfxl.calc._batch import recalculate_batch
+
+        return recalculate_batch(self, scenarios, outputs, inputs=inputs)
+
     # ------------------------------------------------------------------
-    # Formula evaluation (recursive descent)
+    # Formula evaluation (compile once, evaluate many)
     # ------------------------------------------------------------------
 
     def _evaluate_formula(self, cell_ref: str, formula: str) -> Any:
         """Evaluate a single formula string (starting with ``=``).
 
-        Tries the builtin recursive descent evaluator first. If that returns
-        None (unsupported function), falls back to the ``formulas`` library.
+        Runs the formula's compiled node tree first. If that returns None
+        (unsupported function), falls back to the ``formulas`` library.
         """
-        body = formula.strip()
-        if body.startswith('='):
-            body = body[1:]
         sheet = self._sheet_from_ref(cell_ref)
-        result = self._eval_expr(body.strip(), sheet)
+        result = self._compile_formula(formula, sheet)(self._cell_values)
         if result is not None:
             return result
 
@@ -425,7 +630,36 @@ class WorkbookEvaluator:
         return None
 
     def _eval_expr(self, expr: str, sheet: str) -> Any:
-        """Recursively evaluate an expression (no leading ``=``).
+        """Evaluate an expression (no leading ``=``) against current cell values.
+
+        Also the ``eval_fn`` handed to ``_raw_args`` functions, so their
+        sub-expressions share the compile cache.
+        """
+        return self._compile(expr, sheet)(self._cell_values)
+
+    def _compile_formula(self, formula: str, sheet: str) -> _Node:
+        """Compiled node for a whole formula, parsed once per ``(sheet, formula)``."""
+        key = (sheet, formula)
+        node = self._formula_cache.get(key)
+        if node is None:
+            body = formula.strip()
+            if body.startswith('='):
+                body = body[1:]
+            node = self._compile(body.strip(), sheet)
+            self._formula_cache[key] = node
+        return node
+
+    def _compile(self, expr: str, sheet: str) -> _Node:
+        """Compiled node for an expression, parsed once per ``(sheet, expr)``."""
+        key = (sheet, expr)
+        node = self._expr_cache.get(key)
+        if node is None:
+            node = self._compile_expr(expr, sheet)
+            self._expr_cache[key] = node
+        return node
+
+    def _compile_expr(self, expr: str, sheet: str) -> _Node:
+        """Recursively compile an expression into a tree of closures.
 
         Dispatch order (first match wins):
 
@@ -437,40 +671,48 @@ class WorkbookEvaluator:
         6. String literal
         7. Boolean literal
         8. Cell reference
+
+        Every node takes the cell-value mapping and returns the value, so
+        string scanning happens once per distinct expression.
         """
         expr = expr.strip()
         if not expr:
-            return None
+            return _constant(None)
 
         # 1. Binary split (comparison → additive → multiplicative)
         split = _find_top_level_split(expr)
         if split:
             left_str, op, right_str = split
-            left_val = self._eval_expr(left_str, sheet)
-            right_val = self._eval_expr(right_str, sheet)
+            left = self._compile_expr(left_str, sheet)
+            right = self._compile_expr(right_str, sheet)
             if op in ('+', '-', '*', '/', '&'):
-                return _binary_op(left_val, op, right_val)
-            return _compare(left_val, right_val, op)
+                return lambda values: _binary_op(left(values), op, right(values))
+            return lambda values: _compare(left(values), right(values), op)
 
         # 2. Parenthesized sub-expression: (expr)
         if expr.startswith('('):
             close = _find_matching_paren(expr, 0)
             if close == len(expr) - 1:
-                return self._eval_expr(expr[1:close], sheet)
+                return self._compile_expr(expr[1:close], sheet)
 
         # 3. Function call: FUNC(balanced_args)
         func = _match_function_call(expr)
         if func:
-            return self._eval_function(func[0].upper(), func[1], sheet)
+            return self._compile_function(func[0].upper(), func[1], sheet)
 
         # 4. Unary minus / plus
         if expr.startswith('-'):
-            val = self._eval_expr(expr[1:], sheet)
-            if isinstance(val, (int, float)):
-                return -val
-            return val
+            operand = self._compile_expr(expr[1:], sheet)
+
+            def negate(values: dict[str, Any]) -> Any:
+                val = operand(values)
+                if isinstance(val, (int, float)):
+                    return -val
+                return val
+
+            return negate
         if expr.startswith('+'):
-            return self._eval_expr(expr[1:], sheet)
+            return self._compile_expr(expr[1:], sheet)
 
         # 5. Numeric literal (int, float, and scientific notation like 1E3)
         try:
@@ -480,29 +722,102 @@ class WorkbookEvaluator:
         else:
             # Preserve int for plain integer literals
             if re.fullmatch(r'[+-]?\d+', expr):
-                return int(expr)
-            return num
+                return _constant(int(expr))
+            return _constant(num)
 
         # 6. String literal
         if len(expr) >= 2 and expr[0] == '"' and expr[-1] == '"':
-            return expr[1:-1]
+            return _constant(expr[1:-1])
 
         # 7. Boolean
         upper = expr.upper()
         if upper == 'TRUE':
-            return True
+            return _constant(True)
         if upper == 'FALSE':
-            return False
+            return _constant(False)
 
         # 7b. Named range resolution
-        if upper in self._named_ranges:
-            refers_to = self._named_ranges[upper]
-            if ':' in refers_to:
-                return self._resolve_range_2d(refers_to, sheet)
-            return self._resolve_cell_ref(refers_to, sheet)
+        refers_to = self._names.resolve(expr, sheet)
+        if refers_to is not None:
+            return self._compile_named_range(refers_to, sheet)
 
         # 8. Cell reference
-        return self._resolve_cell_ref(expr, sheet)
+        return _cell_node(_cell_key(expr, sheet))
+
+    def _compile_function(self, func_name: str, args_str: str, sheet: str) -> _Node:
+        """Compile a function call; arguments are split and compiled up front.
+
+        The implementation is looked up at evaluation time so functions
+        registered after compilation are still honoured. Functions with
+        ``_raw_args = True`` receive raw argument strings and the evaluator's
+        expression evaluator, rather than resolved values. Functions with
+        ``_shared_ranges = True`` receive range arguments from the
+        evaluator's shared-range cache when evaluating against the live
+        cell values.
+        """
+        functions = self._functions
+        raw_args = self._split_top_level_args(args_str)
+        arg_nodes = [self._compile_arg(arg, sheet) for arg in _split_function_args(args_str)]
+        range_refs = [getattr(node, 'range_ref', None) for node in arg_nodes]
+        eval_expr = self._eval_expr
+        shared = self._shared_ranges
+
+        def call(values: dict[str, Any]) -> Any:
+            func = functions.get(func_name)
+            if func is None:
+                logger.debug("Unsupported function: %s", func_name)
+                return None
+            if getattr(func, '_raw_args', False):
+                try:
+                    return func(list(raw_args), eval_expr, sheet)
+                except Exception as e:
+                    logger.debug("Error evaluating %s: %s", func_name, e)
+                    return None
+            if getattr(func, '_shared_ranges', False) and values is shared.store:
+                args = [
+                    shared.resolve(ref, node) if ref else node(values)
+                    for ref, node in zip(range_refs, arg_nodes)
+                ]
+            else:
+                args = [node(values) for node in arg_nodes]
+            try:
+                return func(args)
+            except Exception as e:
+                logger.debug("Error evaluating %s: %s", func_name, e)
+                return None
+
+        return call
+
+    def _compile_arg(self, arg: str, sheet: str) -> _Node:
+        """Compile a single function argument.
+
+        Range references (containing ``:`` at depth 0) produce a
+        :class:`RangeValue` with 2D shape metadata.  Named ranges that
+        refer to ranges also produce :class:`RangeValue`.  Everything
+        else compiles as an expression.
+        """
+        if not arg:
+            return _constant(None)
+
+        # Range reference at top level
+        if _has_top_level_colon(arg) and not arg.startswith('"'):
+            return _range_node(_range_key(arg, sheet))
+
+        # Named range that refers to a range (needed for SUM(MyRange) etc.)
+        refers_to = self._names.resolve(arg.strip(), sheet)
+        if refers_to is not None:
+            return self._compile_named_range(refers_to, sheet)
+
+        return self._compile_expr(arg, sheet)
+
+    def _compile_named_range(self, refers_to: str, sheet: str) -> _Node:
+        """Compile a name's expanded definition: a range, a cell or a formula."""
+        refers_to = refers_to.strip()
+        if _SINGLE_REF_RE.fullmatch(refers_to):
+            return _cell_node(_cell_key(refers_to, sheet))
+        if ':' in refers_to and '(' not in refers_to:
+            return _range_node(_range_key(refers_to, sheet))
+        return self._compile_expr(refers_to, sheet)
 
     # ------------------------------------------------------------------
     # Atom / argument resolution
@@ -510,71 +825,19 @@ class WorkbookEvaluator:
 
     def _resolve_cell_ref(self, expr: str, sheet: str) -> Any:
         """Resolve a cell reference string to its stored value."""
-        clean = expr.strip().replace('$', '')
-        if '!' in clean:
-            parts = clean.split('!', 1)
-            ref_sheet = parts[0].strip("'")
-            ref = f"{ref_sheet}!{parts[1].upper()}"
-        else:
-            ref = f"{sheet}!{clean.upper()}"
-        return self._cell_values.get(ref)
+        return self._cell_values.get(_cell_key(expr, sheet))
 
     def _resolve_range(self, arg: str, sheet: str) -> list[Any]:
         """Resolve a range like ``A1:A5`` to a flat list of cell values.
 
         Kept for the ``formulas`` library fallback which needs flat lists.
         """
-        clean = arg.strip().replace('$', '')
-        if '!' not in clean:
-            range_ref = f"{sheet}!{clean.upper()}"
-        else:
-            parts = clean.split('!', 1)
-            ref_sheet = parts[0].strip("'")
-            range_ref = f"{ref_sheet}!{parts[1].upper()}"
-        cells = expand_range(range_ref)
+        cells = expand_range(_range_key(arg, sheet))
         return [self._cell_values.get(c) for c in cells]
 
     def _resolve_range_2d(self, arg: str, sheet: str) -> RangeValue:
         """Resolve a range to a :class:`RangeValue` preserving 2D shape."""
-        clean = arg.strip().replace('$', '')
-        if '!' not in clean:
-            range_ref = f"{sheet}!{clean.upper()}"
-        else:
-            parts = clean.split('!', 1)
-            ref_sheet = parts[0].strip("'")
-            range_ref = f"{ref_sheet}!{parts[1].upper()}"
-        cells = expand_range(range_ref)
-        n_rows, n_cols = range_shape(range_ref)
-        values = [self._cell_values.get(c) for c in cells]
-        return RangeValue(values=values, n_rows=n_rows, n_cols=n_cols)
-
-    # ------------------------------------------------------------------
-    # Function dispatch
-    # ------------------------------------------------------------------
-
-    def _eval_function(self, func_name: str, args_str: str, sheet: str) -> Any:
-        """Evaluate a function call with resolved arguments.
-
-        Functions with ``_raw_args = True`` receive raw argument strings
-        and the evaluator's expression evaluator, rather than resolved values.
-        """
-        func = self._functions.get(func_name)
-        if func is None:
-            logger.debug("Unsupported function: %s", func_name)
-            return None
-        if getattr(func, '_raw_args', False):
-            raw_args = self._split_top_level_args(args_str)
-            try:
-                return func(raw_args, self._eval_expr, sheet)
-            except Exception as e:
-                logger.debug("Error evaluating %s: %s", func_name, e)
-                return None
-        args = self._parse_function_args(args_str, sheet)
-        try:
-            return func(args)
-        except Exception as e:
-            logger.debug("Error evaluating %s: %s", func_name, e)
-            return None
+        return _range_node(_range_key(arg, sheet))(self._cell_values)
 
     def _split_top_level_args(self, args_str: str) -> list[str]:
         """Split on commas at depth 0 WITHOUT resolving - returns raw strings."""
@@ -604,76 +867,6 @@ class WorkbookEvaluator:
             args.append(current)
         return args
 
-    def _parse_function_args(self, args_str: str, sheet: str) -> list[Any]:
-        """Split on commas at depth 0 (respecting strings), resolve each argument."""
-        args: list[Any] = []
-        depth = 0
-        in_string = False
-        current = ""
-        i = 0
-        length = len(args_str)
-
-        while i < length:
-            ch = args_str[i]
-
-            if ch == '"':
-                if in_string:
-                    # Handle Excel escaped quote ("")
-                    if i + 1 < length and args_str[i + 1] == '"':
-                        current += '""'
-                        i += 2
-                        continue
-                    in_string = False
-                else:
-                    in_string = True
-                current += ch
-            elif not in_string:
-                if ch == '(':
-                    depth += 1
-                    current += ch
-                elif ch == ')':
-                    depth -= 1
-                    current += ch
-                elif ch == ',' and depth == 0:
-                    args.append(self._resolve_arg(current.strip(), sheet))
-                    current = ""
-                else:
-                    current += ch
-            else:
-                current += ch
-
-            i += 1
-
-        if current.strip():
-            args.append(self._resolve_arg(current.strip(), sheet))
-
-        return args
-
-    def _resolve_arg(self, arg: str, sheet: str) -> Any:
-        """Resolve a single function argument.
-
-        Range references (containing ``:`` at depth 0) return a
-        :class:`RangeValue` with 2D shape metadata.  Named ranges that
-        refer to ranges also resolve to :class:`RangeValue`.  Everything
-        else delegates to ``_eval_expr``.
-        """
-        if not arg:
-            return None
-
-        # Range reference at top level
-        if _has_top_level_colon(arg) and not arg.startswith('"'):
-            return self._resolve_range_2d(arg, sheet)
-
-        # Named range that refers to a range (needed for SUM(MyRange) etc.)
-        upper = arg.strip().upper()
-        if upper in self._named_ranges:
-            refers_to = self._named_ranges[upper]
-            if ':' in refers_to:
-                return self._resolve_range_2d(refers_to, sheet)
-            return self._resolve_cell_ref(refers_to, sheet)
-
-        return self._eval_expr(arg, sheet)
-
     # ------------------------------------------------------------------
     # formulas library fallback
     # ------------------------------------------------------------------
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import bisect
 import calendar
 import datetime
 import fnmatch
 import math
+import operator
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Callable
 
 # ---------------------------------------------------------------------------
@@ -96,6 +98,13 @@ class RangeValue:
     values: list[Any]
     n_rows: int
     n_cols: int
+    # Vectors and lookup indexes memoized by the lookup builtins. Only set
+    # on ranges the evaluator shares between calls (see ``_shared_ranges``);
+    # indexing a range that is resolved afresh per call would cost more
+    # than the scan it replaces.
+    _indexes: dict[tuple[Any, ...], Any] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
 
     def get(self, row: int, col: int) -> Any:
         """Get value at 1-based (row, col) position."""
@@ -508,18 +517,25 @@ def _builtin_concatenate(args: list[Any]) -> str:
 _CRITERIA_OP_RE = re.compile(r"^(>=|<=|<>|>|<|=)(.*)$")
 
 
-def _parse_criteria(criteria: Any) -> Callable[[Any], bool]:
-    """Parse an Excel criteria value into a predicate function.
+_CRITERIA_OPS: dict[str, Callable[[Any, Any], bool]] = {
+    "=": operator.eq,
+    "<>": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+}
 
-    Supports:
-    - Numeric exact match: ``100`` matches cells equal to 100
-    - String exact match (case-insensitive): ``"Sales"``
-    - Operator prefix: ``">100"``, ``"<=50"``, ``"<>0"``
-    - Wildcards: ``"apple*"``, ``"?pple"`` (via fnmatch)
+
+def _criteria_plan(criteria: Any) -> tuple[str, str, Any]:
+    """Classify an Excel criteria value as ``(kind, op, operand)``.
+
+    *kind* is ``"num"`` (compare numbers against a float operand),
+    ``"text"`` (compare ``str(v).lower()`` of non-blank values) or
+    ``"wild"`` (fnmatch pattern); *op* is one of :data:`_CRITERIA_OPS`.
     """
     if isinstance(criteria, (int, float)):
-        target = float(criteria)
-        return lambda v: isinstance(v, (int, float)) and float(v) == target
+        return ("num", "=", float(criteria))
 
     crit_str = str(criteria)
 
@@ -528,45 +544,38 @@ def _parse_criteria(criteria: Any) -> Callable[[Any], bool]:
     if m:
         op, val_str = m.group(1), m.group(2).strip()
         try:
-            threshold = float(val_str)
+            return ("num", op, float(val_str))
         except (ValueError, TypeError):
             # String comparison with operator
-            val_lower = val_str.lower()
-            if op == ">":
-                return lambda v: str(v).lower() > val_lower if v is not None else False
-            if op == "<":
-                return lambda v: str(v).lower() < val_lower if v is not None else False
-            if op == ">=":
-                return lambda v: str(v).lower() >= val_lower if v is not None else False
-            if op == "<=":
-                return lambda v: str(v).lower() <= val_lower if v is not None else False
-            if op == "<>":
-                return lambda v: str(v).lower() != val_lower if v is not None else True
-            if op == "=":
-                return lambda v: str(v).lower() == val_lower if v is not None else False
-            return lambda v: False
-
-        if op == ">":
-            return lambda v, t=threshold: isinstance(v, (int, float)) and float(v) > t
-        if op == "<":
-            return lambda v, t=threshold: isinstance(v, (int, float)) and float(v) < t
-        if op == ">=":
-            return lambda v, t=threshold: isinstance(v, (int, float)) and float(v) >= t
-        if op == "<=":
-            return lambda v, t=threshold: isinstance(v, (int, float)) and float(v) <= t
-        if op == "<>":
-            return lambda v, t=threshold: not (isinstance(v, (int, float)) and float(v) == t)
-        if op == "=":
-            return lambda v, t=threshold: isinstance(v, (int, float)) and float(v) == t
+            return ("text", op, val_str.lower())
 
     # Wildcard check (contains * or ? not escaped)
     if "*" in crit_str or "?" in crit_str:
-        pattern = crit_str.lower()
-        return lambda v, p=pattern: fnmatch.fnmatch(str(v).lower(), p) if v is not None else False
+        return ("wild", "=", crit_str.lower())
 
     # Plain string exact match (case-insensitive)
-    lower = crit_str.lower()
-    return lambda v, lo=lower: str(v).lower() == lo if v is not None else False
+    return ("text", "=", crit_str.lower())
+
+
+def _parse_criteria(criteria: Any) -> Callable[[Any], bool]:
+    """Parse an Excel criteria value into a predicate function.
+
+    Supports:
+    - Numeric exact match: ``100`` matches cells equal to 100
+    - String exact match (case-insensitive): ``"Sales"``
+    - Operator prefix: ``">100"``, ``"<=50"``, ``"<>0"``
+    - Wildcards: ``"apple*"``, ``"?pple"`` (via fnmatch)
+    """
+    kind, op, operand = _criteria_plan(criteria)
+    if kind == "wild":
+        return lambda v: fnmatch.fnmatch(str(v).lower(), operand) if v is not None else False
+    if kind == "text":
+        cmp = _CRITERIA_OPS[op]
+        return lambda v: cmp(str(v).lower(), operand) if v is not None else op == "<>"
+    if op == "<>":
+        return lambda v: not (isinstance(v, (int, float)) and float(v) == operand)
+    cmp = _CRITERIA_OPS[op]
+    return lambda v: isinstance(v, (int, float)) and cmp(float(v), operand)
 
 
 def _match_criteria(criteria: Any, value: Any) -> bool:
@@ -574,6 +583,142 @@ def _match_criteria(criteria: Any, value: Any) -> bool:
     return _parse_criteria(criteria)(value)
 
 
+class _CriteriaIndex:
+    """Buckets and sorted keys of one criteria vector, keyed the way
+    :func:`_parse_criteria` predicates compare values.
+
+    Each non-blank value is filed under its ``"text"`` key
+    (``str(v).lower()``) and, for non-NaN numbers, its ``"num"`` key
+    (``float(v)``). Equality criteria read one bucket, ``<>`` the
+    complement of one, wildcards the union of matching text buckets, and
+    comparisons a slice of ``(key, position)`` pairs sorted on first use.
+    :meth:`patch` keeps all of it current when a value changes.
+    """
+
+    __slots__ = ("_buckets", "_sorted")
+
+    def __init__(self, values: list[Any]) -> None:
+        self._buckets: dict[str, dict[Any, set[int]]] = {"num": {}, "text": {}}
+        self._sorted: dict[str, list[tuple[Any, int]]] = {}
+        for i, value in enumerate(values):
+            self._add(i, value)
+
+    @staticmethod
+    def _keys(value: Any) -> list[tuple[str, Any]]:
+        if value is None:
+            return []
+        keys = [("text", str(value).lower())]
+        if isinstance(value, (int, float)):
+            number = float(value)
+            if number == number:
+                keys.append(("num", number))
+        return keys
+
+    def _add(self, pos: int, value: Any) -> None:
+        for kind, key in self._keys(value):
+            self._buckets[kind].setdefault(key, set()).add(pos)
+            pairs = self._sorted.get(kind)
+            if pairs is not None:
+                bisect.insort(pairs, (key, pos))
+
+    def _remove(self, pos: int, value: Any) -> None:
+        for kind, key in self._keys(value):
+            bucket = self._buckets[kind][key]
+            bucket.discard(pos)
+            if not bucket:
+                del self._buckets[kind][key]
+            pairs = self._sorted.get(kind)
+            if pairs is not None:
+                del pairs[bisect.bisect_left(pairs, (key, pos))]
+
+    def patch(self, pos: int, old: Any, new: Any) -> None:
+        """Move position *pos* from *old*'s keys to *new*'s."""
+        self._remove(pos, old)
+        self._add(pos, new)
+
+    def query(self, criteria: Any) -> tuple[set[int] | None, set[int] | None]:
+        """``(include, exclude)`` positions matching *criteria*.
+
+        *include* None means every position; *exclude* None means none.
+        """
+        kind, op, operand = _criteria_plan(criteria)
+        if kind == "wild":
+            found: set[int] = set()
+            for text, positions in self._buckets["text"].items():
+                if fnmatch.fnmatch(text, operand):
+                    found |= positions
+            return found, None
+        bucket = self._buckets[kind].get(operand, set())
+        if op == "=":
+            return bucket, None
+        if op == "<>":
+            return None, bucket
+        if operand != operand:
+            return set(), None
+        pairs = self._sorted.get(kind)
+        if pairs is None:
+            pairs = self._sorted[kind] = sorted(
+                (key, pos) for key, positions in self._buckets[kind].items() for pos in positions
+            )
+        if op in (">", "<="):
+            cut = bisect.bisect_right(pairs, (operand, math.inf))
+        else:
+            cut = bisect.bisect_left(pairs, (operand, -1))
+        selected = pairs[cut:] if op in (">", ">=") else pairs[:cut]
+        return {pos for _, pos in selected}, None
+
+
+def _indexed_criteria_matches(pairs: list[tuple[Any, Any]], n: int) -> list[int] | None:
+    """:func:`_criteria_matches` answered from the ranges' criteria indexes.
+
+    Returns None unless every criteria range is a shared :class:`RangeValue`.
+    """
+    includes: list[set[int]] = []
+    excludes: list[set[int]] = []
+    for rng, criteria in pairs:
+        index = _shared_index(rng, ("criteria",), lambda rng=rng: _CriteriaIndex(rng.values))
+        if index is None:
+            return None
+        n = min(n, len(rng.values))
+        include, exclude = index.query(criteria)
+        if include is not None:
+            includes.append(include)
+        if exclude:
+            excludes.append(exclude)
+
+    if includes:
+        includes.sort(key=len)
+        candidates: Any = includes[0]
+        rest = includes[1:]
+    else:
+        candidates = range(n)
+        rest = []
+    found = [
+        i for i in candidates
+        if i < n and all(i in s for s in rest) and not any(i in s for s in excludes)
+    ]
+    found.sort()
+    return found
+
+
+def _criteria_matches(pairs: list[tuple[Any, Any]], n: int) -> list[int]:
+    """Ascending positions below *n* where every ``(criteria_range, criteria)``
+    pair holds; positions past the end of a criteria range never match.
+
+    Ranges the evaluator shares are answered from a :class:`_CriteriaIndex`
+    memoized on them, so repeated SUMIFS-style calls over one table read
+    buckets instead of re-testing every row.
+    """
+    found = _indexed_criteria_matches(pairs, n)
+    if found is not None:
+        return found
+    predicates = [(_flatten_range(rng), _parse_criteria(criteria)) for rng, criteria in pairs]
+    return [
+        i for i in range(n)
+        if all(pred(cv[i]) if i < len(cv) else False for cv, pred in predicates)
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Lookup builtins (INDEX, MATCH, XLOOKUP, CHOOSE)
 # ---------------------------------------------------------------------------
@@ -642,18 +787,15 @@ def _builtin_match(args: list[Any]) -> Any:
 
     if match_type == 0:
         # Exact match - case-insensitive for strings
-        for i, v in enumerate(values):
-            if v is None:
-                continue
-            if isinstance(lookup_value, str) and isinstance(v, str):
-                if lookup_value.lower() == v.lower():
-                    return i + 1  # 1-based
-            elif isinstance(lookup_value, (int, float)) and isinstance(v, (int, float)):
-                if float(lookup_value) == float(v):
-                    return i + 1
-            elif lookup_value == v:
-                return i + 1
-        return ExcelError.NA
+        idx = _find_exact(lookup_value, values, lookup_array, ("flat",))
+        return idx + 1 if idx is not None else ExcelError.NA  # 1-based
+
+    if match_type in (1, -1) and isinstance(lookup_value, (int, float)):
+        index = _sorted_index(lookup_array, ("flat",), values, text=False)
+        if index is not None:
+            key = float(lookup_value)
+            best = index.last_lte(key) if match_type == 1 else index.last_gte(key)
+            return best + 1 if best is not None else ExcelError.NA
 
     if match_type == 1:
         # Largest value <= lookup (assumes sorted ascending)
@@ -750,6 +892,211 @@ def _lookup_last_sorted_lte_index(lookup_value: Any, values: list[Any]) -> int |
     return best_idx
 
 
+def _range_vector(table: RangeValue, axis: str, pos: int) -> list[Any]:
+    """Column (``axis="col"``) or row *pos* of *table*, memoized if shared."""
+    indexes = table._indexes
+    key = (axis, pos)
+    if indexes is not None and key in indexes:
+        return indexes[key]
+    vector = table.column(pos) if axis == "col" else table.row(pos)
+    if indexes is not None:
+        indexes[key] = vector
+    return vector
+
+
+def _shared_index(
+    table: Any, key: tuple[Any, ...], build: Callable[[], Any],
+) -> Any | None:
+    """Index memoized on a shared *table*, or None when *table* is not shared."""
+    indexes = table._indexes if isinstance(table, RangeValue) else None
+    if indexes is None:
+        return None
+    index = indexes.get(key)
+    if index is None:
+        index = indexes[key] = build()
+    return index
+
+
+def _patch_range(table: RangeValue, row: int, col: int, value: Any) -> None:
+    """Write *value* at 1-based ``(row, col)`` of a shared *table*.
+
+    Memoized columns and rows are patched, indexes with a ``patch`` method
+    are updated in place, and any other index is dropped to be rebuilt on
+    next use.
+    """
+    pos = (row - 1) * table.n_cols + (col - 1)
+    old = table.values[pos]
+    table.values[pos] = value
+    indexes = table._indexes
+    if not indexes:
+        return
+    for key, memo in list(indexes.items()):
+        if key[0] == "col":
+            if key[1] == col:
+                memo[row - 1] = value
+        elif key[0] == "row":
+            if key[1] == row:
+                memo[col - 1] = value
+        elif hasattr(memo, "patch"):
+            memo.patch(pos, old, value)
+        else:
+            del indexes[key]
+
+
+def _exact_key(value: Any) -> Any:
+    """Hash key under which :func:`_lookup_exact_index` treats values as equal.
+
+    None for values an exact lookup never matches (blanks and NaN).
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return ("s", value.lower())
+    if isinstance(value, ExcelError):
+        return ("s", value.code.lower())
+    if isinstance(value, (int, float)):
+        number = float(value)
+        return None if number != number else ("n", number)
+    return ("o", value)
+
+
+def _build_exact_index(values: list[Any], reverse: bool) -> dict[Any, int] | bool:
+    """Map each exact key to its first index in search order.
+
+    Returns False when a value is unhashable, so callers keep scanning.
+    """
+    index: dict[Any, int] = {}
+    order = range(len(values) - 1, -1, -1) if reverse else range(len(values))
+    try:
+        for i in order:
+            key = _exact_key(values[i])
+            if key is not None and key not in index:
+                index[key] = i
+    except TypeError:
+        return False
+    return index
+
+
+def _find_exact(
+    lookup_value: Any,
+    values: list[Any],
+    table: Any = None,
+    vector: tuple[Any, ...] = (),
+    *,
+    reverse: bool = False,
+) -> int | None:
+    """Index of the first exact match of *lookup_value* in *values*.
+
+    *values* is the *vector* of *table*; when *table* is a shared range the
+    answer comes from a hash index built once per (vector, direction).
+    """
+    index = _shared_index(
+        table, ("exact", vector, reverse), lambda: _build_exact_index(values, reverse),
+    )
+    if isinstance(index, dict):
+        try:
+            return index.get(_exact_key(lookup_value))
+        except TypeError:
+            pass  # unhashable lookup value: scan instead
+    order = range(len(values) - 1, -1, -1) if reverse else None
+    return _lookup_exact_index(lookup_value, values, order)
+
+
+class _SortedIndex:
+    """Comparable values of a lookup vector sorted for bisection.
+
+    ``keys`` ascend with ``positions`` holding their vector indexes (ties in
+    index order); ``prefix_last[i]`` / ``suffix_last[i]`` are the largest
+    index among ``positions[:i + 1]`` / ``positions[i:]``.
+    """
+
+    __slots__ = ("keys", "positions", "prefix_last", "suffix_last")
+
+    def __init__(self, values: list[Any], text: bool) -> None:
+        if text:
+            pairs = sorted(
+                (v.lower(), i) for i, v in enumerate(values) if isinstance(v, str)
+            )
+        else:
+            pairs = sorted(
+                (float(v), i) for i, v in enumerate(values)
+                if isinstance(v, (int, float)) and v == v
+            )
+        self.keys = [k for k, _ in pairs]
+        self.positions = [i for _, i in pairs]
+        self.prefix_last: list[int] = []
+        best = -1
+        for i in self.positions:
+            best = max(best, i)
+            self.prefix_last.append(best)
+        self.suffix_last = [0] * len(self.positions)
+        best = -1
+        for n in range(len(self.positions) - 1, -1, -1):
+            best = max(best, self.positions[n])
+            self.suffix_last[n] = best
+
+    def last_lte(self, key: Any) -> int | None:
+        """Largest index whose value is ``<= key``."""
+        if key != key:
+            return None
+        n = bisect.bisect_right(self.keys, key)
+        return self.prefix_last[n - 1] if n else None
+
+    def last_gte(self, key: Any) -> int | None:
+        """Largest index whose value is ``>= key``."""
+        if key != key:
+            return None
+        n = bisect.bisect_left(self.keys, key)
+        return self.suffix_last[n] if n < len(self.keys) else None
+
+    def nearest(self, key: Any, smaller: bool, reverse: bool) -> int | None:
+        """Index of the closest value ``<= key`` (*smaller*) or ``>= key``.
+
+        Among equal values the first index wins, or the last when *reverse*.
+        """
+        keys = self.keys
+        if key != key:
+            return None
+        if smaller:
+            n = bisect.bisect_right(keys, key)
+            if not n:
+                return None
+            start, stop = bisect.bisect_left(keys, keys[n - 1]), n
+        else:
+            n = bisect.bisect_left(keys, key)
+            if n == len(keys):
+                return None
+            start, stop = n, bisect.bisect_right(keys, keys[n])
+        return self.positions[stop - 1 if reverse else start]
+
+
+def _sorted_index(
+    table: Any, vector: tuple[Any, ...], values: list[Any], text: bool,
+) -> _SortedIndex | None:
+    """Sorted index of a shared *table*'s *vector*, or None if not shared."""
+    return _shared_index(
+        table, ("sorted", vector, text), lambda: _SortedIndex(values, text),
+    )
+
+
+def _find_last_lte(
+    lookup_value: Any,
+    values: list[Any],
+    table: Any = None,
+    vector: tuple[Any, ...] = (),
+) -> int | None:
+    """:func:`_lookup_last_sorted_lte_index`, bisected on shared ranges."""
+    if isinstance(lookup_value, (int, float)):
+        index = _sorted_index(table, vector, values, text=False)
+        if index is not None:
+            return index.last_lte(float(lookup_value))
+    elif isinstance(lookup_value, str):
+        index = _sorted_index(table, vector, values, text=True)
+        if index is not None:
+            return index.last_lte(lookup_value.lower())
+    return _lookup_last_sorted_lte_index(lookup_value, values)
+
+
 def _coerce_range_lookup(value: Any) -> bool:
     """Normalize VLOOKUP/HLOOKUP's optional range_lookup argument."""
     if isinstance(value, bool):
@@ -796,12 +1143,17 @@ def _builtin_xlookup(args: list[Any]) -> Any:
         return return_vals[idx] if idx < len(return_vals) else if_not_found
 
     # --- Exact match (0) or wildcard match (2) ---
-    if match_mode in (0, 2):
+    if match_mode == 0:
+        idx = _find_exact(
+            lookup_value, lookup_vals, lookup_array, ("flat",), reverse=search_mode == -1,
+        )
+        return _safe_return(idx) if idx is not None else if_not_found
+    if match_mode == 2:
         idx = _lookup_exact_index(
             lookup_value,
             lookup_vals,
             search_range,
-            wildcard=match_mode == 2,
+            wildcard=True,
         )
         if idx is not None:
             return _safe_return(idx)
@@ -812,6 +1164,11 @@ def _builtin_xlookup(args: list[Any]) -> Any:
         return if_not_found
 
     lv = float(lookup_value)
+    index = _sorted_index(lookup_array, ("flat",), lookup_vals, text=False)
+    if index is not None:
+        best = index.nearest(lv, smaller=match_mode == -1, reverse=search_mode == -1)
+        return _safe_return(best) if best is not None else if_not_found
+
     best_idx: int | None = None
     best_val: float | None = None
 
@@ -859,8 +1216,8 @@ def _builtin_vlookup(args: list[Any]) -> Any:
     if isinstance(table_array, RangeValue):
         if col_index_num > table_array.n_cols:
             return ExcelError.REF
-        first_col = table_array.column(1)
-        return_col = table_array.column(col_index_num)
+        first_col = _range_vector(table_array, "col", 1)
+        return_col = _range_vector(table_array, "col", col_index_num)
     elif isinstance(table_array, (list, tuple)):
         # Flat list treated as single column
         if col_index_num > 1:
@@ -872,13 +1229,13 @@ def _builtin_vlookup(args: list[Any]) -> Any:
 
     if range_lookup:
         # Approximate match: largest value <= lookup_value (sorted ascending)
-        best_idx = _lookup_last_sorted_lte_index(lookup_value, first_col)
+        best_idx = _find_last_lte(lookup_value, first_col, table_array, ("col", 1))
         if best_idx is None:
             return ExcelError.NA
         return return_col[best_idx] if best_idx < len(return_col) else ExcelError.NA
     else:
         # Exact match (case-insensitive for strings)
-        idx = _lookup_exact_index(lookup_value, first_col)
+        idx = _find_exact(lookup_value, first_col, table_array, ("col", 1))
         if idx is not None:
             return return_col[idx] if idx < len(return_col) else ExcelError.NA
         return ExcelError.NA
@@ -905,8 +1262,8 @@ def _builtin_hlookup(args: list[Any]) -> Any:
     if isinstance(table_array, RangeValue):
         if row_index_num > table_array.n_rows:
             return ExcelError.REF
-        first_row = table_array.row(1)
-        return_row = table_array.row(row_index_num)
+        first_row = _range_vector(table_array, "row", 1)
+        return_row = _range_vector(table_array, "row", row_index_num)
     elif isinstance(table_array, (list, tuple)):
         # Flat list treated as single row
         if row_index_num > 1:
@@ -918,13 +1275,13 @@ def _builtin_hlookup(args: list[Any]) -> Any:
 
     if range_lookup:
         # Approximate match: largest value <= lookup_value (sorted ascending)
-        best_idx = _lookup_last_sorted_lte_index(lookup_value, first_row)
+        best_idx = _find_last_lte(lookup_value, first_row, table_array, ("row", 1))
         if best_idx is None:
             return ExcelError.NA
         return return_row[best_idx] if best_idx < len(return_row) else ExcelError.NA
     else:
         # Exact match (case-insensitive for strings)
-        idx = _lookup_exact_index(lookup_value, first_row)
+        idx = _find_exact(lookup_value, first_row, table_array, ("row", 1))
         if idx is not None:
             return return_row[idx] if idx < len(return_row) else ExcelError.NA
         return ExcelError.NA
@@ -954,29 +1311,14 @@ def _builtin_sumif(args: list[Any]) -> float:
     sum_range = args[2] if len(args) > 2 else None
 
     # Flatten ranges
-    if isinstance(criteria_range, RangeValue):
-        crit_vals = criteria_range.values
-    elif isinstance(criteria_range, (list, tuple)):
-        crit_vals = list(criteria_range)
-    else:
-        crit_vals = [criteria_range]
-
-    if sum_range is None:
-        sum_vals = crit_vals
-    elif isinstance(sum_range, RangeValue):
-        sum_vals = sum_range.values
-    elif isinstance(sum_range, (list, tuple)):
-        sum_vals = list(sum_range)
-    else:
-        sum_vals = [sum_range]
+    crit_vals = _flatten_range(criteria_range)
+    sum_vals = crit_vals if sum_range is None else _flatten_range(sum_range)
 
-    predicate = _parse_criteria(criteria)
     total = 0.0
-    for i, cv in enumerate(crit_vals):
-        if predicate(cv):
-            sv = sum_vals[i] if i < len(sum_vals) else 0
-            if isinstance(sv, (int, float)):
-                total += float(sv)
+    for i in _criteria_matches([(criteria_range, criteria)], len(crit_vals)):
+        sv = sum_vals[i] if i < len(sum_vals) else 0
+        if isinstance(sv, (int, float)):
+            total += float(sv)
     return total
 
 
@@ -987,35 +1329,14 @@ def _builtin_sumifs(args: list[Any]) -> float:
     """
     if len(args) < 3 or len(args) % 2 == 0:
         raise ValueError("SUMIFS requires sum_range + pairs of (criteria_range, criteria)")
-    sum_range = args[0]
-
-    # Flatten sum_range
-    if isinstance(sum_range, RangeValue):
-        sum_vals = sum_range.values
-    elif isinstance(sum_range, (list, tuple)):
-        sum_vals = list(sum_range)
-    else:
-        sum_vals = [sum_range]
-
-    # Build predicate pairs
-    predicates: list[tuple[list[Any], Callable[[Any], bool]]] = []
-    for j in range(1, len(args), 2):
-        crit_range = args[j]
-        criteria = args[j + 1]
-        if isinstance(crit_range, RangeValue):
-            cv = crit_range.values
-        elif isinstance(crit_range, (list, tuple)):
-            cv = list(crit_range)
-        else:
-            cv = [crit_range]
-        predicates.append((cv, _parse_criteria(criteria)))
+    sum_vals = _flatten_range(args[0])
+    pairs = [(args[j], args[j + 1]) for j in range(1, len(args), 2)]
 
     total = 0.0
-    for i in range(len(sum_vals)):
-        if all(pred(cv[i]) if i < len(cv) else False for cv, pred in predicates):
-            sv = sum_vals[i]
-            if isinstance(sv, (int, float)):
-                total += float(sv)
+    for i in _criteria_matches(pairs, len(sum_vals)):
+        sv = sum_vals[i]
+        if isinstance(sv, (int, float)):
+            total += float(sv)
     return total
 
 
@@ -1023,45 +1344,19 @@ def _builtin_countif(args: list[Any]) -> float:
     """COUNTIF(range, criteria)."""
     if len(args) != 2:
         raise ValueError("COUNTIF requires exactly 2 arguments")
-    count_range = args[0]
-    criteria = args[1]
-
-    if isinstance(count_range, RangeValue):
-        values = count_range.values
-    elif isinstance(count_range, (list, tuple)):
-        values = list(count_range)
-    else:
-        values = [count_range]
-
-    predicate = _parse_criteria(criteria)
-    return float(sum(1 for v in values if predicate(v)))
+    values = _flatten_range(args[0])
+    return float(len(_criteria_matches([(args[0], args[1])], len(values))))
 
 
 def _builtin_countifs(args: list[Any]) -> float:
     """COUNTIFS(criteria_range1, criteria1, [criteria_range2, criteria2, ...])."""
     if len(args) < 2 or len(args) % 2 != 0:
         raise ValueError("COUNTIFS requires pairs of (criteria_range, criteria)")
-
-    # Build predicate pairs
-    predicates: list[tuple[list[Any], Callable[[Any], bool]]] = []
-    for j in range(0, len(args), 2):
-        crit_range = args[j]
-        criteria = args[j + 1]
-        if isinstance(crit_range, RangeValue):
-            cv = crit_range.values
-        elif isinstance(crit_range, (list, tuple)):
-            cv = list(crit_range)
-        else:
-            cv = [crit_range]
-        predicates.append((cv, _parse_criteria(criteria)))
+    pairs = [(args[j], args[j + 1]) for j in range(0, len(args), 2)]
 
     # Length of first criteria range determines row count
-    n = len(predicates[0][0]) if predicates else 0
-    count = 0
-    for i in range(n):
-        if all(pred(cv[i]) if i < len(cv) else False for cv, pred in predicates):
-            count += 1
-    return float(count)
+    n = len(_flatten_range(args[0]))
+    return float(len(_criteria_matches(pairs, n)))
 
 
 # ---------------------------------------------------------------------------
@@ -1078,6 +1373,18 @@ def _flatten_range(arg: Any) -> list[Any]:
     return [arg]
 
 
+def _matching_numbers(args: list[Any]) -> list[float]:
+    """Numbers of ``args[0]`` where every following criteria pair holds."""
+    target = _flatten_range(args[0])
+    pairs = [(args[j], args[j + 1]) for j in range(1, len(args), 2)]
+    numbers: list[float] = []
+    for i in _criteria_matches(pairs, len(target)):
+        value = target[i]
+        if isinstance(value, (int, float)):
+            numbers.append(float(value))
+    return numbers
+
+
 def _builtin_averageif(args: list[Any]) -> float | ExcelError:
     """AVERAGEIF(criteria_range, criteria, [average_range])."""
     if len(args) < 2 or len(args) > 3:
@@ -1086,15 +1393,13 @@ def _builtin_averageif(args: list[Any]) -> float | ExcelError:
     criteria = args[1]
     avg_vals = _flatten_range(args[2]) if len(args) > 2 else crit_vals
 
-    predicate = _parse_criteria(criteria)
     total = 0.0
     count = 0
-    for i, cv in enumerate(crit_vals):
-        if predicate(cv):
-            av = avg_vals[i] if i < len(avg_vals) else 0
-            if isinstance(av, (int, float)):
-                total += float(av)
-                count += 1
+    for i in _criteria_matches([(args[0], criteria)], len(crit_vals)):
+        av = avg_vals[i] if i < len(avg_vals) else 0
+        if isinstance(av, (int, float)):
+            total += float(av)
+            count += 1
     if count == 0:
         return ExcelError.DIV0
     return total / count
@@ -1107,24 +1412,13 @@ def _builtin_averageifs(args: list[Any]) -> float | ExcelError:
     """
     if len(args) < 3 or len(args) % 2 == 0:
         raise ValueError("AVERAGEIFS requires average_range + pairs of (criteria_range, criteria)")
-    avg_vals = _flatten_range(args[0])
-
-    predicates: list[tuple[list[Any], Callable[[Any], bool]]] = []
-    for j in range(1, len(args), 2):
-        cv = _flatten_range(args[j])
-        predicates.append((cv, _parse_criteria(args[j + 1])))
-
-    total = 0.0
-    count = 0
-    for i in range(len(avg_vals)):
-        if all(pred(cv[i]) if i < len(cv) else False for cv, pred in predicates):
-            av = avg_vals[i]
-            if isinstance(av, (int, float)):
-                total += float(av)
-                count += 1
-    if count == 0:
+    numbers = _matching_numbers(args)
+    if not numbers:
         return ExcelError.DIV0
-    return total / count
+    total = 0.0
+    for number in numbers:
+        total += number
+    return total / len(numbers)
 
 
 def _builtin_minifs(args: list[Any]) -> float | ExcelError:
@@ -1134,19 +1428,7 @@ def _builtin_minifs(args: list[Any]) -> float | ExcelError:
     """
     if len(args) < 3 or len(args) % 2 == 0:
         raise ValueError("MINIFS requires min_range + pairs of (criteria_range, criteria)")
-    min_vals = _flatten_range(args[0])
-
-    predicates: list[tuple[list[Any], Callable[[Any], bool]]] = []
-    for j in range(1, len(args), 2):
-        cv = _flatten_range(args[j])
-        predicates.append((cv, _parse_criteria(args[j + 1])))
-
-    candidates: list[float] = []
-    for i in range(len(min_vals)):
-        if all(pred(cv[i]) if i < len(cv) else False for cv, pred in predicates):
-            mv = min_vals[i]
-            if isinstance(mv, (int, float)):
-                candidates.append(float(mv))
+    candidates = _matching_numbers(args)
     return min(candidates) if candidates else 0.0
 
 
@@ -1157,19 +1439,7 @@ def _builtin_maxifs(args: list[Any]) -> float | ExcelError:
     """
     if len(args) < 3 or len(args) % 2 == 0:
         raise ValueError("MAXIFS requires max_range + pairs of (criteria_range, criteria)")
-    max_vals = _flatten_range(args[0])
-
-    predicates: list[tuple[list[Any], Callable[[Any], bool]]] = []
-    for j in range(1, len(args), 2):
-        cv = _flatten_range(args[j])
-        predicates.append((cv, _parse_criteria(args[j + 1])))
-
-    candidates: list[float] = []
-    for i in range(len(max_vals)):
-        if all(pred(cv[i]) if i < len(cv) else False for cv, pred in predicates):
-            mv = max_vals[i]
-            if isinstance(mv, (int, float)):
-                candidates.append(float(mv))
+    candidates = _matching_numbers(args)
     return max(candidates) if candidates else 0.0
 
 
@@ -1827,6 +2097,23 @@ def _builtin_offset(raw_args: list[str], eval_fn: Callable, sheet: str) -> Any:
 
 _builtin_offset._raw_args = True  # type: ignore[attr-defined]
 
+# Lookup and criteria builtins receive range arguments the evaluator shares
+# between calls, so the vectors and indexes they memoize on them outlive a
+# single call.
+_builtin_index._shared_ranges = True  # type: ignore[attr-defined]
+_builtin_match._shared_ranges = True  # type: ignore[attr-defined]
+_builtin_xlookup._shared_ranges = True  # type: ignore[attr-defined]
+_builtin_vlookup._shared_ranges = True  # type: ignore[attr-defined]
+_builtin_hlookup._shared_ranges = True  # type: ignore[attr-defined]
+_builtin_sumif._shared_ranges = True  # type: ignore[attr-defined]
+_builtin_sumifs._shared_ranges = True  # type: ignore[attr-defined]
+_builtin_countif._shared_ranges = True  # type: ignore[attr-defined]
+_builtin_countifs._shared_ranges = True  # type: ignore[attr-defined]
+_builtin_averageif._shared_ranges = True  # type: ignore[attr-defined]
+_builtin_averageifs._shared_ranges = True  # type: ignore[attr-defined]
+_builtin_minifs._shared_ranges = True  # type: ignore[attr-defined]
+_builtin_maxifs._shared_ranges = True  # type: ignore[attr-defined]
+
 
 # ---------------------------------------------------------------------------
 # Registry
@@ -2,164 +2,358 @@
 
 from __future__ import annotations
 
-import re
 from collections import deque
 from typing import TYPE_CHECKING
 
-from wolfxl.calc._parser import all_references
+from wolfxl._utils import a1_to_rowcol
+from wolfxl.calc._loader import iter_workbook_cells
+from wolfxl.calc._names import NameTable
+from wolfxl.calc._parser import parse_range_references, parse_references
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from wolfxl._workbook import Workbook
 
+# (sheet, min_row, min_col, max_row, max_col), 1-based and inclusive.
+CellRange = tuple[str, int, int, int, int]
+
+
+def _split_ref(cell_ref: str) -> tuple[str, int, int]:
+    """``"Sheet!B3"`` -> ``("Sheet", 3, 2)``."""
+    sheet, coord = cell_ref.rsplit("!", 1)
+    row, col = a1_to_rowcol(coord)
+    return sheet, row, col
+
+
+def _parse_range(range_ref: str) -> CellRange:
+    """``"Sheet!A1:B5"`` -> ``("Sheet", 1, 1, 5, 2)`` with corners normalized."""
+    sheet, ref = range_ref.rsplit("!", 1)
+    start, end = ref.split(":")
+    r1, c1 = a1_to_rowcol(start)
+    r2, c2 = a1_to_rowcol(end)
+    return (sheet, min(r1, r2), min(c1, c2), max(r1, r2), max(c1, c2))
+
+
+def _row_blocks(min_row: int, max_row: int) -> Iterator[tuple[int, int]]:
+    """Cover rows ``min_row..max_row`` with aligned ``2**level``-row blocks.
+
+    Yields ``(level, block)`` where the block spans 0-based rows
+    ``block << level`` to ``((block + 1) << level) - 1``. Any row span needs
+    at most two blocks per level, so even a full-column range is a handful
+    of entries.
+    """
+    lo, hi = min_row - 1, max_row
+    level = 0
+    while lo < hi:
+        if lo & 1:
+            yield level, lo
+            lo += 1
+        if hi & 1:
+            hi -= 1
+            yield level, hi
+        lo >>= 1
+        hi >>= 1
+        level += 1
+
+
+class _RangeIndex:
+    """Row-band index answering "which ranges contain this cell?".
+
+    Each rectangle is filed under the aligned row blocks that exactly tile
+    its rows (see :func:`_row_blocks`), keyed by ``(sheet, level, block)``.
+    A lookup probes the one block per level that contains the row and
+    keeps the entries whose column span covers the column. Entries are
+    grouped by column span, so its cost tracks the number of distinct
+    spans touching that row band rather than the number of cells the
+    ranges cover or the number of formulas sharing one range.
+    """
+
+    __slots__ = ("_bands", "_levels")
+
+    def __init__(self) -> None:
+        # (sheet, level, block) -> (min_col, max_col) -> {formula cell}
+        self._bands: dict[tuple[str, int, int], dict[tuple[int, int], set[str]]] = {}
+        self._levels = 0
+
+    def add(self, rng: CellRange, cell_ref: str) -> None:
+        sheet, min_row, min_col, max_row, max_col = rng
+        span = (min_col, max_col)
+        for level, block in _row_blocks(min_row, max_row):
+            band = self._bands.setdefault((sheet, level, block), {})
+            band.setdefault(span, set()).add(cell_ref)
+            if level >= self._levels:
+                self._levels = level + 1
+
+    def remove(self, rng: CellRange, cell_ref: str) -> None:
+        sheet, min_row, min_col, max_row, max_col = rng
+        span = (min_col, max_col)
+        for level, block in _row_blocks(min_row, max_row):
+            band = self._bands.get((sheet, level, block))
+            if band is None:
+                continue
+            cells = band.get(span)
+            if cells is not None:
+                cells.discard(cell_ref)
+                if not cells:
+                    del band[span]
+            if not band:
+                del self._bands[(sheet, level, block)]
+
+    def containing(self, sheet: str, row: int, col: int) -> set[str]:
+        """Formula cells with a registered range covering ``(row, col)``."""
+        found: set[str] = set()
+        offset = row - 1
+        bands = self._bands
+        for level in range(self._levels):
+            band = bands.get((sheet, level, offset >> level))
+            if band:
+                for (min_col, max_col), cells in band.items():
+                    if min_col <= col <= max_col:
+                        found |= cells
+        return found
+
 
 class DependencyGraph:
     """Tracks formula cell dependencies for evaluation ordering.
 
-    All cell references use canonical "SheetName!A1" format.
+    All cell references use canonical "SheetName!A1" format. Single-cell
+    references are stored as explicit edges; range references are kept as
+    rectangles in a row-band index and never expanded cell by cell, so use
+    :meth:`dependents_of` rather than ``dependents`` to find every formula
+    reading a cell.
     """
 
-    __slots__ = ("dependencies", "dependents", "formulas")
+    __slots__ = (
+        "_formula_grid",
+        "_levels",
+        "_range_index",
+        "dependencies",
+        "dependents",
+        "formulas",
+        "ranges",
+    )
 
     def __init__(self) -> None:
-        # cell -> set of cells it reads from
+        # cell -> set of single cells it reads from
         self.dependencies: dict[str, set[str]] = {}
-        # cell -> set of cells that read from it (reverse edges)
+        # cell -> set of cells that read from it directly (reverse edges)
         self.dependents: dict[str, set[str]] = {}
+        # cell -> ranges it reads from
+        self.ranges: dict[str, list[CellRange]] = {}
         # cell -> formula string
         self.formulas: dict[str, str] = {}
+        self._range_index = _RangeIndex()
+        # sheet -> column -> row -> formula cell, for range -> formula lookups
+        self._formula_grid: dict[str, dict[int, dict[int, str]]] = {}
+        # formula cell -> topological level; None until first needed
+        self._levels: dict[str, int] | None = None
 
     def add_formula(
         self,
         cell_ref: str,
         formula: str,
         current_sheet: str,
-        named_ranges: dict[str, str] | None = None,
+        named_ranges: NameTable | dict[str, str] | None = None,
     ) -> None:
         """Register a formula cell and its dependencies.
 
-        If *named_ranges* is provided (``{NAME: refers_to}``), named
-        range tokens in the formula are expanded before reference
-        extraction so the dependency graph correctly tracks them.
+        If *named_ranges* is provided (a :class:`NameTable` or
+        ``{NAME: refers_to}`` with upper-cased names), named range tokens in the formula are
+        expanded before reference extraction so the dependency graph
+        correctly tracks them.
         """
+        if cell_ref in self.formulas:
+            self._unlink(cell_ref)
+        else:
+            try:
+                sheet, row, col = _split_ref(cell_ref)
+            except ValueError:
+                pass
+            else:
+                self._formula_grid.setdefault(sheet, {}).setdefault(col, {})[row] = cell_ref
         self.formulas[cell_ref] = formula
 
         # Expand named ranges in the formula for reference extraction
-        expanded = formula
-        if named_ranges:
-            for name, refers_to in named_ranges.items():
-                # Word-boundary replace to avoid partial matches
-                expanded = re.sub(
-                    rf'\b{re.escape(name)}\b',
-                    refers_to,
-                    expanded,
-                    flags=re.IGNORECASE,
-                )
-
-        refs = all_references(expanded, current_sheet)
+        names = NameTable.coerce(named_ranges)
+        expanded = names.expand(formula, current_sheet) if names else formula
+
+        refs = parse_references(expanded, current_sheet)
+        ranges = [_parse_range(rng) for rng in parse_range_references(expanded, current_sheet)]
 
         self.dependencies[cell_ref] = set(refs)
+        self.ranges[cell_ref] = ranges
 
         for ref in refs:
             if ref not in self.dependents:
                 self.dependents[ref] = set()
             self.dependents[ref].add(cell_ref)
+        for rng in ranges:
+            self._range_index.add(rng, cell_ref)
+        self._relevel(cell_ref)
+
+    def _unlink(self, cell_ref: str) -> None:
+        """Drop the edges registered by a previous formula in *cell_ref*."""
+        for ref in self.dependencies.pop(cell_ref, ()):
+            readers = self.dependents.get(ref)
+            if readers is not None:
+                readers.discard(cell_ref)
+                if not readers:
+                    del self.dependents[ref]
+        for rng in self.ranges.pop(cell_ref, ()):
+            self._range_index.remove(rng, cell_ref)
+
+    def dependents_of(self, cell_ref: str) -> set[str]:
+        """Cells that read *cell_ref*, directly or through a range."""
+        found = set(self.dependents.get(cell_ref, ()))
+        try:
+            sheet, row, col = _split_ref(cell_ref)
+        except ValueError:
+            return found
+        found |= self._range_index.containing(sheet, row, col)
+        return found
 
     def topological_order(self) -> list[str]:
-        """Return formula cells in evaluation order (Kahn's algorithm).
+        """Return formula cells in evaluation order (by topological level).
 
         Raises ValueError if a circular reference is detected.
         """
-        # Only consider formula cells (sorted for determinism)
-        formula_cells = set(self.formulas.keys())
-        if not formula_cells:
-            return []
-
-        # Compute in-degrees within formula cells only
-        in_degree: dict[str, int] = {}
-        for cell in formula_cells:
-            deps = self.dependencies.get(cell, set())
-            # Only count deps that are themselves formula cells
-            in_degree[cell] = len(deps & formula_cells)
-
-        # Start with formula cells that have no formula-cell dependencies
-        # Sorted to ensure deterministic output across runs (Python hash randomization)
-        queue: deque[str] = deque(sorted(
-            cell for cell in formula_cells if in_degree[cell] == 0
-        ))
+        levels = self._ensure_levels()
+        return sorted(levels, key=lambda cell: (levels[cell], cell))
 
-        order: list[str] = []
-        while queue:
-            cell = queue.popleft()
-            order.append(cell)
-            # Reduce in-degree for dependent formula cells (sorted for determinism)
-            for dep in sorted(self.dependents.get(cell, set())):
-                if dep in formula_cells:
-                    in_degree[dep] -= 1
-                    if in_degree[dep] == 0:
-                        queue.append(dep)
-
-        if len(order) != len(formula_cells):
-            missing = formula_cells - set(order)
-            raise ValueError(f"Circular reference detected involving: {missing}")
+    def affected_cells(self, changed_cells: set[str]) -> list[str]:
+        """Find all formula cells affected by changes, in evaluation order."""
+        return self.dirty_cells(changed_cells)[0]
 
-        return order
+    def max_depth(self, roots: set[str]) -> int:
+        """Longest dependency chain from root cells through formula cells."""
+        if not roots:
+            return 0
+        return self.dirty_cells(roots)[1]
 
-    def affected_cells(self, changed_cells: set[str]) -> list[str]:
-        """Find all formula cells affected by changes, in evaluation order.
+    def dirty_cells(self, changed_cells: set[str]) -> tuple[list[str], int]:
+        """Affected formula cells in evaluation order, plus the longest chain.
 
-        Uses BFS on the dependents graph, then filters to topological order.
+        Walks only the subgraph reachable from *changed_cells*; ordering
+        comes from the persistent topological levels, and the chain depth
+        is a single longest-path pass over the same cells.
         """
+        levels = self._ensure_levels()
+        readers: dict[str, list[str]] = {}
         affected: set[str] = set()
         queue: deque[str] = deque(changed_cells)
         visited: set[str] = set(changed_cells)
 
         while queue:
             cell = queue.popleft()
-            for dep in self.dependents.get(cell, set()):
+            deps = [dep for dep in self.dependents_of(cell) if dep in levels]
+            readers[cell] = deps
+            for dep in deps:
+                affected.add(dep)
                 if dep not in visited:
                     visited.add(dep)
                     queue.append(dep)
-                    if dep in self.formulas:
-                        affected.add(dep)
 
-        # Return in topological order
-        full_order = self.topological_order()
-        return [c for c in full_order if c in affected]
+        # Non-formula roots first, then formula cells by level.
+        walk = sorted(visited, key=lambda cell: (levels.get(cell, -1), cell))
+        depth: dict[str, int] = dict.fromkeys(changed_cells, 0)
+        max_d = 0
+        for cell in walk:
+            next_depth = depth.get(cell, 0) + 1
+            for dep in readers[cell]:
+                if next_depth > depth.get(dep, -1):
+                    depth[dep] = next_depth
+                    max_d = max(max_d, next_depth)
+
+        order = [cell for cell in walk if cell in affected and cell not in changed_cells]
+        return order, max_d
+
+    def _ensure_levels(self) -> dict[str, int]:
+        """Topological level per formula cell, built on first use.
+
+        Level 0 cells read no formula cells; every other cell sits one above
+        its highest formula precedent. After the first build, add_formula
+        keeps the levels current incrementally.
+        """
+        if self._levels is None:
+            self._levels = self._build_levels()
+        return self._levels
+
+    def _build_levels(self) -> dict[str, int]:
+        """Kahn's algorithm over formula cells, recording each cell's level."""
+        formula_cells = set(self.formulas)
+        readers: dict[str, list[str]] = {}
+        in_degree: dict[str, int] = dict.fromkeys(formula_cells, 0)
+        for cell in formula_cells:
+            deps = [dep for dep in self.dependents_of(cell) if dep in formula_cells]
+            readers[cell] = deps
+            for dep in deps:
+                in_degree[dep] += 1
+
+        levels: dict[str, int] = dict.fromkeys(formula_cells, 0)
+        queue: deque[str] = deque(cell for cell in formula_cells if in_degree[cell] == 0)
+        done = 0
+        while queue:
+            cell = queue.popleft()
+            done += 1
+            next_level = levels[cell] + 1
+            for dep in readers[cell]:
+                if levels[dep] < next_level:
+                    levels[dep] = next_level
+                in_degree[dep] -= 1
+                if in_degree[dep] == 0:
+                    queue.append(dep)
 
-    def max_depth(self, roots: set[str]) -> int:
-        """Longest dependency chain from root cells through formula cells."""
-        if not roots:
-            return 0
+        if done != len(formula_cells):
+            missing = {cell for cell in formula_cells if in_degree[cell] > 0}
+            raise ValueError(f"Circular reference detected involving: {missing}")
+        return levels
 
-        depth: dict[str, int] = {r: 0 for r in roots}
-        queue: deque[str] = deque(roots)
-        max_d = 0
+    def _relevel(self, cell_ref: str) -> None:
+        """Update levels after (re)registering *cell_ref*.
 
+        Existing levels stay valid upper bounds, so only increases are
+        pushed to readers. Reaching *cell_ref* again means the new formula
+        closed a cycle; levels are then dropped so the next ordering call
+        rebuilds and reports it.
+        """
+        levels = self._levels
+        if levels is None:
+            return
+        precedents = self._formula_precedents(cell_ref)
+        if cell_ref in precedents:
+            self._levels = None
+            return
+        levels[cell_ref] = max((levels[p] + 1 for p in precedents), default=0)
+        queue: deque[str] = deque([cell_ref])
         while queue:
             cell = queue.popleft()
-            current_depth = depth[cell]
-            for dep in self.dependents.get(cell, set()):
-                if dep in self.formulas:
-                    new_depth = current_depth + 1
-                    if dep not in depth or new_depth > depth[dep]:
-                        depth[dep] = new_depth
-                        max_d = max(max_d, new_depth)
-                        queue.append(dep)
-
-        return max_d
+            next_level = levels[cell] + 1
+            for dep in self.dependents_of(cell):
+                if dep not in levels or levels[dep] >= next_level:
+                    continue
+                if dep == cell_ref:
+                    self._levels = None
+                    return
+                levels[dep] = next_level
+                queue.append(dep)
+
+    def _formula_precedents(self, cell_ref: str) -> set[str]:
+        """Formula cells that *cell_ref* reads, directly or through a range."""
+        found = {ref for ref in self.dependencies.get(cell_ref, ()) if ref in self.formulas}
+        for sheet, min_row, min_col, max_row, max_col in self.ranges.get(cell_ref, ()):
+            for col, rows in self._formula_grid.get(sheet, {}).items():
+                if min_col <= col <= max_col:
+                    found.update(ref for row, ref in rows.items() if min_row <= row <= max_row)
+        return found
 
     @classmethod
     def from_workbook(cls, workbook: Workbook) -> DependencyGraph:
         """Build a dependency graph by scanning all sheets for formula cells."""
         graph = cls()
 
-        for sheet_name in workbook.sheetnames:
-            ws = workbook[sheet_name]
-            for row in ws.iter_rows(values_only=False):
-                for cell in row:
-                    val = cell.value
-                    if isinstance(val, str) and val.startswith("="):
-                        cell_ref = f"{sheet_name}!{cell.coordinate}"
-                        graph.add_formula(cell_ref, val, sheet_name)
+        for cells in iter_workbook_cells(workbook):
+            for cell_ref, formula in cells.formulas():
+                graph.add_formula(cell_ref, formula, cells.sheet)
 
         return graph
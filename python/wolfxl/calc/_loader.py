@@ -0,0 +1,133 @@
+"""Bulk cell loading for the calc engines.
+
+Walking ``ws.iter_rows(values_only=False)`` builds a :class:`Cell` proxy
+for every grid position, blanks included, and then formats a coordinate
+string per cell. :func:`load_sheet_cells` instead reads the populated
+cells of a sheet in one pass - from the native reader's record stream
+when the workbook was loaded from a file (plain row values for ``.xls``,
+whose reader has no record stream), or straight from the write-mode cell
+map otherwise - into compact parallel arrays keyed by 1-based row and
+column numbers.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from wolfxl._utils import column_letter
+
+if TYPE_CHECKING:
+    from wolfxl._workbook import Workbook
+    from wolfxl._worksheet import Worksheet
+
+_COLUMN_LETTERS: list[str] = [""]
+
+
+def _letters(col: int) -> str:
+    """Column letters for *col*, memoized across loads."""
+    while len(_COLUMN_LETTERS) <= col:
+        _COLUMN_LETTERS.append(column_letter(len(_COLUMN_LETTERS)))
+    return _COLUMN_LETTERS[col]
+
+
+@dataclass
+class SheetCells:
+    """Populated cells of one worksheet as parallel arrays.
+
+    ``rows[i]`` / ``cols[i]`` are the 1-based coordinates of ``values[i]``.
+    Formula cells hold their ``"=..."`` text; blanks are not stored.
+    """
+
+    sheet: str
+    rows: array = field(default_factory=lambda: array("I"))
+    cols: array = field(default_factory=lambda: array("I"))
+    values: list[Any] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def append(self, row: int, col: int, value: Any) -> None:
+        self.rows.append(row)
+        self.cols.append(col)
+        self.values.append(value)
+
+    def refs(self) -> Iterator[tuple[str, Any]]:
+        """Yield ``("Sheet!A1", value)`` for every stored cell."""
+        prefix = f"{self.sheet}!"
+        letters = _COLUMN_LETTERS
+        top = max(self.cols, default=0)
+        if top >= len(letters):
+            _letters(top)
+        for row, col, value in zip(self.rows, self.cols, self.values):
+            yield f"{prefix}{letters[col]}{row}", value
+
+    def formulas(self) -> Iterator[tuple[str, str]]:
+        """Yield ``("Sheet!A1", "=...")`` for every formula cell."""
+        for cell_ref, value in self.refs():
+            if isinstance(value, str) and value.startswith("="):
+                yield cell_ref, value
+
+
+def load_sheet_cells(ws: Worksheet) -> SheetCells:
+    """Read every non-blank cell of *ws* into a :class:`SheetCells`.
+
+    Values match what ``cell.value`` returns, including unsaved edits and
+    the workbook's ``data_only`` setting.
+    """
+    cells = SheetCells(ws.title)
+    workbook = ws._workbook  # noqa: SLF001
+    if workbook._rust_reader is None:  # noqa: SLF001
+        _load_write_mode(ws, cells)
+    elif workbook._format == "xls":  # noqa: SLF001
+        # CalamineXlsBook has no record stream; read plain values instead.
+        _load_values(ws, cells)
+    else:
+        _load_records(ws, cells)
+    return cells
+
+
+def iter_workbook_cells(workbook: Workbook) -> Iterator[SheetCells]:
+    """Yield :func:`load_sheet_cells` for each sheet in workbook order."""
+    for sheet_name in workbook.sheetnames:
+        yield load_sheet_cells(workbook[sheet_name])
+
+
+def _load_records(ws: Worksheet, cells: SheetCells) -> None:
+    """Fill *cells* from the native reader in one whole-sheet record read."""
+    from wolfxl._worksheet_records import iter_cell_records
+
+    append = cells.append
+    for record in iter_cell_records(
+        ws,
+        include_format=False,
+        include_coordinate=False,
+        include_style_id=False,
+        include_extended_format=False,
+    ):
+        value = record["value"]
+        if value is not None:
+            append(record["row"], record["column"], value)
+
+
+def _load_values(ws: Worksheet, cells: SheetCells) -> None:
+    """Fill *cells* from ``iter_rows(values_only=True)``."""
+    append = cells.append
+    for row, values in enumerate(ws.iter_rows(values_only=True), start=1):
+        for col, value in enumerate(values, start=1):
+            if value is not None:
+                append(row, col, value)
+
+
+def _load_write_mode(ws: Worksheet, cells: SheetCells) -> None:
+    """Fill *cells* from the in-memory cell map and pending write buffers."""
+    from wolfxl._worksheet_pending import collect_pending_overlay
+
+    values = {key: cell.value for key, cell in ws._cells.items()}  # noqa: SLF001
+    values.update(collect_pending_overlay(ws))
+    append = cells.append
+    for (row, col), value in sorted(values.items()):
+        if value is not None:
+            append(row, col, value)
@@ -0,0 +1,167 @@
+"""Defined-name resolution for formula text.
+
+:class:`NameTable` holds workbook- and sheet-scoped defined names and
+expands the names in a formula with a single tokenizing pass: every
+identifier-shaped token is looked up once, so the cost of expansion does
+not grow with the number of names defined in the workbook.
+"""
+
+from __future__ import annotations
+
+import re
+
+# One alternation, scanned left to right: string literals are matched (and
+# kept verbatim) so names inside them are never touched; otherwise an
+# identifier with an optional ``Sheet!`` / ``'My Sheet'!`` qualifier that
+# is not part of a longer word, a function call, an absolute reference
+# (``A$1``) or a qualifier itself.
+_NAME_TOKEN_RE = re.compile(
+    r'"[^"]*"'
+    r"|(?<![\w.$!])"
+    r"(?:(?:'(?P<quoted>(?:[^']|'')+)'|(?P<sheet>[A-Za-z_][\w.]*))!)?"
+    r"(?P<name>[A-Za-z_\\][\w.]*)"
+    r"(?![\w.(!$])"
+)
+
+# Strings and quoted sheet qualifiers are kept verbatim; otherwise an A1
+# cell or range reference that carries no ``Sheet!`` qualifier of its own.
+_BARE_REF_RE = re.compile(
+    r'"[^"]*"'
+    r"|'(?:[^']|'')*'!"
+    r"|(?<![\w.$!:'])"
+    r"(?P<ref>\$?[A-Za-z]{1,3}\$?\d+(?:\s*:\s*\$?[A-Za-z]{1,3}\$?\d+)?)"
+    r"(?![\w.(!$])"
+)
+_PLAIN_SHEET_RE = re.compile(r"[A-Za-z0-9_]+")
+# A whole definition that is one (optionally sheet-qualified) cell, range,
+# column or row reference; anything else is parenthesized when substituted.
+_SINGLE_REF_RE = re.compile(
+    r"(?:(?:'(?:[^']|'')+'|[\w.]+)!)?"
+    r"(?:\$?[A-Za-z]{1,3}\$?\d+(?::\$?[A-Za-z]{1,3}\$?\d+)?"
+    r"|\$?[A-Za-z]{1,3}:\$?[A-Za-z]{1,3}"
+    r"|\$?\d+:\$?\d+)"
+)
+
+
+def _split_qualifier(token: str) -> tuple[str | None, str]:
+    """Split ``Sheet!Name`` / ``'My Sheet'!Name`` into sheet and name."""
+    if "!" not in token:
+        return None, token
+    sheet, _, name = token.rpartition("!")
+    if sheet.startswith("'") and sheet.endswith("'"):
+        sheet = sheet[1:-1].replace("''", "'")
+    return sheet, name
+
+
+def _qualify(refers_to: str, sheet: str) -> str:
+    """Prefix every unqualified cell or range reference with *sheet*.
+
+    Sheet-scoped names are stored relative to their own sheet (``$B$1``),
+    but must keep pointing there when used from a formula on another one.
+    """
+    prefix = sheet if _PLAIN_SHEET_RE.fullmatch(sheet) else f"'{sheet}'"
+
+    def substitute(match: re.Match[str]) -> str:
+        ref = match.group("ref")
+        return match.group(0) if ref is None else f"{prefix}!{ref}"
+
+    return _BARE_REF_RE.sub(substitute, refers_to)
+
+
+class NameTable:
+    """Workbook- and sheet-scoped defined names.
+
+    *workbook* maps upper-cased names to what they refer to and is kept
+    by reference, so later edits to that mapping are seen. Sheet-scoped
+    names are added with :meth:`define`. An unqualified name in a formula
+    on sheet ``S`` resolves to ``S``'s own name first and then to the
+    workbook-level one; ``S!Name`` only matches a name scoped to ``S``.
+    Names whose definition mentions other names expand recursively.
+    """
+
+    __slots__ = ("_sheets", "workbook")
+
+    def __init__(self, workbook: dict[str, str] | None = None) -> None:
+        self.workbook: dict[str, str] = {} if workbook is None else workbook
+        # upper-cased sheet -> upper-cased name -> refers_to
+        self._sheets: dict[str, dict[str, str]] = {}
+
+    @classmethod
+    def coerce(cls, names: NameTable | dict[str, str] | None) -> NameTable | None:
+        """Wrap a plain ``{NAME: refers_to}`` mapping; pass tables through."""
+        if names is None or isinstance(names, NameTable):
+            return names
+        return cls(names)
+
+    def __bool__(self) -> bool:
+        return bool(self.workbook) or any(self._sheets.values())
+
+    def clear(self) -> None:
+        self.workbook.clear()
+        self._sheets.clear()
+
+    def define(self, name: str, refers_to: str, sheet: str | None = None) -> None:
+        """Add a name, scoped to *sheet* when given.
+
+        Unqualified references in a sheet-scoped definition are pinned to
+        *sheet*, the way Excel reads them.
+        """
+        refers_to = refers_to[1:] if refers_to.startswith("=") else refers_to
+        if sheet is None:
+            self.workbook[name.upper()] = refers_to
+        else:
+            refers_to = _qualify(refers_to, sheet)
+            self._sheets.setdefault(sheet.upper(), {})[name.upper()] = refers_to
+
+    def lookup(self, token: str, sheet: str | None) -> tuple[str, str | None] | None:
+        """Raw definition of *token* as used on *sheet*, and its scope.
+
+        Returns ``(refers_to, scope_sheet)`` where *scope_sheet* is None
+        for workbook-level names, or None when *token* is not a name.
+        """
+        qualifier, name = _split_qualifier(token)
+        key = name.upper()
+        if qualifier is not None:
+            refers_to = self._sheets.get(qualifier.upper(), {}).get(key)
+            return None if refers_to is None else (refers_to, qualifier)
+        if sheet is not None:
+            refers_to = self._sheets.get(sheet.upper(), {}).get(key)
+            if refers_to is not None:
+                return refers_to, sheet
+        refers_to = self.workbook.get(key)
+        return None if refers_to is None else (refers_to, None)
+
+    def resolve(self, token: str, sheet: str | None) -> str | None:
+        """Fully expanded definition of *token* on *sheet*, or None."""
+        return self._resolve(token, sheet, frozenset())
+
+    def expand(self, formula: str, sheet: str | None) -> str:
+        """Replace every defined name in *formula* with its definition."""
+        if not self:
+            return formula
+        return self._expand(formula, sheet, frozenset())
+
+    def _resolve(self, token: str, sheet: str | None, seen: frozenset[tuple]) -> str | None:
+        found = self.lookup(token, sheet)
+        if found is None:
+            return None
+        refers_to, scope = found
+        key = (scope and scope.upper(), _split_qualifier(token)[1].upper())
+        if key in seen:
+            return None  # self-referencing definition: leave the token alone
+        return self._expand(refers_to, scope, seen | {key})
+
+    def _expand(self, text: str, sheet: str | None, seen: frozenset[tuple]) -> str:
+        def substitute(match: re.Match[str]) -> str:
+            if match.group("name") is None:
+                return match.group(0)
+            resolved = self._resolve(match.group(0), sheet, seen)
+            if resolved is None:
+                return match.group(0)
+            if _SINGLE_REF_RE.fullmatch(resolved.strip()):
+                return resolved
+            # Keep the definition's own precedence: Rate = 0.05+0.02 used
+            # as Rate*2 must not become 0.05+0.02*2.
+            return f"({resolved})"
+
+        return _NAME_TOKEN_RE.sub(substitute, text)
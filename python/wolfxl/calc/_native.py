@@ -0,0 +1,206 @@
+"""Native formula evaluation backed by the Rust engine in ``wolfxl._rust``.
+
+:class:`NativeEvaluator` implements the :class:`CalcEngine` protocol on
+top of ``wolfxl._rust.NativeCalcEngine``, which parses every formula once
+with the ``wolfxl-formula`` tokenizer and evaluates the workbook with the
+GIL released. It covers the builtins that do not depend on the clock or
+on raw argument text (everything except ``TODAY``, ``NOW``, ``TEXT`` and
+``OFFSET``); :attr:`NativeEvaluator.unsupported` lists whatever it cannot
+run so callers can fall back to :class:`WorkbookEvaluator`.
+"""
+
+from __future__ import annotations
+
+import datetime
+import os
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+from wolfxl._utils import rowcol_to_a1
+from wolfxl.calc._evaluator import _values_differ
+from wolfxl.calc._functions import _date_to_serial
+from wolfxl.calc._loader import iter_workbook_cells
+from wolfxl.calc._protocol import BatchRecalcResult, CellDelta, RecalcResult
+
+if TYPE_CHECKING:
+    from wolfxl._workbook import Workbook
+
+
+def native_engine_available() -> bool:
+    """True when the compiled extension ships the native calc engine."""
+    from wolfxl import _rust
+
+    return hasattr(_rust, "NativeCalcEngine")
+
+
+def _to_native(value: Any) -> Any:
+    """Cell value in a form the native engine accepts; dates become serials.
+
+    Raises ``TypeError`` for values the engine has no representation for.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, datetime.datetime):
+        fraction = (value - value.replace(hour=0, minute=0, second=0, microsecond=0)).total_seconds()
+        return _date_to_serial(value.year, value.month, value.day) + fraction / 86400
+    if isinstance(value, datetime.date):
+        return _date_to_serial(value.year, value.month, value.day)
+    if isinstance(value, datetime.time):
+        return (value.hour * 3600 + value.minute * 60 + value.second) / 86400
+    if isinstance(value, datetime.timedelta):
+        return value.total_seconds() / 86400
+    raise TypeError(f"unsupported cell value type: {type(value).__name__}")
+
+
+class NativeEvaluator:
+    """Evaluates a wolfxl Workbook's formulas with the native Rust engine.
+
+    Usage::
+
+        evaluator = NativeEvaluator()
+        evaluator.load(workbook)
+        if not evaluator.unsupported:
+            results = evaluator.calculate()
+            recalc = evaluator.recalculate({"Sheet1!A1": 42.0})
+
+    Results match :class:`WorkbookEvaluator`'s shapes; numbers always come
+    back as ``float`` and dates are read as Excel serial numbers.
+
+    *threads* > 1 evaluates every sufficiently wide dependency level on
+    that many native threads; ``0`` uses one thread per CPU. Formulas on
+    one level never read each other, so results are identical to a
+    serial run.
+    """
+
+    def __init__(self, threads: int = 1) -> None:
+        if threads < 0:
+            raise ValueError(f"threads must be >= 0, got {threads}")
+        self.threads = threads or os.cpu_count() or 1
+        self._engine: Any = None
+        self._loaded = False
+        # (cell_ref, reason) for every formula or value the engine cannot take
+        self.unsupported: list[tuple[str, str]] = []
+
+    def load(self, workbook: Workbook) -> None:
+        """Scan workbook values, formulas and defined names into the engine."""
+        from wolfxl._rust import NativeCalcEngine  # type: ignore[attr-defined]
+
+        engine = NativeCalcEngine()
+        engine.set_threads(self.threads)
+        unsupported: list[tuple[str, str]] = []
+        for name, defined in workbook.defined_names.items():
+            refers_to = getattr(defined, "value", defined)
+            if isinstance(refers_to, str):
+                engine.define_name(name, refers_to)
+        # The engine only knows workbook-level names; a sheet-scoped one
+        # would silently resolve to its workbook namesake or not at all.
+        for sheet_name in workbook.sheetnames:
+            for name in workbook[sheet_name].defined_names:
+                unsupported.append((f"{sheet_name}!{name}", "sheet-scoped defined name"))
+
+        for cells in iter_workbook_cells(workbook):
+            index = engine.add_sheet(cells.sheet)
+            batch: list[tuple[int, int, Any]] = []
+            for row, col, value in zip(cells.rows, cells.cols, cells.values):
+                try:
+                    batch.append((row, col, _to_native(value)))
+                except TypeError as exc:
+                    ref = f"{cells.sheet}!{rowcol_to_a1(row, col)}"
+                    unsupported.append((ref, str(exc)))
+            engine.set_cells(index, batch)
+
+        unsupported.extend(engine.unsupported())
+        self._engine = engine
+        self.unsupported = unsupported
+        self._loaded = True
+
+    def calculate(self) -> dict[str, Any]:
+        """Evaluate all formulas in topological order.
+
+        Returns dict of cell_ref -> computed value for formula cells.
+        """
+        self._check_loaded("calculate")
+        return dict(self._engine.calculate())
+
+    def recalculate(
+        self,
+        perturbations: dict[str, float | int],
+        tolerance: float = 1e-10,
+    ) -> RecalcResult:
+        """Perturb input cells and recompute affected formulas."""
+        self._check_loaded("recalculate")
+        affected, max_depth = self._engine.recalculate(
+            [(ref, _to_native(value)) for ref, value in perturbations.items()],
+        )
+        deltas = tuple(
+            CellDelta(cell_ref=ref, old_value=old, new_value=new, formula=formula)
+            for ref, old, new, formula in affected
+            if _values_differ(old, new, tolerance)
+        )
+        return RecalcResult(
+            perturbations=dict(perturbations),
+            deltas=deltas,
+            total_formula_cells=self._engine.formula_count(),
+            propagated_cells=len(deltas),
+            max_chain_depth=max_depth,
+        )
+
+    def recalculate_batch(
+        self,
+        scenarios: Any,
+        outputs: Sequence[str] | None = None,
+        *,
+        inputs: Sequence[str] | None = None,
+    ) -> BatchRecalcResult:
+        """Evaluate many perturbation scenarios in one native pass.
+
+        Accepts the same *scenarios* / *inputs* forms as
+        :meth:`WorkbookEvaluator.recalculate_batch`. ``values`` is a
+        ``float64`` array when every output is numeric, else an object
+        array. Cell values are left unchanged. Requires NumPy.
+        """
+        self._check_loaded("recalculate_batch")
+        import numpy as np
+
+        if inputs is not None:
+            matrix = np.asarray(scenarios)
+            if matrix.dtype.kind not in "biuf":
+                raise TypeError("recalculate_batch: scenario arrays must be numeric")
+            if matrix.ndim != 2 or matrix.shape[1] != len(inputs):
+                raise ValueError(
+                    "recalculate_batch: scenarios must have shape (n_scenarios, len(inputs)), "
+                    f"got {matrix.shape}"
+                )
+            refs = list(inputs)
+            rows = matrix.tolist()
+        else:
+            scenarios = list(scenarios)
+            refs = []
+            for scenario in scenarios:
+                if not isinstance(scenario, Mapping):
+                    raise TypeError(
+                        "recalculate_batch: scenarios must be {cell_ref: value} mappings "
+                        "or a 2-D array together with inputs="
+                    )
+                refs.extend(ref for ref in scenario if ref not in refs)
+            base = {ref: self._engine.value(ref) for ref in refs}
+            rows = [
+                [_to_native(scenario.get(ref, base[ref])) for ref in refs]
+                for scenario in scenarios
+            ]
+
+        out, values = self._engine.evaluate_scenarios(
+            refs, rows, None if outputs is None else list(outputs),
+        )
+        numeric = all(isinstance(v, (int, float)) for row in values for v in row)
+        matrix = np.empty((len(rows), len(out)), dtype=np.float64 if numeric else object)
+        for i, row in enumerate(values):
+            matrix[i, :] = row
+        return BatchRecalcResult(inputs=tuple(refs), outputs=tuple(out), values=matrix)
+
+    def _check_loaded(self, method: str) -> None:
+        if not self._loaded:
+            raise RuntimeError(f"Call load() before {method}()")
+        if self.unsupported:
+            ref, reason = self.unsupported[0]
+            raise RuntimeError(f"Native engine cannot evaluate {ref}: {reason}")
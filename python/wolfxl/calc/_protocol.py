@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
     from wolfxl._workbook import Workbook
@@ -36,6 +36,15 @@ class RecalcResult:
         return self.propagated_cells / self.total_formula_cells
 
 
+@dataclass(frozen=True)
+class BatchRecalcResult:
+    """Result of evaluating many perturbation scenarios in one pass."""
+
+    inputs: tuple[str, ...]  # perturbed cell refs
+    outputs: tuple[str, ...]  # cell refs, one per column of ``values``
+    values: Any  # ndarray of shape (n_scenarios, len(outputs))
+
+
 @runtime_checkable
 class CalcEngine(Protocol):
     """Protocol for formula evaluation engines."""
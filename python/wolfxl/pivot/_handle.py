@@ -19,10 +19,7 @@ and layout edits:
 
 from __future__ import annotations
 
-import os
 import re
-import tempfile
-import zipfile
 from typing import TYPE_CHECKING, Any
 
 from wolfxl.chart.reference import Reference
@@ -376,7 +373,7 @@ def _parse_a1_cell(cell: str) -> tuple[int | None, int | None]:
 __all__ = ["PivotTableHandle"]
 
 
-def apply_pivot_layout_authoring_to_xlsx(path: str, workbook: Any) -> None:
+def apply_pivot_layout_authoring_to_package(package: Any, workbook: Any) -> None:
     payloads: list[dict[str, Any]] = []
     for ws in workbook._sheets.values():  # noqa: SLF001
         handles = getattr(ws, "_pivot_handles_cache", None)
@@ -390,34 +387,18 @@ def apply_pivot_layout_authoring_to_xlsx(path: str, workbook: Any) -> None:
         return
 
     replacements: dict[str, bytes] = {}
-    with zipfile.ZipFile(path, "r") as src:
-        names = set(src.namelist())
-        for payload in payloads:
-            table_path = payload["table_part_path"]
-            cache_path = payload["cache_part_path"]
-            if table_path in names:
-                table_bytes = replacements.get(table_path) or src.read(table_path)
-                replacements[table_path] = _rewrite_pivot_table_xml(table_bytes, payload)
-            if cache_path in names:
-                cache_bytes = replacements.get(cache_path) or src.read(cache_path)
-                replacements[cache_path] = _force_refresh_on_load(cache_bytes)
-
-    fd, tmp_name = tempfile.mkstemp(prefix="wolfxl-pivot-layout-", suffix=".xlsx")
-    os.close(fd)
-    try:
-        with zipfile.ZipFile(path, "r") as src, zipfile.ZipFile(
-            tmp_name, "w", zipfile.ZIP_DEFLATED
-        ) as dst:
-            for info in src.infolist():
-                data = replacements.get(info.filename)
-                if data is None:
-                    with src.open(info, "r") as handle:
-                        data = handle.read()
-                dst.writestr(info, data)
-        os.replace(tmp_name, path)
-    finally:
-        if os.path.exists(tmp_name):
-            os.unlink(tmp_name)
+    names = set(package.namelist())
+    for payload in payloads:
+        table_path = payload["table_part_path"]
+        cache_path = payload["cache_part_path"]
+        if table_path in names:
+            table_bytes = replacements.get(table_path) or package.read(table_path)
+            replacements[table_path] = _rewrite_pivot_table_xml(table_bytes, payload)
+        if cache_path in names:
+            cache_bytes = replacements.get(cache_path) or package.read(cache_path)
+            replacements[cache_path] = _force_refresh_on_load(cache_bytes)
+    for name, data in replacements.items():
+        package.write(name, data)
 
 
 def _rewrite_pivot_table_xml(xml: bytes, payload: dict[str, Any]) -> bytes:
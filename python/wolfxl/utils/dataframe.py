@@ -29,6 +29,9 @@ def dataframe_to_rows(
       MultiIndex index, each index level becomes its own leading column.
     - An empty separator row is yielded between header and data when
       ``index=True`` to match openpyxl's layout convention.
+
+    To write a large frame without per-cell Python rows, use
+    :meth:`Worksheet.write_dataframe` instead.
     """
     import pandas as pd  # type: ignore[import-untyped]
 
@@ -69,14 +72,38 @@ def worksheet_to_dataframe(
     max_row: int | None = None,
     min_col: int | None = None,
     max_col: int | None = None,
+    columnar: bool = False,
 ) -> pd.DataFrame:
     """Materialize worksheet values as a pandas DataFrame.
 
     Pandas is imported lazily. When ``header=True``, the first row in
     the requested range becomes the DataFrame columns.
+
+    With ``columnar=True`` an eagerly loaded sheet is read from the native
+    reader's typed column buffers (see :meth:`Worksheet.to_numpy`) instead
+    of per-cell Python rows. Column dtypes then follow those buffers, so
+    date columns come back as ``datetime64[ms]``. ``read_only=True``
+    workbooks always stream rows.
     """
     import pandas as pd  # type: ignore[import-untyped]
 
+    workbook = getattr(ws, "_workbook", None)
+    reader = getattr(workbook, "_rust_reader", None)
+    if (
+        columnar
+        and hasattr(reader, "read_sheet_columns")
+        and not getattr(workbook, "_read_only", False)
+        and not ws._collect_pending_overlay()
+    ):
+        return _native_dataframe(
+            ws,
+            header=header,
+            min_row=min_row,
+            max_row=max_row,
+            min_col=min_col,
+            max_col=max_col,
+        )
+
     rows = list(
         ws.iter_rows(
             min_row=min_row,
@@ -94,4 +121,20 @@ def worksheet_to_dataframe(
     return pd.DataFrame(rows)
 
 
+def _native_dataframe(ws: Any, *, header: bool, **bounds: Any) -> pd.DataFrame:
+    import pandas as pd  # type: ignore[import-untyped]
+
+    from wolfxl._worksheet_columns import column_buffers, to_numpy_array
+
+    labels, descriptors = column_buffers(ws, header=header, **bounds)
+    if not descriptors or (not header and descriptors[0]["length"] == 0):
+        return pd.DataFrame()
+    frame = pd.DataFrame(
+        {idx: to_numpy_array(desc) for idx, desc in enumerate(descriptors)}
+    )
+    if header:
+        frame.columns = labels
+    return frame
+
+
 __all__ = ["dataframe_to_rows", "worksheet_to_dataframe"]
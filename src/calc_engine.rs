@@ -0,0 +1,230 @@
+//! Python binding for the native formula evaluator in
+//! [`wolfxl_formula::calc`].
+//!
+//! Public surface (Python, wrapped by `wolfxl.calc._native`):
+//!
+//! - `NativeCalcEngine()` — empty engine.
+//! - `engine.add_sheet(name)` → sheet index; sheets go in workbook order.
+//! - `engine.define_name(name, refers_to)`.
+//! - `engine.set_threads(n)` — evaluate wide dependency levels on up to
+//!   `n` threads; results do not depend on `n`.
+//! - `engine.set_cells(sheet, [(row, col, value), ...])` — 1-based
+//!   coordinates; a `str` starting with `=` is a formula, other values
+//!   are `None` / `bool` / `int` / `float` / `str`.
+//! - `engine.value(cell_ref)` — current value of a `Sheet!A1` cell.
+//! - `engine.unsupported()` → `[(cell_ref, reason), ...]` for formulas the
+//!   engine cannot evaluate.
+//! - `engine.calculate()` → `[(cell_ref, value), ...]` in evaluation order.
+//! - `engine.recalculate([(cell_ref, value), ...])` →
+//!   `([(cell_ref, old, new, formula), ...], max_depth)`.
+//! - `engine.evaluate_scenarios(inputs, rows, outputs)` →
+//!   `(outputs, [[value, ...], ...])`, leaving cell values unchanged.
+//!
+//! Evaluation runs with the GIL released. Error results come back as
+//! `wolfxl.calc._functions.ExcelError` instances.
+
+use pyo3::exceptions::{PyTypeError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::types::{PyBool, PyFloat, PyInt, PyString};
+use pyo3::IntoPyObjectExt;
+
+use wolfxl_formula::calc::{CellAddr, Engine, EngineError, Value};
+
+use crate::util::a1_to_row_col;
+
+type PyObject = Py<PyAny>;
+
+/// Native formula evaluator for one workbook.
+#[pyclass(module = "wolfxl._rust")]
+#[derive(Default)]
+pub struct NativeCalcEngine {
+    engine: Engine,
+}
+
+fn engine_error(err: EngineError) -> PyErr {
+    PyErr::new::<PyValueError, _>(err.to_string())
+}
+
+fn value_from_py(obj: &Bound<'_, PyAny>) -> PyResult<Value> {
+    if obj.is_none() {
+        Ok(Value::Empty)
+    } else if obj.is_instance_of::<PyBool>() {
+        Ok(Value::Bool(obj.extract()?))
+    } else if obj.is_instance_of::<PyInt>() || obj.is_instance_of::<PyFloat>() {
+        Ok(Value::Number(obj.extract()?))
+    } else if obj.is_instance_of::<PyString>() {
+        Ok(Value::Text(obj.extract()?))
+    } else {
+        Err(PyErr::new::<PyTypeError, _>(format!(
+            "unsupported cell value type: {}",
+            obj.get_type().name()?
+        )))
+    }
+}
+
+fn value_to_py(py: Python<'_>, value: &Value) -> PyResult<PyObject> {
+    match value {
+        Value::Empty => Ok(py.None()),
+        Value::Number(n) => (*n).into_py_any(py),
+        Value::Text(s) => s.as_str().into_py_any(py),
+        Value::Bool(b) => (*b).into_py_any(py),
+        Value::Error(e) => Ok(py
+            .import("wolfxl.calc._functions")?
+            .getattr("ExcelError")?
+            .call_method1("of", (e.code(),))?
+            .unbind()),
+    }
+}
+
+impl NativeCalcEngine {
+    /// Parse a canonical `Sheet!A1` reference.
+    fn addr(&self, cell_ref: &str) -> PyResult<CellAddr> {
+        let invalid =
+            || PyErr::new::<PyValueError, _>(format!("Invalid cell reference: {cell_ref}"));
+        let (sheet, a1) = cell_ref.rsplit_once('!').ok_or_else(invalid)?;
+        let sheet = self
+            .engine
+            .sheet_index(sheet.trim_matches('\''))
+            .ok_or_else(invalid)?;
+        let (row, col) = a1_to_row_col(&a1.replace('$', "")).map_err(|_| invalid())?;
+        Ok(CellAddr {
+            sheet,
+            row: row + 1,
+            col: col + 1,
+        })
+    }
+}
+
+#[pymethods]
+impl NativeCalcEngine {
+    #[new]
+    fn new() -> Self {
+        Self::default()
+    }
+
+    fn add_sheet(&mut self, name: &str) -> u32 {
+        self.engine.add_sheet(name)
+    }
+
+    fn define_name(&mut self, name: &str, refers_to: &str) {
+        self.engine.define_name(name, refers_to);
+    }
+
+    fn set_threads(&mut self, threads: usize) {
+        self.engine.set_threads(threads);
+    }
+
+    fn set_cells(&mut self, sheet: u32, cells: Vec<(u32, u32, Bound<'_, PyAny>)>) -> PyResult<()> {
+        if self.engine.sheet_name(sheet).is_none() {
+            return Err(PyErr::new::<PyValueError, _>(format!(
+                "Unknown sheet index: {sheet}"
+            )));
+        }
+        for (row, col, obj) in cells {
+            let addr = CellAddr { sheet, row, col };
+            match value_from_py(&obj)? {
+                Value::Text(text) if text.starts_with('=') => self.engine.set_formula(addr, &text),
+                value => self.engine.set_value(addr, value),
+            }
+        }
+        Ok(())
+    }
+
+    /// Current value of `cell_ref`.
+    fn value(&self, py: Python<'_>, cell_ref: &str) -> PyResult<PyObject> {
+        value_to_py(py, self.engine.value(&self.addr(cell_ref)?))
+    }
+
+    fn formula_count(&self) -> usize {
+        self.engine.formula_count()
+    }
+
+    fn unsupported(&self) -> Vec<(String, String)> {
+        self.engine
+            .unsupported()
+            .into_iter()
+            .map(|(addr, reason)| (self.engine.ref_string(&addr), reason))
+            .collect()
+    }
+
+    fn calculate(&mut self, py: Python<'_>) -> PyResult<Vec<(String, PyObject)>> {
+        let engine = &mut self.engine;
+        let results = py.detach(|| engine.calculate()).map_err(engine_error)?;
+        results
+            .iter()
+            .map(|(addr, value)| Ok((self.engine.ref_string(addr), value_to_py(py, value)?)))
+            .collect()
+    }
+
+    #[allow(clippy::type_complexity)]
+    fn recalculate(
+        &mut self,
+        py: Python<'_>,
+        changes: Vec<(String, Bound<'_, PyAny>)>,
+    ) -> PyResult<(Vec<(String, PyObject, PyObject, String)>, usize)> {
+        let changes = changes
+            .iter()
+            .map(|(cell_ref, obj)| Ok((self.addr(cell_ref)?, value_from_py(obj)?)))
+            .collect::<PyResult<Vec<_>>>()?;
+        let engine = &mut self.engine;
+        let recalc = py
+            .detach(|| engine.recalculate(&changes))
+            .map_err(engine_error)?;
+        let mut affected = Vec::with_capacity(recalc.affected.len());
+        for (addr, old, new) in &recalc.affected {
+            affected.push((
+                self.engine.ref_string(addr),
+                value_to_py(py, old)?,
+                value_to_py(py, new)?,
+                self.engine
+                    .formula_text(addr)
+                    .unwrap_or_default()
+                    .to_string(),
+            ));
+        }
+        Ok((affected, recalc.max_depth))
+    }
+
+    #[pyo3(signature = (inputs, scenarios, outputs=None))]
+    #[allow(clippy::type_complexity)]
+    fn evaluate_scenarios(
+        &mut self,
+        py: Python<'_>,
+        inputs: Vec<String>,
+        scenarios: Vec<Vec<Bound<'_, PyAny>>>,
+        outputs: Option<Vec<String>>,
+    ) -> PyResult<(Vec<String>, Vec<Vec<PyObject>>)> {
+        let inputs = inputs
+            .iter()
+            .map(|cell_ref| self.addr(cell_ref))
+            .collect::<PyResult<Vec<_>>>()?;
+        let rows = scenarios
+            .iter()
+            .map(|row| row.iter().map(value_from_py).collect::<PyResult<Vec<_>>>())
+            .collect::<PyResult<Vec<_>>>()?;
+        let outputs = outputs
+            .map(|refs| {
+                refs.iter()
+                    .map(|r| self.addr(r))
+                    .collect::<PyResult<Vec<_>>>()
+            })
+            .transpose()?;
+        let engine = &mut self.engine;
+        let (outputs, values) = py
+            .detach(|| engine.evaluate_scenarios(&inputs, &rows, outputs.as_deref()))
+            .map_err(engine_error)?;
+        let refs = outputs
+            .iter()
+            .map(|addr| self.engine.ref_string(addr))
+            .collect();
+        let values = values
+            .iter()
+            .map(|row| {
+                row.iter()
+                    .map(|v| value_to_py(py, v))
+                    .collect::<PyResult<Vec<_>>>()
+            })
+            .collect::<PyResult<Vec<_>>>()?;
+        Ok((refs, values))
+    }
+}
@@ -5,9 +5,11 @@ type PyObject = Py<PyAny>;
 
 mod atomic_save;
 mod calamine_xlsb_xls_backend;
+mod calc_engine;
 mod native_reader_backend;
 mod native_reader_cell_helpers;
 mod native_reader_cf;
+mod native_reader_columns;
 mod native_reader_comments;
 mod native_reader_dimensions;
 mod native_reader_drawings;
@@ -29,6 +31,7 @@ mod native_writer_autofilter;
 mod native_writer_backend;
 mod native_writer_cells;
 mod native_writer_charts;
+mod native_writer_columns;
 mod native_writer_formats;
 mod native_writer_images;
 mod native_writer_rich_text;
@@ -38,6 +41,7 @@ mod native_writer_streaming;
 mod native_writer_workbook;
 mod native_writer_workbook_metadata;
 mod ooxml_util;
+mod py_stream;
 mod streaming;
 mod util;
 mod wolfxl;
@@ -132,6 +136,7 @@ fn _rust(m: &Bound<'_, PyModule>) -> PyResult<()> {
         m
     )?)?;
     m.add_class::<streaming::StreamingSheetReader>()?;
+    m.add_class::<calc_engine::NativeCalcEngine>()?;
     m.add_class::<wolfxl::XlsxPatcher>()?;
     wolfxl_core_bridge::register(m)?;
     Ok(())
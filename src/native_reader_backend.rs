@@ -3,6 +3,14 @@
 //! (`ensure_sheet`, `resolve_window`, etc.) stay here because every feature
 //! module needs them. Feature payloads emit openpyxl-compatible dicts; keep
 //! new keys additive so older Python hydration can ignore unknown fields.
+//!
+//! Both book classes are `Send + Sync` so a handle can be handed to a worker
+//! thread, but use one handle per thread: reads fill the sheet caches through
+//! `&mut self`, and that borrow is held while the GIL is released. A second
+//! thread calling into the same handle mid-read gets PyO3's "Already
+//! borrowed" `RuntimeError`. Opening and sheet parsing (ZIP inflate + XML
+//! parse) run with the GIL released via [`NativeXlsxBook::prefetch_sheet`];
+//! only the final Python-object boxing holds it.
 
 use std::collections::HashMap;
 
@@ -14,26 +22,29 @@ type PyObject = Py<PyAny>;
 use crate::native_reader_dimensions::{parse_range_1based, update_bounds};
 use crate::util::a1_to_row_col;
 use wolfxl_reader::{
-    Cell, NativeXlsbBook as NativeXlsbReaderBook, NativeXlsxBook as NativeReaderBook, WorksheetData,
+    Cell, CellIndex, CompactCells, NativeXlsbBook as NativeXlsbReaderBook,
+    NativeXlsxBook as NativeReaderBook, ParseProfile, WorksheetData,
 };
 
-#[pyclass(unsendable, module = "wolfxl._rust")]
+#[pyclass(module = "wolfxl._rust")]
 pub struct NativeXlsxBook {
     pub(crate) book: NativeReaderBook,
     pub(crate) sheet_names: Vec<String>,
+    /// Parsed sheets with `cells` moved out into `sheet_cells`.
     pub(crate) sheet_cache: HashMap<String, WorksheetData>,
-    pub(crate) sheet_cell_indexes: HashMap<String, HashMap<(u32, u32), usize>>,
+    pub(crate) sheet_cells: HashMap<String, CompactCells>,
     pub(crate) sheet_merged_bounds: HashMap<String, Vec<(u32, u32, u32, u32)>>,
+    pub(crate) parse_profile: ParseProfile,
     pub(crate) opened_from_bytes: bool,
     pub(crate) source_path: Option<String>,
 }
 
-#[pyclass(unsendable, module = "wolfxl._rust")]
+#[pyclass(module = "wolfxl._rust")]
 pub struct NativeXlsbBook {
     pub(crate) book: NativeXlsbReaderBook,
     pub(crate) sheet_names: Vec<String>,
     pub(crate) sheet_cache: HashMap<String, WorksheetData>,
-    pub(crate) sheet_cell_indexes: HashMap<String, HashMap<(u32, u32), usize>>,
+    pub(crate) sheet_cell_indexes: HashMap<String, CellIndex>,
 }
 
 #[pymethods]
@@ -41,15 +52,15 @@ impl NativeXlsxBook {
     /// Open an XLSX/XLSM workbook from a filesystem path.
     #[staticmethod]
     #[pyo3(signature = (path, permissive = false))]
-    pub fn open(path: &str, permissive: bool) -> PyResult<Self> {
-        crate::native_reader_workbook_basics::open_xlsx_path(path, permissive)
+    pub fn open(py: Python<'_>, path: &str, permissive: bool) -> PyResult<Self> {
+        py.detach(|| crate::native_reader_workbook_basics::open_xlsx_path(path, permissive))
     }
 
     /// Open an XLSX/XLSM workbook from raw bytes.
     #[staticmethod]
     #[pyo3(signature = (data, permissive = false))]
-    pub fn open_from_bytes(data: &[u8], permissive: bool) -> PyResult<Self> {
-        crate::native_reader_workbook_basics::open_xlsx_bytes(data, permissive)
+    pub fn open_from_bytes(py: Python<'_>, data: &[u8], permissive: bool) -> PyResult<Self> {
+        py.detach(|| crate::native_reader_workbook_basics::open_xlsx_bytes(data, permissive))
     }
 
     pub fn sheet_names(&self) -> Vec<String> {
@@ -88,6 +99,18 @@ impl NativeXlsxBook {
         crate::native_reader_workbook_basics::read_print_titles_xlsx(self, py, sheet)
     }
 
+    /// Restrict what later sheet parses read: ``"values"``,
+    /// ``"values+styles"`` or ``"full"`` (the default). Sheets already
+    /// parsed keep their cached data.
+    pub fn set_parse_profile(&mut self, profile: &str) -> PyResult<()> {
+        self.parse_profile = ParseProfile::from_name(profile).ok_or_else(|| {
+            PyErr::new::<PyValueError, _>(format!(
+                "parse_profile must be 'values', 'values+styles' or 'full', got {profile:?}"
+            ))
+        })?;
+        Ok(())
+    }
+
     pub fn opened_from_bytes(&self) -> bool {
         self.opened_from_bytes
     }
@@ -115,6 +138,7 @@ impl NativeXlsxBook {
         a1: &str,
         data_only: bool,
     ) -> PyResult<PyObject> {
+        self.prefetch_sheet(py, sheet)?;
         crate::native_reader_sheet_data::read_cell_value_xlsx(self, py, sheet, a1, data_only)
     }
 
@@ -126,6 +150,7 @@ impl NativeXlsxBook {
         cell_range: Option<&str>,
         data_only: bool,
     ) -> PyResult<PyObject> {
+        self.prefetch_sheet(py, sheet)?;
         crate::native_reader_sheet_data::read_sheet_values_xlsx(
             self, py, sheet, cell_range, data_only,
         )
@@ -139,11 +164,28 @@ impl NativeXlsxBook {
         cell_range: Option<&str>,
         data_only: bool,
     ) -> PyResult<PyObject> {
+        self.prefetch_sheet(py, sheet)?;
         crate::native_reader_sheet_data::read_sheet_values_plain_xlsx(
             self, py, sheet, cell_range, data_only,
         )
     }
 
+    /// Typed column buffers for `cell_range`; see `native_reader_columns`.
+    #[pyo3(signature = (sheet, cell_range = None, data_only = false, columns = None))]
+    pub fn read_sheet_columns(
+        &mut self,
+        py: Python<'_>,
+        sheet: &str,
+        cell_range: Option<&str>,
+        data_only: bool,
+        columns: Option<Vec<u32>>,
+    ) -> PyResult<PyObject> {
+        self.prefetch_sheet(py, sheet)?;
+        crate::native_reader_columns::read_sheet_columns_xlsx(
+            self, py, sheet, cell_range, data_only, columns,
+        )
+    }
+
     #[pyo3(signature = (
         sheet,
         cell_range = None,
@@ -171,6 +213,7 @@ impl NativeXlsxBook {
         include_extended_format: bool,
         include_cached_formula_value: bool,
     ) -> PyResult<PyObject> {
+        self.prefetch_sheet(py, sheet)?;
         crate::native_reader_records::read_sheet_records_xlsx(
             self,
             py,
@@ -379,6 +422,16 @@ impl NativeXlsxBook {
     ) -> PyResult<PyObject> {
         crate::native_reader_styles::read_cell_border_xlsx(self, py, sheet, a1)
     }
+
+    /// Format payload for a cell style id, without touching any sheet.
+    pub fn read_style_format(&self, py: Python<'_>, style_id: u32) -> PyResult<PyObject> {
+        crate::native_reader_styles::read_style_format_xlsx(self, py, style_id)
+    }
+
+    /// Border payload for a cell style id, without touching any sheet.
+    pub fn read_style_border(&self, py: Python<'_>, style_id: u32) -> PyResult<PyObject> {
+        crate::native_reader_styles::read_style_border(&self.book, py, style_id)
+    }
 }
 
 #[pymethods]
@@ -386,15 +439,15 @@ impl NativeXlsbBook {
     /// Open an XLSB workbook from a filesystem path.
     #[staticmethod]
     #[pyo3(signature = (path, _permissive = false))]
-    pub fn open(path: &str, _permissive: bool) -> PyResult<Self> {
-        crate::native_reader_workbook_basics::open_xlsb_path(path)
+    pub fn open(py: Python<'_>, path: &str, _permissive: bool) -> PyResult<Self> {
+        py.detach(|| crate::native_reader_workbook_basics::open_xlsb_path(path))
     }
 
     /// Open an XLSB workbook from raw bytes.
     #[staticmethod]
     #[pyo3(signature = (data, _permissive = false))]
-    pub fn open_from_bytes(data: &[u8], _permissive: bool) -> PyResult<Self> {
-        crate::native_reader_workbook_basics::open_xlsb_bytes(data)
+    pub fn open_from_bytes(py: Python<'_>, data: &[u8], _permissive: bool) -> PyResult<Self> {
+        py.detach(|| crate::native_reader_workbook_basics::open_xlsb_bytes(data))
     }
 
     pub fn sheet_names(&self) -> Vec<String> {
@@ -520,6 +573,7 @@ impl NativeXlsbBook {
         a1: &str,
         data_only: bool,
     ) -> PyResult<PyObject> {
+        self.prefetch_sheet(py, sheet)?;
         crate::native_reader_sheet_data::read_cell_value_xlsb(self, py, sheet, a1, data_only)
     }
 
@@ -531,6 +585,7 @@ impl NativeXlsbBook {
         cell_range: Option<&str>,
         data_only: bool,
     ) -> PyResult<PyObject> {
+        self.prefetch_sheet(py, sheet)?;
         crate::native_reader_sheet_data::read_sheet_values_xlsb(
             self, py, sheet, cell_range, data_only,
         )
@@ -544,6 +599,7 @@ impl NativeXlsbBook {
         cell_range: Option<&str>,
         data_only: bool,
     ) -> PyResult<PyObject> {
+        self.prefetch_sheet(py, sheet)?;
         crate::native_reader_sheet_data::read_sheet_values_plain_xlsb(
             self, py, sheet, cell_range, data_only,
         )
@@ -576,6 +632,7 @@ impl NativeXlsbBook {
         include_extended_format: bool,
         include_cached_formula_value: bool,
     ) -> PyResult<PyObject> {
+        self.prefetch_sheet(py, sheet)?;
         crate::native_reader_records::read_sheet_records_xlsb(
             self,
             py,
@@ -651,11 +708,31 @@ impl NativeXlsbBook {
     ) -> PyResult<PyObject> {
         crate::native_reader_styles::read_cell_border_xlsb(self, py, sheet, a1)
     }
+
+    /// Format payload for a cell style id, without touching any sheet.
+    pub fn read_style_format(&self, py: Python<'_>, style_id: u32) -> PyResult<PyObject> {
+        crate::native_reader_styles::read_style_format_xlsb(self, py, style_id)
+    }
+
+    /// Border payload for a cell style id, without touching any sheet.
+    pub fn read_style_border(&self, py: Python<'_>, style_id: u32) -> PyResult<PyObject> {
+        crate::native_reader_styles::read_style_border(&self.book, py, style_id)
+    }
 }
 
 // ---------- Inherent helpers shared across feature modules ----------
 
 impl NativeXlsxBook {
+    /// Parse `sheet` and build its cell index with the GIL released, so other
+    /// Python threads keep running while the worksheet XML is inflated and
+    /// parsed. No-op once the sheet is cached.
+    pub(crate) fn prefetch_sheet(&mut self, py: Python<'_>, sheet: &str) -> PyResult<()> {
+        if self.sheet_merged_bounds.contains_key(sheet) {
+            return Ok(());
+        }
+        py.detach(|| self.ensure_sheet_indexes(sheet))
+    }
+
     pub(crate) fn ensure_sheet(&mut self, sheet: &str) -> PyResult<&WorksheetData> {
         if !self.sheet_names.iter().any(|name| name == sheet) {
             return Err(PyErr::new::<PyValueError, _>(format!(
@@ -663,37 +740,36 @@ impl NativeXlsxBook {
             )));
         }
         if !self.sheet_cache.contains_key(sheet) {
-            let data = self.book.worksheet(sheet).map_err(|e| {
-                PyErr::new::<PyIOError, _>(format!("native sheet read failed: {e}"))
-            })?;
+            let mut data = self
+                .book
+                .worksheet_with_profile(sheet, self.parse_profile)
+                .map_err(|e| {
+                    PyErr::new::<PyIOError, _>(format!("native sheet read failed: {e}"))
+                })?;
+            let cells = self.book.compact_cells(std::mem::take(&mut data.cells));
+            self.sheet_cells.insert(sheet.to_string(), cells);
             self.sheet_cache.insert(sheet.to_string(), data);
         }
         Ok(self.sheet_cache.get(sheet).unwrap())
     }
 
+    /// Cells of `sheet` in compact form; the cached `WorksheetData` keeps an
+    /// empty `cells` vector.
+    pub(crate) fn ensure_cells(&mut self, sheet: &str) -> PyResult<&CompactCells> {
+        self.ensure_sheet(sheet)?;
+        Ok(self.sheet_cells.get(sheet).unwrap())
+    }
+
     pub(crate) fn ensure_sheet_indexes(&mut self, sheet: &str) -> PyResult<()> {
-        if self.sheet_cell_indexes.contains_key(sheet)
-            && self.sheet_merged_bounds.contains_key(sheet)
-        {
+        if self.sheet_merged_bounds.contains_key(sheet) {
             return Ok(());
         }
-        let (cell_index, merged_bounds) = {
-            let data = self.ensure_sheet(sheet)?;
-            let cell_index = data
-                .cells
-                .iter()
-                .enumerate()
-                .map(|(idx, cell)| ((cell.row, cell.col), idx))
-                .collect();
-            let merged_bounds = data
-                .merged_ranges
-                .iter()
-                .filter_map(|range| parse_range_1based(range))
-                .collect();
-            (cell_index, merged_bounds)
-        };
-        self.sheet_cell_indexes
-            .insert(sheet.to_string(), cell_index);
+        let merged_bounds = self
+            .ensure_sheet(sheet)?
+            .merged_ranges
+            .iter()
+            .filter_map(|range| parse_range_1based(range))
+            .collect();
         self.sheet_merged_bounds
             .insert(sheet.to_string(), merged_bounds);
         Ok(())
@@ -703,10 +779,12 @@ impl NativeXlsxBook {
         &mut self,
         sheet: &str,
     ) -> PyResult<Option<(u32, u32, u32, u32)>> {
-        let data = self.ensure_sheet(sheet)?;
+        self.ensure_sheet(sheet)?;
+        let data = &self.sheet_cache[sheet];
+        let cells = &self.sheet_cells[sheet];
         let mut bounds: Option<(u32, u32, u32, u32)> = None;
-        for cell in &data.cells {
-            update_bounds(&mut bounds, cell.row, cell.col);
+        for pos in 0..cells.len() {
+            update_bounds(&mut bounds, cells.row(pos), cells.col(pos));
         }
         for range in &data.merged_ranges {
             if let Some((min_row, min_col, max_row, max_col)) = parse_range_1based(range) {
@@ -742,6 +820,14 @@ impl NativeXlsxBook {
 }
 
 impl NativeXlsbBook {
+    /// GIL-released sheet parse; see [`NativeXlsxBook::prefetch_sheet`].
+    pub(crate) fn prefetch_sheet(&mut self, py: Python<'_>, sheet: &str) -> PyResult<()> {
+        if self.sheet_cell_indexes.contains_key(sheet) {
+            return Ok(());
+        }
+        py.detach(|| self.ensure_sheet_indexes(sheet))
+    }
+
     pub(crate) fn ensure_sheet(&mut self, sheet: &str) -> PyResult<&WorksheetData> {
         if !self.sheet_names.iter().any(|name| name == sheet) {
             return Err(PyErr::new::<PyValueError, _>(format!(
@@ -761,13 +847,7 @@ impl NativeXlsbBook {
         if self.sheet_cell_indexes.contains_key(sheet) {
             return Ok(());
         }
-        let cell_index = self
-            .ensure_sheet(sheet)?
-            .cells
-            .iter()
-            .enumerate()
-            .map(|(idx, cell)| ((cell.row, cell.col), idx))
-            .collect();
+        let cell_index = CellIndex::from_cells(&self.ensure_sheet(sheet)?.cells);
         self.sheet_cell_indexes
             .insert(sheet.to_string(), cell_index);
         Ok(())
@@ -822,8 +902,7 @@ impl NativeXlsbBook {
         let index = self
             .sheet_cell_indexes
             .get(sheet)
-            .and_then(|cells| cells.get(&(row, col)))
-            .copied();
+            .and_then(|cells| cells.get(row, col));
         let data = self.ensure_sheet(sheet)?;
         Ok(index.and_then(|idx| data.cells[idx].style_id))
     }
@@ -0,0 +1,299 @@
+//! Columnar sheet export for `read_sheet_columns` (xlsx).
+//!
+//! Each requested column is typed from the cells it holds and packed into a
+//! flat buffer (`f64` / `i64` / `u8` values, or Arrow-style `i64` offsets plus
+//! UTF-8 data for strings) alongside an Arrow LSB validity bitmap. Buffers are
+//! built with the GIL released and handed to Python as `bytes`, which
+//! `numpy.frombuffer` and `pyarrow.py_buffer` wrap without copying. Only
+//! columns mixing incompatible kinds fall back to Python objects.
+
+use std::collections::HashMap;
+
+use chrono::NaiveDate;
+use pyo3::prelude::*;
+use pyo3::types::{PyBytes, PyDict, PyList};
+
+use wolfxl_reader::{CellValue, CompactCells};
+
+use crate::native_reader_backend::NativeXlsxBook;
+use crate::native_reader_cell_helpers::{
+    cell_to_plain, ensure_formula_prefix, excel_serial_to_datetime, is_date_format,
+};
+
+type PyObject = Py<PyAny>;
+
+/// Storage chosen for one exported column.
+#[derive(Clone, Copy, PartialEq, Eq, Debug)]
+enum ColumnKind {
+    Null,
+    Int64,
+    Float64,
+    Bool,
+    Datetime,
+    String,
+    Object,
+}
+
+impl ColumnKind {
+    fn label(self) -> &'static str {
+        match self {
+            ColumnKind::Null => "null",
+            ColumnKind::Int64 => "int64",
+            ColumnKind::Float64 => "float64",
+            ColumnKind::Bool => "bool",
+            ColumnKind::Datetime => "datetime64[ms]",
+            ColumnKind::String => "string",
+            ColumnKind::Object => "object",
+        }
+    }
+
+    /// Widen `self` so it can also hold a value of kind `other`.
+    fn merge(self, other: ColumnKind) -> ColumnKind {
+        use ColumnKind::*;
+        match (self, other) {
+            (a, b) if a == b => a,
+            (Null, b) => b,
+            (a, Null) => a,
+            (Int64, Float64) | (Float64, Int64) => Float64,
+            _ => Object,
+        }
+    }
+}
+
+/// One cell reduced to what column typing needs.
+enum Slot {
+    Missing,
+    Number(f64),
+    Date(f64),
+    Bool(bool),
+    Text(String),
+}
+
+impl Slot {
+    fn kind(&self) -> ColumnKind {
+        match self {
+            Slot::Missing => ColumnKind::Null,
+            Slot::Number(n) if n.fract() == 0.0 && n.abs() < 9.007_199_254_740_992e15 => {
+                ColumnKind::Int64
+            }
+            Slot::Number(_) => ColumnKind::Float64,
+            Slot::Date(_) => ColumnKind::Datetime,
+            Slot::Bool(_) => ColumnKind::Bool,
+            Slot::Text(_) => ColumnKind::String,
+        }
+    }
+}
+
+/// Typed buffers for one column, built without the GIL.
+struct ColumnBuffers {
+    kind: ColumnKind,
+    nulls: usize,
+    data: Vec<u8>,
+    offsets: Vec<u8>,
+    validity: Vec<u8>,
+    /// Cell positions for `Object` columns, converted under the GIL.
+    positions: Vec<Option<usize>>,
+}
+
+struct ColumnBuilder<'a> {
+    cells: &'a CompactCells,
+    book: &'a NativeXlsxBook,
+    data_only: bool,
+    date1904: bool,
+    date_styles: HashMap<u32, bool>,
+}
+
+impl ColumnBuilder<'_> {
+    fn slot(&mut self, pos: Option<usize>) -> Slot {
+        let Some(pos) = pos else {
+            return Slot::Missing;
+        };
+        let cells = self.cells;
+        if !self.data_only {
+            if let Some(formula) = cells.formula(pos) {
+                return Slot::Text(ensure_formula_prefix(formula));
+            }
+        }
+        match cells.value(pos) {
+            CellValue::Empty => Slot::Missing,
+            CellValue::Number(n) if self.is_date_style(cells.style_id(pos)) => Slot::Date(n),
+            CellValue::Number(n) => Slot::Number(n),
+            CellValue::Bool(b) => Slot::Bool(b),
+            CellValue::String(s) | CellValue::Error(s) => Slot::Text(s),
+        }
+    }
+
+    fn is_date_style(&mut self, style_id: Option<u32>) -> bool {
+        let Some(style_id) = style_id else {
+            return false;
+        };
+        let book = self.book;
+        *self.date_styles.entry(style_id).or_insert_with(|| {
+            is_date_format(book.book.number_format_for_style_id(style_id))
+        })
+    }
+
+    fn column(&mut self, col: u32, min_row: u32, max_row: u32) -> ColumnBuffers {
+        let len = (max_row - min_row + 1) as usize;
+        let positions: Vec<Option<usize>> = (min_row..=max_row)
+            .map(|row| self.cells.find(row, col))
+            .collect();
+        let slots: Vec<Slot> = positions.iter().map(|pos| self.slot(*pos)).collect();
+        let kind = slots
+            .iter()
+            .fold(ColumnKind::Null, |kind, slot| kind.merge(slot.kind()));
+        let nulls = slots.iter().filter(|slot| matches!(slot, Slot::Missing)).count();
+        let kind = if kind == ColumnKind::Int64 && nulls > 0 {
+            ColumnKind::Float64
+        } else {
+            kind
+        };
+
+        let mut validity = vec![0u8; len.div_ceil(8)];
+        for (idx, slot) in slots.iter().enumerate() {
+            if !matches!(slot, Slot::Missing) {
+                validity[idx / 8] |= 1 << (idx % 8);
+            }
+        }
+        let mut buffers = ColumnBuffers {
+            kind,
+            nulls,
+            data: Vec::new(),
+            offsets: Vec::new(),
+            validity,
+            positions: Vec::new(),
+        };
+        match kind {
+            ColumnKind::Null => {}
+            ColumnKind::Int64 => {
+                buffers.data.reserve(len * 8);
+                for slot in &slots {
+                    let value = match slot {
+                        Slot::Number(n) => *n as i64,
+                        _ => 0,
+                    };
+                    buffers.data.extend_from_slice(&value.to_ne_bytes());
+                }
+            }
+            ColumnKind::Float64 => {
+                buffers.data.reserve(len * 8);
+                for slot in &slots {
+                    let value = match slot {
+                        Slot::Number(n) => *n,
+                        _ => f64::NAN,
+                    };
+                    buffers.data.extend_from_slice(&value.to_ne_bytes());
+                }
+            }
+            ColumnKind::Bool => {
+                buffers.data = slots
+                    .iter()
+                    .map(|slot| matches!(slot, Slot::Bool(true)) as u8)
+                    .collect();
+            }
+            ColumnKind::Datetime => {
+                let unix_epoch = NaiveDate::from_ymd_opt(1970, 1, 1)
+                    .unwrap()
+                    .and_hms_opt(0, 0, 0)
+                    .unwrap();
+                buffers.data.reserve(len * 8);
+                for slot in &slots {
+                    // i64::MIN is NumPy's NaT; Arrow masks it via the bitmap.
+                    let millis = match slot {
+                        Slot::Date(serial) => (excel_serial_to_datetime(*serial, self.date1904)
+                            - unix_epoch)
+                            .num_milliseconds(),
+                        _ => i64::MIN,
+                    };
+                    buffers.data.extend_from_slice(&millis.to_ne_bytes());
+                }
+            }
+            ColumnKind::String => {
+                buffers.offsets.reserve((len + 1) * 8);
+                buffers.offsets.extend_from_slice(&0i64.to_ne_bytes());
+                for slot in &slots {
+                    if let Slot::Text(text) = slot {
+                        buffers.data.extend_from_slice(text.as_bytes());
+                    }
+                    let end = buffers.data.len() as i64;
+                    buffers.offsets.extend_from_slice(&end.to_ne_bytes());
+                }
+            }
+            ColumnKind::Object => buffers.positions = positions,
+        }
+        buffers
+    }
+}
+
+pub(crate) fn read_sheet_columns_xlsx(
+    book: &mut NativeXlsxBook,
+    py: Python<'_>,
+    sheet: &str,
+    cell_range: Option<&str>,
+    data_only: bool,
+    columns: Option<Vec<u32>>,
+) -> PyResult<PyObject> {
+    let Some((min_row, min_col, max_row, max_col)) = book.resolve_window(sheet, cell_range)?
+    else {
+        return Ok(PyList::empty(py).into());
+    };
+    book.ensure_sheet(sheet)?;
+    let columns = columns.unwrap_or_else(|| (min_col..=max_col).collect());
+    let book: &NativeXlsxBook = book;
+    let cells = &book.sheet_cells[sheet];
+    let date1904 = book.book.date1904();
+
+    let built: Vec<ColumnBuffers> = py.detach(|| {
+        let mut builder = ColumnBuilder {
+            cells,
+            book,
+            data_only,
+            date1904,
+            date_styles: HashMap::new(),
+        };
+        columns
+            .iter()
+            .map(|&col| builder.column(col, min_row, max_row))
+            .collect()
+    });
+
+    let length = (max_row - min_row + 1) as usize;
+    let out = PyList::empty(py);
+    for (col, buffers) in columns.iter().zip(built) {
+        let d = PyDict::new(py);
+        d.set_item("column", *col)?;
+        d.set_item("kind", buffers.kind.label())?;
+        d.set_item("length", length)?;
+        d.set_item("null_count", buffers.nulls)?;
+        d.set_item("validity", PyBytes::new(py, &buffers.validity))?;
+        match buffers.kind {
+            ColumnKind::Object => {
+                let values = PyList::empty(py);
+                for pos in buffers.positions {
+                    match pos {
+                        Some(pos) => {
+                            let cell = cells.cell(pos);
+                            let number_format = book.number_format_for_cell(&cell);
+                            values.append(cell_to_plain(
+                                py,
+                                &cell,
+                                data_only,
+                                number_format,
+                                date1904,
+                            )?)?;
+                        }
+                        None => values.append(py.None())?,
+                    }
+                }
+                d.set_item("values", values)?;
+            }
+            ColumnKind::String => {
+                d.set_item("offsets", PyBytes::new(py, &buffers.offsets))?;
+                d.set_item("data", PyBytes::new(py, &buffers.data))?;
+            }
+            _ => d.set_item("data", PyBytes::new(py, &buffers.data))?,
+        }
+        out.append(d)?;
+    }
+    Ok(out.into())
+}
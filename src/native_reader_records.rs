@@ -44,17 +44,12 @@ pub(crate) fn read_sheet_records_xlsx(
 ) -> PyResult<PyObject> {
     let window = book.resolve_window(sheet, cell_range)?;
     book.ensure_sheet_indexes(sheet)?;
-    let cell_index = book
-        .sheet_cell_indexes
-        .get(sheet)
-        .cloned()
-        .unwrap_or_default();
     let merged_bounds = book
         .sheet_merged_bounds
         .get(sheet)
         .cloned()
         .unwrap_or_default();
-    let data = book.ensure_sheet(sheet)?.clone();
+    let cells = &book.sheet_cells[sheet];
     let options = NativeRecordOptions {
         data_only,
         include_format,
@@ -71,12 +66,13 @@ pub(crate) fn read_sheet_records_xlsx(
         if let Some((min_row, min_col, max_row, max_col)) = window {
             for row in min_row..=max_row {
                 for col in min_col..=max_col {
+                    let cell = cells.find(row, col).map(|pos| cells.cell(pos));
                     append_native_record(
                         py,
                         &out,
                         &book.book,
                         &merged_bounds,
-                        cell_index.get(&(row, col)).map(|idx| &data.cells[*idx]),
+                        cell.as_ref(),
                         row,
                         col,
                         options,
@@ -87,14 +83,15 @@ pub(crate) fn read_sheet_records_xlsx(
         }
     }
 
-    for cell in &data.cells {
+    for pos in 0..cells.len() {
         if let Some((min_row, min_col, max_row, max_col)) = window {
-            if cell.row < min_row || cell.row > max_row || cell.col < min_col || cell.col > max_col
-            {
+            let (row, col) = (cells.row(pos), cells.col(pos));
+            if row < min_row || row > max_row || col < min_col || col > max_col {
                 continue;
             }
         }
-        if !native_record_should_emit(cell, options) {
+        let cell = cells.cell(pos);
+        if !native_record_should_emit(&cell, options) {
             continue;
         }
         append_native_record(
@@ -102,7 +99,7 @@ pub(crate) fn read_sheet_records_xlsx(
             &out,
             &book.book,
             &merged_bounds,
-            Some(cell),
+            Some(&cell),
             cell.row,
             cell.col,
             options,
@@ -128,12 +125,8 @@ pub(crate) fn read_sheet_records_xlsb(
 ) -> PyResult<PyObject> {
     let window = book.resolve_window(sheet, cell_range)?;
     book.ensure_sheet_indexes(sheet)?;
-    let cell_index = book
-        .sheet_cell_indexes
-        .get(sheet)
-        .cloned()
-        .unwrap_or_default();
-    let data = book.ensure_sheet(sheet)?.clone();
+    let cell_index = &book.sheet_cell_indexes[sheet];
+    let data = &book.sheet_cache[sheet];
     let options = NativeRecordOptions {
         data_only,
         include_format,
@@ -154,7 +147,7 @@ pub(crate) fn read_sheet_records_xlsb(
                         &out,
                         &book.book,
                         &[],
-                        cell_index.get(&(row, col)).map(|idx| &data.cells[*idx]),
+                        cell_index.get(row, col).map(|idx| &data.cells[idx]),
                         row,
                         col,
                         options,
@@ -28,14 +28,8 @@ pub(crate) fn read_cell_value_xlsx(
     let row = row0 + 1;
     let col = col0 + 1;
     let cell = {
-        book.ensure_sheet_indexes(sheet)?;
-        let index = book
-            .sheet_cell_indexes
-            .get(sheet)
-            .and_then(|cells| cells.get(&(row, col)))
-            .copied();
-        let data = book.ensure_sheet(sheet)?;
-        index.map(|idx| data.cells[idx].clone())
+        let cells = book.ensure_cells(sheet)?;
+        cells.find(row, col).map(|pos| cells.cell(pos))
     };
     let Some(cell) = cell else {
         return cell_blank(py);
@@ -59,8 +53,7 @@ pub(crate) fn read_cell_value_xlsb(
         let index = book
             .sheet_cell_indexes
             .get(sheet)
-            .and_then(|cells| cells.get(&(row, col)))
-            .copied();
+            .and_then(|cells| cells.get(row, col));
         let data = book.ensure_sheet(sheet)?;
         index.map(|idx| data.cells[idx].clone())
     };
@@ -84,21 +77,16 @@ pub(crate) fn read_sheet_values_xlsx(
         Some(bounds) => bounds,
         None => return Ok(PyList::empty(py).into()),
     };
-    book.ensure_sheet_indexes(sheet)?;
-    let cell_index = book
-        .sheet_cell_indexes
-        .get(sheet)
-        .cloned()
-        .unwrap_or_default();
-    let cells = book.ensure_sheet(sheet)?.cells.clone();
+    book.ensure_sheet(sheet)?;
+    let cells = &book.sheet_cells[sheet];
     let outer = PyList::empty(py);
     let date1904 = book.book.date1904();
     for row in min_row..=max_row {
         let inner = PyList::empty(py);
         for col in min_col..=max_col {
-            if let Some(cell) = cell_index.get(&(row, col)).map(|idx| &cells[*idx]) {
-                let number_format = book.number_format_for_cell(cell);
-                inner.append(cell_to_dict(py, cell, data_only, number_format, date1904)?)?;
+            if let Some(cell) = cells.find(row, col).map(|pos| cells.cell(pos)) {
+                let number_format = book.number_format_for_cell(&cell);
+                inner.append(cell_to_dict(py, &cell, data_only, number_format, date1904)?)?;
             } else {
                 inner.append(cell_blank(py)?)?;
             }
@@ -120,24 +108,17 @@ pub(crate) fn read_sheet_values_xlsb(
         return Ok(PyList::empty(py).into());
     };
     book.ensure_sheet_indexes(sheet)?;
-    let cell_index = book
-        .sheet_cell_indexes
-        .get(sheet)
-        .cloned()
-        .unwrap_or_default();
-    let data = book.ensure_sheet(sheet)?.clone();
+    let cell_index = &book.sheet_cell_indexes[sheet];
+    let data = &book.sheet_cache[sheet];
     let date1904 = book.book.date1904();
     let outer = PyList::empty(py);
     for row in min_row..=max_row {
         let inner = PyList::empty(py);
         for col in min_col..=max_col {
-            let cell = cell_index
-                .get(&(row, col))
-                .map(|idx| data.cells[*idx].clone());
-            match cell {
+            match cell_index.get(row, col).map(|idx| &data.cells[idx]) {
                 Some(cell) => {
-                    let number_format = book.number_format_for_cell(&cell);
-                    inner.append(cell_to_dict(py, &cell, data_only, number_format, date1904)?)?;
+                    let number_format = book.number_format_for_cell(cell);
+                    inner.append(cell_to_dict(py, cell, data_only, number_format, date1904)?)?;
                 }
                 None => inner.append(cell_blank(py)?)?,
             }
@@ -158,21 +139,16 @@ pub(crate) fn read_sheet_values_plain_xlsx(
         Some(bounds) => bounds,
         None => return Ok(PyList::empty(py).into()),
     };
-    book.ensure_sheet_indexes(sheet)?;
-    let cell_index = book
-        .sheet_cell_indexes
-        .get(sheet)
-        .cloned()
-        .unwrap_or_default();
-    let cells = book.ensure_sheet(sheet)?.cells.clone();
+    book.ensure_sheet(sheet)?;
+    let cells = &book.sheet_cells[sheet];
     let date1904 = book.book.date1904();
     let outer = PyList::empty(py);
     for row in min_row..=max_row {
         let inner = PyList::empty(py);
         for col in min_col..=max_col {
-            if let Some(cell) = cell_index.get(&(row, col)).map(|idx| &cells[*idx]) {
-                let number_format = book.number_format_for_cell(cell);
-                inner.append(cell_to_plain(py, cell, data_only, number_format, date1904)?)?;
+            if let Some(cell) = cells.find(row, col).map(|pos| cells.cell(pos)) {
+                let number_format = book.number_format_for_cell(&cell);
+                inner.append(cell_to_plain(py, &cell, data_only, number_format, date1904)?)?;
             } else {
                 inner.append(py.None())?;
             }
@@ -194,30 +170,17 @@ pub(crate) fn read_sheet_values_plain_xlsb(
         return Ok(PyList::empty(py).into());
     };
     book.ensure_sheet_indexes(sheet)?;
-    let cell_index = book
-        .sheet_cell_indexes
-        .get(sheet)
-        .cloned()
-        .unwrap_or_default();
-    let data = book.ensure_sheet(sheet)?.clone();
+    let cell_index = &book.sheet_cell_indexes[sheet];
+    let data = &book.sheet_cache[sheet];
     let date1904 = book.book.date1904();
     let outer = PyList::empty(py);
     for row in min_row..=max_row {
         let inner = PyList::empty(py);
         for col in min_col..=max_col {
-            let cell = cell_index
-                .get(&(row, col))
-                .map(|idx| data.cells[*idx].clone());
-            match cell {
+            match cell_index.get(row, col).map(|idx| &data.cells[idx]) {
                 Some(cell) => {
-                    let number_format = book.number_format_for_cell(&cell);
-                    inner.append(cell_to_plain(
-                        py,
-                        &cell,
-                        data_only,
-                        number_format,
-                        date1904,
-                    )?)?;
+                    let number_format = book.number_format_for_cell(cell);
+                    inner.append(cell_to_plain(py, cell, data_only, number_format, date1904)?)?;
                 }
                 None => inner.append(py.None())?,
             }
@@ -233,14 +196,13 @@ pub(crate) fn read_sheet_formulas_xlsx(
     book: &mut NativeXlsxBook,
     sheet: &str,
 ) -> PyResult<HashMap<(u32, u32), String>> {
-    let data = book.ensure_sheet(sheet)?;
-    Ok(data
-        .cells
-        .iter()
-        .filter_map(|c| {
-            c.formula
-                .as_ref()
-                .map(|f| ((c.row - 1, c.col - 1), f.clone()))
+    let cells = book.ensure_cells(sheet)?;
+    Ok(cells
+        .formula_positions()
+        .filter_map(|pos| {
+            cells
+                .formula(pos)
+                .map(|f| ((cells.row(pos) - 1, cells.col(pos) - 1), f.to_string()))
         })
         .collect())
 }
@@ -270,13 +232,13 @@ pub(crate) fn read_cell_formula_xlsx(
     let (row0, col0) = a1_to_row_col(a1).map_err(|msg| PyErr::new::<PyValueError, _>(msg))?;
     let row = row0 + 1;
     let col = col0 + 1;
-    let formula = book
-        .ensure_sheet(sheet)?
-        .cells
-        .iter()
-        .find(|cell| cell.row == row && cell.col == col)
-        .and_then(|cell| cell.formula.as_deref())
-        .map(str::to_string);
+    let formula = {
+        let cells = book.ensure_cells(sheet)?;
+        cells
+            .find(row, col)
+            .and_then(|pos| cells.formula(pos))
+            .map(str::to_string)
+    };
     match formula {
         Some(formula) => formula_to_py(py, &formula),
         None => Ok(py.None()),
@@ -288,17 +250,17 @@ pub(crate) fn read_cached_formula_values_xlsx(
     py: Python<'_>,
     sheet: &str,
 ) -> PyResult<PyObject> {
-    let cells = book.ensure_sheet(sheet)?.cells.clone();
+    book.ensure_sheet(sheet)?;
+    let cells = &book.sheet_cells[sheet];
     let date1904 = book.book.date1904();
     let out = PyDict::new(py);
-    for cell in &cells {
-        if cell.formula.is_some() {
-            let number_format = book.number_format_for_cell(cell);
-            out.set_item(
-                &cell.coordinate,
-                cell_to_plain(py, cell, true, number_format, date1904)?,
-            )?;
-        }
+    for pos in cells.formula_positions() {
+        let cell = cells.cell(pos);
+        let number_format = book.number_format_for_cell(&cell);
+        out.set_item(
+            &cell.coordinate,
+            cell_to_plain(py, &cell, true, number_format, date1904)?,
+        )?;
     }
     Ok(out.into())
 }
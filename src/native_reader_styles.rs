@@ -15,10 +15,6 @@ use crate::native_reader_dimensions::{is_merged_subordinate, row_col_to_a1_1base
 use crate::native_reader_traits::NativeStyleResolver;
 use crate::util::a1_to_row_col;
 
-// Silence unused-import lint when the trait is referenced only transitively.
-#[allow(dead_code)]
-fn _trait_marker<T: NativeStyleResolver>(_: &T) {}
-
 type PyObject = Py<PyAny>;
 
 // ---------- Rich text ----------
@@ -33,11 +29,11 @@ pub(crate) fn read_cell_rich_text_xlsx(
     let row = row0 + 1;
     let col = col0 + 1;
     let runs = {
-        let data = book.ensure_sheet(sheet)?;
-        data.cells
-            .iter()
-            .find(|c| c.row == row && c.col == col)
-            .and_then(|cell| cell.rich_text.clone())
+        let cells = book.ensure_cells(sheet)?;
+        cells
+            .find(row, col)
+            .and_then(|pos| cells.rich_text(pos))
+            .map(<[_]>::to_vec)
     };
     serialize_rich_text(py, runs)
 }
@@ -264,38 +260,12 @@ pub(crate) fn read_cell_format_xlsx(
         ) {
             return Ok(PyDict::new(py).into());
         }
-        let index = book
-            .sheet_cell_indexes
-            .get(sheet)
-            .and_then(|cells| cells.get(&(row, col)))
-            .copied();
-        let data = book.ensure_sheet(sheet)?;
-        index.and_then(|idx| data.cells[idx].style_id)
+        let cells = book.ensure_cells(sheet)?;
+        cells.find(row, col).and_then(|pos| cells.style_id(pos))
     };
     let d = PyDict::new(py);
-    if let Some(style_id) = style_id {
-        if style_id == 0 {
-            return Ok(d.into());
-        }
-        if let Some(font) = book.book.font_for_style_id(style_id) {
-            populate_font(&d, font)?;
-        }
-        if let Some(fill) = book.book.fill_for_style_id(style_id) {
-            populate_fill(&d, fill)?;
-        }
-        if let Some(number_format) = book.book.number_format_for_style_id(style_id) {
-            d.set_item("number_format", number_format)?;
-        }
-        if let Some(alignment) = book.book.alignment_for_style_id(style_id) {
-            populate_alignment(&d, alignment)?;
-        }
-        if let Some(protection) = book.book.protection_for_style_id(style_id) {
-            d.set_item("locked", protection.locked)?;
-            d.set_item("hidden", protection.hidden)?;
-        }
-        if let Some(name) = book.book.named_style_for_style_id(style_id) {
-            d.set_item("named_style", name)?;
-        }
+    if let Some(style_id) = style_id.filter(|&id| id != 0) {
+        populate_style_format(&book.book, &d, style_id)?;
     }
     Ok(d.into())
 }
@@ -309,26 +279,66 @@ pub(crate) fn read_cell_format_xlsb(
     let style_id = book.style_id_for_a1(sheet, a1)?;
     let d = PyDict::new(py);
     if let Some(style_id) = style_id {
-        if let Some(font) = book.book.font_for_style_id(style_id) {
-            populate_font(&d, font)?;
-        }
-        if let Some(fill) = book.book.fill_for_style_id(style_id) {
-            populate_fill(&d, fill)?;
-        }
-        if let Some(number_format) = book.book.number_format_for_style_id(style_id) {
-            d.set_item("number_format", number_format)?;
-        }
-        if let Some(alignment) = book.book.alignment_for_style_id(style_id) {
-            populate_alignment(&d, alignment)?;
-        }
-        if let Some(protection) = book.book.protection_for_style_id(style_id) {
-            d.set_item("locked", protection.locked)?;
-            d.set_item("hidden", protection.hidden)?;
-        }
+        populate_style_format(&book.book, &d, style_id)?;
+    }
+    Ok(d.into())
+}
+
+/// Format payload for `style_id` itself, in the shape `read_cell_format`
+/// returns for a cell carrying that id.
+///
+/// Streaming readers already know each cell's style id, so resolving it
+/// directly skips the per-sheet cell index `read_cell_format` builds.
+/// Style id 0 (the default `xf`) resolves to an empty payload on xlsx.
+pub(crate) fn read_style_format_xlsx(
+    book: &NativeXlsxBook,
+    py: Python<'_>,
+    style_id: u32,
+) -> PyResult<PyObject> {
+    let d = PyDict::new(py);
+    if style_id != 0 {
+        populate_style_format(&book.book, &d, style_id)?;
     }
     Ok(d.into())
 }
 
+pub(crate) fn read_style_format_xlsb(
+    book: &NativeXlsbBook,
+    py: Python<'_>,
+    style_id: u32,
+) -> PyResult<PyObject> {
+    let d = PyDict::new(py);
+    populate_style_format(&book.book, &d, style_id)?;
+    Ok(d.into())
+}
+
+fn populate_style_format<B: NativeStyleResolver>(
+    book: &B,
+    d: &Bound<'_, PyDict>,
+    style_id: u32,
+) -> PyResult<()> {
+    if let Some(font) = book.font_for_style_id(style_id) {
+        populate_font(d, font)?;
+    }
+    if let Some(fill) = book.fill_for_style_id(style_id) {
+        populate_fill(d, fill)?;
+    }
+    if let Some(number_format) = book.number_format_for_style_id(style_id) {
+        d.set_item("number_format", number_format)?;
+    }
+    if let Some(alignment) = book.alignment_for_style_id(style_id) {
+        populate_alignment(d, alignment)?;
+    }
+    if let Some(protection) = book.protection_for_style_id(style_id) {
+        d.set_item("locked", protection.locked)?;
+        d.set_item("hidden", protection.hidden)?;
+    }
+    if let Some(name) = book.named_style_for_style_id(style_id) {
+        d.set_item("named_style", name)?;
+    }
+    Ok(())
+}
+
 // ---------- Cell border ----------
 
 pub(crate) fn read_cell_border_xlsx(
@@ -352,13 +362,8 @@ pub(crate) fn read_cell_border_xlsx(
         ) {
             return Ok(PyDict::new(py).into());
         }
-        let index = book
-            .sheet_cell_indexes
-            .get(sheet)
-            .and_then(|cells| cells.get(&(row, col)))
-            .copied();
-        let data = book.ensure_sheet(sheet)?;
-        index.and_then(|idx| data.cells[idx].style_id)
+        let cells = book.ensure_cells(sheet)?;
+        cells.find(row, col).and_then(|pos| cells.style_id(pos))
     };
     let d = PyDict::new(py);
     if let Some(border) = style_id.and_then(|id| book.book.border_for_style_id(id)) {
@@ -383,6 +388,19 @@ pub(crate) fn read_cell_border_xlsb(
     Ok(d.into())
 }
 
+/// Border payload for `style_id`, as `read_cell_border` returns it.
+pub(crate) fn read_style_border<B: NativeStyleResolver>(
+    book: &B,
+    py: Python<'_>,
+    style_id: u32,
+) -> PyResult<PyObject> {
+    let d = PyDict::new(py);
+    if let Some(border) = book.border_for_style_id(style_id) {
+        populate_border(py, &d, border)?;
+    }
+    Ok(d.into())
+}
+
 // ---------- Style populators ----------
 
 pub(crate) fn populate_font(d: &Bound<'_, PyDict>, font: &FontInfo) -> PyResult<()> {
@@ -8,7 +8,8 @@ use pyo3::prelude::*;
 use pyo3::types::PyDict;
 
 use wolfxl_reader::{
-    NativeXlsbBook as NativeXlsbReaderBook, NativeXlsxBook as NativeReaderBook, SheetState,
+    NativeXlsbBook as NativeXlsbReaderBook, NativeXlsxBook as NativeReaderBook, ParseProfile,
+    SheetState,
 };
 
 use crate::native_reader_backend::{NativeXlsbBook, NativeXlsxBook};
@@ -23,8 +24,9 @@ pub(crate) fn open_xlsx_path(path: &str, permissive: bool) -> PyResult<NativeXls
         book,
         sheet_names,
         sheet_cache: HashMap::new(),
-        sheet_cell_indexes: HashMap::new(),
+        sheet_cells: HashMap::new(),
         sheet_merged_bounds: HashMap::new(),
+        parse_profile: ParseProfile::Full,
         opened_from_bytes: false,
         source_path: Some(path.to_string()),
     })
@@ -38,8 +40,9 @@ pub(crate) fn open_xlsx_bytes(data: &[u8], permissive: bool) -> PyResult<NativeX
         book,
         sheet_names,
         sheet_cache: HashMap::new(),
-        sheet_cell_indexes: HashMap::new(),
+        sheet_cells: HashMap::new(),
         sheet_merged_bounds: HashMap::new(),
+        parse_profile: ParseProfile::Full,
         opened_from_bytes: true,
         source_path: None,
     })
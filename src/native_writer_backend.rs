@@ -30,7 +30,7 @@
 
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::types::{PyBytes, PyDict};
 
 use wolfxl_writer::model::Worksheet;
 use wolfxl_writer::Workbook;
@@ -65,7 +65,7 @@ use crate::native_writer_workbook_metadata::{
 // PyClass
 // ---------------------------------------------------------------------------
 
-#[pyclass(unsendable)]
+#[pyclass]
 pub struct NativeWorkbook {
     inner: Workbook,
 }
@@ -154,6 +154,25 @@ impl NativeWorkbook {
         write_value_grid(&mut self.inner, sheet, start_a1, values)
     }
 
+    /// Bulk-write typed column buffers with the top-left cell at
+    /// (`start_row`, `start_col`); see `native_writer_columns` for the
+    /// descriptor shape. Returns the number of rows written.
+    pub fn write_columns(
+        &mut self,
+        sheet: &str,
+        start_row: u32,
+        start_col: u32,
+        columns: &Bound<'_, pyo3::types::PyList>,
+    ) -> PyResult<usize> {
+        crate::native_writer_columns::write_columns(
+            &mut self.inner,
+            sheet,
+            start_row,
+            start_col,
+            columns,
+        )
+    }
+
     pub fn write_cell_format(
         &mut self,
         sheet: &str,
@@ -226,8 +245,29 @@ impl NativeWorkbook {
         apply_freeze_panes(ws, settings)
     }
 
-    pub fn save(&mut self, path: &str) -> PyResult<()> {
-        crate::native_writer_workbook::save(&mut self.inner, path)
+    /// Emit and compress the workbook with the GIL released.
+    pub fn save(&mut self, py: Python<'_>, path: &str) -> PyResult<()> {
+        py.detach(|| crate::native_writer_workbook::save(&mut self.inner, path))
+    }
+
+    /// Stream the archive into a seekable binary file object, with the
+    /// GIL released between writes.
+    pub fn save_to(&mut self, py: Python<'_>, fileobj: Py<PyAny>) -> PyResult<()> {
+        py.detach(|| {
+            let sink = crate::py_stream::PyFileWriter::buffered(&fileobj);
+            let sink = crate::native_writer_workbook::emit_to(&mut self.inner, sink, "stream")?;
+            crate::py_stream::finish(sink)
+        })
+    }
+
+    /// Emit the archive into memory and return it as `bytes`.
+    pub fn save_bytes<'py>(&mut self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        let data = py.detach(|| {
+            let sink = std::io::Cursor::new(Vec::new());
+            crate::native_writer_workbook::emit_to(&mut self.inner, sink, "bytes")
+                .map(std::io::Cursor::into_inner)
+        })?;
+        Ok(PyBytes::new(py, &data))
     }
 
     // =========================================================================
@@ -251,6 +291,22 @@ impl NativeWorkbook {
         append_streaming_row(&mut self.inner, sheet, row_idx, cells)
     }
 
+    /// Append typed column buffers to a streaming sheet, one row per
+    /// index starting at `start_row`. Returns the number of rows appended.
+    pub fn append_streaming_columns(
+        &mut self,
+        sheet: &str,
+        start_row: u32,
+        columns: &Bound<'_, pyo3::types::PyList>,
+    ) -> PyResult<usize> {
+        crate::native_writer_columns::append_streaming_columns(
+            &mut self.inner,
+            sheet,
+            start_row,
+            columns,
+        )
+    }
+
     /// Flush every streaming sheet's `BufWriter`. Called automatically
     /// from `save`, but exposed so the Python `WriteOnlyWorksheet.close()`
     /// path can release file descriptors before save if needed.
@@ -0,0 +1,276 @@
+//! Columnar bulk writes for `write_columns` (eager and streaming sheets).
+//!
+//! Python hands over one descriptor per column instead of one payload per
+//! cell:
+//!
+//! - `{"kind": "float64" | "int64" | "bool" | "datetime64[ms]", "values": buffer}`
+//!   — a contiguous buffer of `f64` / `i64` / `u8` / `i64` milliseconds since
+//!   the Unix epoch, read through the buffer protocol.
+//! - `{"kind": "string", "values": [str | None, ...]}`.
+//! - `{"kind": "object", "values": [payload dict | None, ...]}` — the
+//!   `write_cell_value` payload shape, for mixed columns.
+//!
+//! Optional keys: `"mask"` (a `u8` buffer, non-zero = missing),
+//! `"number_format"` (interned once per column), and `"style_id"`. Float
+//! `NaN` and datetime `NaT` are treated as missing; datetime columns without a
+//! number format get the same `yyyy-mm-dd hh:mm:ss` default as eager writes.
+
+use chrono::{Duration, NaiveDate};
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::{PyIOError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyList};
+
+use wolfxl_writer::model::cell::WriteCell;
+use wolfxl_writer::model::date::datetime_to_excel_serial;
+use wolfxl_writer::model::worksheet::Row;
+use wolfxl_writer::model::{FormatSpec, WriteCellValue};
+use wolfxl_writer::Workbook;
+
+use crate::native_writer_cells::payload_to_write_cell_value;
+
+const DEFAULT_DATETIME_FORMAT: &str = "yyyy-mm-dd hh:mm:ss";
+
+enum ColumnValues {
+    Float(Vec<f64>),
+    Int(Vec<i64>),
+    Bool(Vec<u8>),
+    DatetimeMs(Vec<i64>),
+    Text(Vec<Option<String>>),
+    Cells(Vec<Option<WriteCellValue>>),
+}
+
+struct WriteColumn {
+    values: ColumnValues,
+    mask: Option<Vec<u8>>,
+    style_id: Option<u32>,
+}
+
+impl WriteColumn {
+    fn len(&self) -> usize {
+        match &self.values {
+            ColumnValues::Float(v) => v.len(),
+            ColumnValues::Int(v) => v.len(),
+            ColumnValues::Bool(v) => v.len(),
+            ColumnValues::DatetimeMs(v) => v.len(),
+            ColumnValues::Text(v) => v.len(),
+            ColumnValues::Cells(v) => v.len(),
+        }
+    }
+
+    /// Cell value at `idx`, or `None` when the slot is missing.
+    fn value(&self, idx: usize) -> PyResult<Option<WriteCellValue>> {
+        if self.mask.as_ref().is_some_and(|mask| mask[idx] != 0) {
+            return Ok(None);
+        }
+        Ok(match &self.values {
+            ColumnValues::Float(v) => {
+                let n = v[idx];
+                if n.is_nan() {
+                    None
+                } else if n.is_infinite() {
+                    return Err(PyValueError::new_err(format!(
+                        "write_columns: non-finite floats are not representable in xlsx; got {n}"
+                    )));
+                } else {
+                    Some(WriteCellValue::Number(n))
+                }
+            }
+            ColumnValues::Int(v) => Some(WriteCellValue::Number(v[idx] as f64)),
+            ColumnValues::Bool(v) => Some(WriteCellValue::Boolean(v[idx] != 0)),
+            ColumnValues::DatetimeMs(v) => {
+                // i64::MIN is NumPy's NaT.
+                if v[idx] == i64::MIN {
+                    return Ok(None);
+                }
+                Some(WriteCellValue::DateSerial(millis_to_excel_serial(v[idx])?))
+            }
+            ColumnValues::Text(v) => v[idx].clone().map(WriteCellValue::String),
+            ColumnValues::Cells(v) => v[idx].clone(),
+        })
+    }
+}
+
+fn millis_to_excel_serial(millis: i64) -> PyResult<f64> {
+    let unix_epoch = NaiveDate::from_ymd_opt(1970, 1, 1)
+        .unwrap()
+        .and_hms_opt(0, 0, 0)
+        .unwrap();
+    unix_epoch
+        .checked_add_signed(Duration::milliseconds(millis))
+        .and_then(datetime_to_excel_serial)
+        .ok_or_else(|| {
+            PyValueError::new_err(format!(
+                "write_columns: datetime {millis}ms since 1970 is outside Excel's 1900-9999 range"
+            ))
+        })
+}
+
+fn read_buffer<T: pyo3::buffer::Element + Copy>(
+    py: Python<'_>,
+    obj: &Bound<'_, PyAny>,
+) -> PyResult<Vec<T>> {
+    PyBuffer::<T>::get(obj)?.to_vec(py)
+}
+
+fn extract_column(wb: &mut Workbook, desc: &Bound<'_, PyAny>) -> PyResult<WriteColumn> {
+    let py = desc.py();
+    let dict = desc
+        .cast::<PyDict>()
+        .map_err(|_| PyValueError::new_err("each column must be a dict"))?;
+    let kind: String = dict
+        .get_item("kind")?
+        .ok_or_else(|| PyValueError::new_err("column missing 'kind'"))?
+        .extract()?;
+    let raw = dict
+        .get_item("values")?
+        .ok_or_else(|| PyValueError::new_err("column missing 'values'"))?;
+    let values = match kind.as_str() {
+        "float64" => ColumnValues::Float(read_buffer(py, &raw)?),
+        "int64" => ColumnValues::Int(read_buffer(py, &raw)?),
+        "bool" => ColumnValues::Bool(read_buffer(py, &raw)?),
+        "datetime64[ms]" => ColumnValues::DatetimeMs(read_buffer(py, &raw)?),
+        "string" => ColumnValues::Text(raw.extract()?),
+        "object" => {
+            let items = raw
+                .cast::<PyList>()
+                .map_err(|_| PyValueError::new_err("object column values must be a list"))?;
+            let mut cells = Vec::with_capacity(items.len());
+            for item in items.iter() {
+                cells.push(if item.is_none() {
+                    None
+                } else {
+                    Some(payload_to_write_cell_value(&item)?)
+                });
+            }
+            ColumnValues::Cells(cells)
+        }
+        other => {
+            return Err(PyValueError::new_err(format!(
+                "unsupported column kind: {other}"
+            )))
+        }
+    };
+    let mask = dict
+        .get_item("mask")?
+        .filter(|m| !m.is_none())
+        .map(|m| read_buffer::<u8>(py, &m))
+        .transpose()?;
+
+    let mut style_id: Option<u32> = dict
+        .get_item("style_id")?
+        .filter(|v| !v.is_none())
+        .map(|v| v.extract())
+        .transpose()?;
+    if style_id.is_none() {
+        let mut number_format: Option<String> = dict
+            .get_item("number_format")?
+            .filter(|v| !v.is_none())
+            .map(|v| v.extract())
+            .transpose()?;
+        if number_format.is_none() && matches!(values, ColumnValues::DatetimeMs(_)) {
+            number_format = Some(DEFAULT_DATETIME_FORMAT.to_string());
+        }
+        if let Some(number_format) = number_format {
+            let spec = FormatSpec {
+                number_format: Some(number_format),
+                ..Default::default()
+            };
+            style_id = Some(wb.styles.intern_format(&spec));
+        }
+    }
+
+    let column = WriteColumn {
+        values,
+        mask,
+        style_id,
+    };
+    if column.mask.as_ref().is_some_and(|mask| mask.len() != column.len()) {
+        return Err(PyValueError::new_err("column mask length differs from its values"));
+    }
+    Ok(column)
+}
+
+fn extract_columns(
+    wb: &mut Workbook,
+    columns: &Bound<'_, PyList>,
+) -> PyResult<(Vec<WriteColumn>, usize)> {
+    let columns = columns
+        .iter()
+        .map(|desc| extract_column(wb, &desc))
+        .collect::<PyResult<Vec<_>>>()?;
+    let rows = columns.first().map_or(0, WriteColumn::len);
+    if columns.iter().any(|column| column.len() != rows) {
+        return Err(PyValueError::new_err(
+            "write_columns: all columns must have the same length",
+        ));
+    }
+    Ok((columns, rows))
+}
+
+fn build_row(columns: &[WriteColumn], idx: usize) -> PyResult<Row> {
+    let mut row = Row::default();
+    for (offset, column) in columns.iter().enumerate() {
+        let Some(value) = column.value(idx)? else {
+            continue;
+        };
+        let cell = match column.style_id {
+            Some(s) => WriteCell::new(value).with_style(s),
+            None => WriteCell::new(value),
+        };
+        row.cells.insert(offset as u32 + 1, cell);
+    }
+    Ok(row)
+}
+
+/// Write `columns` into an eager sheet with the top-left cell at
+/// (`start_row`, `start_col`). Returns the number of rows covered.
+pub(crate) fn write_columns(
+    wb: &mut Workbook,
+    sheet: &str,
+    start_row: u32,
+    start_col: u32,
+    columns: &Bound<'_, PyList>,
+) -> PyResult<usize> {
+    let (columns, rows) = extract_columns(wb, columns)?;
+    let ws = wb
+        .sheets
+        .iter_mut()
+        .find(|s| s.name == sheet)
+        .ok_or_else(|| PyValueError::new_err(format!("Unknown sheet: {sheet}")))?;
+    for idx in 0..rows {
+        let row_idx = start_row + idx as u32;
+        for (offset, column) in columns.iter().enumerate() {
+            if let Some(value) = column.value(idx)? {
+                ws.write_cell(row_idx, start_col + offset as u32, value, column.style_id);
+            }
+        }
+    }
+    Ok(rows)
+}
+
+/// Append `columns` to a streaming sheet, one `<row>` per index starting at
+/// `start_row`. Returns the number of rows appended.
+pub(crate) fn append_streaming_columns(
+    wb: &mut Workbook,
+    sheet: &str,
+    start_row: u32,
+    columns: &Bound<'_, PyList>,
+) -> PyResult<usize> {
+    let (columns, rows) = extract_columns(wb, columns)?;
+    let idx = wb
+        .sheets
+        .iter()
+        .position(|s| s.name == sheet)
+        .ok_or_else(|| PyValueError::new_err(format!("Unknown sheet: {sheet}")))?;
+    let stream = wb.sheets[idx].streaming.as_mut().ok_or_else(|| {
+        PyValueError::new_err(format!("sheet '{sheet}' is not in streaming mode"))
+    })?;
+    for offset in 0..rows {
+        let row = build_row(&columns, offset)?;
+        stream
+            .append_row(start_row + offset as u32, &row, &mut wb.sst)
+            .map_err(|e| PyIOError::new_err(format!("streaming append failed: {e}")))?;
+    }
+    Ok(rows)
+}
@@ -1,6 +1,6 @@
 //! Workbook-level helpers for the native writer backend.
 
-use std::io::BufWriter;
+use std::io::{BufWriter, Seek, Write};
 
 use pyo3::exceptions::{PyIOError, PyValueError};
 use pyo3::prelude::*;
@@ -24,10 +24,19 @@ pub(crate) fn move_sheet(wb: &mut Workbook, name: &str, offset: isize) -> PyResu
 }
 
 pub(crate) fn save(wb: &mut Workbook, path: &str) -> PyResult<()> {
+    crate::atomic_save::write_zip_atomically(path, |file| {
+        emit_to(wb, BufWriter::new(file), path)?;
+        Ok(())
+    })
+}
+
+/// Emit the workbook into a seekable sink and hand the flushed sink
+/// back. `target` only names the destination in error messages.
+pub(crate) fn emit_to<W: Write + Seek>(wb: &mut Workbook, dest: W, target: &str) -> PyResult<W> {
     // G20: flush per-sheet streaming BufWriters so the splice phase
     // inside `emit_xlsx → sheet_xml::emit` reads consistent bytes.
     crate::native_writer_streaming::finalize_all_streaming(wb)?;
-    // RFC-073 v1.5: stream the ZIP container straight into a BufWriter<File>
+    // RFC-073 v1.5: stream the ZIP container straight into `dest`
     // instead of materialising the whole archive as `Vec<u8>` first. The
     // dominant memory cost during save is still the per-sheet emit `String`
     // (~150 MB for 1M-row × 5-col sheets) — `package` itself only cost the
@@ -35,14 +44,10 @@ pub(crate) fn save(wb: &mut Workbook, path: &str) -> PyResult<()> {
     // but real on the disk-write peak; closing the larger sheet-body
     // materialisation requires plumbing `Write` all the way through
     // `sheet_xml::emit`, which is out of scope for v1.5.
-    crate::atomic_save::write_zip_atomically(path, |file| {
-        let mut writer = BufWriter::new(file);
-        wolfxl_writer::emit_xlsx_to(wb, &mut writer)
-            .map_err(|e| PyIOError::new_err(format!("failed to write {path}: {e}")))?;
-        use std::io::Write;
-        writer
-            .flush()
-            .map_err(|e| PyIOError::new_err(format!("failed to flush {path}: {e}")))?;
-        Ok(())
-    })
+    let mut dest = dest;
+    wolfxl_writer::emit_xlsx_to(wb, &mut dest)
+        .map_err(|e| PyIOError::new_err(format!("failed to write {target}: {e}")))?;
+    dest.flush()
+        .map_err(|e| PyIOError::new_err(format!("failed to flush {target}: {e}")))?;
+    Ok(dest)
 }
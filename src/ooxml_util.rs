@@ -2,7 +2,6 @@ use pyo3::exceptions::PyIOError;
 use pyo3::prelude::*;
 
 use std::collections::{HashMap, HashSet};
-use std::fs::File;
 use std::io::{Read, Seek};
 
 use quick_xml::events::{BytesStart, Event};
@@ -221,7 +220,7 @@ pub fn parse_relationship_targets(xml: &str) -> PyResult<HashMap<String, String>
     Ok(out)
 }
 
-pub fn zip_read_to_string(zip: &mut ZipArchive<File>, name: &str) -> PyResult<String> {
+pub fn zip_read_to_string<R: Read + Seek>(zip: &mut ZipArchive<R>, name: &str) -> PyResult<String> {
     match zip.by_name(name) {
         Ok(mut f) => {
             validate_zip_entry_metadata(name, f.size(), f.compressed_size())?;
@@ -249,7 +248,10 @@ pub fn zip_read_to_string(zip: &mut ZipArchive<File>, name: &str) -> PyResult<St
     Ok(out)
 }
 
-pub fn zip_read_to_string_opt(zip: &mut ZipArchive<File>, name: &str) -> PyResult<Option<String>> {
+pub fn zip_read_to_string_opt<R: Read + Seek>(
+    zip: &mut ZipArchive<R>,
+    name: &str,
+) -> PyResult<Option<String>> {
     match zip.by_name(name) {
         Ok(mut f) => {
             validate_zip_entry_metadata(name, f.size(), f.compressed_size())?;
@@ -282,7 +284,10 @@ pub fn zip_read_to_string_opt(zip: &mut ZipArchive<File>, name: &str) -> PyResul
     }
 }
 
-fn resolve_zip_name_case_insensitive(zip: &ZipArchive<File>, name: &str) -> Option<String> {
+fn resolve_zip_name_case_insensitive<R: Read + Seek>(
+    zip: &ZipArchive<R>,
+    name: &str,
+) -> Option<String> {
     zip.file_names()
         .find(|candidate| candidate.eq_ignore_ascii_case(name))
         .map(str::to_string)
@@ -0,0 +1,120 @@
+//! Python binary file objects as Rust I/O: a `Write + Seek` adapter so the
+//! writer and patcher can stream a finished archive into `io.BytesIO`, an
+//! open file or a response body without a temp file, and a `Read + Seek`
+//! adapter so the streaming reader can open a package held by Python.
+
+use std::io::{self, BufReader, BufWriter, Read, Seek, SeekFrom, Write};
+
+use pyo3::prelude::*;
+use pyo3::types::PyBytes;
+
+/// Data crosses into Python in chunks of this size, so streaming costs a
+/// few GIL round trips per MiB rather than one per ZIP record.
+const PY_IO_CHUNK: usize = 256 * 1024;
+
+/// `fileobj.seek(pos)`, reattaching to the GIL for the call.
+fn py_seek(fileobj: &Py<PyAny>, pos: SeekFrom) -> io::Result<u64> {
+    let (offset, whence) = match pos {
+        SeekFrom::Start(n) => (n as i64, 0),
+        SeekFrom::Current(n) => (n, 1),
+        SeekFrom::End(n) => (n, 2),
+    };
+    Python::attach(|py| {
+        fileobj
+            .bind(py)
+            .call_method1("seek", (offset, whence))?
+            .extract::<u64>()
+    })
+    .map_err(io::Error::from)
+}
+
+/// Seekable sink that forwards to a Python object's `write` / `seek`.
+///
+/// Safe to use with the GIL released: every call reattaches for the
+/// duration of the Python method call only.
+pub(crate) struct PyFileWriter<'a> {
+    fileobj: &'a Py<PyAny>,
+}
+
+impl<'a> PyFileWriter<'a> {
+    /// Buffered writer over `fileobj`; finish it with [`finish`].
+    pub(crate) fn buffered(fileobj: &'a Py<PyAny>) -> BufWriter<Self> {
+        BufWriter::with_capacity(PY_IO_CHUNK, Self { fileobj })
+    }
+}
+
+impl Write for PyFileWriter<'_> {
+    fn write(&mut self, buf: &[u8]) -> io::Result<usize> {
+        Python::attach(|py| {
+            let written = self
+                .fileobj
+                .bind(py)
+                .call_method1("write", (PyBytes::new(py, buf),))?;
+            // Raw streams report short writes; buffered ones return None or
+            // the full length.
+            if written.is_none() {
+                Ok(buf.len())
+            } else {
+                written.extract::<usize>()
+            }
+        })
+        .map_err(io::Error::from)
+    }
+
+    fn flush(&mut self) -> io::Result<()> {
+        Python::attach(|py| {
+            let fileobj = self.fileobj.bind(py);
+            if fileobj.hasattr("flush")? {
+                fileobj.call_method0("flush")?;
+            }
+            Ok::<_, PyErr>(())
+        })
+        .map_err(io::Error::from)
+    }
+}
+
+impl Seek for PyFileWriter<'_> {
+    fn seek(&mut self, pos: SeekFrom) -> io::Result<u64> {
+        py_seek(self.fileobj, pos)
+    }
+}
+
+/// Flush the buffered tail of a [`PyFileWriter`] and the Python object.
+pub(crate) fn finish(writer: BufWriter<PyFileWriter<'_>>) -> PyResult<()> {
+    let mut inner = writer.into_inner().map_err(|e| e.into_error())?;
+    inner.flush()?;
+    Ok(())
+}
+
+/// Seekable source that forwards to a Python object's `read` / `seek`.
+///
+/// Like [`PyFileWriter`], usable with the GIL released.
+pub(crate) struct PyFileReader<'a> {
+    fileobj: &'a Py<PyAny>,
+}
+
+impl<'a> PyFileReader<'a> {
+    /// Buffered reader over `fileobj`.
+    pub(crate) fn buffered(fileobj: &'a Py<PyAny>) -> BufReader<Self> {
+        BufReader::with_capacity(PY_IO_CHUNK, Self { fileobj })
+    }
+}
+
+impl Read for PyFileReader<'_> {
+    fn read(&mut self, buf: &mut [u8]) -> io::Result<usize> {
+        Python::attach(|py| {
+            let chunk = self.fileobj.bind(py).call_method1("read", (buf.len(),))?;
+            let data = chunk.cast::<PyBytes>()?.as_bytes();
+            let n = data.len().min(buf.len());
+            buf[..n].copy_from_slice(&data[..n]);
+            Ok::<_, PyErr>(n)
+        })
+        .map_err(io::Error::from)
+    }
+}
+
+impl Seek for PyFileReader<'_> {
+    fn seek(&mut self, pos: SeekFrom) -> io::Result<u64> {
+        py_seek(self.fileobj, pos)
+    }
+}
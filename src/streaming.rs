@@ -10,7 +10,8 @@
 //!
 //! Public surface (Python):
 //!
-//! - `StreamingSheetReader.open(path, sheet, ...)` — constructor.
+//! - `StreamingSheetReader.open(source, sheet, ...)` — constructor; `source`
+//!   is a path, the package `bytes`, or a seekable binary file object.
 //! - `reader.read_next_row()` → `(row_index_1based, [(col_1based, value, style_id, type), ...])`.
 //! - `reader.read_next_values(min_col, max_col)` → padded value tuple.
 //! - `reader.close()` — eagerly closes the XML reader and removes the temp part.
@@ -19,14 +20,21 @@
 //! workbooks); sheet XML is spooled to a temp file and parsed incrementally,
 //! so peak RSS scales with the largest row/parser buffer rather than the full
 //! decompressed worksheet XML.
+//!
+//! Threading: opening (ZIP inflate, SST parse, sheet spool) and row parsing
+//! run with the GIL released. Rows are parsed into GIL-free [`CellValue`]s
+//! and only boxed into Python objects once the GIL is re-acquired, so readers
+//! on different Python threads make progress concurrently. Each thread needs
+//! its own reader: the `&mut self` borrow is held across the GIL-free parse.
 
 use std::collections::HashMap;
 use std::fs::File;
-use std::io::{BufReader, Seek, SeekFrom};
+use std::io::{BufReader, Cursor, Read, Seek, SeekFrom};
+use std::path::PathBuf;
 
 use pyo3::exceptions::{PyIOError, PyStopIteration, PyValueError};
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList, PyTuple};
+use pyo3::types::{PyBytes, PyDict, PyList, PyTuple};
 use pyo3::IntoPyObjectExt;
 
 use quick_xml::events::{BytesStart, Event};
@@ -35,6 +43,7 @@ use tempfile::NamedTempFile;
 use zip::ZipArchive;
 
 use crate::ooxml_util;
+use crate::py_stream::PyFileReader;
 use crate::util::a1_to_row_col;
 
 type PyObjectOwned = Py<PyAny>;
@@ -42,7 +51,7 @@ type PyObjectOwned = Py<PyAny>;
 /// Parse `xl/sharedStrings.xml` into a flat `Vec<String>`. Each entry is
 /// the plain-text concatenation of any nested `<r><t>...</t></r>` runs
 /// (matches Excel/openpyxl's flattening for `Cell.value`).
-fn load_sst(zip: &mut ZipArchive<File>) -> PyResult<Vec<String>> {
+fn load_sst<R: Read + Seek>(zip: &mut ZipArchive<R>) -> PyResult<Vec<String>> {
     let xml = match ooxml_util::zip_read_to_string_opt(zip, "xl/sharedStrings.xml")? {
         Some(s) => s,
         None => return Ok(Vec::new()),
@@ -108,7 +117,10 @@ fn load_sst(zip: &mut ZipArchive<File>) -> PyResult<Vec<String>> {
 }
 
 /// Resolve `<sheet name=...>` → ZIP path (`xl/worksheets/sheetN.xml`).
-fn resolve_sheet_xml_path(zip: &mut ZipArchive<File>, sheet: &str) -> PyResult<String> {
+fn resolve_sheet_xml_path<R: Read + Seek>(
+    zip: &mut ZipArchive<R>,
+    sheet: &str,
+) -> PyResult<String> {
     let workbook_xml = ooxml_util::zip_read_to_string(zip, "xl/workbook.xml")?;
     let rels_xml = ooxml_util::zip_read_to_string(zip, "xl/_rels/workbook.xml.rels")?;
     let sheet_rids = ooxml_util::parse_workbook_sheet_rids(&workbook_xml)?;
@@ -125,8 +137,31 @@ fn resolve_sheet_xml_path(zip: &mut ZipArchive<File>, sheet: &str) -> PyResult<S
     )))
 }
 
+/// Load the SST from `package` and spool `sheet`'s XML part to a temp
+/// file, rewound for reading.
+fn spool_sheet<R: Read + Seek>(package: R, sheet: &str) -> PyResult<(Vec<String>, NamedTempFile)> {
+    let mut zip = ZipArchive::new(package)
+        .map_err(|e| PyErr::new::<PyIOError, _>(format!("Failed to open zip: {e}")))?;
+    ooxml_util::validate_zip_archive(&mut zip)?;
+
+    let sst = load_sst(&mut zip)?;
+    let sheet_path = resolve_sheet_xml_path(&mut zip, sheet)?;
+    let mut sheet_entry = zip.by_name(&sheet_path).map_err(|e| {
+        PyErr::new::<PyIOError, _>(format!("Failed to open sheet part '{sheet_path}': {e}"))
+    })?;
+    let mut temp_file = NamedTempFile::new()
+        .map_err(|e| PyErr::new::<PyIOError, _>(format!("streaming temp file: {e}")))?;
+    std::io::copy(&mut sheet_entry, temp_file.as_file_mut())
+        .map_err(|e| PyErr::new::<PyIOError, _>(format!("spool sheet XML: {e}")))?;
+    temp_file
+        .as_file_mut()
+        .seek(SeekFrom::Start(0))
+        .map_err(|e| PyErr::new::<PyIOError, _>(format!("rewind sheet XML: {e}")))?;
+    Ok((sst, temp_file))
+}
+
 /// Streaming sheet reader. See module docs.
-#[pyclass(unsendable, module = "wolfxl._rust")]
+#[pyclass(module = "wolfxl._rust")]
 pub struct StreamingSheetReader {
     /// Incremental XML reader over the disk-spooled sheet part.
     reader: Option<XmlReader<BufReader<File>>>,
@@ -151,43 +186,75 @@ pub struct StreamingSheetReader {
 /// One parsed cell, before Python-tuple boxing.
 struct ParsedCell {
     col: u32,
-    value: PyObjectOwned,
+    value: CellValue,
     style_id: Option<u32>,
     cell_type: &'static str,
 }
 
+/// GIL-free cell payload, boxed into the Python shape documented on
+/// [`StreamingSheetReader::read_next_row`] by [`CellValue::into_py`].
+enum CellValue {
+    Empty,
+    Int(i64),
+    Float(f64),
+    Bool(bool),
+    Text(String),
+    Error(String),
+    Formula { formula: String, cached: String },
+}
+
+impl CellValue {
+    fn into_py(self, py: Python<'_>) -> PyResult<PyObjectOwned> {
+        match self {
+            CellValue::Empty => Ok(py.None()),
+            CellValue::Int(i) => i.into_py_any(py),
+            CellValue::Float(f) => f.into_py_any(py),
+            CellValue::Bool(b) => b.into_py_any(py),
+            CellValue::Text(s) => s.into_py_any(py),
+            CellValue::Error(v) => {
+                let d = PyDict::new(py);
+                d.set_item("type", "error")?;
+                d.set_item("value", &v)?;
+                d.into_py_any(py)
+            }
+            CellValue::Formula { formula, cached } => build_formula_dict(py, &formula, &cached),
+        }
+    }
+}
+
 #[pymethods]
 impl StreamingSheetReader {
-    /// Open `path` and prepare to stream `sheet`.
+    /// Open `source` and prepare to stream `sheet`.
+    ///
+    /// `source` is a filesystem path, the package as `bytes`, or a
+    /// seekable binary file object; in-memory packages are read where
+    /// they are rather than written out first. The ZIP inflate, SST parse
+    /// and sheet spool run with the GIL released.
     #[staticmethod]
-    #[pyo3(signature = (path, sheet, min_row=None, max_row=None, min_col=None, max_col=None))]
+    #[pyo3(signature = (source, sheet, min_row=None, max_row=None, min_col=None, max_col=None))]
     pub fn open(
-        path: &str,
+        py: Python<'_>,
+        source: &Bound<'_, PyAny>,
         sheet: &str,
         min_row: Option<u32>,
         max_row: Option<u32>,
         min_col: Option<u32>,
         max_col: Option<u32>,
     ) -> PyResult<Self> {
-        let file = File::open(path)
-            .map_err(|e| PyErr::new::<PyIOError, _>(format!("Failed to open xlsx: {e}")))?;
-        let mut zip = ZipArchive::new(file)
-            .map_err(|e| PyErr::new::<PyIOError, _>(format!("Failed to open zip: {e}")))?;
-        ooxml_util::validate_zip_archive(&mut zip)?;
-
-        let sst = load_sst(&mut zip)?;
-        let sheet_path = resolve_sheet_xml_path(&mut zip, sheet)?;
-        let mut sheet_entry = zip.by_name(&sheet_path).map_err(|e| {
-            PyErr::new::<PyIOError, _>(format!("Failed to open sheet part '{sheet_path}': {e}"))
-        })?;
-        let mut temp_file = NamedTempFile::new()
-            .map_err(|e| PyErr::new::<PyIOError, _>(format!("streaming temp file: {e}")))?;
-        std::io::copy(&mut sheet_entry, temp_file.as_file_mut())
-            .map_err(|e| PyErr::new::<PyIOError, _>(format!("spool sheet XML: {e}")))?;
-        temp_file
-            .as_file_mut()
-            .seek(SeekFrom::Start(0))
-            .map_err(|e| PyErr::new::<PyIOError, _>(format!("rewind sheet XML: {e}")))?;
+        let (sst, temp_file) = if let Ok(data) = source.cast::<PyBytes>() {
+            let data = data.as_bytes();
+            py.detach(|| spool_sheet(Cursor::new(data), sheet))?
+        } else if source.hasattr("read")? {
+            let fileobj = source.clone().unbind();
+            py.detach(|| spool_sheet(PyFileReader::buffered(&fileobj), sheet))?
+        } else {
+            let path: PathBuf = source.extract()?;
+            py.detach(|| {
+                let file = File::open(&path)
+                    .map_err(|e| PyErr::new::<PyIOError, _>(format!("Failed to open xlsx: {e}")))?;
+                spool_sheet(file, sheet)
+            })?
+        };
         let reader_file = temp_file
             .reopen()
             .map_err(|e| PyErr::new::<PyIOError, _>(format!("reopen sheet XML: {e}")))?;
@@ -212,40 +279,38 @@ impl StreamingSheetReader {
     /// Returns `None` when the stream is exhausted. Otherwise returns
     /// `(row_index_1based, [(col_1based, value, style_id_or_None, type_str), ...])`.
     pub fn read_next_row<'py>(&mut self, py: Python<'py>) -> PyResult<Option<Bound<'py, PyTuple>>> {
-        if self.exhausted {
+        let Some((row_idx, cells)) = py.detach(|| self.next_matching_row())? else {
             return Ok(None);
-        }
-        loop {
-            match self.parse_one_row(py)? {
-                StepResult::Row(row_idx, cells) => {
-                    let cell_list = PyList::empty(py);
-                    for c in cells {
-                        let style_obj = match c.style_id {
-                            Some(s) => s.into_py_any(py)?,
-                            None => py.None(),
-                        };
-                        let tup = PyTuple::new(
-                            py,
-                            [
-                                c.col.into_py_any(py)?,
-                                c.value,
-                                style_obj,
-                                c.cell_type.into_py_any(py)?,
-                            ],
-                        )?;
-                        cell_list.append(tup)?;
-                    }
-                    let outer =
-                        PyTuple::new(py, [row_idx.into_py_any(py)?, cell_list.into_py_any(py)?])?;
-                    return Ok(Some(outer));
-                }
-                StepResult::Skip => continue,
-                StepResult::Done => {
-                    self.exhausted = true;
-                    return Ok(None);
+        };
+        Ok(Some(row_to_py(py, row_idx, cells)?))
+    }
+
+    /// Read up to `max_rows` rows in one call, each shaped like
+    /// [`read_next_row`](Self::read_next_row)'s result. The whole block is
+    /// parsed with the GIL released. An empty list means the stream is
+    /// exhausted.
+    #[pyo3(signature = (max_rows = 1024))]
+    pub fn read_next_block<'py>(
+        &mut self,
+        py: Python<'py>,
+        max_rows: usize,
+    ) -> PyResult<Bound<'py, PyList>> {
+        let limit = max_rows.max(1);
+        let rows = py.detach(|| -> PyResult<Vec<(u32, Vec<ParsedCell>)>> {
+            let mut rows = Vec::with_capacity(limit.min(4096));
+            while rows.len() < limit {
+                match self.next_matching_row()? {
+                    Some(row) => rows.push(row),
+                    None => break,
                 }
             }
+            Ok(rows)
+        })?;
+        let block = PyList::empty(py);
+        for (row_idx, cells) in rows {
+            block.append(row_to_py(py, row_idx, cells)?)?;
         }
+        Ok(block)
     }
 
     /// Read the next row as a plain tuple of values, padded by column
@@ -254,21 +319,10 @@ impl StreamingSheetReader {
         &mut self,
         py: Python<'py>,
     ) -> PyResult<Option<Bound<'py, PyTuple>>> {
-        if self.exhausted {
+        let Some((_row_idx, cells)) = py.detach(|| self.next_matching_row())? else {
             return Ok(None);
-        }
-        loop {
-            match self.parse_one_row(py)? {
-                StepResult::Row(_row_idx, cells) => {
-                    return Ok(Some(self.row_to_values_tuple(py, cells)?));
-                }
-                StepResult::Skip => continue,
-                StepResult::Done => {
-                    self.exhausted = true;
-                    return Ok(None);
-                }
-            }
-        }
+        };
+        Ok(Some(self.row_to_values_tuple(py, cells)?))
     }
 
     /// True once the stream has been fully consumed.
@@ -299,6 +353,32 @@ impl StreamingSheetReader {
     }
 }
 
+/// `(row_idx, [(col, value, style_id, cell_type), ...])`.
+fn row_to_py<'py>(
+    py: Python<'py>,
+    row_idx: u32,
+    cells: Vec<ParsedCell>,
+) -> PyResult<Bound<'py, PyTuple>> {
+    let cell_list = PyList::empty(py);
+    for c in cells {
+        let style_obj = match c.style_id {
+            Some(s) => s.into_py_any(py)?,
+            None => py.None(),
+        };
+        let tup = PyTuple::new(
+            py,
+            [
+                c.col.into_py_any(py)?,
+                c.value.into_py(py)?,
+                style_obj,
+                c.cell_type.into_py_any(py)?,
+            ],
+        )?;
+        cell_list.append(tup)?;
+    }
+    PyTuple::new(py, [row_idx.into_py_any(py)?, cell_list.into_py_any(py)?])
+}
+
 enum StepResult {
     Row(u32, Vec<ParsedCell>),
     Skip,
@@ -306,7 +386,25 @@ enum StepResult {
 }
 
 impl StreamingSheetReader {
-    fn parse_one_row(&mut self, py: Python<'_>) -> PyResult<StepResult> {
+    /// Advance to the next row inside the configured bounds. Pure Rust —
+    /// callers run it under `py.detach`.
+    fn next_matching_row(&mut self) -> PyResult<Option<(u32, Vec<ParsedCell>)>> {
+        if self.exhausted {
+            return Ok(None);
+        }
+        loop {
+            match self.parse_one_row()? {
+                StepResult::Row(row_idx, cells) => return Ok(Some((row_idx, cells))),
+                StepResult::Skip => continue,
+                StepResult::Done => {
+                    self.exhausted = true;
+                    return Ok(None);
+                }
+            }
+        }
+    }
+
+    fn parse_one_row(&mut self) -> PyResult<StepResult> {
         let reader = match self.reader.as_mut() {
             Some(reader) => reader,
             None => return Ok(StepResult::Done),
@@ -321,13 +419,8 @@ impl StreamingSheetReader {
                 Event::Start(e) if e.local_name().as_ref() == b"row" => {
                     let row_idx = parse_row_index_from_start(&e)?;
                     drop(e);
-                    let cells = read_cells_until_row_end(
-                        reader,
-                        &mut self.event_buf,
-                        py,
-                        &self.sst,
-                        row_idx,
-                    )?;
+                    let cells =
+                        read_cells_until_row_end(reader, &mut self.event_buf, &self.sst, row_idx)?;
                     return self.row_result(row_idx, cells);
                 }
                 Event::Empty(e) if e.local_name().as_ref() == b"row" => {
@@ -389,14 +482,14 @@ impl StreamingSheetReader {
             return Ok(PyTuple::empty(py));
         }
         let width = (cmax - cmin + 1) as usize;
-        let mut by_col: HashMap<u32, PyObjectOwned> = HashMap::with_capacity(cells.len());
+        let mut by_col: HashMap<u32, CellValue> = HashMap::with_capacity(cells.len());
         for c in cells {
             by_col.insert(c.col, c.value);
         }
         let mut out: Vec<PyObjectOwned> = Vec::with_capacity(width);
         for col in cmin..=cmax {
             match by_col.remove(&col) {
-                Some(v) => out.push(v),
+                Some(v) => out.push(v.into_py(py)?),
                 None => out.push(py.None()),
             }
         }
@@ -407,7 +500,6 @@ impl StreamingSheetReader {
 fn read_cells_until_row_end(
     reader: &mut XmlReader<BufReader<File>>,
     buf: &mut Vec<u8>,
-    py: Python<'_>,
     sst: &[String],
     row_idx: u32,
 ) -> PyResult<Vec<ParsedCell>> {
@@ -424,7 +516,7 @@ fn read_cells_until_row_end(
                 let style_id = attr_value(&e, b"s").and_then(|s| s.parse::<u32>().ok());
                 let t_attr = attr_value(&e, b"t").unwrap_or_else(|| "n".to_string());
                 drop(e);
-                let (value, cell_type) = read_cell_contents(reader, buf, py, &t_attr, sst)?;
+                let (value, cell_type) = read_cell_contents(reader, buf, &t_attr, sst)?;
                 let col = cell_column(coord.as_deref(), &cells)?;
                 cells.push(ParsedCell {
                     col,
@@ -439,7 +531,7 @@ fn read_cells_until_row_end(
                 let col = cell_column(coord.as_deref(), &cells)?;
                 cells.push(ParsedCell {
                     col,
-                    value: py.None(),
+                    value: CellValue::Empty,
                     style_id,
                     cell_type: "blank",
                 });
@@ -458,10 +550,9 @@ fn read_cells_until_row_end(
 fn read_cell_contents(
     reader: &mut XmlReader<BufReader<File>>,
     buf: &mut Vec<u8>,
-    py: Python<'_>,
     t_attr: &str,
     sst: &[String],
-) -> PyResult<(PyObjectOwned, &'static str)> {
+) -> PyResult<(CellValue, &'static str)> {
     let mut v_text: Option<String> = None;
     let mut f_text: Option<String> = None;
     let mut inline_text: Option<String> = None;
@@ -507,7 +598,7 @@ fn read_cell_contents(
             }
             Event::End(e) => match e.local_name().as_ref() {
                 b"c" => {
-                    return build_cell_object(py, t_attr, f_text, v_text.or(inline_text), sst);
+                    return build_cell_value(t_attr, f_text, v_text.or(inline_text), sst);
                 }
                 b"v" => in_v = false,
                 b"f" => in_f = false,
@@ -698,16 +789,17 @@ fn parse_cell_inner(
     let f_text = extract_inner_text(inner, b"f");
     let is_text = extract_is_text(inner);
 
-    build_cell_object(py, t_attr, f_text, v_text.or(is_text), sst)
+    let (value, cell_type) = build_cell_value(t_attr, f_text, v_text.or(is_text), sst)?;
+    Ok((value.into_py(py)?, cell_type))
 }
 
-fn build_cell_object(
-    py: Python<'_>,
+fn build_cell_value(
     t_attr: &str,
     formula: Option<String>,
     raw_value: Option<String>,
     sst: &[String],
-) -> PyResult<(PyObjectOwned, &'static str)> {
+) -> PyResult<(CellValue, &'static str)> {
+    let formula_value = |formula: String, cached: String| CellValue::Formula { formula, cached };
     match t_attr {
         "s" => {
             let v = raw_value.unwrap_or_default();
@@ -716,56 +808,53 @@ fn build_cell_object(
                 .map_err(|_| PyErr::new::<PyValueError, _>(format!("Bad SST index: {v:?}")))?;
             let resolved = sst.get(idx).cloned().unwrap_or_default();
             if let Some(formula) = formula {
-                return Ok((build_formula_dict(py, &formula, &resolved)?, "formula"));
+                return Ok((formula_value(formula, resolved), "formula"));
             }
-            Ok((resolved.into_py_any(py)?, "s"))
+            Ok((CellValue::Text(resolved), "s"))
         }
         "str" => {
             let v = raw_value.unwrap_or_default();
             if let Some(formula) = formula {
-                return Ok((build_formula_dict(py, &formula, &v)?, "formula"));
+                return Ok((formula_value(formula, v), "formula"));
             }
-            Ok((v.into_py_any(py)?, "str"))
+            Ok((CellValue::Text(v), "str"))
         }
         "inlineStr" => {
             let v = raw_value.unwrap_or_default();
-            Ok((v.into_py_any(py)?, "inlineStr"))
+            Ok((CellValue::Text(v), "inlineStr"))
         }
         "b" => {
             let v = raw_value.unwrap_or_default();
             let b = matches!(v.trim(), "1" | "true" | "TRUE");
             if let Some(formula) = formula {
-                return Ok((build_formula_dict(py, &formula, &v)?, "formula"));
+                return Ok((formula_value(formula, v), "formula"));
             }
-            Ok((b.into_py_any(py)?, "b"))
+            Ok((CellValue::Bool(b), "b"))
         }
         "e" => {
             let v = raw_value.unwrap_or_else(|| "#ERROR!".to_string());
-            let d = PyDict::new(py);
-            d.set_item("type", "error")?;
-            d.set_item("value", &v)?;
-            Ok((d.into_py_any(py)?, "e"))
+            Ok((CellValue::Error(v), "e"))
         }
         "d" => {
             let v = raw_value.unwrap_or_default();
-            Ok((v.into_py_any(py)?, "d"))
+            Ok((CellValue::Text(v), "d"))
         }
         _ => {
             let v = match raw_value {
                 Some(s) => s,
-                None => return Ok((py.None(), "blank")),
+                None => return Ok((CellValue::Empty, "blank")),
             };
             if let Some(formula) = formula {
-                return Ok((build_formula_dict(py, &formula, &v)?, "formula"));
+                return Ok((formula_value(formula, v), "formula"));
             }
             if let Ok(i) = v.parse::<i64>() {
                 // Excel-stored ints: surface as int when round-trip safe.
-                return Ok((i.into_py_any(py)?, "n"));
+                return Ok((CellValue::Int(i), "n"));
             }
             let f: f64 = v
                 .parse()
                 .map_err(|_| PyErr::new::<PyValueError, _>(format!("Bad numeric value: {v:?}")))?;
-            Ok((f.into_py_any(py)?, "n"))
+            Ok((CellValue::Float(f), "n"))
         }
     }
 }
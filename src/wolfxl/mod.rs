@@ -68,10 +68,11 @@ pub mod external_links;
 
 use std::collections::{BTreeMap, HashMap, HashSet};
 use std::fs::File;
+use std::io::{Seek, Write};
 
 use pyo3::exceptions::{PyIOError, PyValueError};
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::types::{PyBytes, PyDict};
 
 use zip::ZipArchive;
 
@@ -87,7 +88,7 @@ use patcher_payload::{
     extract_cf_rule, extract_f64, extract_str, extract_u32, parse_workbook_security_payload,
     py_runs_to_rust,
 };
-use patcher_save::{open_source_zip, SaveWorkspace};
+use patcher_save::{open_source_zip, PartSet, PreparedSave, SaveEdits, SaveWorkspace};
 use patcher_workbook::{
     load_or_empty_rels, replace_first_occurrence, sheet_rels_path_for, xml_escape_attr,
 };
@@ -166,6 +167,8 @@ pub struct XlsxPatcher {
     /// now keeps the short-circuit predicate and rewrite loop forward-
     /// compatible without a follow-up patcher refactor.
     file_deletes: HashSet<String>,
+    /// Phase output held between `prepare_save` and the next save.
+    prepared: Option<PreparedSave>,
     /// Per-sheet inventory of ancillary parts (comments, VML drawings,
     /// tables, hyperlinks) lazily populated from the source ZIP's
     /// `_rels/sheetN.xml.rels` files (RFC-013). Scaffolding-only this
@@ -533,6 +536,7 @@ impl XlsxPatcher {
             sheet_order,
             file_adds: HashMap::new(),
             file_deletes: HashSet::new(),
+            prepared: None,
             ancillary: ancillary::AncillaryPartRegistry::new(),
             queued_content_type_ops: HashMap::new(),
             queued_props: None,
@@ -1890,15 +1894,35 @@ impl XlsxPatcher {
         Ok(())
     }
 
-    /// Save patched file to a new path.
-    fn save(&mut self, path: &str) -> PyResult<()> {
-        self.do_save(path)
+    /// Save patched file to a new path. Runs with the GIL released while
+    /// holding `&mut self`, so other threads must not touch this patcher
+    /// until it returns.
+    fn save(&mut self, py: Python<'_>, path: &str) -> PyResult<()> {
+        py.detach(|| self.do_save(path))
     }
 
-    /// Save in-place (atomic tmp+rename).
-    fn save_in_place(&mut self) -> PyResult<()> {
+    /// Save in-place (atomic tmp+rename). Runs with the GIL released.
+    fn save_in_place(&mut self, py: Python<'_>) -> PyResult<()> {
         let target = self.file_path.clone();
-        self.do_save(&target)
+        py.detach(|| self.do_save(&target))
+    }
+
+    /// Stream the patched package into a seekable binary file object,
+    /// with the GIL released between writes.
+    fn save_to(&mut self, py: Python<'_>, fileobj: Py<PyAny>) -> PyResult<()> {
+        py.detach(|| {
+            let sink = self.do_save_to(crate::py_stream::PyFileWriter::buffered(&fileobj))?;
+            crate::py_stream::finish(sink)
+        })
+    }
+
+    /// Build the patched package in memory and return it as `bytes`.
+    fn save_bytes<'py>(&mut self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        let data = py.detach(|| {
+            self.do_save_to(std::io::Cursor::new(Vec::new()))
+                .map(std::io::Cursor::into_inner)
+        })?;
+        Ok(PyBytes::new(py, &data))
     }
 
     /// Return whether the Rust patcher already has queued mutations.
@@ -1906,6 +1930,83 @@ impl XlsxPatcher {
         self.has_pending_save_work()
     }
 
+    /// Run the queued save phases now without writing anything.
+    ///
+    /// Until the next `save` / `save_in_place`, `read_part` sees the
+    /// patched package and `write_part` / `delete_part` edit it, so
+    /// Python-side authoring joins the same single ZIP rewrite. Mutations
+    /// queued after this call are not applied by that save.
+    fn prepare_save(&mut self, py: Python<'_>) -> PyResult<()> {
+        py.detach(|| self.ensure_prepared())
+    }
+
+    /// Bytes of `path` in the package being saved, or `None` when absent.
+    fn read_part<'py>(
+        &mut self,
+        py: Python<'py>,
+        path: &str,
+    ) -> PyResult<Option<Bound<'py, PyBytes>>> {
+        self.ensure_prepared()?;
+        let prepared = self.prepared.as_mut().expect("prepared above");
+        let bytes = if prepared.parts.deletes.contains(path) {
+            None
+        } else if let Some(added) = prepared.parts.adds.get(path) {
+            Some(added.clone())
+        } else {
+            prepared.read_part(path)?
+        };
+        Ok(bytes.map(|b| PyBytes::new(py, &b)))
+    }
+
+    /// Part names of the package being saved: surviving source entries in
+    /// source order, then added parts sorted by name.
+    fn part_names(&mut self) -> PyResult<Vec<String>> {
+        self.ensure_prepared()?;
+        let prepared = self.prepared.as_mut().expect("prepared above");
+        let mut names: Vec<String> = prepared
+            .source_part_names()
+            .into_iter()
+            .filter(|name| !prepared.parts.deletes.contains(name))
+            .collect();
+        let mut added: Vec<&String> = prepared
+            .parts
+            .adds
+            .keys()
+            .filter(|name| !prepared.has_source_part(name))
+            .collect();
+        added.sort();
+        names.extend(added.into_iter().cloned());
+        Ok(names)
+    }
+
+    /// Replace or add `path` in the package being saved. The edit applies
+    /// to that save only.
+    fn write_part(&mut self, path: &str, data: Vec<u8>) -> PyResult<()> {
+        ooxml_util::validate_part_name(path)?;
+        self.ensure_prepared()?;
+        let prepared = self.prepared.as_mut().expect("prepared above");
+        if prepared.has_source_part(path) {
+            prepared.file_patches.insert(path.to_string(), data);
+            prepared.parts.deletes.remove(path);
+        } else {
+            prepared.parts.adds.insert(path.to_string(), data);
+        }
+        Ok(())
+    }
+
+    /// Drop `path` from the package being saved. The edit applies to that
+    /// save only.
+    fn delete_part(&mut self, path: &str) -> PyResult<()> {
+        self.ensure_prepared()?;
+        let prepared = self.prepared.as_mut().expect("prepared above");
+        prepared.file_patches.remove(path);
+        if prepared.has_source_part(path) {
+            prepared.parts.deletes.insert(path.to_string());
+        }
+        prepared.parts.adds.remove(path);
+        Ok(())
+    }
+
     /// RFC-072 (G19): return the raw `xl/vbaProject.bin` bytes from the
     /// source workbook, or `None` when the workbook contains no VBA
     /// archive. Read-only inspection — no authoring side effects.
@@ -2113,20 +2214,72 @@ impl XlsxPatcher {
 
 impl XlsxPatcher {
     fn do_save(&mut self, output_path: &str) -> PyResult<()> {
-        if !self.has_pending_save_work() {
-            patcher_workbook::copy_source_file_phase(self, output_path)?;
-            return Ok(());
+        match self.take_save_edits()? {
+            None => patcher_workbook::copy_source_file_phase(self, output_path),
+            // --- Phase 4: Rewrite ZIP ---
+            Some(edits) => patcher_workbook::rewrite_zip_phase(self, &edits, output_path),
         }
+    }
 
-        let mut zip = open_source_zip(&self.file_path)?;
+    /// Same as `do_save`, but into an in-memory or Python-backed sink.
+    fn do_save_to<W: Write + Seek>(&mut self, dst: W) -> PyResult<W> {
+        match self.take_save_edits()? {
+            None => patcher_workbook::copy_source_to(self, dst),
+            Some(edits) => patcher_workbook::write_patched_zip(self, &edits, dst),
+        }
+    }
 
+    /// Part edits for this save, or `None` when nothing is pending and
+    /// the source package can be copied verbatim.
+    fn take_save_edits(&mut self) -> PyResult<Option<SaveEdits>> {
+        Ok(match self.prepared.take() {
+            // Dropping the prepared source handle before the rewrite lets
+            // an in-place save replace the file it was reading from.
+            Some(prepared) => Some(prepared.into_edits()),
+            None if !self.has_pending_save_work() => None,
+            None => {
+                let mut zip = open_source_zip(&self.file_path)?;
+                Some(SaveEdits {
+                    file_patches: self.run_save_phases(&mut zip)?,
+                    parts: None,
+                })
+            }
+        })
+    }
+
+    /// Run the save phases up to (not including) the ZIP rewrite, keeping
+    /// the result so later part edits land in the same output pass.
+    fn ensure_prepared(&mut self) -> PyResult<()> {
+        if self.prepared.is_none() {
+            let mut zip = open_source_zip(&self.file_path)?;
+            let file_patches = if self.has_pending_save_work() {
+                self.run_save_phases(&mut zip)?
+            } else {
+                HashMap::new()
+            };
+            let parts = PartSet {
+                adds: self.file_adds.clone(),
+                deletes: self.file_deletes.clone(),
+            };
+            self.prepared = Some(PreparedSave::new(zip, file_patches, parts));
+        }
+        Ok(())
+    }
+
+    /// Every ordered save phase, returning the replaced source entries.
+    /// New entries and deletions accumulate in `file_adds` /
+    /// `file_deletes`.
+    fn run_save_phases(
+        &mut self,
+        zip: &mut ZipArchive<File>,
+    ) -> PyResult<HashMap<String, Vec<u8>>> {
         // Centralized part-suffix allocator (RFC-035 §5.2 / §8 risk #1).
         // Built once per save; seeded from the source ZIP's part listing
         // so freshly minted tableN / commentsN / vmlDrawingN / sheetN
         // suffixes never collide with source entries. Shared by Phase
         // 2.7 (sheet copies), Phase 2.5f (tables), and Phase 2.5g
         // (comments + VML).
-        let mut save = SaveWorkspace::new(&mut zip, &self.queued_blocks);
+        let mut save = SaveWorkspace::new(zip, &self.queued_blocks);
 
         // RFC-035 §8 risk #6: when Phase 2.7 clones tables onto cloned
         // sheets, those new table names must be visible to Phase 2.5f's
@@ -2144,13 +2297,13 @@ impl XlsxPatcher {
         // Source sheet removal must run before blank-sheet creation so a user
         // can remove a sheet and recreate the same title in one save session.
         if !self.queued_sheet_deletes.is_empty() {
-            patcher_workbook::apply_sheet_deletes_phase(self, &mut save.file_patches, &mut zip)?;
+            patcher_workbook::apply_sheet_deletes_phase(self, &mut save.file_patches, zip)?;
         }
         if !self.queued_sheet_creates.is_empty() {
             patcher_workbook::apply_sheet_creates_phase(
                 self,
                 &mut save.file_patches,
-                &mut zip,
+                zip,
                 &mut save.part_id_allocator,
             )?;
         }
@@ -2183,7 +2336,7 @@ impl XlsxPatcher {
             patcher_sheet_copy::apply_sheet_copies_phase(
                 self,
                 &mut save.file_patches,
-                &mut zip,
+                zip,
                 &mut save.part_id_allocator,
                 &mut save.cloned_table_names,
             )?;
@@ -2191,7 +2344,7 @@ impl XlsxPatcher {
 
         // --- Phase 1 / 2: Styles + cell patches ---
         let (mut styles_xml, sheet_cell_patches) =
-            patcher_cells::build_sheet_cell_patches_phase(self, &mut zip)?;
+            patcher_cells::build_sheet_cell_patches_phase(self, zip)?;
 
         // --- Phase 2.5: Build <dataValidations> blocks from queued DV
         // patches (RFC-025).  Each queued sheet gets exactly one
@@ -2212,7 +2365,7 @@ impl XlsxPatcher {
         // (comments + VML) consume the same instance below so
         // workbook-wide suffix uniqueness is preserved across phases.
 
-        patcher_sheet_blocks::apply_data_validations_phase(self, &mut save.local_blocks, &mut zip)?;
+        patcher_sheet_blocks::apply_data_validations_phase(self, &mut save.local_blocks, zip)?;
 
         // --- Phase 2.5b: Build <conditionalFormatting> blocks from
         // queued CF patches (RFC-026). Cross-sheet coordination: a
@@ -2231,7 +2384,7 @@ impl XlsxPatcher {
             self,
             &mut save.local_blocks,
             &mut styles_xml,
-            &mut zip,
+            zip,
         )?;
 
         // --- Phase 2.5e: Hyperlinks (RFC-022) ---
@@ -2259,7 +2412,7 @@ impl XlsxPatcher {
         // Cloning `sheet_order` into a local Vec sidesteps the
         // immutable-borrow-on-self-while-mutating-self.{ancillary,
         // rels_patches} conflict (same trick as Phase 2.5d).
-        patcher_sheet_blocks::apply_hyperlinks_phase(self, &mut save.local_blocks, &mut zip)?;
+        patcher_sheet_blocks::apply_hyperlinks_phase(self, &mut save.local_blocks, zip)?;
 
         // --- Phase 2.5f: Tables (RFC-024) ---
         //
@@ -2298,7 +2451,7 @@ impl XlsxPatcher {
             self,
             &mut save.local_blocks,
             &save.file_patches,
-            &mut zip,
+            zip,
             &mut save.part_id_allocator,
             &save.cloned_table_names,
         )?;
@@ -2342,7 +2495,7 @@ impl XlsxPatcher {
         let (threaded_file_writes, threaded_file_deletes) =
             patcher_sheet_blocks::apply_threaded_comments_phase(
                 self,
-                &mut zip,
+                zip,
                 &mut save.part_id_allocator,
             )?;
 
@@ -2350,7 +2503,7 @@ impl XlsxPatcher {
             patcher_sheet_blocks::apply_comments_phase(
                 self,
                 &mut save.local_blocks,
-                &mut zip,
+                zip,
                 &mut save.part_id_allocator,
             )?;
 
@@ -2364,7 +2517,7 @@ impl XlsxPatcher {
         // starts with exactly one image can remove the old drawing ref and
         // then create a fresh drawing for the replacement add.
         if !self.queued_image_removes.is_empty() {
-            patcher_drawing::apply_image_removes_phase(self, &mut save.file_patches, &mut zip)?;
+            patcher_drawing::apply_image_removes_phase(self, &mut save.file_patches, zip)?;
         }
         //
         // Drains `queued_images` per sheet. For each sheet that has queued images:
@@ -2393,7 +2546,7 @@ impl XlsxPatcher {
             patcher_drawing::apply_image_adds_phase(
                 self,
                 &mut save.file_patches,
-                &mut zip,
+                zip,
                 &mut save.part_id_allocator,
             )?;
         }
@@ -2411,13 +2564,13 @@ impl XlsxPatcher {
         // Phase 2.5l runs BEFORE Phase 3 so cell-range formulas in
         // chart XML can compose with cell rewrites in the same save.
         if !self.queued_chart_removes.is_empty() {
-            patcher_drawing::apply_chart_removes_phase(self, &mut save.file_patches, &mut zip)?;
+            patcher_drawing::apply_chart_removes_phase(self, &mut save.file_patches, zip)?;
         }
         if !self.queued_charts.is_empty() {
             patcher_drawing::apply_chart_adds_phase(
                 self,
                 &mut save.file_patches,
-                &mut zip,
+                zip,
                 &mut save.part_id_allocator,
             )?;
         }
@@ -2443,7 +2596,7 @@ impl XlsxPatcher {
         //      * Add a sheet-rel of type PIVOT_TABLE.
         //      * Add a content-type override.
         if !self.queued_pivot_caches.is_empty() || !self.queued_pivot_tables.is_empty() {
-            patcher_pivot::apply_pivot_adds_phase(self, &mut save.file_patches, &mut zip)?;
+            patcher_pivot::apply_pivot_adds_phase(self, &mut save.file_patches, zip)?;
         }
 
         // --- Phase 2.5m-edit: G17 / RFC-070 — pivot source-range
@@ -2452,11 +2605,7 @@ impl XlsxPatcher {
         // session is touched in its post-adds form. The phase is a
         // no-op when no edits have been registered.
         if !self.queued_pivot_source_edits.is_empty() {
-            patcher_pivot_edit::apply_pivot_source_edits_phase(
-                self,
-                &mut save.file_patches,
-                &mut zip,
-            )?;
+            patcher_pivot_edit::apply_pivot_source_edits_phase(self, &mut save.file_patches, zip)?;
         }
 
         // --- Phase 2.5n: Sheet setup (Sprint Ο Pod 1A.5 / RFC-055) ---
@@ -2515,7 +2664,7 @@ impl XlsxPatcher {
         //      owner sheet.
         //   8. Add content-type Overrides for both parts.
         if !self.queued_slicers.is_empty() {
-            patcher_pivot::apply_slicer_adds_phase(self, &mut save.file_patches, &mut zip)?;
+            patcher_pivot::apply_slicer_adds_phase(self, &mut save.file_patches, zip)?;
         }
 
         // --- Phase 2.5o: AutoFilter (Sprint Ο Pod 1B / RFC-056) ---
@@ -2544,7 +2693,7 @@ impl XlsxPatcher {
                 self,
                 &mut save.local_blocks,
                 &save.file_patches,
-                &mut zip,
+                zip,
             )?
         };
 
@@ -2565,7 +2714,7 @@ impl XlsxPatcher {
             &save.local_blocks,
             &autofilter_hidden_rows,
             &mut save.file_patches,
-            &mut zip,
+            zip,
         )?;
 
         // Add styles.xml patch if modified
@@ -2594,14 +2743,14 @@ impl XlsxPatcher {
             patcher_external_links::apply_external_links_drop_phase(
                 self,
                 &mut save.file_patches,
-                &mut zip,
+                zip,
             )?;
         }
-        patcher_workbook::apply_workbook_xml_phases(self, &mut save.file_patches, &mut zip)?;
+        patcher_workbook::apply_workbook_xml_phases(self, &mut save.file_patches, zip)?;
         patcher_workbook::apply_sheet_rename_chart_formula_refs_phase(
             self,
             &mut save.file_patches,
-            &mut zip,
+            zip,
         )?;
 
         // Serialize any mutated `*.rels` graphs. Routing depends on whether
@@ -2610,7 +2759,7 @@ impl XlsxPatcher {
         //   - absent  → `file_adds` appends a brand-new entry (RFC-013)
         // The "absent" branch is the common case for RFC-022 on a clean
         // file that had zero hyperlinks before.
-        patcher_workbook::serialize_rels_patches_phase(self, &mut save.file_patches, &mut zip)?;
+        patcher_workbook::serialize_rels_patches_phase(self, &mut save.file_patches, zip)?;
 
         // --- Phase 2.5c: Content-types aggregation (RFC-013) ---
         //
@@ -2627,7 +2776,7 @@ impl XlsxPatcher {
         // via new `xl/comments<N>.xml` Overrides + a vml `Default`),
         // and RFC-024 (Tables via new `xl/tables/tableN.xml` Overrides)
         // will be the first volume producers.
-        patcher_workbook::apply_content_types_phase(self, &mut save.file_patches, &mut zip)?;
+        patcher_workbook::apply_content_types_phase(self, &mut save.file_patches, zip)?;
 
         // --- Phase 2.5d: Document properties (RFC-020) ---
         //
@@ -2644,7 +2793,7 @@ impl XlsxPatcher {
         // If the caller didn't supply `sheet_names`, we thread the
         // patcher's `sheet_order` in so app.xml's `<TitlesOfParts>`
         // matches the workbook's tab order.
-        patcher_workbook::apply_document_properties_phase(self, &mut save.file_patches, &mut zip)?;
+        patcher_workbook::apply_document_properties_phase(self, &mut save.file_patches, zip)?;
 
         // Route RFC-023 comments/vml + RFC-068 threaded-comments/persons
         // part bytes into the right primitive (in-place patch vs. new
@@ -2657,7 +2806,7 @@ impl XlsxPatcher {
         patcher_workbook::route_part_writes_and_deletes_phase(
             self,
             &mut save.file_patches,
-            &mut zip,
+            zip,
             combined_writes,
             combined_deletes,
         );
@@ -2683,7 +2832,7 @@ impl XlsxPatcher {
         // handles the global no-op case; this block handles the
         // partial case where some other RFC also queued ops).
         if !self.queued_axis_shifts.is_empty() {
-            patcher_structural::apply_axis_shifts_phase(self, &mut save.file_patches, &mut zip)?;
+            patcher_structural::apply_axis_shifts_phase(self, &mut save.file_patches, zip)?;
         }
 
         // --- Phase 2.5j: Range moves (RFC-034) ---
@@ -2696,7 +2845,7 @@ impl XlsxPatcher {
         // mirrors Phase 2.5i: each op runs against the post-previous
         // bytes.
         if !self.queued_range_moves.is_empty() {
-            patcher_structural::apply_range_moves_phase(self, &mut save.file_patches, &mut zip)?;
+            patcher_structural::apply_range_moves_phase(self, &mut save.file_patches, zip)?;
         }
 
         // --- Phase 2.8: calcChain.xml rebuild (Sprint Θ Pod-C3) ---
@@ -2714,12 +2863,9 @@ impl XlsxPatcher {
         // The no-op short-circuit at the top of `do_save` already
         // bypasses this whole flush, so byte-identical no-op saves
         // are unaffected.
-        patcher_workbook::rebuild_calc_chain_phase(self, &mut save.file_patches, &mut zip)?;
-
-        drop(zip);
+        patcher_workbook::rebuild_calc_chain_phase(self, &mut save.file_patches, zip)?;
 
-        // --- Phase 4: Rewrite ZIP ---
-        patcher_workbook::rewrite_zip_phase(self, &save.file_patches, output_path)
+        Ok(save.file_patches)
     }
 
     fn has_pending_save_work(&self) -> bool {
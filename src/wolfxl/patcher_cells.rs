@@ -23,14 +23,16 @@ pub(super) fn build_sheet_cell_patches_phase(
     if !patcher.format_patches.is_empty() {
         let raw = ooxml_util::zip_read_to_string_opt(zip, "xl/styles.xml")?
             .unwrap_or_else(minimal_styles_xml);
-        let mut xml = raw;
+        let mut table = styles::StylesTable::parse(&raw);
 
-        for ((sheet, cell), spec) in &patcher.format_patches {
-            let (updated, xf_idx) = styles::apply_format_spec(&xml, spec);
-            xml = updated;
+        // Sorted so appended style entries come out in a stable order.
+        let mut queued: Vec<_> = patcher.format_patches.iter().collect();
+        queued.sort_unstable_by(|a, b| a.0.cmp(b.0));
+        for ((sheet, cell), spec) in queued {
+            let xf_idx = table.intern_format(spec);
             style_assignments.insert(format!("{sheet}:{cell}"), xf_idx);
         }
-        styles_xml = Some(xml);
+        styles_xml = Some(table.into_xml());
     }
 
     let mut sheet_cell_patches: HashMap<String, Vec<CellPatch>> = HashMap::new();
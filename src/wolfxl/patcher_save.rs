@@ -2,6 +2,7 @@
 
 use std::collections::{HashMap, HashSet};
 use std::fs::File;
+use std::io::Read;
 
 use pyo3::exceptions::PyIOError;
 use pyo3::prelude::*;
@@ -51,3 +52,89 @@ impl SaveWorkspace {
         }
     }
 }
+
+/// New and dropped parts for one save.
+pub(super) struct PartSet {
+    pub(super) adds: HashMap<String, Vec<u8>>,
+    pub(super) deletes: HashSet<String>,
+}
+
+/// Part edits the ZIP rewrite applies on top of the source package.
+pub(super) struct SaveEdits {
+    pub(super) file_patches: HashMap<String, Vec<u8>>,
+    /// Added and dropped parts when Python-side authoring edited them for
+    /// this save; `None` uses the patcher's `file_adds` / `file_deletes`.
+    pub(super) parts: Option<PartSet>,
+}
+
+/// Save phases already run by `XlsxPatcher::prepare_save`.
+///
+/// Holds the phase output and the open source archive so Python-side
+/// authoring (external links, chartsheets, source-chart and pivot-layout
+/// rewrites) can read and replace parts before the single ZIP rewrite,
+/// instead of re-reading and re-compressing the saved archive per step.
+/// `parts` starts as a copy of the patcher's `file_adds` / `file_deletes`
+/// and takes Python-side adds and deletes, so they apply to this save
+/// only and never leak into the next save of the same workbook.
+pub(super) struct PreparedSave {
+    pub(super) source: ZipArchive<File>,
+    pub(super) file_patches: HashMap<String, Vec<u8>>,
+    pub(super) parts: PartSet,
+}
+
+impl PreparedSave {
+    pub(super) fn new(
+        source: ZipArchive<File>,
+        file_patches: HashMap<String, Vec<u8>>,
+        parts: PartSet,
+    ) -> Self {
+        Self {
+            source,
+            file_patches,
+            parts,
+        }
+    }
+
+    /// Edits for the rewrite; drops the source handle.
+    pub(super) fn into_edits(self) -> SaveEdits {
+        SaveEdits {
+            file_patches: self.file_patches,
+            parts: Some(self.parts),
+        }
+    }
+
+    pub(super) fn has_source_part(&self, path: &str) -> bool {
+        self.source.index_for_name(path).is_some()
+    }
+
+    pub(super) fn source_part_names(&self) -> Vec<String> {
+        self.source
+            .file_names()
+            .filter(|name| !name.ends_with('/'))
+            .map(str::to_string)
+            .collect()
+    }
+
+    /// Current bytes of a source part: the phase output when a phase
+    /// replaced it, else the source entry.
+    pub(super) fn read_part(&mut self, path: &str) -> PyResult<Option<Vec<u8>>> {
+        if let Some(bytes) = self.file_patches.get(path) {
+            return Ok(Some(bytes.clone()));
+        }
+        let mut entry = match self.source.by_name(path) {
+            Ok(entry) => entry,
+            Err(zip::result::ZipError::FileNotFound) => return Ok(None),
+            Err(e) => {
+                return Err(PyErr::new::<PyIOError, _>(format!(
+                    "Zip error reading {path}: {e}"
+                )))
+            }
+        };
+        ooxml_util::validate_zip_entry_metadata(path, entry.size(), entry.compressed_size())?;
+        let mut out = Vec::with_capacity(entry.size() as usize);
+        entry
+            .read_to_end(&mut out)
+            .map_err(|e| PyErr::new::<PyIOError, _>(format!("Failed to read {path}: {e}")))?;
+        Ok(Some(out))
+    }
+}
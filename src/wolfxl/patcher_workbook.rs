@@ -15,6 +15,7 @@ use zip::{ZipArchive, ZipWriter};
 use crate::ooxml_util;
 use wolfxl_rels::{RelId, RelsGraph};
 
+use super::patcher_save::SaveEdits;
 use super::{
     calcchain, content_types, defined_names, properties, security, sheet_order, XlsxPatcher,
 };
@@ -1980,91 +1981,183 @@ pub(super) fn rebuild_calc_chain_phase(
 
 pub(super) fn rewrite_zip_phase(
     patcher: &XlsxPatcher,
-    file_patches: &HashMap<String, Vec<u8>>,
+    edits: &SaveEdits,
     output_path: &str,
 ) -> PyResult<()> {
     crate::atomic_save::write_zip_atomically(output_path, |dst| {
-        let src = File::open(&patcher.file_path)
-            .map_err(|e| PyIOError::new_err(format!("Cannot open '{}': {e}", patcher.file_path)))?;
-        let mut zip =
-            ZipArchive::new(src).map_err(|e| PyIOError::new_err(format!("ZIP read error: {e}")))?;
-        ooxml_util::validate_zip_archive(&mut zip)?;
-
-        let mut out = ZipWriter::new(dst);
+        write_patched_zip(patcher, edits, dst)?;
+        Ok(())
+    })
+}
 
-        let mut source_names: HashSet<String> = HashSet::with_capacity(zip.len());
+/// Write the patched package into `dst` and hand the finished sink back.
+pub(super) fn write_patched_zip<W: Write + Seek>(
+    patcher: &XlsxPatcher,
+    edits: &SaveEdits,
+    dst: W,
+) -> PyResult<W> {
+    let file_patches = &edits.file_patches;
+    let (file_adds, file_deletes) = match &edits.parts {
+        Some(parts) => (&parts.adds, &parts.deletes),
+        None => (&patcher.file_adds, &patcher.file_deletes),
+    };
+    let src = File::open(&patcher.file_path)
+        .map_err(|e| PyIOError::new_err(format!("Cannot open '{}': {e}", patcher.file_path)))?;
+    let mut zip =
+        ZipArchive::new(src).map_err(|e| PyIOError::new_err(format!("ZIP read error: {e}")))?;
+    ooxml_util::validate_zip_archive(&mut zip)?;
+
+    let mut out = ZipWriter::new(dst);
+    let dt = epoch_or_now();
+
+    // Parallel mode: compress every replaced and added part on the
+    // worker pool before the write loop, then raw-copy the finished
+    // shards in source/sorted order so output stays deterministic.
+    let threads = wolfxl_writer::zip::compression_threads();
+    let mut shards: HashMap<String, Vec<u8>> = HashMap::new();
+    if threads > 1 {
+        let mut jobs: Vec<wolfxl_writer::zip::ShardJob<'_>> = Vec::new();
         for i in 0..zip.len() {
-            let mut file = zip
-                .by_index(i)
+            let file = zip
+                .by_index_raw(i)
                 .map_err(|e| PyIOError::new_err(format!("ZIP entry read error: {e}")))?;
-            let name = file.name().to_string();
-            source_names.insert(name.clone());
-
-            if patcher.file_deletes.contains(&name) {
+            if file.is_dir() || file_deletes.contains(file.name()) {
                 continue;
             }
-
-            let mut opts = SimpleFileOptions::default().compression_method(file.compression());
-            if file.compression() == zip::CompressionMethod::Deflated {
-                opts = opts.compression_level(Some(FAST_SAVE_DEFLATE_LEVEL));
-            }
-            if let Some(dt) = file.last_modified() {
-                opts = opts.last_modified_time(dt);
-            }
-            if let Some(mode) = file.unix_mode() {
-                opts = opts.unix_permissions(mode);
+            if let Some(patched) = file_patches.get(file.name()) {
+                jobs.push(wolfxl_writer::zip::ShardJob {
+                    path: file.name().to_string(),
+                    bytes: patched,
+                    options: patched_entry_options(
+                        file.compression(),
+                        file.last_modified(),
+                        file.unix_mode(),
+                    ),
+                });
             }
+        }
+        let mut new_paths: Vec<&String> = file_adds.keys().collect();
+        new_paths.sort();
+        for new_path in new_paths {
+            jobs.push(wolfxl_writer::zip::ShardJob {
+                path: new_path.clone(),
+                bytes: &file_adds[new_path],
+                options: added_entry_options(dt),
+            });
+        }
+        let compressed = wolfxl_writer::zip::compress_shards(&jobs, threads)
+            .map_err(|e| PyIOError::new_err(format!("ZIP write error: {e}")))?;
+        shards = jobs
+            .into_iter()
+            .map(|job| job.path)
+            .zip(compressed)
+            .collect();
+    }
 
-            if file.is_dir() {
-                out.add_directory(&name, opts)
-                    .map_err(|e| PyIOError::new_err(format!("ZIP write error: {e}")))?;
-                continue;
-            }
+    let mut source_names: HashSet<String> = HashSet::with_capacity(zip.len());
+    for i in 0..zip.len() {
+        // Open the entry raw so untouched parts never pass through
+        // inflate/deflate: their compressed bytes, CRC and sizes are
+        // carried across verbatim by `raw_copy_file`.
+        let file = zip
+            .by_index_raw(i)
+            .map_err(|e| PyIOError::new_err(format!("ZIP entry read error: {e}")))?;
+        let name = file.name().to_string();
+        source_names.insert(name.clone());
+
+        if file_deletes.contains(&name) {
+            continue;
+        }
 
-            let data = if let Some(patched) = file_patches.get(&name) {
-                patched.clone()
-            } else {
-                let mut buf = Vec::new();
-                file.read_to_end(&mut buf)
-                    .map_err(|e| PyIOError::new_err(format!("ZIP read error: {e}")))?;
-                buf
-            };
+        let Some(patched) = file_patches.get(&name) else {
+            out.raw_copy_file(file)
+                .map_err(|e| PyIOError::new_err(format!("ZIP write error: {e}")))?;
+            continue;
+        };
+
+        let opts =
+            patched_entry_options(file.compression(), file.last_modified(), file.unix_mode());
 
-            out.start_file(&name, opts)
+        if file.is_dir() {
+            out.add_directory(&name, opts)
                 .map_err(|e| PyIOError::new_err(format!("ZIP write error: {e}")))?;
-            out.write_all(&data)
+            continue;
+        }
+
+        if let Some(shard) = shards.remove(&name) {
+            wolfxl_writer::zip::append_shard(&mut out, shard)
                 .map_err(|e| PyIOError::new_err(format!("ZIP write error: {e}")))?;
+            continue;
         }
+        out.start_file(&name, opts)
+            .map_err(|e| PyIOError::new_err(format!("ZIP write error: {e}")))?;
+        out.write_all(patched)
+            .map_err(|e| PyIOError::new_err(format!("ZIP write error: {e}")))?;
+    }
 
-        if !patcher.file_adds.is_empty() {
-            for new_path in patcher.file_adds.keys() {
-                assert!(
-                    !source_names.contains(new_path),
-                    "file_adds collision with source entry: {new_path}; \
-                 caller bug; use file_patches to REPLACE existing entries"
-                );
-            }
-            let mut new_paths: Vec<&String> = patcher.file_adds.keys().collect();
-            new_paths.sort();
-            let dt = epoch_or_now();
-            for new_path in new_paths {
-                let bytes = &patcher.file_adds[new_path];
-                let opts = SimpleFileOptions::default()
-                    .compression_method(zip::CompressionMethod::Deflated)
-                    .compression_level(Some(FAST_SAVE_DEFLATE_LEVEL))
-                    .last_modified_time(dt);
-                out.start_file(new_path, opts)
-                    .map_err(|e| PyIOError::new_err(format!("ZIP write error: {e}")))?;
-                out.write_all(bytes)
+    if !file_adds.is_empty() {
+        for new_path in file_adds.keys() {
+            assert!(
+                !source_names.contains(new_path),
+                "file_adds collision with source entry: {new_path}; \
+             caller bug; use file_patches to REPLACE existing entries"
+            );
+        }
+        let mut new_paths: Vec<&String> = file_adds.keys().collect();
+        new_paths.sort();
+        for new_path in new_paths {
+            if let Some(shard) = shards.remove(new_path) {
+                wolfxl_writer::zip::append_shard(&mut out, shard)
                     .map_err(|e| PyIOError::new_err(format!("ZIP write error: {e}")))?;
+                continue;
             }
+            let bytes = &file_adds[new_path];
+            out.start_file(new_path, added_entry_options(dt))
+                .map_err(|e| PyIOError::new_err(format!("ZIP write error: {e}")))?;
+            out.write_all(bytes)
+                .map_err(|e| PyIOError::new_err(format!("ZIP write error: {e}")))?;
         }
+    }
 
-        out.finish()
-            .map_err(|e| PyIOError::new_err(format!("ZIP finalize error: {e}")))?;
+    out.finish()
+        .map_err(|e| PyIOError::new_err(format!("ZIP finalize error: {e}")))
+}
 
-        Ok(())
-    })
+/// Copy the unmodified source package into `dst`.
+pub(super) fn copy_source_to<W: Write>(patcher: &XlsxPatcher, mut dst: W) -> PyResult<W> {
+    let mut src = File::open(&patcher.file_path)
+        .map_err(|e| PyIOError::new_err(format!("Cannot open '{}': {e}", patcher.file_path)))?;
+    std::io::copy(&mut src, &mut dst)
+        .map_err(|e| PyIOError::new_err(format!("Copy failed: {e}")))?;
+    Ok(dst)
+}
+
+/// Options for re-writing a replaced source entry: keep its method, mtime
+/// and permissions, but DEFLATE at the fast save level.
+fn patched_entry_options(
+    method: zip::CompressionMethod,
+    last_modified: Option<zip::DateTime>,
+    unix_mode: Option<u32>,
+) -> SimpleFileOptions {
+    let mut opts = SimpleFileOptions::default().compression_method(method);
+    if method == zip::CompressionMethod::Deflated {
+        opts = opts.compression_level(Some(FAST_SAVE_DEFLATE_LEVEL));
+    }
+    if let Some(dt) = last_modified {
+        opts = opts.last_modified_time(dt);
+    }
+    if let Some(mode) = unix_mode {
+        opts = opts.unix_permissions(mode);
+    }
+    opts
+}
+
+/// Options for a brand-new part queued in `file_adds`.
+fn added_entry_options(dt: zip::DateTime) -> SimpleFileOptions {
+    SimpleFileOptions::default()
+        .compression_method(zip::CompressionMethod::Deflated)
+        .compression_level(Some(FAST_SAVE_DEFLATE_LEVEL))
+        .last_modified_time(dt)
 }
 
 pub(super) fn ensure_calc_chain_metadata(
@@ -9,8 +9,11 @@
 //! Each cell has a `s` attribute (style index) pointing into `<cellXfs>`.
 //! A cellXfs `<xf>` combines fontId + fillId + borderId + numFmtId.
 //!
-//! For patching, WolfXL appends new component entries and a new `<xf>`,
-//! then sets the cell's `s` attribute to the new xf index.
+//! For patching, WolfXL interns component entries and `<xf>`s in a
+//! [`StylesTable`] (appending only ones not already present), then sets
+//! the cell's `s` attribute to the resulting xf index.
+
+use std::collections::HashMap;
 
 use quick_xml::events::{BytesStart, Event};
 use quick_xml::Reader as XmlReader;
@@ -506,64 +509,303 @@ fn xml_escape(s: &str) -> String {
         .replace('"', "&quot;")
 }
 
-/// Convenience: apply a full FormatSpec to styles.xml, returning updated XML and the xf index.
-pub fn apply_format_spec(xml: &str, spec: &FormatSpec) -> (String, u32) {
-    let mut xml = xml.to_string();
+// ---------------------------------------------------------------------------
+// Interned style table
+// ---------------------------------------------------------------------------
 
-    // 1. Font
-    let font_id = if let Some(ref font) = spec.font {
-        let font_xml = font_to_xml(font);
-        let (updated, id) = inject_into_section(&xml, "fonts", &font_xml);
-        xml = updated;
-        id
-    } else {
-        0
-    };
+/// One child collection of `<styleSheet>` (`<fonts>`, `<cellXfs>`, ...).
+#[derive(Debug, Default)]
+struct StyleSection {
+    /// Byte span of the opening tag; `None` when styles.xml lacks the section.
+    open: Option<(usize, usize)>,
+    /// Byte offset of the closing tag; `None` for a self-closing section.
+    close: Option<usize>,
+    /// Element XML → index, for existing and appended children alike.
+    index: HashMap<String, u32>,
+    len: u32,
+    added: Vec<String>,
+}
 
-    // 2. Fill
-    let fill_id = if let Some(ref fill) = spec.fill {
-        let fill_xml = fill_to_xml(fill);
-        let (updated, id) = inject_into_section(&xml, "fills", &fill_xml);
-        xml = updated;
-        id
-    } else {
-        0
-    };
+impl StyleSection {
+    /// Index of `element`, appending it unless an identical one exists.
+    /// A section missing from styles.xml resolves everything to 0.
+    fn intern(&mut self, element: String) -> u32 {
+        if self.open.is_none() {
+            return 0;
+        }
+        if let Some(&idx) = self.index.get(&element) {
+            return idx;
+        }
+        let idx = self.len;
+        self.len += 1;
+        self.index.insert(element.clone(), idx);
+        self.added.push(element);
+        idx
+    }
 
-    // 3. Border
-    let border_id = if let Some(ref border) = spec.border {
-        let border_xml = border_to_xml(border);
-        let (updated, id) = inject_into_section(&xml, "borders", &border_xml);
-        xml = updated;
-        id
-    } else {
-        0
-    };
+    /// Record an existing child; the first of several identical ones wins.
+    fn note_child(&mut self, element: &str) {
+        self.index.entry(element.to_string()).or_insert(self.len);
+        self.len += 1;
+    }
+}
+
+/// `styles.xml` parsed once for a batch of format patches.
+///
+/// Fonts, fills, borders and cellXfs entries are interned by their XML,
+/// so formatting many cells the same way (or the way an earlier save
+/// already did) reuses one entry instead of appending a duplicate per
+/// cell. Each [`FormatSpec`] resolves to an xf index through hash
+/// lookups; [`StylesTable::into_xml`] writes the result out once.
+#[derive(Debug)]
+pub struct StylesTable {
+    xml: String,
+    num_fmts: StyleSection,
+    fonts: StyleSection,
+    fills: StyleSection,
+    borders: StyleSection,
+    cell_xfs: StyleSection,
+    /// End of the `<styleSheet>` open tag: where a section with no
+    /// existing element goes when nothing else anchors it.
+    root_open_end: Option<usize>,
+    /// Custom number format code → numFmtId.
+    num_fmt_ids: HashMap<String, u32>,
+    max_num_fmt_id: u32,
+}
+
+impl StylesTable {
+    pub fn parse(xml: &str) -> Self {
+        let mut table = StylesTable {
+            xml: xml.to_string(),
+            num_fmts: StyleSection::default(),
+            fonts: StyleSection::default(),
+            fills: StyleSection::default(),
+            borders: StyleSection::default(),
+            cell_xfs: StyleSection::default(),
+            root_open_end: None,
+            num_fmt_ids: HashMap::new(),
+            max_num_fmt_id: 163, // custom IDs start at 164
+        };
+
+        let mut reader = XmlReader::from_str(xml);
+        let mut depth = 0usize;
+        // Section being read, and the start of its current child element.
+        let mut current: Option<&'static str> = None;
+        let mut child_start = 0usize;
+        loop {
+            let before = reader.buffer_position() as usize;
+            let event = match reader.read_event() {
+                Ok(Event::Eof) | Err(_) => break,
+                Ok(event) => event,
+            };
+            let after = reader.buffer_position() as usize;
+            match event {
+                Event::Start(ref e) => {
+                    depth += 1;
+                    if depth == 1 {
+                        table.root_open_end = Some(after);
+                    } else if depth == 2 {
+                        current = section_tag(e.local_name().as_ref());
+                        if let Some(tag) = current {
+                            table.section_mut(tag).open = Some((before, after));
+                        }
+                    } else if depth == 3 && current.is_some() {
+                        child_start = before;
+                        table.note_num_fmt(e);
+                    }
+                }
+                Event::Empty(ref e) => {
+                    if depth == 1 {
+                        if let Some(tag) = section_tag(e.local_name().as_ref()) {
+                            table.section_mut(tag).open = Some((before, after));
+                        }
+                    } else if depth == 2 {
+                        if let Some(tag) = current {
+                            table.note_num_fmt(e);
+                            table.section_mut(tag).note_child(&xml[before..after]);
+                        }
+                    }
+                }
+                Event::End(_) => {
+                    if depth == 3 {
+                        if let Some(tag) = current {
+                            table.section_mut(tag).note_child(&xml[child_start..after]);
+                        }
+                    } else if depth == 2 {
+                        if let Some(tag) = current.take() {
+                            table.section_mut(tag).close = Some(before);
+                        }
+                    }
+                    depth = depth.saturating_sub(1);
+                }
+                _ => {}
+            }
+        }
+        table
+    }
 
-    // 4. Number format
-    let num_fmt_id = if let Some(ref code) = spec.number_format {
-        let (updated, id) = find_or_create_num_fmt(&xml, code);
-        xml = updated;
+    /// xf index for `spec`, reusing identical components and xfs.
+    pub fn intern_format(&mut self, spec: &FormatSpec) -> u32 {
+        let font_id = spec
+            .font
+            .as_ref()
+            .map_or(0, |font| self.fonts.intern(font_to_xml(font)));
+        let fill_id = spec
+            .fill
+            .as_ref()
+            .map_or(0, |fill| self.fills.intern(fill_to_xml(fill)));
+        let border_id = spec
+            .border
+            .as_ref()
+            .map_or(0, |border| self.borders.intern(border_to_xml(border)));
+        let num_fmt_id = spec
+            .number_format
+            .as_deref()
+            .map_or(0, |code| self.intern_num_fmt(code));
+        let xf_xml = xf_to_xml(
+            font_id,
+            fill_id,
+            border_id,
+            num_fmt_id,
+            spec.alignment.as_ref(),
+            spec.font.is_some(),
+            spec.fill.is_some(),
+            spec.border.is_some(),
+            spec.number_format.is_some(),
+        );
+        self.cell_xfs.intern(xf_xml)
+    }
+
+    /// Serialize: original XML with appended children and updated counts.
+    pub fn into_xml(self) -> String {
+        let sections = [
+            &self.num_fmts,
+            &self.fonts,
+            &self.fills,
+            &self.borders,
+            &self.cell_xfs,
+        ];
+        if sections.iter().all(|section| section.added.is_empty()) {
+            return self.xml;
+        }
+        let xml = self.xml.as_str();
+        // (offset, bytes replaced, text) edits, applied in offset order.
+        let mut edits: Vec<(usize, usize, String)> = Vec::new();
+        for (tag, section) in ["numFmts", "fonts", "fills", "borders", "cellXfs"]
+            .into_iter()
+            .zip(sections)
+        {
+            if section.added.is_empty() {
+                continue;
+            }
+            let added = section.added.concat();
+            match (section.open, section.close) {
+                (Some((start, end)), Some(close)) => {
+                    edits.push((
+                        start,
+                        end - start,
+                        update_count_attr(&xml[start..end], section.len),
+                    ));
+                    edits.push((close, 0, added));
+                }
+                (Some((start, end)), None) => {
+                    let open = xml[start..end].trim_end_matches('>').trim_end_matches('/');
+                    let open = update_count_attr(&format!("{open}>"), section.len);
+                    edits.push((start, end - start, format!("{open}{added}</{tag}>")));
+                }
+                (None, _) => {
+                    // Only numFmts can be added from scratch; it goes before
+                    // <fonts>, or first inside <styleSheet> when there is none.
+                    let Some(at) = self
+                        .fonts
+                        .open
+                        .map(|(start, _)| start)
+                        .or(self.root_open_end)
+                    else {
+                        continue;
+                    };
+                    edits.push((
+                        at,
+                        0,
+                        format!("<{tag} count=\"{}\">{added}</{tag}>", section.len),
+                    ));
+                }
+            }
+        }
+        edits.sort_by_key(|(offset, _, _)| *offset);
+        let extra: usize = edits.iter().map(|(_, _, text)| text.len()).sum();
+        let mut out = String::with_capacity(xml.len() + extra);
+        let mut pos = 0;
+        for (offset, replaced, text) in edits {
+            out.push_str(&xml[pos..offset]);
+            out.push_str(&text);
+            pos = offset + replaced;
+        }
+        out.push_str(&xml[pos..]);
+        out
+    }
+
+    fn section_mut(&mut self, tag: &str) -> &mut StyleSection {
+        match tag {
+            "numFmts" => &mut self.num_fmts,
+            "fonts" => &mut self.fonts,
+            "fills" => &mut self.fills,
+            "borders" => &mut self.borders,
+            _ => &mut self.cell_xfs,
+        }
+    }
+
+    fn note_num_fmt(&mut self, e: &BytesStart<'_>) {
+        if e.local_name().as_ref() != b"numFmt" {
+            return;
+        }
+        let id = attr_value(e, b"numFmtId")
+            .and_then(|s| s.parse::<u32>().ok())
+            .unwrap_or(0);
+        let code = attr_value(e, b"formatCode").unwrap_or_default();
+        self.num_fmt_ids.entry(code).or_insert(id);
+        self.max_num_fmt_id = self.max_num_fmt_id.max(id);
+    }
+
+    fn intern_num_fmt(&mut self, code: &str) -> u32 {
+        if let Some(id) = builtin_num_fmt_id(code) {
+            return id;
+        }
+        if let Some(&id) = self.num_fmt_ids.get(code) {
+            return id;
+        }
+        self.max_num_fmt_id += 1;
+        let id = self.max_num_fmt_id;
+        self.num_fmt_ids.insert(code.to_string(), id);
+        // `added` is what gets written; numFmts are keyed by code, not index.
+        self.num_fmts.len += 1;
+        self.num_fmts.added.push(format!(
+            "<numFmt numFmtId=\"{id}\" formatCode=\"{}\"/>",
+            xml_escape(code)
+        ));
         id
-    } else {
-        0
-    };
+    }
+}
 
-    // 5. Create cellXfs entry
-    let xf_xml = xf_to_xml(
-        font_id,
-        fill_id,
-        border_id,
-        num_fmt_id,
-        spec.alignment.as_ref(),
-        spec.font.is_some(),
-        spec.fill.is_some(),
-        spec.border.is_some(),
-        spec.number_format.is_some(),
-    );
-    let (xml, xf_index) = inject_into_section(&xml, "cellXfs", &xf_xml);
+fn section_tag(name: &[u8]) -> Option<&'static str> {
+    match name {
+        b"numFmts" => Some("numFmts"),
+        b"fonts" => Some("fonts"),
+        b"fills" => Some("fills"),
+        b"borders" => Some("borders"),
+        b"cellXfs" => Some("cellXfs"),
+        _ => None,
+    }
+}
 
-    (xml, xf_index)
+/// Convenience: apply a full FormatSpec to styles.xml, returning updated XML and the xf index.
+///
+/// Parses and re-serializes styles.xml per call; use [`StylesTable`] to
+/// apply many specs at once.
+pub fn apply_format_spec(xml: &str, spec: &FormatSpec) -> (String, u32) {
+    let mut table = StylesTable::parse(xml);
+    let xf_index = table.intern_format(spec);
+    (table.into_xml(), xf_index)
 }
 
 #[cfg(test)]
@@ -661,4 +903,82 @@ mod tests {
         assert!(xf.contains("horizontal=\"center\""));
         assert!(xf.contains("wrapText=\"1\""));
     }
+
+    fn bold_red() -> FormatSpec {
+        FormatSpec {
+            font: Some(FontSpec {
+                bold: true,
+                ..Default::default()
+            }),
+            fill: Some(FillSpec {
+                pattern_type: "solid".to_string(),
+                fg_color_rgb: Some("FFFF0000".to_string()),
+            }),
+            number_format: Some("0.000".to_string()),
+            ..Default::default()
+        }
+    }
+
+    #[test]
+    fn test_styles_table_dedups_identical_specs() {
+        let mut table = StylesTable::parse(MINIMAL_STYLES);
+        let first = table.intern_format(&bold_red());
+        let second = table.intern_format(&bold_red());
+        let plain = table.intern_format(&FormatSpec::default());
+        assert_eq!((first, second, plain), (1, 1, 0));
+        let xml = table.into_xml();
+        assert_eq!(xml.matches("<b/>").count(), 1);
+        assert!(xml.contains("<fonts count=\"2\">"));
+        assert!(xml.contains("<fills count=\"3\">"));
+        assert!(xml.contains("<cellXfs count=\"2\">"));
+        assert!(xml.contains("<numFmts count=\"1\"><numFmt numFmtId=\"164\""));
+        assert!(xml.find("<numFmts").unwrap() < xml.find("<fonts").unwrap());
+    }
+
+    #[test]
+    fn test_styles_table_reuses_entries_from_earlier_save() {
+        let (saved, idx) = apply_format_spec(MINIMAL_STYLES, &bold_red());
+        let mut table = StylesTable::parse(&saved);
+        assert_eq!(table.intern_format(&bold_red()), idx);
+        assert_eq!(table.into_xml(), saved);
+    }
+
+    #[test]
+    fn test_styles_table_adds_num_fmts_inside_style_sheet_without_fonts() {
+        let xml = r#"<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellXfs></styleSheet>"#;
+        let mut table = StylesTable::parse(xml);
+        let spec = FormatSpec {
+            number_format: Some("0.000".to_string()),
+            ..Default::default()
+        };
+        assert_eq!(table.intern_format(&spec), 1);
+        let out = table.into_xml();
+        assert!(out.starts_with("<?xml"));
+        assert!(out.contains(
+            "main\"><numFmts count=\"1\"><numFmt numFmtId=\"164\" formatCode=\"0.000\"/></numFmts><cellXfs count=\"2\">"
+        ));
+    }
+
+    #[test]
+    fn test_styles_table_counts_children_not_nested_elements() {
+        let xml = r#"<styleSheet><numFmts count="0"/><fonts count="1"><font><b/></font></fonts><fills count="1"><fill/></fills><borders count="1"><border/></borders><cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellXfs><dxfs count="1"><dxf><font><i/></font></dxf></dxfs></styleSheet>"#;
+        let mut table = StylesTable::parse(xml);
+        let spec = FormatSpec {
+            font: Some(FontSpec {
+                italic: true,
+                ..Default::default()
+            }),
+            number_format: Some("0.0".to_string()),
+            ..Default::default()
+        };
+        assert_eq!(table.intern_format(&spec), 1);
+        let out = table.into_xml();
+        assert!(out.contains(
+            "<numFmts count=\"1\"><numFmt numFmtId=\"164\" formatCode=\"0.0\"/></numFmts>"
+        ));
+        assert!(out.contains("<fonts count=\"2\"><font><b/></font><font><i/></font></fonts>"));
+        assert!(out.contains("numFmtId=\"164\" fontId=\"1\" fillId=\"0\""));
+        assert!(out.ends_with("<dxfs count=\"1\"><dxf><font><i/></font></dxf></dxfs></styleSheet>"));
+    }
 }
@@ -8,6 +8,8 @@ import tempfile
 import pytest
 from wolfxl.calc._evaluator import WorkbookEvaluator
 from wolfxl.calc._functions import ExcelError
+from wolfxl.calc._loader import load_sheet_cells
+from wolfxl.workbook.defined_name import DefinedName
 
 import wolfxl
 
@@ -137,6 +139,65 @@ class TestLoadAndCalculate:
         assert results["Sheet!B1"] == 10
 
 
+class TestBulkLoad:
+    def test_sheet_cells_skip_blanks(self) -> None:
+        wb = _make_sum_chain_workbook()
+        wb.active["C2"] = "x"
+        wb.active["B1"] = None
+        cells = load_sheet_cells(wb.active)
+        assert list(zip(cells.rows, cells.cols, cells.values)) == [
+            (1, 1, 10), (2, 1, 20), (2, 3, "x"), (3, 1, "=SUM(A1:A2)"), (4, 1, "=A3*2"),
+        ]
+        assert list(cells.formulas()) == [("Sheet!A3", "=SUM(A1:A2)"), ("Sheet!A4", "=A3*2")]
+
+    def test_appended_rows_are_loaded(self) -> None:
+        wb = wolfxl.Workbook()
+        ws = wb.active
+        ws.append([1, 2, "=A1+B1"])
+        ws.append([3, 4, "=C1*A2+B2"])
+        ev = WorkbookEvaluator()
+        ev.load(wb)
+        assert ev.calculate() == {"Sheet!C1": 3, "Sheet!C2": 13}
+
+    def test_column_writes_are_loaded(self) -> None:
+        np = pytest.importorskip("numpy")
+        wb = wolfxl.Workbook()
+        ws = wb.active
+        ws.write_columns({"qty": np.array([2, 3]), "price": np.array([1.5, 2.5])})
+        ws["C2"] = "=A2*B2"
+        ws["C4"] = "=SUMPRODUCT(A2:A3,B2:B3)"
+        assert wb.calculate() == {"Sheet!C2": 3.0, "Sheet!C4": 10.5}
+
+    def test_roundtrip_load_matches_write_mode(self) -> None:
+        wb = _make_sum_chain_workbook()
+        wb.active["B7"] = "=A4-A1"
+        wb2, path = _roundtrip(wb)
+        try:
+            before, after = WorkbookEvaluator(), WorkbookEvaluator()
+            before.load(wb)
+            after.load(wb2)
+            assert after._cell_values == before._cell_values
+            assert after.calculate() == before.calculate()
+        finally:
+            wb2.close()
+            os.unlink(path)
+
+    def test_xls_loads_through_plain_values(self) -> None:
+        path = os.path.join(os.path.dirname(__file__), "fixtures", "sprint_kappa_smoke.xls")
+        wb = wolfxl.load_workbook(path)
+        ws = wb[wb.sheetnames[0]]
+        expected = [
+            (row, col, value)
+            for row, values in enumerate(ws.iter_rows(values_only=True), start=1)
+            for col, value in enumerate(values, start=1)
+            if value is not None
+        ]
+        cells = load_sheet_cells(ws)
+        assert expected
+        assert list(zip(cells.rows, cells.cols, cells.values)) == expected
+        assert isinstance(wb.calculate(), dict)
+
+
 class TestCrossSheet:
     def test_cross_sheet_sum(self) -> None:
         wb = wolfxl.Workbook()
@@ -794,6 +855,20 @@ class TestNamedRanges:
         results = ev.calculate()
         assert results["Sheet!B1"] == 400.0
 
+    def test_compound_nested_name_keeps_precedence(self) -> None:
+        """Total = Rate*2 with Rate = 0.05+0.02 is (0.05+0.02)*2."""
+        wb = wolfxl.Workbook()
+        ws = wb.active
+        ws["A1"] = "=Total"
+        ws["A2"] = "=Total*10"
+        ev = WorkbookEvaluator()
+        ev.load(wb)
+        ev._named_ranges["RATE"] = "0.05+0.02"
+        ev._named_ranges["TOTAL"] = "Rate*2"
+        results = ev.calculate()
+        assert results["Sheet!A1"] == pytest.approx(0.14)
+        assert results["Sheet!A2"] == pytest.approx(1.4)
+
     def test_named_range_cross_sheet(self) -> None:
         """Named range can refer to a cell on another sheet."""
         wb = wolfxl.Workbook()
@@ -826,7 +901,113 @@ class TestNamedRanges:
         recalc = ev.recalculate({"Sheet!A1": 200}, tolerance=1e-10)
         assert any(d.cell_ref == "Sheet!B1" and d.new_value == 400.0 for d in recalc.deltas)
 
+    def test_sheet_scoped_name_shadows_workbook_name(self) -> None:
+        wb = wolfxl.Workbook()
+        ws = wb.active
+        other = wb.create_sheet("Other")
+        ws["A1"] = 5
+        other["A1"] = 7
+        ws["B1"] = "=Rate*2"
+        other["B1"] = "=Rate*2"
+        ws["C1"] = "=Other!Rate*3"
+        wb.defined_names["Rate"] = DefinedName(name="Rate", value="Sheet!$A$1")
+        # Sheet-scoped names come back without their own sheet prefix.
+        other.defined_names["Rate"] = DefinedName(name="Rate", value="$A$1")
+        results = wb.calculate()
+        assert results["Sheet!B1"] == 10
+        assert results["Other!B1"] == 14
+        assert results["Sheet!C1"] == 21
+
+    def test_name_referring_to_names(self) -> None:
+        wb = wolfxl.Workbook()
+        ws = wb.active
+        ws["A1"] = 10
+        ws["A2"] = 20
+        ws["B1"] = "=Total+Offset"
+        for name, value in (
+            ("Amounts", "Sheet!$A$1:$A$2"),
+            ("Total", "SUM(Amounts)"),
+            ("Offset", "=Sheet!$A$1"),
+        ):
+            wb.defined_names[name] = DefinedName(name=name, value=value)
+        assert wb.calculate()["Sheet!B1"] == 40
+
     def test_write_mode_has_no_named_ranges(self) -> None:
         """Write-mode workbook returns empty defined_names."""
         wb = wolfxl.Workbook()
         assert wb.defined_names == {}
+
+
+class TestCompileCache:
+    def test_formula_compiled_once_across_recalculations(self) -> None:
+        wb = _make_sum_chain_workbook()
+        ev = WorkbookEvaluator()
+        ev.load(wb)
+        ev.calculate()
+        nodes = dict(ev._formula_cache)
+        for value in (1, 2, 3):
+            recalc = ev.recalculate({"Sheet!A1": value})
+            assert ev._cell_values["Sheet!A4"] == (value + 20) * 2
+            assert recalc.propagated_cells == 2
+        assert ev._formula_cache == nodes
+        assert len(nodes) == 2
+
+    def test_registered_function_after_compile(self) -> None:
+        wb = wolfxl.Workbook()
+        ws = wb.active
+        ws["A1"] = 4
+        ws["B1"] = "=DOUBLE(A1)+1"
+        ev = WorkbookEvaluator()
+        ev.load(wb)
+        assert ev.calculate()["Sheet!B1"] is None
+        ev._functions.register("DOUBLE", lambda args: args[0] * 2)
+        assert ev.calculate()["Sheet!B1"] == 9
+
+    def test_load_clears_compiled_nodes(self) -> None:
+        wb = _make_sum_chain_workbook()
+        ev = WorkbookEvaluator()
+        ev.load(wb)
+        ev.calculate()
+        assert ev._formula_cache
+        ev.load(wolfxl.Workbook())
+        assert not ev._formula_cache
+        assert not ev._expr_cache
+
+
+class TestRecalculateBatch:
+    def _evaluator(self) -> WorkbookEvaluator:
+        wb = wolfxl.Workbook()
+        ws = wb.active
+        ws["A1"] = 10
+        ws["A2"] = 20
+        ws["A3"] = "=SUM(A1:A2)"
+        ws["A4"] = "=IF(A3>25,A3*2,-A1)"
+        ws["A5"] = '=A1&"x"'
+        ws["A6"] = "=A1/(A2-20)"
+        ev = WorkbookEvaluator()
+        ev.load(wb)
+        ev.calculate()
+        return ev
+
+    def test_matches_scalar_recalculate(self) -> None:
+        pytest.importorskip("numpy")
+        ev = self._evaluator()
+        scenarios = [{"Sheet!A1": 1}, {"Sheet!A1": 7, "Sheet!A2": 21}, {"Sheet!A2": 2.5}]
+        batch = ev.recalculate_batch(scenarios)
+        assert batch.inputs == ("Sheet!A1", "Sheet!A2")
+        assert ev._cell_values["Sheet!A3"] == 30
+        for row, scenario in zip(batch.values, scenarios):
+            fresh = self._evaluator()
+            fresh.recalculate(scenario)
+            for ref, value in zip(batch.outputs, row):
+                assert value == fresh._cell_values[ref], ref
+
+    def test_array_form_returns_numeric_matrix(self) -> None:
+        np = pytest.importorskip("numpy")
+        ev = self._evaluator()
+        values = np.array([[1.0, 2.0], [30.0, 4.0]])
+        batch = ev.recalculate_batch(
+            values, ["Sheet!A3", "Sheet!A4"], inputs=["Sheet!A1", "Sheet!A2"],
+        )
+        assert batch.values.dtype == np.float64
+        assert batch.values.tolist() == [[3.0, -1.0], [34.0, 68.0]]
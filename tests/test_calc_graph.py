@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import pytest
 from wolfxl.calc._graph import DependencyGraph
+from wolfxl.calc._names import NameTable
 
 
 class TestAddFormula:
@@ -16,10 +17,27 @@ class TestAddFormula:
     def test_range_dependency(self) -> None:
         g = DependencyGraph()
         g.add_formula("Sheet1!A4", "=SUM(A1:A3)", "Sheet1")
-        deps = g.dependencies["Sheet1!A4"]
-        assert "Sheet1!A1" in deps
-        assert "Sheet1!A2" in deps
-        assert "Sheet1!A3" in deps
+        assert g.ranges["Sheet1!A4"] == [("Sheet1", 1, 1, 3, 1)]
+        assert g.dependencies["Sheet1!A4"] == set()
+        for ref in ("Sheet1!A1", "Sheet1!A2", "Sheet1!A3"):
+            assert g.dependents_of(ref) == {"Sheet1!A4"}
+        assert g.dependents_of("Sheet1!A5") == set()
+        assert g.dependents_of("Sheet1!B2") == set()
+
+    def test_large_range_is_not_expanded(self) -> None:
+        g = DependencyGraph()
+        g.add_formula("Sheet1!B1", "=SUM(A1:A1048576)", "Sheet1")
+        assert g.dependents == {}
+        assert g.dependents_of("Sheet1!A777777") == {"Sheet1!B1"}
+        assert g.affected_cells({"Sheet1!A1048576"}) == ["Sheet1!B1"]
+
+    def test_readding_formula_replaces_edges(self) -> None:
+        g = DependencyGraph()
+        g.add_formula("Sheet1!C1", "=A1+SUM(B1:B5)", "Sheet1")
+        g.add_formula("Sheet1!C1", "=D1", "Sheet1")
+        assert g.dependents_of("Sheet1!A1") == set()
+        assert g.dependents_of("Sheet1!B3") == set()
+        assert g.dependents_of("Sheet1!D1") == {"Sheet1!C1"}
 
     def test_cross_sheet_dependency(self) -> None:
         g = DependencyGraph()
@@ -29,6 +47,41 @@ class TestAddFormula:
         assert "TB!A2" in deps
 
 
+class TestNamedRanges:
+    def test_plain_mapping(self) -> None:
+        g = DependencyGraph()
+        g.add_formula("S!B1", "=Rate*Qty", "S", named_ranges={"RATE": "S!$A$1", "QTY": "S!A2"})
+        assert g.dependencies["S!B1"] == {"S!A1", "S!A2"}
+
+    def test_only_whole_tokens_expand(self) -> None:
+        names = NameTable({"RATE": "S!A1", "SUM": "S!A9"})
+        assert names.expand('=Rates+RATE&"Rate"+SUM(Rate)', "S") == '=Rates+S!A1&"Rate"+SUM(S!A1)'
+        assert names.expand("=Other!Rate+1E5+Rate.2", "S") == "=Other!Rate+1E5+Rate.2"
+
+    def test_sheet_scope_shadows_workbook(self) -> None:
+        names = NameTable()
+        names.define("Rate", "Inputs!$A$1")
+        names.define("Rate", "=Local!$B$1", sheet="Local")
+        g = DependencyGraph()
+        g.add_formula("Local!C1", "=Rate", "Local", named_ranges=names)
+        g.add_formula("Other!C1", "=Rate+'Local'!Rate", "Other", named_ranges=names)
+        assert g.dependencies["Local!C1"] == {"Local!B1"}
+        assert g.dependencies["Other!C1"] == {"Inputs!A1", "Local!B1"}
+
+    def test_names_referring_to_names(self) -> None:
+        names = NameTable({"TOTAL": "SUM(Sales)", "SALES": "Data!$A$1:$A$9", "LOOP": "Loop+1"})
+        assert names.resolve("total", "S") == "SUM(Data!$A$1:$A$9)"
+        assert names.resolve("Loop", "S") == "Loop+1"
+        g = DependencyGraph()
+        g.add_formula("S!A1", "=Total*2", "S", named_ranges=names)
+        assert g.ranges["S!A1"] == [("Data", 1, 1, 9, 1)]
+
+    def test_compound_names_are_parenthesized(self) -> None:
+        names = NameTable({"RATE": "0.05+0.02", "TOTAL": "Rate*2", "CELL": "'My S'!$A$1"})
+        assert names.resolve("Total", "S") == "(0.05+0.02)*2"
+        assert names.expand("=Total*3+Cell", "S") == "=((0.05+0.02)*2)*3+'My S'!$A$1"
+
+
 class TestTopologicalOrder:
     def test_empty(self) -> None:
         g = DependencyGraph()
@@ -129,3 +182,31 @@ class TestMaxDepth:
         assert g.max_depth({"Sheet1!A1"}) == 1
         # C1 is not referenced by anyone
         assert g.max_depth({"Sheet1!C1"}) == 0
+
+
+class TestDirtyCells:
+    def test_order_and_depth_in_one_pass(self) -> None:
+        g = DependencyGraph()
+        g.add_formula("Sheet1!B1", "=Sheet1!A1+1", "Sheet1")
+        g.add_formula("Sheet1!C1", "=SUM(Sheet1!A1:B1)", "Sheet1")
+        g.add_formula("Sheet1!D1", "=Sheet1!Z1", "Sheet1")
+        order, depth = g.dirty_cells({"Sheet1!A1"})
+        assert order == ["Sheet1!B1", "Sheet1!C1"]
+        assert depth == 2
+
+    def test_levels_follow_formulas_added_after_ordering(self) -> None:
+        g = DependencyGraph()
+        g.add_formula("Sheet1!C1", "=Sheet1!B1*2", "Sheet1")
+        assert g.topological_order() == ["Sheet1!C1"]
+        # B1 becomes a formula cell after levels were built.
+        g.add_formula("Sheet1!B1", "=SUM(Sheet1!A1:A3)", "Sheet1")
+        assert g.topological_order() == ["Sheet1!B1", "Sheet1!C1"]
+        assert g.affected_cells({"Sheet1!A2"}) == ["Sheet1!B1", "Sheet1!C1"]
+
+    def test_cycle_closed_after_ordering_is_reported(self) -> None:
+        g = DependencyGraph()
+        g.add_formula("Sheet1!A1", "=Sheet1!B1+1", "Sheet1")
+        g.topological_order()
+        g.add_formula("Sheet1!B1", "=SUM(Sheet1!A1:A2)", "Sheet1")
+        with pytest.raises(ValueError, match="Circular reference"):
+            g.topological_order()
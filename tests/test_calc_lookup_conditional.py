@@ -9,7 +9,14 @@ chains.
 from __future__ import annotations
 
 from wolfxl.calc._evaluator import WorkbookEvaluator
-from wolfxl.calc._functions import RangeValue, _match_criteria, _parse_criteria
+from wolfxl.calc._functions import (
+    RangeValue,
+    _builtin_match,
+    _builtin_sumifs,
+    _builtin_xlookup,
+    _match_criteria,
+    _parse_criteria,
+)
 
 import wolfxl
 
@@ -657,3 +664,113 @@ class TestPerturbationPropagation:
         delta_map = {d.cell_ref: d for d in recalc.deltas}
         assert "Sheet!C1" in delta_map
         assert delta_map["Sheet!C1"].new_value == 800.0  # 500 + 300
+
+
+# ---------------------------------------------------------------------------
+# Shared lookup indexes
+# ---------------------------------------------------------------------------
+
+
+class TestSharedLookupIndex:
+    def _table_wb(self) -> wolfxl.Workbook:
+        data: dict[str, object] = {}
+        for i, key in enumerate(["apple", "Pear", "fig", "pear", "kiwi"], start=1):
+            data[f"A{i}"] = key
+            data[f"B{i}"] = i * 10
+        return _make_wb(data, {
+            "D1": '=VLOOKUP("PEAR",$A$1:$B$5,2,FALSE)',
+            "D2": '=VLOOKUP("kiwi",$A$1:$B$5,2,FALSE)',
+            "D3": '=MATCH("fig",$A$1:$A$5,0)',
+            "D4": '=XLOOKUP("pear",$A$1:$A$5,$B$1:$B$5,"none",0,-1)',
+            "D5": "=INDEX($B$1:$B$5,4)",
+        })
+
+    def test_lookups_share_one_range(self) -> None:
+        ev = WorkbookEvaluator()
+        ev.load(self._table_wb())
+        results = ev.calculate()
+        assert results["Sheet!D1"] == 20
+        assert results["Sheet!D2"] == 50
+        assert results["Sheet!D3"] == 3
+        assert results["Sheet!D4"] == 40
+        assert results["Sheet!D5"] == 40
+        assert set(ev._shared_ranges._entries) == {  # noqa: SLF001
+            "Sheet!A1:B5", "Sheet!A1:A5", "Sheet!B1:B5",
+        }
+
+    def test_recalculate_invalidates_changed_range(self) -> None:
+        ev = WorkbookEvaluator()
+        ev.load(self._table_wb())
+        ev.calculate()
+        recalc = ev.recalculate({"Sheet!A2": "plum", "Sheet!B5": 7})
+        delta_map = {d.cell_ref: d.new_value for d in recalc.deltas}
+        assert delta_map["Sheet!D1"] == 40
+        assert delta_map["Sheet!D2"] == 7
+        assert "Sheet!D3" not in delta_map
+
+    def test_indexed_matches_scan(self) -> None:
+        values = [3, None, "b", 1, 7, 3, True, "A", 5.0]
+        plain = RangeValue(values=values, n_rows=len(values), n_cols=1)
+        shared = RangeValue(values=values, n_rows=len(values), n_cols=1)
+        shared._indexes = {}  # noqa: SLF001
+        returns = list(range(len(values)))
+        for lookup in (3, 4, 6, 0, 1, "a"):
+            for match_type in (0, 1, -1):
+                assert _builtin_match([lookup, shared, match_type]) == _builtin_match(
+                    [lookup, plain, match_type],
+                )
+                for search_mode in (1, -1):
+                    tail = [returns, "nf", match_type, search_mode]
+                    assert _builtin_xlookup([lookup, shared, *tail]) == _builtin_xlookup(
+                        [lookup, plain, *tail],
+                    )
+
+
+class TestCriteriaIndex:
+    def _fact_wb(self) -> wolfxl.Workbook:
+        data: dict[str, object] = {}
+        regions = ["East", "West", "east", None, "North", "West"]
+        for i, region in enumerate(regions, start=1):
+            data[f"A{i}"] = region
+            data[f"B{i}"] = i
+            data[f"C{i}"] = i * 100
+        return _make_wb(data, {
+            "E1": '=SUMIFS($C$1:$C$6,$A$1:$A$6,"east",$B$1:$B$6,">1")',
+            "E2": '=COUNTIFS($A$1:$A$6,"<>West",$B$1:$B$6,"<=4")',
+            "E3": '=SUMIF($A$1:$A$6,"*st",$C$1:$C$6)',
+            "E4": '=AVERAGEIFS($C$1:$C$6,$A$1:$A$6,"West")',
+            "E5": '=MAXIFS($C$1:$C$6,$B$1:$B$6,"<4")',
+        })
+
+    def test_indexed_results(self) -> None:
+        results = _calc(self._fact_wb())
+        assert results["Sheet!E1"] == 300.0
+        assert results["Sheet!E2"] == 3.0
+        assert results["Sheet!E3"] == 1200.0
+        assert results["Sheet!E4"] == 400.0
+        assert results["Sheet!E5"] == 300.0
+
+    def test_recalculate_patches_index_in_place(self) -> None:
+        ev = WorkbookEvaluator()
+        ev.load(self._fact_wb())
+        ev.calculate()
+        regions = ev._shared_ranges._entries["Sheet!A1:A6"][0]  # noqa: SLF001
+        index = regions._indexes[("criteria",)]  # noqa: SLF001
+        recalc = ev.recalculate({"Sheet!A2": "EAST", "Sheet!C3": 1000})
+        delta_map = {d.cell_ref: d.new_value for d in recalc.deltas}
+        assert delta_map["Sheet!E1"] == 1200.0
+        assert delta_map["Sheet!E4"] == 600.0
+        assert regions._indexes[("criteria",)] is index  # noqa: SLF001
+        assert regions.values[1] == "EAST"
+
+    def test_indexed_matches_scan(self) -> None:
+        values = [3, None, "b", 1, 7, "3", True, "A", 5.0, "ab"]
+        amounts = list(range(10, 110, 10))
+        for criteria in (3, "3", "<>3", ">2", "<=b", "a*", "?", "<>", "=", True):
+            plain = [RangeValue(values=v, n_rows=10, n_cols=1) for v in (amounts, values)]
+            shared = [RangeValue(values=v, n_rows=10, n_cols=1) for v in (amounts, values)]
+            for rng in shared:
+                rng._indexes = {}  # noqa: SLF001
+            assert _builtin_sumifs([shared[0], shared[1], criteria]) == _builtin_sumifs(
+                [plain[0], plain[1], criteria],
+            )
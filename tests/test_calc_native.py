@@ -0,0 +1,196 @@
+"""Tests for wolfxl.calc NativeEvaluator (the Rust calc engine)."""
+
+from __future__ import annotations
+
+import datetime
+
+import pytest
+from wolfxl._workbook_calc import load_evaluator
+from wolfxl.calc._evaluator import WorkbookEvaluator
+from wolfxl.calc._functions import ExcelError
+from wolfxl.calc._native import NativeEvaluator, native_engine_available
+
+import wolfxl
+
+pytestmark = pytest.mark.skipif(
+    not native_engine_available(), reason="extension built without NativeCalcEngine",
+)
+
+
+def _make_model_workbook() -> wolfxl.Workbook:
+    wb = wolfxl.Workbook()
+    ws = wb.active
+    ws["A1"] = "East"
+    ws["A2"] = "West"
+    ws["A3"] = "East"
+    ws["B1"] = 10
+    ws["B2"] = 20
+    ws["B3"] = 30
+    ws["C1"] = "=SUM(B1:B3)"
+    ws["C2"] = '=SUMIF(A1:A3,"East",B1:B3)'
+    ws["C3"] = "=C1*2-C2"
+    ws["C4"] = '=VLOOKUP("West",A1:B3,2,FALSE)'
+    ws["C5"] = '=IF(C3>50,"big","small")'
+    ws["C6"] = "=B1/(B2-20)"
+    return wb
+
+
+def _native(wb: wolfxl.Workbook) -> NativeEvaluator:
+    ev = NativeEvaluator()
+    ev.load(wb)
+    assert ev.unsupported == []
+    return ev
+
+
+class TestNativeCalculate:
+    def test_matches_python_evaluator(self) -> None:
+        wb = _make_model_workbook()
+        native = _native(wb).calculate()
+        python = WorkbookEvaluator()
+        python.load(wb)
+        assert native == python.calculate()
+
+    def test_evaluation_order_and_errors(self) -> None:
+        results = _native(_make_model_workbook()).calculate()
+        assert list(results)[:2] == ["Sheet!C1", "Sheet!C2"]
+        assert results["Sheet!C5"] == "big"
+        assert results["Sheet!C6"] is ExcelError.DIV0
+
+    def test_dates_are_serials(self) -> None:
+        wb = wolfxl.Workbook()
+        ws = wb.active
+        ws["A1"] = datetime.date(2024, 1, 15)
+        ws["A2"] = "=YEAR(A1)*100+MONTH(A1)"
+        ws["A3"] = "=EOMONTH(A1,1)-A1"
+        results = _native(wb).calculate()
+        assert results["Sheet!A2"] == 202401
+        assert results["Sheet!A3"] == 45
+
+    def test_defined_names(self) -> None:
+        wb = _make_model_workbook()
+        wb.create_named_range("Sales", wb.active, "$B$1:$B$3")
+        wb.active["D1"] = "=SUM(Sales)"
+        assert _native(wb).calculate()["Sheet!D1"] == 60
+
+    def test_parallel_levels_match_serial(self) -> None:
+        wb = wolfxl.Workbook()
+        ws = wb.active
+        for row in range(1, 2001):
+            ws.cell(row=row, column=1, value=row)
+            ws.cell(row=row, column=2, value=f"=A{row}*2+SUM(A1:A10)")
+            ws.cell(row=row, column=3, value=f"=B{row}+1")
+        ws["D1"] = "=SUM(C1:C2000)"
+        serial = NativeEvaluator()
+        serial.load(wb)
+        parallel = NativeEvaluator(threads=4)
+        parallel.load(wb)
+        assert list(parallel.calculate().items()) == list(serial.calculate().items())
+        assert parallel.recalculate({"Sheet!A3": 0}) == serial.recalculate({"Sheet!A3": 0})
+
+    def test_threads_must_not_be_negative(self) -> None:
+        with pytest.raises(ValueError, match="threads"):
+            NativeEvaluator(threads=-1)
+
+    def test_cycle_raises(self) -> None:
+        wb = wolfxl.Workbook()
+        wb.active["A1"] = "=B1"
+        wb.active["B1"] = "=A1"
+        with pytest.raises(ValueError, match="Circular reference"):
+            _native(wb).calculate()
+
+
+class TestNativeRecalculate:
+    def test_deltas_and_depth(self) -> None:
+        ev = _native(_make_model_workbook())
+        ev.calculate()
+        result = ev.recalculate({"Sheet!B1": 40})
+        changed = {d.cell_ref: d.new_value for d in result.deltas}
+        assert changed == {"Sheet!C1": 90, "Sheet!C2": 70, "Sheet!C3": 110}
+        assert result.max_chain_depth == 3
+        assert result.total_formula_cells == 6
+
+    def test_batch_leaves_values_unchanged(self) -> None:
+        np = pytest.importorskip("numpy")
+        ev = _native(_make_model_workbook())
+        ev.calculate()
+        batch = ev.recalculate_batch(
+            np.array([[1.0], [2.0]]), ["Sheet!C1", "Sheet!C3"], inputs=["Sheet!B1"],
+        )
+        assert batch.values.dtype == np.float64
+        assert batch.values.tolist() == [[51.0, 71.0], [52.0, 72.0]]
+        assert ev.recalculate({"Sheet!B2": 20}).deltas == ()
+
+
+class TestFallback:
+    def test_unsupported_function_is_listed(self) -> None:
+        wb = _make_model_workbook()
+        wb.active["D1"] = "=TODAY()"
+        ev = NativeEvaluator()
+        ev.load(wb)
+        assert [ref for ref, _ in ev.unsupported] == ["Sheet!D1"]
+        with pytest.raises(RuntimeError, match="Sheet!D1"):
+            ev.calculate()
+
+    def test_sheet_scoped_names_fall_back(self) -> None:
+        from wolfxl.workbook.defined_name import DefinedName
+
+        wb = _make_model_workbook()
+        wb.create_named_range("Rate", wb.active, "$B$1")
+        other = wb.create_sheet("Other")
+        other["A1"] = 7
+        other["B1"] = "=Rate*2"
+        other.defined_names["Rate"] = DefinedName(name="Rate", value="$A$1")
+        ev = NativeEvaluator()
+        ev.load(wb)
+        assert [ref for ref, _ in ev.unsupported] == ["Other!Rate"]
+        assert isinstance(load_evaluator(wb, native=True), WorkbookEvaluator)
+        assert wb.calculate(native=True)["Other!B1"] == 14
+
+    def test_load_evaluator_picks_engine(self) -> None:
+        wb = _make_model_workbook()
+        assert isinstance(load_evaluator(wb), WorkbookEvaluator)
+        assert isinstance(load_evaluator(wb, native=True), NativeEvaluator)
+        wb.active["D1"] = "=TODAY()"
+        assert isinstance(load_evaluator(wb, native=True), WorkbookEvaluator)
+
+    def test_threads_imply_native(self) -> None:
+        wb = _make_model_workbook()
+        ev = load_evaluator(wb, threads=4)
+        assert isinstance(ev, NativeEvaluator)
+        assert ev.threads == 4
+
+    def test_dropped_threads_warn(self) -> None:
+        wb = _make_model_workbook()
+        wb.active["D1"] = "=TODAY()"
+        with pytest.warns(RuntimeWarning, match=r"Sheet!D1.*4 thread"):
+            results = wb.calculate(threads=4)
+        assert isinstance(wb._evaluator, WorkbookEvaluator)
+        assert results["Sheet!C1"] == 60
+
+    def test_serial_fallback_does_not_warn(self, recwarn: pytest.WarningsRecorder) -> None:
+        wb = _make_model_workbook()
+        wb.active["D1"] = "=TODAY()"
+        assert isinstance(load_evaluator(wb, native=True), WorkbookEvaluator)
+        assert not [w for w in recwarn if issubclass(w.category, RuntimeWarning)]
+
+    def test_default_results_keep_python_types(self) -> None:
+        wb = wolfxl.Workbook()
+        ws = wb.active
+        ws["A1"] = 3
+        ws["A2"] = datetime.date(2024, 1, 31)
+        ws["B1"] = "=A1*2"
+        ws["B2"] = "=A2"
+        ws["B3"] = "=A9"
+        ws["B4"] = "=A1+A9"
+        python = WorkbookEvaluator()
+        python.load(wb)
+        expected = python.calculate()
+        results = wb.calculate()
+        assert results == expected
+        assert {ref: type(v) for ref, v in results.items()} == {
+            ref: type(v) for ref, v in expected.items()
+        }
+        native = wb.calculate(native=True)
+        assert native == {
+            "Sheet!B1": 6.0, "Sheet!B2": 45322.0, "Sheet!B3": None, "Sheet!B4": 3.0,
+        }
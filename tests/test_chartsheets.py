@@ -98,6 +98,33 @@ def test_create_chartsheet_in_modify_mode_round_trips(tmp_path: Path) -> None:
     assert len(reloaded.chartsheets[0]._charts) == 1  # noqa: SLF001
 
 
+def test_modify_mode_chartsheet_survives_a_second_save(tmp_path: Path) -> None:
+    openpyxl = pytest.importorskip("openpyxl")
+
+    src = tmp_path / "twice_src.xlsx"
+    op = openpyxl.Workbook()
+    op.active.title = "Data"
+    op.active.append(["month", "sales"])
+    op.active.append(["Jan", 10])
+    op.save(src)
+
+    wb = wolfxl.load_workbook(src, modify=True)
+    wb.create_chartsheet("Chart")
+    first = tmp_path / "first.xlsx"
+    second = tmp_path / "second.xlsx"
+    wb.save(first)
+    wb.save(second)
+
+    for out in (first, second):
+        with zipfile.ZipFile(out) as z:
+            names = z.namelist()
+            content_types = z.read("[Content_Types].xml").decode()
+        chartsheets = [name for name in names if name.startswith("xl/chartsheets/sheet")]
+        assert chartsheets == ["xl/chartsheets/sheet1.xml"]
+        assert 'PartName="/xl/chartsheets/sheet1.xml"' in content_types
+        assert openpyxl.load_workbook(out).sheetnames == ["Data", "Chart"]
+
+
 def test_chartsheet_can_be_inserted_between_worksheets(tmp_path: Path) -> None:
     openpyxl = pytest.importorskip("openpyxl")
 
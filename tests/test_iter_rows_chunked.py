@@ -0,0 +1,48 @@
+"""Eager ``iter_rows(values_only=True)`` reads the sheet in row blocks."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import wolfxl
+from wolfxl import _worksheet_iteration
+
+
+def _make_workbook(path: Path, rows: int) -> None:
+    wb = wolfxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    for row in range(1, rows + 1):
+        ws.cell(row=row, column=1, value=row)
+        ws.cell(row=row, column=3, value=f"r{row}")
+    wb.save(path)
+
+
+def test_blocks_match_single_range_read(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "rows.xlsx"
+    _make_workbook(path, 10)
+    expected = [(row, None, f"r{row}") for row in range(1, 11)]
+
+    wb = wolfxl.load_workbook(path)
+    reader = wb._rust_reader  # noqa: SLF001
+    calls: list[str] = []
+    original = reader.read_sheet_values_plain
+
+    class _CountingReader:
+        def __getattr__(self, name: str) -> object:
+            return getattr(reader, name)
+
+        def read_sheet_values_plain(self, sheet: str, cell_range: str, data_only: bool) -> list:
+            calls.append(cell_range)
+            return original(sheet, cell_range, data_only)
+
+    monkeypatch.setattr(_worksheet_iteration, "BULK_CHUNK_ROWS", 4)
+    wb._rust_reader = _CountingReader()  # noqa: SLF001
+
+    assert list(wb["Data"].iter_rows(values_only=True)) == expected
+    assert calls == ["A1:C4", "A5:C8", "A9:C10"]
+    assert list(wb["Data"].iter_rows(min_row=3, max_row=6, values_only=True)) == expected[2:6]
@@ -0,0 +1,72 @@
+"""``load_workbook(parse_profile=...)`` trims what read mode parses."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import openpyxl
+import pytest
+from openpyxl.comments import Comment as OpyComment
+from openpyxl.worksheet.datavalidation import DataValidation as OpyDV
+
+from wolfxl import load_workbook
+
+
+def _make_fixture(path: Path) -> None:
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["name", "qty"])
+    ws.append(["apple", 3])
+    ws.append(["pear", 5])
+    ws["B2"].number_format = "0.00"
+    ws["A1"].comment = OpyComment("header note", "alice")
+    dv = OpyDV(type="whole", operator="greaterThan", formula1="0")
+    dv.add("B2:B3")
+    ws.add_data_validation(dv)
+    wb.save(path)
+
+
+@pytest.mark.parametrize("profile", ["values", "values+styles", "full"])
+def test_every_profile_reads_identical_values(tmp_path: Path, profile: str) -> None:
+    path = tmp_path / "book.xlsx"
+    _make_fixture(path)
+
+    wb = load_workbook(path, parse_profile=profile)
+    ws = wb["Data"]
+
+    assert list(ws.iter_rows(values_only=True)) == [
+        ("name", "qty"),
+        ("apple", 3),
+        ("pear", 5),
+    ]
+    assert ws["B2"].number_format == "0.00"
+
+
+def test_values_profile_skips_comments_and_validations(tmp_path: Path) -> None:
+    path = tmp_path / "book.xlsx"
+    _make_fixture(path)
+
+    full = load_workbook(path)["Data"]
+    lean = load_workbook(path, parse_profile="values")["Data"]
+
+    assert full["A1"].comment is not None
+    assert len(full.data_validations.dataValidation) == 1
+    assert lean["A1"].comment is None
+    assert len(lean.data_validations.dataValidation) == 0
+
+
+def test_parse_profile_rejects_unknown_names(tmp_path: Path) -> None:
+    path = tmp_path / "book.xlsx"
+    _make_fixture(path)
+
+    with pytest.raises(ValueError, match="parse_profile"):
+        load_workbook(path, parse_profile="cells")
+
+
+def test_parse_profile_is_read_mode_only(tmp_path: Path) -> None:
+    path = tmp_path / "book.xlsx"
+    _make_fixture(path)
+
+    with pytest.raises(ValueError, match="read-mode only"):
+        load_workbook(path, modify=True, parse_profile="values")
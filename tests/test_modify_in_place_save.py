@@ -43,3 +43,34 @@ def test_modify_save_to_source_path_is_atomic_and_valid(tmp_path):
     assert roundtrip["Data"]["C1"].value == "wolfxl_modify_smoke"
     roundtrip.close()
 
+
+def test_save_package_edits_join_the_patcher_save(tmp_path):
+    from wolfxl._save_package import SavePackage
+
+    path = tmp_path / "source.xlsx"
+    workbook = openpyxl.Workbook()
+    workbook.active.title = "Data"
+    workbook.active["A1"] = "before"
+    workbook.save(path)
+
+    wolf_workbook = wolfxl.load_workbook(path, modify=True)
+    wolf_workbook["Data"]["A1"] = "after"
+    wolf_workbook["Data"]._flush()  # noqa: SLF001
+    package = SavePackage(wolf_workbook._rust_patcher)  # noqa: SLF001
+    assert b"after" in package.read("xl/worksheets/sheet1.xml")
+    assert package.get("customXml/item1.xml") is None
+
+    package.write("customXml/item1.xml", b"<root/>")
+    package.delete("docProps/app.xml")
+    assert "customXml/item1.xml" in package.namelist()
+    assert "docProps/app.xml" not in package.namelist()
+    wolf_workbook._rust_patcher.save_in_place()  # noqa: SLF001
+    wolf_workbook.close()
+
+    with ZipFile(path) as archive:
+        names = archive.namelist()
+        assert archive.read("customXml/item1.xml") == b"<root/>"
+    assert "docProps/app.xml" not in names
+    roundtrip = openpyxl.load_workbook(path)
+    assert roundtrip["Data"]["A1"].value == "after"
+    roundtrip.close()
@@ -108,3 +108,46 @@ def test_modify_noop_preserves_macro_sidecar_package_shape_on_copy(
     wb.close()
 
     assert output.read_bytes() == before
+
+
+def test_modify_cell_edit_raw_copies_untouched_entries(tmp_path: Path) -> None:
+    source = tmp_path / "source.xlsx"
+    output = tmp_path / "edited.xlsx"
+    sheet_xml = """<?xml version="1.0" encoding="UTF-8"?>
+<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+  <sheetData><row r="1"><c r="A1"><v>1</v></c></row></sheetData>
+</worksheet>"""
+    wb = wolfxl.Workbook()
+    wb.active["A1"] = 1
+    wb.create_sheet("Other")["B2"] = "untouched " * 200
+    wb.save(source)
+    wb.close()
+    # Re-pack at max compression so a re-deflate at the patcher's fast
+    # level would show up as a different compressed size.
+    repacked = tmp_path / "repacked.xlsx"
+    with zipfile.ZipFile(source) as src, zipfile.ZipFile(
+        repacked, "w", zipfile.ZIP_DEFLATED, compresslevel=9
+    ) as dst:
+        for info in src.infolist():
+            data = src.read(info.filename)
+            if info.filename == "xl/worksheets/sheet1.xml":
+                data = sheet_xml.encode()
+            dst.writestr(info, data, compresslevel=9)
+
+    wb = wolfxl.load_workbook(repacked, modify=True)
+    wb.active["A1"] = 2
+    wb.save(output)
+    wb.close()
+
+    with zipfile.ZipFile(repacked) as before, zipfile.ZipFile(output) as after:
+        before_infos = {info.filename: info for info in before.infolist()}
+        after_infos = {info.filename: info for info in after.infolist()}
+        assert after.read("xl/worksheets/sheet1.xml") != before.read(
+            "xl/worksheets/sheet1.xml"
+        )
+        for name in ("xl/worksheets/sheet2.xml", "xl/sharedStrings.xml"):
+            if name not in before_infos:
+                continue
+            assert after_infos[name].CRC == before_infos[name].CRC
+            assert after_infos[name].compress_size == before_infos[name].compress_size
+            assert after.read(name) == before.read(name)
@@ -54,3 +54,73 @@ def test_eager_workbook_can_retry_after_failed_save(tmp_path: Path) -> None:
     good_path = tmp_path / "good.xlsx"
     wb.save(str(good_path))
     assert load_workbook(good_path).active["A1"].value == "hello"
+
+
+def _forbid_temp_files(monkeypatch) -> None:
+    import tempfile
+
+    def fail(*args, **kwargs):
+        raise AssertionError("in-memory save must not stage a temp file")
+
+    monkeypatch.setattr(tempfile, "NamedTemporaryFile", fail)
+    monkeypatch.setattr(tempfile, "mkstemp", fail)
+
+
+def test_in_memory_saves_skip_temp_files(tmp_path: Path, monkeypatch) -> None:
+    """Writer, write-only and patcher saves stream straight into memory."""
+    import io
+
+    import wolfxl
+    from openpyxl import load_workbook
+
+    _forbid_temp_files(monkeypatch)
+
+    wb = wolfxl.Workbook()
+    wb.active["A1"] = "writer"
+    written = wb.save_bytes()
+    assert load_workbook(io.BytesIO(written)).active["A1"].value == "writer"
+
+    streaming = wolfxl.Workbook(write_only=True)
+    streaming.create_sheet("Rows").append(["write-only", 1])
+    target = io.BytesIO(b"stale bytes that must be truncated")
+    streaming.save(target)
+    assert target.tell() == 0
+    assert load_workbook(target)["Rows"]["A1"].value == "write-only"
+
+    source = tmp_path / "source.xlsx"
+    source.write_bytes(written)
+    modified = wolfxl.load_workbook(source, modify=True)
+    modified.active["B1"] = "patched"
+    patched = io.BytesIO()
+    modified.save(patched)
+    reloaded = load_workbook(patched).active
+    assert (reloaded["A1"].value, reloaded["B1"].value) == ("writer", "patched")
+    assert source.read_bytes() == written
+
+
+def test_failed_save_leaves_target_stream_untouched(tmp_path: Path) -> None:
+    """The caller's stream is only truncated once the save can go ahead."""
+    import io
+
+    import pytest
+
+    import wolfxl
+    from wolfxl.utils.exceptions import WorkbookAlreadySaved
+
+    streaming = wolfxl.Workbook(write_only=True)
+    streaming.create_sheet("Rows").append(["once"])
+    streaming.save(io.BytesIO())
+    target = io.BytesIO(b"existing contents")
+    with pytest.raises(WorkbookAlreadySaved):
+        streaming.save(target)
+    assert target.getvalue() == b"existing contents"
+
+    source = tmp_path / "source.xlsx"
+    wb = wolfxl.Workbook()
+    wb.active["A1"] = "source"
+    wb.save(source)
+    read_only = wolfxl.load_workbook(source, read_only=True)
+    read_only.active["A1"] = "edited"
+    with pytest.raises(RuntimeError, match="read_only"):
+        read_only.save(target)
+    assert target.getvalue() == b"existing contents"
@@ -13,6 +13,7 @@ path, transparently to the caller.
 from __future__ import annotations
 
 import datetime as dt
+import io
 import os
 from pathlib import Path
 import re
@@ -26,6 +27,7 @@ from wolfxl._streaming import (
     AUTO_STREAM_ROW_THRESHOLD,
     StreamingCell,
     should_auto_stream,
+    stream_iter_rows,
 )
 
 
@@ -167,6 +169,55 @@ def test_streaming_values_only_yields_1000_rows(basic_xlsx: Path) -> None:
     assert rows[-1] == (10001, 10002, 10003, 10004, 10005)
 
 
+def test_streaming_read_next_block_matches_row_reads(basic_xlsx: Path) -> None:
+    from wolfxl import _rust
+
+    by_row = _rust.StreamingSheetReader.open(str(basic_xlsx), "Sheet1", max_row=25)
+    rows = list(iter(by_row.read_next_row, None))
+    by_block = _rust.StreamingSheetReader.open(str(basic_xlsx), "Sheet1", max_row=25)
+    blocks = list(iter(lambda: by_block.read_next_block(10), []))
+
+    assert [len(block) for block in blocks] == [10, 10, 5]
+    assert [row for block in blocks for row in block] == rows
+
+
+def test_streaming_reader_opens_in_memory_sources(basic_xlsx: Path) -> None:
+    from wolfxl import _rust
+
+    data = basic_xlsx.read_bytes()
+    expected = list(
+        iter(_rust.StreamingSheetReader.open(str(basic_xlsx), "Sheet1").read_next_row, None)
+    )
+    for source in (data, io.BytesIO(data)):
+        reader = _rust.StreamingSheetReader.open(source, "Sheet1")
+        assert list(iter(reader.read_next_row, None)) == expected
+
+
+def test_read_only_bytes_workbook_streams(basic_xlsx: Path) -> None:
+    wb = wolfxl.load_workbook(io.BytesIO(basic_xlsx.read_bytes()), read_only=True)
+    ws = wb["Sheet1"]
+    assert wb._source_path is None  # noqa: SLF001
+    rows = list(stream_iter_rows(ws, max_row=3, values_only=True))
+    assert rows[0] == (11, 12, 13, 14, 15)
+    assert len(rows) == 3
+    assert list(ws.iter_rows(values_only=True)) == list(
+        wolfxl.load_workbook(basic_xlsx, read_only=True)["Sheet1"].iter_rows(values_only=True)
+    )
+
+
+def test_streaming_iter_rows_spans_block_boundaries(
+    basic_xlsx: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from wolfxl import _streaming
+
+    monkeypatch.setattr(_streaming, "STREAM_BLOCK_ROWS", 7)
+    wb = wolfxl.load_workbook(basic_xlsx, read_only=True)
+    rows = list(wb["Sheet1"].iter_rows(values_only=True))
+    assert len(rows) == 1000
+    assert rows[6] == (71, 72, 73, 74, 75)
+    assert rows[7] == (81, 82, 83, 84, 85)
+
+
 def test_read_only_values_only_does_not_hydrate_cells_or_bulk_read(
     basic_xlsx: Path,
 ) -> None:
@@ -233,6 +284,40 @@ def test_streaming_cells_expose_styles(styled_xlsx: Path) -> None:
     assert rows[1][1].alignment.horizontal == "center"
 
 
+def test_streaming_styles_resolve_by_style_id(styled_xlsx: Path) -> None:
+    class CoordinateGuard:
+        def __init__(self, inner: object) -> None:
+            self._inner = inner
+            self.style_reads: list[int] = []
+
+        def __getattr__(self, name: str) -> object:
+            return getattr(self._inner, name)
+
+        def read_cell_format(self, *args: object) -> object:
+            raise AssertionError("streaming styles must not use the cell index")
+
+        def read_cell_border(self, *args: object) -> object:
+            raise AssertionError("streaming styles must not use the cell index")
+
+        def read_style_format(self, style_id: int) -> object:
+            self.style_reads.append(style_id)
+            return self._inner.read_style_format(style_id)
+
+    wb = wolfxl.load_workbook(styled_xlsx, read_only=True)
+    guard = CoordinateGuard(wb._rust_reader)  # noqa: SLF001
+    wb._rust_reader = guard  # noqa: SLF001
+    ws = wb["Styled"]
+    rows = [list(r) for r in ws.iter_rows(min_row=1, max_row=3, min_col=1, max_col=2)]
+
+    assert rows[0][0].font.bold is True
+    assert rows[1][0].number_format == "0.00"
+    assert rows[1][1].alignment.horizontal == "center"
+    assert rows[0][0].border.left.style is None
+    again = next(ws.iter_rows(min_row=1, max_row=1, min_col=1, max_col=1))[0]
+    assert again.font is rows[0][0].font
+    assert len(guard.style_reads) == len(set(guard.style_reads))
+
+
 # ---------------------------------------------------------------------------
 # 3. Bounded range — min_row=10, max_row=20 yields 11 rows.
 # ---------------------------------------------------------------------------
@@ -0,0 +1,114 @@
+"""Native reader / writer / patcher handles are usable from worker threads.
+
+A handle may move between threads, but each thread uses its own: reads and
+saves hold a mutable borrow while the GIL is released.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import wolfxl
+from wolfxl import _rust
+
+
+def _make_workbook(path: Path, seed: int) -> None:
+    wb = wolfxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    for row in range(1, 201):
+        ws.cell(row=row, column=1, value=row * seed)
+        ws.cell(row=row, column=2, value=f"r{row}-{seed}")
+    wb.save(path)
+
+
+def _load_values(path: Path) -> list[tuple]:
+    wb = wolfxl.load_workbook(path)
+    try:
+        return list(wb["Data"].iter_rows(values_only=True))
+    finally:
+        wb.close()
+
+
+def test_concurrent_loads_match_serial(tmp_path: Path) -> None:
+    paths = []
+    for seed in range(1, 9):
+        path = tmp_path / f"book{seed}.xlsx"
+        _make_workbook(path, seed)
+        paths.append(path)
+
+    serial = [_load_values(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        threaded = list(pool.map(_load_values, paths))
+
+    assert threaded == serial
+
+
+def test_concurrent_saves_in_write_and_modify_mode(tmp_path: Path) -> None:
+    def write(seed: int) -> Path:
+        path = tmp_path / f"written{seed}.xlsx"
+        _make_workbook(path, seed)
+        wb = wolfxl.load_workbook(path, modify=True)
+        wb["Data"]["C1"] = "patched"
+        wb.save(path)
+        wb.close()
+        return path
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        paths = list(pool.map(write, range(1, 7)))
+
+    for seed, path in enumerate(paths, start=1):
+        rows = _load_values(path)
+        assert rows[0] == (seed, f"r1-{seed}", "patched")
+
+
+def test_native_book_handle_crosses_threads(tmp_path: Path) -> None:
+    path = tmp_path / "shared.xlsx"
+    _make_workbook(path, 3)
+    book = _rust.NativeXlsxBook.open(str(path))
+    result: list = []
+
+    def read() -> None:
+        result.append(book.read_sheet_values_plain("Data", "A1:B2"))
+
+    worker = threading.Thread(target=read)
+    worker.start()
+    worker.join()
+
+    assert result == [[[3, "r1-3"], [6, "r2-3"]]]
+
+
+def test_one_book_handle_per_thread(tmp_path: Path) -> None:
+    path = tmp_path / "per_thread.xlsx"
+    _make_workbook(path, 5)
+    expected = _rust.NativeXlsxBook.open(str(path)).read_sheet_values_plain("Data")
+    barrier = threading.Barrier(2)
+
+    def read() -> list:
+        book = _rust.NativeXlsxBook.open(str(path))
+        barrier.wait()
+        return book.read_sheet_values_plain("Data")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = list(pool.map(lambda _: read(), range(2)))
+
+    assert results == [expected, expected]
+
+
+def test_streaming_reader_handle_crosses_threads(tmp_path: Path) -> None:
+    path = tmp_path / "stream.xlsx"
+    _make_workbook(path, 2)
+    reader = _rust.StreamingSheetReader.open(str(path), "Data", max_row=2)
+    rows: list = []
+
+    def drain() -> None:
+        while (values := reader.read_next_values()) is not None:
+            rows.append(values)
+
+    worker = threading.Thread(target=drain)
+    worker.start()
+    worker.join()
+
+    assert rows == [(2, "r1-2"), (4, "r2-2")]
@@ -0,0 +1,130 @@
+"""Columnar export: ``Worksheet.to_numpy`` / ``to_arrow`` from native buffers."""
+
+from __future__ import annotations
+
+import datetime as dt
+from pathlib import Path
+
+import pytest
+
+import wolfxl
+
+np = pytest.importorskip("numpy")
+
+
+def _make_workbook(path: Path) -> None:
+    wb = wolfxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["id", "price", "name", "when", "flag", "mixed"])
+    ws.append([1, 1.5, "apple", dt.datetime(2024, 1, 2, 3, 4, 5), True, 1])
+    ws.append([2, None, "pear", dt.datetime(2024, 2, 3), False, "x"])
+    ws.append([3, 4.25, None, None, True, None])
+    wb.save(path)
+
+
+def test_read_sheet_columns_types_each_column(tmp_path: Path) -> None:
+    path = tmp_path / "cols.xlsx"
+    _make_workbook(path)
+    wb = wolfxl.load_workbook(path)
+
+    descriptors = wb._rust_reader.read_sheet_columns("Data", "A2:F4")  # noqa: SLF001
+
+    assert [desc["kind"] for desc in descriptors] == [
+        "int64",
+        "float64",
+        "string",
+        "datetime64[ms]",
+        "bool",
+        "object",
+    ]
+    assert [desc["null_count"] for desc in descriptors] == [0, 1, 1, 1, 0, 1]
+    assert descriptors[5]["values"] == [1, "x", None]
+
+
+def test_to_numpy_matches_row_values(tmp_path: Path) -> None:
+    path = tmp_path / "cols.xlsx"
+    _make_workbook(path)
+    ws = wolfxl.load_workbook(path)["Data"]
+
+    arrays = ws.to_numpy()
+
+    assert list(arrays) == ["id", "price", "name", "when", "flag", "mixed"]
+    assert arrays["id"].dtype == np.int64
+    assert arrays["id"].tolist() == [1, 2, 3]
+    assert arrays["price"][0] == 1.5 and np.isnan(arrays["price"][1])
+    assert arrays["name"].tolist() == ["apple", "pear", None]
+    assert arrays["when"][0] == np.datetime64("2024-01-02T03:04:05")
+    assert np.isnat(arrays["when"][2])
+    assert arrays["flag"].tolist() == [True, False, True]
+    assert arrays["mixed"].tolist() == [1, "x", None]
+
+
+def test_to_numpy_selects_columns_by_label_letter_or_index(tmp_path: Path) -> None:
+    path = tmp_path / "cols.xlsx"
+    _make_workbook(path)
+    ws = wolfxl.load_workbook(path)["Data"]
+
+    arrays = ws.to_numpy(columns=["name", "A", 5])
+
+    assert list(arrays) == ["name", "id", "flag"]
+    with pytest.raises(KeyError):
+        ws.to_numpy(columns=["missing label"])
+
+
+def test_to_numpy_write_mode_falls_back_to_cell_values() -> None:
+    wb = wolfxl.Workbook()
+    ws = wb.active
+    ws.append(["a", "b"])
+    ws.append([1, "x"])
+    ws.append([2, None])
+
+    arrays = ws.to_numpy()
+
+    assert arrays["a"].dtype == np.int64
+    assert arrays["a"].tolist() == [1, 2]
+    assert arrays["b"].tolist() == ["x", None]
+
+
+def test_to_arrow_wraps_native_buffers(tmp_path: Path) -> None:
+    pa = pytest.importorskip("pyarrow")
+    path = tmp_path / "cols.xlsx"
+    _make_workbook(path)
+    ws = wolfxl.load_workbook(path)["Data"]
+
+    table = ws.to_arrow(columns=["id", "price", "name", "when", "flag"])
+
+    assert table.schema.types == [
+        pa.int64(),
+        pa.float64(),
+        pa.large_string(),
+        pa.timestamp("ms"),
+        pa.bool_(),
+    ]
+    assert table.column("price").to_pylist() == [1.5, None, 4.25]
+    assert table.column("name").to_pylist() == ["apple", "pear", None]
+    assert table.column("when").to_pylist()[1] == dt.datetime(2024, 2, 3)
+
+
+def test_to_dataframe_keeps_row_path_dtypes(tmp_path: Path) -> None:
+    pd = pytest.importorskip("pandas")
+    path = tmp_path / "cols.xlsx"
+    _make_workbook(path)
+    ws = wolfxl.load_workbook(path)["Data"]
+    rows = list(ws.iter_rows(values_only=True))
+    expected = pd.DataFrame(rows[1:], columns=list(rows[0]))
+
+    pd.testing.assert_frame_equal(ws.to_dataframe(), expected)
+    columnar = ws.to_dataframe(columnar=True)
+    assert columnar["when"].dtype == np.dtype("datetime64[ms]")
+    assert columnar["when"].tolist()[:2] == expected["when"].tolist()[:2]
+
+
+def test_to_dataframe_columnar_streams_read_only(tmp_path: Path) -> None:
+    pd = pytest.importorskip("pandas")
+    path = tmp_path / "cols.xlsx"
+    _make_workbook(path)
+    eager = wolfxl.load_workbook(path)["Data"].to_dataframe()
+    streamed = wolfxl.load_workbook(path, read_only=True)["Data"].to_dataframe(columnar=True)
+
+    pd.testing.assert_frame_equal(streamed, eager)
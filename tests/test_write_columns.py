@@ -0,0 +1,97 @@
+"""Columnar bulk writes: ``write_columns`` / ``write_dataframe``."""
+
+from __future__ import annotations
+
+import datetime as dt
+from pathlib import Path
+
+import pytest
+
+import wolfxl
+
+np = pytest.importorskip("numpy")
+
+
+def _columns() -> dict[str, object]:
+    return {
+        "id": np.arange(1, 4, dtype=np.int64),
+        "price": np.array([1.5, np.nan, 4.25]),
+        "flag": np.array([True, False, True]),
+        "when": np.array(["2024-01-02T03:04:05", "NaT", "2024-02-03"], dtype="datetime64[s]"),
+        "name": ["apple", None, "pear"],
+    }
+
+
+def _rows(path: Path) -> list[tuple]:
+    return list(wolfxl.load_workbook(path).active.iter_rows(values_only=True))
+
+
+def test_write_columns_round_trips_typed_buffers(tmp_path: Path) -> None:
+    wb = wolfxl.Workbook()
+    ws = wb.active
+    ws.write_columns(_columns(), number_formats={"price": "0.00"})
+    ws.append(["total"])
+    path = tmp_path / "cols.xlsx"
+    wb.save(path)
+
+    rows = _rows(path)
+    assert rows[0] == ("id", "price", "flag", "when", "name")
+    assert rows[1] == (1, 1.5, True, dt.datetime(2024, 1, 2, 3, 4, 5), "apple")
+    assert rows[2] == (2, None, False, None, None)
+    assert rows[3] == (3, 4.25, True, dt.datetime(2024, 2, 3), "pear")
+    assert rows[4][0] == "total"
+    assert wolfxl.load_workbook(path).active["B2"].number_format == "0.00"
+
+
+def test_write_columns_at_offset_without_header(tmp_path: Path) -> None:
+    wb = wolfxl.Workbook()
+    ws = wb.active
+    ws.write_columns([np.array([1, 2]), ["a", "=A2*2"]], start_row=2, start_col=2)
+    path = tmp_path / "offset.xlsx"
+    wb.save(path)
+
+    ws = wolfxl.load_workbook(path).active
+    assert ws["B2"].value == 1
+    assert ws["C2"].value == "a"
+    assert ws["C3"].value == "=A2*2"
+
+
+def test_write_only_write_dataframe(tmp_path: Path) -> None:
+    pd = pytest.importorskip("pandas")
+    frame = pd.DataFrame(_columns())
+
+    wb = wolfxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Data")
+    ws.append(["report"])
+    ws.write_dataframe(frame)
+    ws.append(["end"])
+    path = tmp_path / "stream.xlsx"
+    wb.save(path)
+
+    rows = list(wolfxl.load_workbook(path)["Data"].iter_rows(values_only=True))
+    assert rows[0][0] == "report"
+    assert rows[1] == ("id", "price", "flag", "when", "name")
+    assert rows[2] == (1, 1.5, True, dt.datetime(2024, 1, 2, 3, 4, 5), "apple")
+    assert rows[3] == (2, None, False, None, None)
+    assert rows[5][0] == "end"
+
+
+def test_write_columns_rejects_ragged_columns() -> None:
+    ws = wolfxl.Workbook().active
+    with pytest.raises(ValueError, match="same length"):
+        ws.write_columns({"a": np.arange(3), "b": np.arange(2)})
+
+
+def test_write_columns_rejects_infinity_on_native_save(tmp_path: Path) -> None:
+    wb = wolfxl.Workbook()
+    wb.active.write_columns({"x": np.array([1.0, np.inf])})
+    with pytest.raises(ValueError, match="non-finite"):
+        wb.save(tmp_path / "inf.xlsx")
+
+
+def test_write_columns_rejects_infinity_in_modify_mode(tmp_path: Path) -> None:
+    path = tmp_path / "source.xlsx"
+    wolfxl.Workbook().save(path)
+    wb = wolfxl.load_workbook(path, modify=True)
+    with pytest.raises(ValueError, match="non-finite"):
+        wb.active.write_columns({"x": np.array([1.0, -np.inf])})